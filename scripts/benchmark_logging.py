@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Per-command logging overhead benchmark.
+
+Measures the cost GameLogger.log_command adds to each executed command with
+logging disabled, enabled with a synchronous handler, and enabled with the
+asynchronous queue handler. Output goes to an in-memory stream so the
+numbers reflect the logging layer rather than terminal speed.
+"""
+
+import io
+import logging
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ti4.core.logging import (  # noqa: E402
+    GameLogger,
+    StructuredFormatter,
+    disable_async_logging,
+)
+
+COMMANDS = 20_000
+
+
+class BenchmarkCommand:
+    """Command with a realistically sized serialized form."""
+
+    def serialize(self) -> dict[str, Any]:
+        return {
+            "type": "move_units",
+            "player_id": "player1",
+            "units": [{"id": f"unit_{i}", "type": "cruiser"} for i in range(8)],
+            "from_system": "18",
+            "to_system": "26",
+        }
+
+
+def _make_logger(name: str, level: int) -> tuple[GameLogger, io.StringIO]:
+    game_logger = GameLogger(name)
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(StructuredFormatter("%(asctime)s - %(message)s"))
+    game_logger.logger.handlers = [handler]
+    game_logger.logger.setLevel(level)
+    return game_logger, stream
+
+
+def _per_command_us(game_logger: GameLogger) -> float:
+    command = BenchmarkCommand()
+    context = {"player_id": "player1", "turn": 3}
+    elapsed = min(
+        timeit.repeat(
+            lambda: game_logger.log_command(command, "success", context),
+            number=COMMANDS,
+            repeat=3,
+        )
+    )
+    return elapsed / COMMANDS * 1_000_000
+
+
+def main() -> None:
+    """Report per-command logging overhead in microseconds."""
+    disabled, _ = _make_logger("benchmark_disabled", logging.WARNING)
+    sync, _ = _make_logger("benchmark_sync", logging.INFO)
+    async_logger, _ = _make_logger("benchmark_async", logging.INFO)
+    async_handler = async_logger.enable_async()
+
+    print(f"Per-command log_command overhead ({COMMANDS} commands):")
+    print(f"  logging disabled   {_per_command_us(disabled):8.2f}us")
+    print(f"  synchronous        {_per_command_us(sync):8.2f}us")
+    print(f"  asynchronous       {_per_command_us(async_logger):8.2f}us (caller)")
+
+    async_handler.flush()
+    disable_async_logging(async_logger.logger)
+
+
+if __name__ == "__main__":
+    main()
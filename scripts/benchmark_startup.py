@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for static data loading.
+
+Each measurement runs in a fresh interpreter so nothing is shared between
+runs. Reports the import time of the core game modules and the time to load
+all static game data, first from source (CSV parsing and registry
+construction) and then from the prebuilt data bundle.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+RUNS = 7
+
+_PROBE = """
+import time
+start = time.perf_counter()
+import ti4.core.game_state
+from ti4.core.component_catalog import ALL_CATALOGS
+from ti4.core.constants import Faction
+from ti4.core.leaders import LeaderRegistry, LeaderType
+from ti4.core.objective import ObjectiveCardFactory
+from ti4.core.technology_cards.specifications import TechnologySpecificationRegistry
+imported = time.perf_counter()
+for catalog in ALL_CATALOGS:
+    catalog.preload()
+ObjectiveCardFactory.create_all_objectives()
+TechnologySpecificationRegistry()
+registry = LeaderRegistry()
+for faction in Faction:
+    for leader_type in LeaderType:
+        registry.get_leader_definition(faction, leader_type)
+loaded = time.perf_counter()
+print(imported - start, loaded - imported)
+"""
+
+
+def _measure(bundle_path: str) -> tuple[float, float]:
+    """Run the probe in a fresh interpreter and return (import, load) times."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), TI4_DATA_BUNDLE=bundle_path)
+    output = subprocess.run(  # nosec B603 - fixed interpreter and script
+        [sys.executable, "-c", _PROBE],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), float(output[1])
+
+
+def _report(label: str, samples: list[tuple[float, float]]) -> float:
+    import_ms = statistics.median(sample[0] for sample in samples) * 1000
+    load_ms = statistics.median(sample[1] for sample in samples) * 1000
+    print(f"{label:<12} import {import_ms:8.1f}ms   static data {load_ms:8.1f}ms")
+    return load_ms
+
+
+def main() -> None:
+    """Compare cold-start data loading with and without the bundle."""
+    from ti4.core.data_bundle import build_bundle
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle = build_bundle(Path(tmp) / "ti4_static_data.bundle")
+        missing = str(Path(tmp) / "missing.bundle")
+
+        # Warm the OS file cache and bytecode caches before measuring
+        _measure(missing)
+        _measure(str(bundle))
+
+        before = [_measure(missing) for _ in range(RUNS)]
+        after = [_measure(str(bundle)) for _ in range(RUNS)]
+
+    print(f"Median of {RUNS} cold starts:")
+    before_ms = _report("from source", before)
+    after_ms = _report("from bundle", after)
+    print(f"Static data load speedup: {before_ms / after_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Build the precompiled static data bundle.
+
+Compiles the component CSVs, technology specifications and leader
+definitions into ``src/ti4/data/ti4_static_data.bundle`` (or the path given
+on the command line) so processes can load them without parsing.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def main() -> None:
+    """Build the bundle and report its size."""
+    from ti4.core.data_bundle import build_bundle, load_bundle
+
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else None
+    start = time.perf_counter()
+    path = build_bundle(target)
+    elapsed = time.perf_counter() - start
+
+    # Make sure the bundle we just wrote is readable and current
+    load_bundle(path)
+    print(f"Wrote {path} ({path.stat().st_size:,} bytes) in {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
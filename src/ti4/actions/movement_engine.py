@@ -7,6 +7,7 @@ For Rule 89 compliance validation, use TacticalActionValidator in core/tactical_
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -207,7 +208,7 @@ class SpaceCannonOffenseStep(TacticalActionStep):
             return False
 
         # Check if there are any units with space cannon ability
-        space_cannon_units = self._get_space_cannon_units(system)
+        space_cannon_units = self._get_space_cannon_units(system, game_state)
         return len(space_cannon_units) > 0
 
     def get_step_name(self) -> str:
@@ -222,7 +223,7 @@ class SpaceCannonOffenseStep(TacticalActionStep):
             return game_state
 
         # Get all players with space cannon units
-        space_cannon_players = self._get_space_cannon_players(system)
+        space_cannon_players = self._get_space_cannon_players(system, game_state)
 
         # Execute space cannon offense for each player in order
         for player_id in space_cannon_players:
@@ -230,32 +231,34 @@ class SpaceCannonOffenseStep(TacticalActionStep):
 
         return game_state
 
-    def _get_space_cannon_units(self, system: Any) -> list[Any]:
-        """Get all units with space cannon ability in the system."""
-        space_cannon_units = []
+    def _get_space_cannon_units(self, system: Any, game_state: Any = None) -> list[Any]:
+        """Get all units with space cannon ability on the planets of the system.
 
-        # Check units on planets (PDS units have space cannon)
-        for planet in system.planets:
-            for unit in planet.units:
-                # Check if unit has space cannon ability using unit stats
-                if hasattr(unit, "unit_type"):
-                    from ..core.constants import UnitType
-                    from ..core.unit_stats import UnitStatsProvider
-
-                    provider = UnitStatsProvider()
-                    # Convert string unit_type back to enum
-                    unit_type_enum = UnitType(unit.unit_type)
-                    stats = provider.get_unit_stats(unit_type_enum)
-                    if stats.space_cannon:
-                        space_cannon_units.append(unit)
+        Reads the game state's space cannon coverage index when a game state
+        is given, so unchanged systems are not re-read.
+        """
+        from ..core.space_cannon_coverage import (
+            find_space_cannon_sources,
+            get_space_cannon_coverage,
+        )
 
-        return space_cannon_units
+        if game_state is not None and isinstance(
+            getattr(game_state, "systems", None), Mapping
+        ):
+            return get_space_cannon_coverage(game_state).get_units_in_system(system)
+        return [
+            source.unit
+            for source in find_space_cannon_sources(system)
+            if source.planet_name is not None
+        ]
 
-    def _get_space_cannon_players(self, system: Any) -> list[str]:
+    def _get_space_cannon_players(
+        self, system: Any, game_state: Any = None
+    ) -> list[str]:
         """Get players who have space cannon units in order."""
         players = set()
 
-        for unit in self._get_space_cannon_units(system):
+        for unit in self._get_space_cannon_units(system, game_state):
             players.add(unit.owner)
 
         return sorted(players)  # Return in consistent order
@@ -291,7 +294,7 @@ class SpaceCannonOffenseStep(TacticalActionStep):
         # Get space cannon units for this player
         player_units = [
             unit
-            for unit in self._get_space_cannon_units(system)
+            for unit in self._get_space_cannon_units(system, game_state)
             if unit.owner == player_id
         ]
 
@@ -303,12 +306,13 @@ class SpaceCannonOffenseStep(TacticalActionStep):
         if not target_players:
             return
 
-        # Roll dice for each space cannon unit
-        total_hits = 0
+        # Roll the dice of every space cannon unit at once
+        from ..core.pre_combat_rolls import PreCombatRollBatch
 
+        batch = PreCombatRollBatch()
         for unit in player_units:
-            hits = self._roll_space_cannon_dice(unit, game_state, context)
-            total_hits += hits
+            batch.add_space_cannon(unit)
+        total_hits = batch.roll().total_hits()
 
         # Assign hits to target units (simplified - target first available unit)
         if total_hits > 0:
@@ -330,26 +334,6 @@ class SpaceCannonOffenseStep(TacticalActionStep):
             unit = target_units[i]
             system.remove_unit_from_space(unit)
 
-    def _roll_space_cannon_dice(
-        self, unit: Any, game_state: Any, context: dict[str, Any]
-    ) -> int:
-        """Roll space cannon dice for a unit and return hits."""
-        from ..core.dice import calculate_hits, roll_dice
-
-        # Get unit's space cannon stats
-        stats = unit.get_stats()
-        if not hasattr(stats, "space_cannon_value") or stats.space_cannon_value is None:
-            return 0
-
-        # Get number of dice to roll (default 1 if not specified)
-        dice_count = getattr(stats, "space_cannon_dice", 1)
-
-        # Roll dice
-        dice_results = roll_dice(dice_count)
-
-        # Calculate hits
-        return calculate_hits(dice_results, stats.space_cannon_value)
-
     def _assign_hits(self, system: Any, target_players: list[str], hits: int) -> None:
         """Assign hits to target units (alias for _assign_space_cannon_hits)."""
         self._assign_space_cannon_hits(system, target_players, hits)
@@ -358,54 +342,14 @@ class SpaceCannonOffenseStep(TacticalActionStep):
         self, player_id: str, game_state: Any, context: dict[str, Any]
     ) -> list[Any]:
         """Get all space cannon units for a player in the active system and adjacent systems (for PDS II)."""
-        from ..core.constants import UnitType
-        from ..core.unit_stats import UnitStatsProvider
-
-        active_system_id = context["active_system_id"]
-        active_system = game_state.systems[active_system_id]
-
-        # Get units in the active system (space units)
-        units = []
-        for unit in active_system.space_units:
-            if unit.owner == player_id and hasattr(unit, "unit_type"):
-                provider = UnitStatsProvider()
-                unit_type_enum = UnitType(unit.unit_type)
-                stats = provider.get_unit_stats(unit_type_enum)
-                if stats.space_cannon:
-                    units.append(unit)
-
-        # Get units on planets in the active system
-        for planet in active_system.planets:
-            for unit in planet.units:
-                if unit.owner == player_id and hasattr(unit, "unit_type"):
-                    provider = UnitStatsProvider()
-                    unit_type_enum = UnitType(unit.unit_type)
-                    stats = provider.get_unit_stats(unit_type_enum)
-                    if stats.space_cannon:
-                        units.append(unit)
-
-        # For PDS II units, also check adjacent systems (Rule 77.3c)
-        if hasattr(game_state, "galaxy") and game_state.galaxy:
-            # Get all systems adjacent to the active system
-            for system_id, system in game_state.systems.items():
-                if system_id != active_system_id:
-                    # Check if this system is adjacent to the active system
-                    if game_state.galaxy.are_systems_adjacent(
-                        system_id, active_system_id
-                    ):
-                        # Check for PDS units with PDS II upgrade on planets in adjacent system
-                        for planet in system.planets:
-                            for unit in planet.units:
-                                if (
-                                    unit.owner == player_id
-                                    and hasattr(unit, "unit_type")
-                                    and unit.unit_type == UnitType.PDS
-                                    and hasattr(unit, "_has_pds_ii_upgrade")
-                                    and unit._has_pds_ii_upgrade
-                                ):
-                                    units.append(unit)
-
-        return units
+        from ..core.space_cannon_coverage import get_space_cannon_coverage
+
+        # Units in the active system (space area, then planets), then PDS II
+        # units in adjacent systems (Rule 77.3c)
+        threat = get_space_cannon_coverage(game_state).get_threat(
+            player_id, context["active_system_id"]
+        )
+        return [source.unit for source in threat.sources]
 
     def _resolve_space_cannon_for_player(
         self, player_id: str, game_state: Any, context: dict[str, Any]
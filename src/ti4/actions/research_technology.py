@@ -1,9 +1,11 @@
 """Research technology action for TI4 - Integrated with Rule 90 TechnologyManager."""
 
+from copy import copy
 from dataclasses import dataclass
 from typing import Any
 
 from ..core.constants import Technology
+from ..core.game_state import GameState
 from ..core.game_technology_manager import GameTechnologyManager
 from .action import Action
 
@@ -34,10 +36,10 @@ class ResearchTechnologyAction(Action):
     def execute(self, state: Any, player_id: str) -> Any:
         """Execute the technology research and return new game state.
 
-        Uses Rule 90 TechnologyManager with full game state integration.
+        Uses Rule 90 TechnologyManager with full game state integration. The
+        new state shares everything with the old one except the technologies
+        of the researching player.
         """
-        from copy import deepcopy
-
         # Validate the action can be performed
         if not self.is_legal(state, player_id):
             raise ValueError(
@@ -45,7 +47,7 @@ class ResearchTechnologyAction(Action):
             )
 
         # Create new state
-        new_state = deepcopy(state)
+        new_state = _copy_for_research(state, player_id)
 
         # Use integrated technology manager
         game_tech_manager = GameTechnologyManager(new_state)
@@ -59,3 +61,20 @@ class ResearchTechnologyAction(Action):
     def get_description(self) -> str:
         """Get a human-readable description of this action."""
         return f"Research {self.technology.value}"
+
+
+def _copy_for_research(state: Any, player_id: str) -> Any:
+    """Shallow-copy a state, copying only what researching changes."""
+    player_technologies = dict(state.player_technologies)
+    if isinstance(state, GameState):
+        return state._create_new_state(player_technologies=player_technologies)
+
+    # Other (mock) states keep technologies on their player states too
+    new_state = copy(state)
+    new_state.player_technologies = player_technologies
+    players = getattr(state, "players", None)
+    if isinstance(players, dict) and player_id in players:
+        new_players = dict(players)
+        new_players[player_id] = copy(players[player_id])
+        new_state.players = new_players
+    return new_state
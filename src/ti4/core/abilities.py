@@ -17,6 +17,7 @@ Key LRR Rules Implemented:
 - 1.18: Abilities resolve once per trigger occurrence
 """
 
+import bisect
 import itertools
 import logging
 from dataclasses import dataclass, field
@@ -282,17 +283,92 @@ class AbilityManager:
         self.abilities: list[Ability] = []
         self.pending_resolutions: list[Ability] = []
         self._occurrence_counter = itertools.count(1)
+        # Abilities bucketed by trigger event, each bucket kept in resolution
+        # order (highest precedence score first, registration order for ties)
+        self._abilities_by_trigger: dict[str, list[Ability]] = {}
+        self._abilities_by_trigger_and_timing: dict[
+            tuple[str, TimingWindow], list[Ability]
+        ] = {}
 
     def add_ability(self, ability: Ability) -> None:
         """Add an ability to the manager"""
         self.abilities.append(ability)
-        logger.debug(f"Added ability: {ability.name}")
+        self._insert_into_bucket(
+            self._abilities_by_trigger.setdefault(ability.trigger, []), ability
+        )
+        self._insert_into_bucket(
+            self._abilities_by_trigger_and_timing.setdefault(
+                (ability.trigger, ability.timing), []
+            ),
+            ability,
+        )
+        logger.debug("Added ability: %s", ability.name)
 
     def remove_ability(self, ability: Ability) -> None:
         """Remove an ability from the manager"""
         if ability in self.abilities:
             self.abilities.remove(ability)
-            logger.debug(f"Removed ability: {ability.name}")
+            self._remove_from_bucket(
+                self._abilities_by_trigger, ability.trigger, ability
+            )
+            self._remove_from_bucket(
+                self._abilities_by_trigger_and_timing,
+                (ability.trigger, ability.timing),
+                ability,
+            )
+            logger.debug("Removed ability: %s", ability.name)
+
+    def get_abilities_for_trigger(
+        self, event: str, timing: TimingWindow | None = None
+    ) -> list[Ability]:
+        """Get registered abilities for an event in resolution order.
+
+        Args:
+            event: The trigger event to look up
+            timing: Optionally restrict the result to a single timing window
+
+        Returns:
+            Abilities triggered by the event, highest precedence first
+        """
+        if timing is None:
+            return list(self._abilities_by_trigger.get(event, ()))
+        return list(self._abilities_by_trigger_and_timing.get((event, timing), ()))
+
+    @staticmethod
+    def _insert_into_bucket(bucket: list[Ability], ability: Ability) -> None:
+        """Insert an ability after all abilities of equal or higher precedence."""
+        bisect.insort_right(
+            bucket, ability, key=lambda indexed: -indexed.get_precedence_score()
+        )
+
+    @staticmethod
+    def _remove_from_bucket(
+        index: dict[Any, list[Ability]], key: Any, ability: Ability
+    ) -> None:
+        """Remove an ability from an index bucket, dropping empty buckets."""
+        bucket = index.get(key)
+        if bucket is None or ability not in bucket:
+            return
+        bucket.remove(ability)
+        if not bucket:
+            del index[key]
+
+    def _get_applicable_abilities(
+        self,
+        event: str,
+        context: dict[str, Any] | None,
+        timing: TimingWindow | None = None,
+    ) -> list[Ability]:
+        """Get triggerable, active abilities for an event in resolution order."""
+        if timing is None:
+            candidates = self._abilities_by_trigger.get(event, ())
+        else:
+            candidates = self._abilities_by_trigger_and_timing.get((event, timing), ())
+        return [
+            ability
+            for ability in candidates
+            if ability.can_trigger(event, context) and ability.is_active()
+        ]
 
     def trigger_event(
         self, event: str, context: dict[str, Any] | None = None
@@ -310,20 +386,12 @@ class AbilityManager:
         if "occurrence_id" not in context and "combat_id" not in context:
             context["occurrence_id"] = next(self._occurrence_counter)
 
-        applicable_abilities = [
-            ability
-            for ability in self.abilities
-            if ability.can_trigger(event, context) and ability.is_active()
-        ]
+        # Buckets are kept sorted by precedence and timing (Rule 1.16)
+        sorted_abilities = self._get_applicable_abilities(event, context)
 
-        if not applicable_abilities:
+        if not sorted_abilities:
             return AbilityResolutionResult(success=True, resolved_abilities=[])
 
-        # Sort by precedence and timing (Rule 1.16)
-        sorted_abilities = sorted(
-            applicable_abilities, key=lambda a: a.get_precedence_score(), reverse=True
-        )
-
         resolved = []
         failed = []
         event_modified = False
@@ -341,7 +409,7 @@ class AbilityManager:
                     failed.append(ability)
 
             except Exception as e:
-                logger.error(f"Error resolving ability {ability.name}: {e}")
+                logger.error("Error resolving ability %s: %s", ability.name, e)
                 failed.append(ability)
 
         return AbilityResolutionResult(
@@ -357,35 +425,26 @@ class AbilityManager:
         """
         Resolve conflicts between abilities (Rules 1.2, 1.6)
         """
-        conflicting_abilities = [
-            ability
-            for ability in self.abilities
-            if ability.can_trigger(event, context) and ability.is_active()
-        ]
+        conflicting_abilities = self._get_applicable_abilities(event, context)
 
         if not conflicting_abilities:
             return AbilityResolutionResult(success=True, resolved_abilities=[])
 
-        # Find highest precedence ability
-        winner = max(conflicting_abilities, key=lambda a: a.get_precedence_score())
+        # Buckets are ordered by precedence, so the first ability wins
+        winner = conflicting_abilities[0]
 
         return AbilityResolutionResult(
             success=True, resolved_abilities=[winner], winning_ability=winner
         )
 
     def get_resolution_order(
-        self, event: str, context: dict[str, Any] | None = None
+        self,
+        event: str,
+        context: dict[str, Any] | None = None,
+        timing: TimingWindow | None = None,
     ) -> list[Ability]:
         """Get the order abilities would resolve for an event"""
-        applicable_abilities = [
-            ability
-            for ability in self.abilities
-            if ability.can_trigger(event, context) and ability.is_active()
-        ]
-
-        return sorted(
-            applicable_abilities, key=lambda a: a.get_precedence_score(), reverse=True
-        )
+        return self._get_applicable_abilities(event, context, timing)
 
     def resolve_ability(
         self,
@@ -518,7 +577,7 @@ class AbilityManager:
             return True
 
         except Exception as e:
-            logger.error(f"Failed to resolve ability {ability.name}: {e}")
+            logger.error("Failed to resolve ability %s: %s", ability.name, e)
             return False
 
     def _draw_relic(self, player: PlayerProtocol | None) -> bool:
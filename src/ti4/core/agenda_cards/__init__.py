@@ -14,7 +14,7 @@ from .exceptions import (
     AgendaCardValidationError,
 )
 from .law_manager import ActiveLaw, GameContext, LawManager
-from .registry import AgendaCardRegistry
+from .registry import AgendaCardRegistry, warm_up_agenda_cards
 from .validation import (
     ActionValidationResult,
     AgendaCardValidator,
@@ -27,6 +27,7 @@ __all__ = [
     "DirectiveCard",
     "LawCard",
     "AgendaCardRegistry",
+    "warm_up_agenda_cards",
     "AgendaDeck",
     "AgendaDeckEmptyError",
     "ActiveLaw",
@@ -52,6 +52,19 @@ class AgendaDeck:
         if self._total_cards == 0:
             raise ValueError("Cannot create deck from empty registry")
 
+    @classmethod
+    def create_standard(cls) -> "AgendaDeck":
+        """
+        Create a deck of every implemented agenda card.
+
+        The deck refers to the process-wide shared cards (see
+        AgendaCardRegistry.create_standard), so only its card order is per game.
+
+        Returns:
+            A new, unshuffled agenda deck
+        """
+        return cls(AgendaCardRegistry.create_standard())
+
     def __len__(self) -> int:
         """Get the number of cards remaining in the deck."""
         return len(self._deck)
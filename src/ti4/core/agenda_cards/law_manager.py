@@ -3,16 +3,77 @@ Law persistence and tracking system for TI4 agenda cards.
 
 This module provides the ActiveLaw data structure and LawManager class
 for tracking persistent law effects throughout the game.
+
+Law checks sit on movement, production and research paths, so effect text is
+classified into categories once per distinct text, and LawManager keeps the
+active laws indexed by category and by elected player. Looking up the laws
+for an action costs O(applicable laws) and never scans effect text.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .base import BaseAgendaCard
 
+# Effect text keyword -> law effect category
+_EFFECT_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("technology", "technology"),
+    ("tech", "technology"),
+    ("fleet pool", "fleet_pool"),
+    ("fleet", "fleet"),
+    ("pds", "pds"),
+    ("movement", "movement"),
+    ("wormhole", "movement"),
+    ("combat", "combat"),
+    ("destroyed", "combat"),
+    ("reinforcements", "combat"),
+)
+
+# Action type keyword -> category of the laws that apply to the action
+_ACTION_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("research", "technology"),
+    ("fleet_pool", "fleet"),
+    ("pds_placement", "pds"),
+    ("movement", "movement"),
+    ("combat", "combat"),
+)
+
+
+@lru_cache(maxsize=512)
+def classify_law_effect(effect_description: str) -> frozenset[str]:
+    """Get the categories of a law effect (cached per distinct text).
+
+    Args:
+        effect_description: The law's effect text
+
+    Returns:
+        Categories such as "technology", "movement" or "combat"
+    """
+    effect_lower = effect_description.lower()
+    return frozenset(
+        category for keyword, category in _EFFECT_KEYWORDS if keyword in effect_lower
+    )
+
+
+@lru_cache(maxsize=512)
+def classify_action_type(action_type: str) -> frozenset[str]:
+    """Get the law effect categories that apply to an action type.
+
+    Args:
+        action_type: The action type of a GameContext
+
+    Returns:
+        Categories of the laws that apply to the action
+    """
+    action_lower = action_type.lower()
+    return frozenset(
+        category for keyword, category in _ACTION_KEYWORDS if keyword in action_lower
+    )
+
 
 def _validate_non_empty_string(value: str, field_name: str) -> str:
     """Validate that a string is not None or empty after stripping whitespace."""
@@ -65,46 +126,23 @@ class ActiveLaw:
             self.effect_description, "effect_description"
         )
 
+    @property
+    def effect_categories(self) -> frozenset[str]:
+        """Categories of this law's effect, classified once per effect text."""
+        return classify_law_effect(self.effect_description)
+
     def applies_to_context(self, context: GameContext) -> bool:
         """Check if this law applies to the given game context."""
-        # Basic implementation - concrete laws should override this
-        # For now, match based on simple keywords in effect description
-        effect_lower = self.effect_description.lower()
-        action_lower = context.action_type.lower()
-
-        # Technology-related laws
-        if self._is_technology_related(effect_lower) and "research" in action_lower:
-            return True
-
-        # Fleet-related laws
-        if "fleet" in effect_lower and (
-            "fleet_pool" in action_lower or "fleet_pool_management" in action_lower
-        ):
-            return True
-
-        # PDS-related laws
-        if "pds" in effect_lower and "pds_placement" in action_lower:
-            return True
-
-        # Movement-related laws
-        if "movement" in effect_lower and "movement" in action_lower:
-            return True
-        if "wormhole" in effect_lower and "movement" in action_lower:
-            return True
-
-        # Combat-related laws
-        if "combat" in effect_lower and "combat" in action_lower:
-            return True
-        if "destroyed" in effect_lower and "combat" in action_lower:
-            return True
-        if "reinforcements" in effect_lower and "combat" in action_lower:
-            return True
-
-        return False
+        # Basic implementation - concrete laws should override this.
+        # A law applies when its effect category matches the action type,
+        # e.g. technology laws apply to research actions.
+        return not self.effect_categories.isdisjoint(
+            classify_action_type(context.action_type)
+        )
 
     def _is_technology_related(self, effect_text: str) -> bool:
         """Check if the effect text is technology-related."""
-        return "technology" in effect_text or "tech" in effect_text
+        return "technology" in classify_law_effect(effect_text)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize ActiveLaw to dictionary for persistence."""
@@ -163,6 +201,14 @@ class LawManager:
     def __init__(self) -> None:
         """Initialize empty law manager."""
         self._active_laws: list[ActiveLaw] = []
+        # Lookup structures over _active_laws, rebuilt lazily after changes
+        self._index_valid_for: int | None = None
+        self._laws_by_category: dict[str, list[ActiveLaw]] = {}
+        self._laws_by_player: dict[str, list[ActiveLaw]] = {}
+        # Laws overriding applies_to_context(); checked for every context
+        self._unindexed_laws: list[ActiveLaw] = []
+        self._position: dict[int, int] = {}
+        self._context_cache: dict[str, list[ActiveLaw]] = {}
 
     def get_active_laws(self) -> list[ActiveLaw]:
         """Get all currently active laws."""
@@ -207,6 +253,15 @@ class LawManager:
             self.remove_law(conflict.agenda_card.get_name())
 
         self._active_laws.append(active_law)
+        self._invalidate_index()
+
+    def restore_law(self, active_law: ActiveLaw) -> None:
+        """Add a previously enacted law (e.g. when loading a saved game).
+
+        Unlike enact_law(), no conflicting laws are removed.
+        """
+        self._active_laws.append(active_law)
+        self._invalidate_index()
 
     def _validate_enact_law_parameters(
         self,
@@ -235,6 +290,7 @@ class LawManager:
         for i, law in enumerate(self._active_laws):
             if law.agenda_card.get_name() == law_name:
                 del self._active_laws[i]
+                self._invalidate_index()
                 return True
 
         return False
@@ -256,8 +312,68 @@ class LawManager:
         return None
 
     def get_laws_affecting_context(self, context: GameContext) -> list[ActiveLaw]:
-        """Get laws that affect a specific game context."""
-        return [law for law in self._active_laws if law.applies_to_context(context)]
+        """Get laws that affect a specific game context.
+
+        Results per action type are cached until the active laws change, so
+        repeated checks cost O(applicable laws).
+        """
+        self._ensure_index()
+        laws = self._context_cache.get(context.action_type)
+        if laws is None:
+            laws = self._find_indexed_laws(context.action_type)
+            self._context_cache[context.action_type] = laws
+        if not self._unindexed_laws:
+            return laws.copy()
+
+        # Laws with their own applicability rules are checked every time
+        applicable = laws + [
+            law for law in self._unindexed_laws if law.applies_to_context(context)
+        ]
+        applicable.sort(key=lambda law: self._position[id(law)])
+        return applicable
+
+    def get_laws_affecting_player(self, player_id: str) -> list[ActiveLaw]:
+        """Get laws whose elected target is the given player."""
+        self._ensure_index()
+        return self._laws_by_player.get(player_id, []).copy()
+
+    def _find_indexed_laws(self, action_type: str) -> list[ActiveLaw]:
+        """Get indexed laws applying to an action type, in enactment order."""
+        categories = classify_action_type(action_type)
+        if len(categories) == 1:
+            (category,) = categories
+            return self._laws_by_category.get(category, []).copy()
+
+        found: dict[int, ActiveLaw] = {}
+        for category in categories:
+            for law in self._laws_by_category.get(category, ()):
+                found[id(law)] = law
+        return sorted(found.values(), key=lambda law: self._position[id(law)])
+
+    def _invalidate_index(self) -> None:
+        self._index_valid_for = None
+
+    def _ensure_index(self) -> None:
+        """Rebuild the lookup structures if the active laws changed."""
+        # The length check also catches laws appended to the list directly
+        if self._index_valid_for == len(self._active_laws):
+            return
+
+        self._laws_by_category = {}
+        self._laws_by_player = {}
+        self._unindexed_laws = []
+        self._position = {}
+        self._context_cache = {}
+        for position, law in enumerate(self._active_laws):
+            self._position[id(law)] = position
+            if law.elected_target is not None:
+                self._laws_by_player.setdefault(law.elected_target, []).append(law)
+            if type(law).applies_to_context is not ActiveLaw.applies_to_context:
+                self._unindexed_laws.append(law)
+                continue
+            for category in law.effect_categories:
+                self._laws_by_category.setdefault(category, []).append(law)
+        self._index_valid_for = len(self._active_laws)
 
     def get_laws_enacted_in_round(self, round_number: int) -> list[ActiveLaw]:
         """Get laws enacted in a specific round."""
@@ -346,6 +462,7 @@ class LawManager:
 
         # Enact the new law
         self._active_laws.append(new_law)
+        self._invalidate_index()
 
         # Create descriptive message
         if removed_laws:
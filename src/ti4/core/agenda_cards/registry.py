@@ -2,10 +2,99 @@
 Agenda card registry system.
 
 This module provides the registry for managing concrete agenda card implementations.
+
+Agenda cards hold only definition data, so the concrete cards are created once
+per process and shared: a standard registry (AgendaCardRegistry.create_standard)
+refers to the shared cards instead of creating its own, and a deck built from
+it keeps only its per-game card order. Cards that keep state of their own are
+still created per registry. warm_up_agenda_cards() creates the shared cards at
+startup.
 """
 
+from __future__ import annotations
+
+from collections.abc import Callable
+
 from .base import BaseAgendaCard
 
+# Process-wide agenda cards by name (see warm_up_agenda_cards)
+_shared_cards: dict[str, BaseAgendaCard] = {}
+
+# Concrete card classes take no arguments
+_CardTypes = tuple[Callable[[], BaseAgendaCard], ...]
+
+
+def _standard_card_types() -> tuple[_CardTypes, _CardTypes]:
+    """Get the agenda card classes: (shared, created per registry).
+
+    The placeholder Crown card is not an agenda card of the game.
+    """
+    # Import here to avoid circular imports
+    from .concrete.anti_intellectual_revolution import AntiIntellectualRevolution
+    from .concrete.classified_document_leaks import ClassifiedDocumentLeaks
+    from .concrete.committee_formation import CommitteeFormation
+    from .concrete.conventions_of_war import ConventionsOfWar
+    from .concrete.core_mining import CoreMining
+    from .concrete.crown_of_emphidia import CrownOfEmphidia
+    from .concrete.crown_of_thalnos import CrownOfThalnos
+    from .concrete.demilitarized_zone import DemilitarizedZone
+    from .concrete.enforced_travel_ban import EnforcedTravelBan
+    from .concrete.executive_sanctions import ExecutiveSanctions
+    from .concrete.fleet_regulations import FleetRegulations
+    from .concrete.holy_planet_of_ixth import HolyPlanetOfIxth
+    from .concrete.homeland_defense_act import HomelandDefenseAct
+    from .concrete.minister_of_commerce import MinisterOfCommerce
+    from .concrete.publicize_weapon_schematics import PublicizeWeaponSchematics
+    from .concrete.regulated_conscription import RegulatedConscription
+    from .concrete.research_team import ResearchTeam
+    from .concrete.senate_sanctuary import SenateSanctuary
+    from .concrete.shard_of_the_throne import ShardOfTheThrone
+    from .concrete.shared_research import SharedResearch
+    from .concrete.terraforming_initiative import TerraformingInitiative
+    from .concrete.wormhole_reconstruction import WormholeReconstruction
+
+    shared = (
+        AntiIntellectualRevolution,
+        ClassifiedDocumentLeaks,
+        ConventionsOfWar,
+        CoreMining,
+        CrownOfEmphidia,
+        CrownOfThalnos,
+        DemilitarizedZone,
+        EnforcedTravelBan,
+        ExecutiveSanctions,
+        FleetRegulations,
+        HolyPlanetOfIxth,
+        HomelandDefenseAct,
+        MinisterOfCommerce,
+        PublicizeWeaponSchematics,
+        RegulatedConscription,
+        ResearchTeam,
+        SenateSanctuary,
+        ShardOfTheThrone,
+        SharedResearch,
+        TerraformingInitiative,
+        WormholeReconstruction,
+    )
+    # Committee Formation tracks whether it has been discarded
+    per_registry = (CommitteeFormation,)
+    return shared, per_registry
+
+
+def warm_up_agenda_cards() -> int:
+    """
+    Create the shared agenda cards once, ahead of any game.
+
+    Returns:
+        Number of shared agenda cards
+    """
+    if not _shared_cards:
+        shared, _per_registry = _standard_card_types()
+        for card_type in shared:
+            card = card_type()
+            _shared_cards[card.get_name()] = card
+    return len(_shared_cards)
+
 
 class AgendaCardRegistry:
     """
@@ -19,6 +108,25 @@ class AgendaCardRegistry:
         """Initialize the agenda card registry."""
         self._cards: dict[str, BaseAgendaCard] = {}
 
+    @classmethod
+    def create_standard(cls) -> AgendaCardRegistry:
+        """
+        Create a registry of every implemented TI4 agenda card.
+
+        Shared cards are referenced rather than created (see
+        warm_up_agenda_cards); cards with state of their own are new.
+
+        Returns:
+            A new registry containing all implemented agenda cards
+        """
+        warm_up_agenda_cards()
+        registry = cls()
+        registry._cards.update(_shared_cards)
+        _shared, per_registry = _standard_card_types()
+        for card_type in per_registry:
+            registry.register_card(card_type())
+        return registry
+
     def register_card(self, card: BaseAgendaCard) -> None:
         """
         Register an agenda card implementation.
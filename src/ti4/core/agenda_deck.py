@@ -15,21 +15,15 @@ class AgendaDeck:
         self._initialize_deck()
 
     def _initialize_deck(self) -> None:
-        """Initialize the deck with sample agenda cards."""
-        # Add some sample agenda cards for testing
-        sample_cards = [
-            "Anti-Intellectual Revolution",
-            "Classified Document Leaks",
-            "Committee Formation",
-            "Conventions of War",
-            "Core Mining",
-            "Crown of Emphidia",
-            "Crown of Thalnos",
-            "Demilitarized Zone",
-            "Enforced Travel Ban",
-            "Executive Sanctions",
-        ]
-        self.cards = sample_cards.copy()
+        """Initialize the deck with the implemented agenda cards, by name.
+
+        The names come from the standard registry, which refers to the agenda
+        cards shared by all games.
+        """
+        # Import here to avoid circular imports
+        from .agenda_cards.registry import AgendaCardRegistry
+
+        self.cards = sorted(AgendaCardRegistry.create_standard().get_all_card_names())
 
     def look_at_top_cards(self, count: int) -> list[str]:
         """Look at the top cards of the agenda deck.
@@ -6,6 +6,8 @@ This module implements Rule 8: AGENDA PHASE mechanics according to the LRR.
 Key Components:
 - AgendaPhase: Main phase controller
 - VotingSystem: Handles voting mechanics and influence calculation
+- AgendaVotingEngine (agenda_voting module): Batch voting from an influence
+  snapshot taken once per agenda phase
 - AgendaCard: Represents agenda cards (laws and directives)
 - SpeakerSystem: Manages speaker privileges and tie-breaking
 
@@ -14,7 +16,7 @@ Note: CustodiansToken is imported from custodians_token module
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -22,6 +24,7 @@ from .constants import AgendaType
 from .custodians_token import CustodiansToken
 
 if TYPE_CHECKING:
+    from .agenda_voting import AgendaVotingEngine, BatchVotingResult, PlayerVote
     from .resource_management import ResourceManager
 
 # Voting orchestration imports removed - will be re-implemented via TDD
@@ -175,6 +178,8 @@ class VotingSystem:
     def __init__(self) -> None:
         self.player_votes: dict[str, str] = {}  # Track player vote outcomes
         self._vote_tally: dict[str, int] = {}
+        # Influence snapshot for the current agenda phase (see begin_agenda_phase)
+        self.voting_engine: AgendaVotingEngine | None = None
 
     def cast_votes(
         self,
@@ -314,6 +319,73 @@ class VotingSystem:
         """Reset all votes and tally for a new agenda."""
         self.player_votes.clear()
         self._vote_tally.clear()
+        if self.voting_engine is not None:
+            self.voting_engine.start_agenda()
+
+    def begin_agenda_phase(
+        self,
+        game_state: Any,
+        players: list[str],
+        speaker_system: SpeakerSystem | None = None,
+    ) -> AgendaVotingEngine:
+        """Snapshot every player's votable influence for this agenda phase.
+
+        Args:
+            game_state: Game state providing the players' planets
+            players: Player IDs in seating order
+            speaker_system: Speaker system, so the speaker votes last
+
+        Returns:
+            The voting engine used by cast_votes_batch() until
+            end_agenda_phase()
+        """
+        from .agenda_voting import AgendaVotingEngine
+
+        voting_order = (
+            self.get_voting_order(players, speaker_system)
+            if speaker_system is not None
+            else list(players)
+        )
+        self.voting_engine = AgendaVotingEngine(game_state, voting_order)
+        return self.voting_engine
+
+    def end_agenda_phase(self) -> None:
+        """Discard the influence snapshot of the agenda phase."""
+        self.voting_engine = None
+
+    def cast_votes_batch(
+        self,
+        votes: Iterable[PlayerVote],
+        agenda: AgendaCard | Any | None = None,
+        atomic: bool = False,
+    ) -> BatchVotingResult:
+        """Cast all players' votes on the current agenda as one batch.
+
+        Args:
+            votes: The players' votes (processed in voting order)
+            agenda: Optional agenda card for outcome validation
+            atomic: Cast no vote (and exhaust no planet) unless every vote
+                in the batch can be cast
+
+        Returns:
+            Per-player voting outcomes and the resulting tally
+
+        Raises:
+            VotingValidationError: If begin_agenda_phase() was not called
+        """
+        if self.voting_engine is None:
+            raise VotingValidationError(
+                "begin_agenda_phase() must be called before casting batch votes"
+            )
+        valid_outcomes = self._get_voting_outcomes_from_card(agenda) if agenda else None
+        result = self.voting_engine.cast_votes(votes, valid_outcomes, atomic)
+        for vote, outcome in result.outcomes:
+            if outcome.success and outcome.outcome is not None:
+                self.player_votes[vote.player_id] = outcome.outcome
+                self._vote_tally[outcome.outcome] = (
+                    self._vote_tally.get(outcome.outcome, 0) + outcome.votes_cast
+                )
+        return result
 
     def get_voting_order(
         self, players: list[str], speaker_system: SpeakerSystem
@@ -483,7 +555,9 @@ class VotingSystem:
         """Calculate available influence for voting using ResourceManager.
 
         Integrates with ResourceManager to get influence calculations that
-        exclude trade goods per Rule 47.3.
+        exclude trade goods per Rule 47.3. The total comes from the economy
+        ledger's running influence total, so no planets are walked. During an
+        agenda phase started with begin_agenda_phase() the snapshot is used.
 
         Args:
             player_id: The player ID
@@ -492,6 +566,9 @@ class VotingSystem:
         Returns:
             Total influence available for voting (planets only, no trade goods)
         """
+        engine = self.voting_engine
+        if engine is not None and player_id in engine.voting_order:
+            return engine.get_votable_influence(player_id)
         try:
             influence: int = resource_manager.calculate_available_influence(
                 player_id, for_voting=True
@@ -801,6 +878,7 @@ class AgendaPhase:
         voting_system: VotingSystem,
         players: list[str],
         voting_callback: Callable[[VoteResult], VoteResult] | None = None,
+        votes: Iterable[PlayerVote] | None = None,
     ) -> AgendaPhaseResult:
         """
         Resolve the first agenda of the phase using the voting orchestration system.
@@ -808,6 +886,20 @@ class AgendaPhase:
         LRR 8.2: The speaker reveals the top agenda card from the agenda deck.
 
         Flow: reveal → reset_votes → external voting window → tally/resolve
+
+        Args:
+            agenda_deck: The agenda deck to draw from
+            speaker_system: The speaker system for tie resolution
+            voting_system: The voting system for vote management
+            players: List of player IDs in the game
+            voting_callback: Optional callback for handling voting window
+            votes: Optional votes of all players, cast as one atomic batch
+                with cast_votes_batch() (requires
+                voting_system.begin_agenda_phase(), which
+                execute_complete_phase() calls)
+
+        Returns:
+            AgendaPhaseResult indicating success/failure and details
         """
         # Validate inputs
         if agenda_deck is None:
@@ -835,6 +927,12 @@ class AgendaPhase:
         # Start voting process (triggers before_players_vote timing window)
         self.start_voting(agenda)
 
+        # Votes supplied up front are cast as one batch from the phase snapshot
+        if votes is not None:
+            failure = self._cast_batch_votes(voting_system, votes, agenda)
+            if failure is not None:
+                return failure
+
         # TODO: Implement voting orchestration system via TDD
         # For now, use simplified voting approach
         # orchestration_result = self.voting_orchestrator.start_voting_session(
@@ -893,6 +991,7 @@ class AgendaPhase:
         voting_system: VotingSystem,
         players: list[str],
         voting_callback: Callable[[VoteResult], VoteResult] | None = None,
+        votes: Iterable[PlayerVote] | None = None,
     ) -> AgendaPhaseResult:
         """
         Resolve the second agenda of the agenda phase.
@@ -903,6 +1002,10 @@ class AgendaPhase:
             voting_system: The voting system for vote management
             players: List of player IDs in the game
             voting_callback: Optional callback for handling voting window
+            votes: Optional votes of all players, cast as one atomic batch
+                with cast_votes_batch() (requires
+                voting_system.begin_agenda_phase(), which
+                execute_complete_phase() calls)
 
         Returns:
             AgendaPhaseResult indicating success/failure and details
@@ -928,6 +1031,12 @@ class AgendaPhase:
         # Start voting process (triggers before_players_vote timing window)
         self.start_voting(agenda)
 
+        # Votes supplied up front are cast as one batch from the phase snapshot
+        if votes is not None:
+            failure = self._cast_batch_votes(voting_system, votes, agenda)
+            if failure is not None:
+                return failure
+
         # TODO: Implement voting orchestration system via TDD
         # For now, use simplified voting approach
         # orchestration_result = self.voting_orchestrator.start_voting_session(
@@ -980,6 +1089,32 @@ class AgendaPhase:
             error_message=outcome_result.error_message,
         )
 
+    def _cast_batch_votes(
+        self,
+        voting_system: VotingSystem,
+        votes: Iterable[PlayerVote],
+        agenda: AgendaCard | Any,
+    ) -> AgendaPhaseResult | None:
+        """Cast all votes on an agenda at once.
+
+        Returns:
+            A failed result if any vote could not be cast (then no vote is
+            cast), otherwise None
+        """
+        try:
+            batch_result = voting_system.cast_votes_batch(votes, agenda, atomic=True)
+        except VotingValidationError as e:
+            return AgendaPhaseResult(
+                success=False, agenda_revealed=agenda, error_message=str(e)
+            )
+        if batch_result.success:
+            return None
+        return AgendaPhaseResult(
+            success=False,
+            agenda_revealed=agenda,
+            error_message="Voting failed: " + "; ".join(batch_result.get_errors()),
+        )
+
     def ready_all_planets(
         self, players_planets: dict[str, list[Any]]
     ) -> AgendaPhaseResult:
@@ -1370,6 +1505,8 @@ class AgendaPhase:
         game_state: Any,
         custodians: CustodiansToken | None = None,
         voting_callback: Callable[[VoteResult], VoteResult] | None = None,
+        first_votes: Iterable[PlayerVote] | None = None,
+        second_votes: Iterable[PlayerVote] | None = None,
     ) -> AgendaPhaseResult:
         """
         Execute the complete agenda phase sequence with voting orchestration support.
@@ -1381,6 +1518,13 @@ class AgendaPhase:
             game_state: The current game state
             custodians: The custodians token (optional)
             voting_callback: Optional callback to handle voting windows interactively
+            first_votes: Optional votes of all players on the first agenda
+            second_votes: Optional votes of all players on the second agenda
+
+        When votes are given, the players' votable influence is snapshot once
+        for the phase (VotingSystem.begin_agenda_phase) and released after
+        planets are readied. Games without get_agenda_deck() draw from a
+        shuffled deck of the shared agenda cards (AgendaDeck.create_standard).
         """
         if custodians is None:
             custodians = getattr(game_state, "get_custodians_token", lambda: None)()
@@ -1402,22 +1546,21 @@ class AgendaPhase:
             game_state, "get_players", lambda: ["player1", "player2", "player3"]
         )()
 
-        class _DefaultAgendaDeck:
-            def draw_top_card(self) -> AgendaCard:
-                return AgendaCard(
-                    name="Mock Agenda",
-                    agenda_type=AgendaType.LAW,
-                    outcomes=["For", "Against"],
-                )
-
-        agenda_deck = getattr(
-            game_state, "get_agenda_deck", lambda: _DefaultAgendaDeck()
-        )()
+        agenda_deck = getattr(game_state, "get_agenda_deck", _standard_agenda_deck)()
 
+        batch_voting = first_votes is not None or second_votes is not None
         try:
+            if batch_voting:
+                voting_system.begin_agenda_phase(game_state, players, speaker_system)
+
             # Execute first agenda with voting orchestration
             first_result = self.resolve_first_agenda(
-                agenda_deck, speaker_system, voting_system, players, voting_callback
+                agenda_deck,
+                speaker_system,
+                voting_system,
+                players,
+                voting_callback,
+                first_votes,
             )
 
             if not first_result.success:
@@ -1425,7 +1568,12 @@ class AgendaPhase:
 
             # Execute second agenda with voting orchestration
             second_result = self.resolve_second_agenda(
-                agenda_deck, speaker_system, voting_system, players, voting_callback
+                agenda_deck,
+                speaker_system,
+                voting_system,
+                players,
+                voting_callback,
+                second_votes,
             )
 
             if not second_result.success:
@@ -1462,6 +1610,9 @@ class AgendaPhase:
             return AgendaPhaseResult(
                 success=False, error_message=f"Agenda phase execution failed: {str(e)}"
             )
+        finally:
+            if batch_voting:
+                voting_system.end_agenda_phase()
 
     def execute_complete_phase_with_concrete_cards(self, game_state: Any) -> Any:
         """Execute complete agenda phase workflow with concrete cards."""
@@ -1492,3 +1643,16 @@ class AgendaPhase:
     def set_timing_window_callback(self, callback: Any) -> None:
         """Set timing window callback for testing."""
         self._timing_window_callback = callback
+
+
+def _standard_agenda_deck() -> Any:
+    """Create a shuffled deck of the shared agenda cards.
+
+    Used by games that do not provide their own agenda deck.
+    """
+    # Import here to avoid circular imports
+    from .agenda_cards.deck import AgendaDeck
+
+    deck = AgendaDeck.create_standard()
+    deck.shuffle()
+    return deck
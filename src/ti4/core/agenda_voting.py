@@ -0,0 +1,396 @@
+"""Batch agenda voting for Rule 8: AGENDA PHASE.
+
+Per-vote voting (VotingSystem.cast_votes_with_resource_manager) builds
+influence totals and spending plans from scratch for every player and every
+agenda. AgendaVotingEngine instead snapshots each player's votable influence
+once per agenda phase:
+
+- Votable influence is the influence of ready planets only; trade goods
+  cannot be spent on votes (Rule 47.3).
+- Planets exhausted to vote on the first agenda stay exhausted for the
+  second (they are readied after the second agenda, LRR 8.4), so the
+  snapshot is reduced as votes are cast rather than rebuilt.
+- Votes are processed as one batch in voting order (speaker last, LRR 80.2)
+  and added to running tallies.
+- An atomic batch (cast_votes(..., atomic=True)) is cast in full or not at
+  all, so an agenda is never left half-voted.
+- what_if() tallies hypothetical votes from the same snapshot without
+  exhausting planets, so agents can compare many vote splits cheaply.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .agenda_phase import VotingOutcome
+from .resource_management import PlanetSelection, SpendingPlanner
+
+_NOT_CAST = "Vote not cast because another vote in the batch failed"
+
+
+@dataclass(frozen=True)
+class PlayerVote:
+    """A player's votes on the current agenda.
+
+    A vote without an outcome (or with no influence) is an abstention.
+    """
+
+    player_id: str
+    outcome: str | None
+    influence: int = 0
+
+    @property
+    def abstains(self) -> bool:
+        """Whether the player casts no votes."""
+        return self.outcome is None or self.influence <= 0
+
+
+@dataclass
+class BatchVotingResult:
+    """Result of casting a batch of votes."""
+
+    # (vote, outcome) pairs in the order the votes were processed
+    outcomes: list[tuple[PlayerVote, VotingOutcome]] = field(default_factory=list)
+    vote_tally: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        """Whether every vote in the batch was cast."""
+        return all(outcome.success for _, outcome in self.outcomes)
+
+    def get_outcome(self, player_id: str) -> VotingOutcome | None:
+        """Get the outcome of a player's first vote in the batch."""
+        for vote, outcome in self.outcomes:
+            if vote.player_id == player_id:
+                return outcome
+        return None
+
+    def get_errors(self) -> list[str]:
+        """Get the error messages of the votes that failed."""
+        return [
+            outcome.error_message or "Vote failed"
+            for _, outcome in self.outcomes
+            if not outcome.success
+        ]
+
+
+class _VotingPower:
+    """The ready influence planets one player can still vote with."""
+
+    __slots__ = ("planets", "_planner")
+
+    def __init__(self, planets: Iterable[Any]) -> None:
+        self.planets: dict[str, Any] = {
+            planet.name: planet
+            for planet in planets
+            if planet.can_spend_influence() and planet.influence > 0
+        }
+        self._planner: SpendingPlanner | None = None
+
+    @property
+    def total(self) -> int:
+        return sum(planet.influence for planet in self.planets.values())
+
+    def plan(self, influence: int) -> PlanetSelection:
+        """Select the planets to exhaust for at least ``influence`` votes."""
+        if self._planner is None:
+            # Prefer keeping planets with high resources ready
+            self._planner = SpendingPlanner(
+                {name: planet.influence for name, planet in self.planets.items()},
+                trade_goods=0,
+                preserved_values={
+                    name: planet.resources for name, planet in self.planets.items()
+                },
+            )
+        return self._planner.plan(influence)
+
+    def spend(self, planet_names: Iterable[str]) -> None:
+        for name in planet_names:
+            del self.planets[name]
+        self._planner = None
+
+    def restore(self, planets: Iterable[Any]) -> None:
+        """Make readied planets available for voting again."""
+        for planet in planets:
+            self.planets[planet.name] = planet
+        self._planner = None
+
+
+class AgendaVotingEngine:
+    """Votable influence snapshot and vote tallies for one agenda phase."""
+
+    def __init__(self, game_state: Any, voting_order: Iterable[str]) -> None:
+        """Snapshot the votable influence of every voting player.
+
+        Args:
+            game_state: Game state providing ``get_player_planets``
+            voting_order: Player IDs in the order they vote (speaker last)
+        """
+        self.game_state = game_state
+        self._voting_order = tuple(voting_order)
+        self._order_index = {
+            player_id: index for index, player_id in enumerate(self._voting_order)
+        }
+        self._power = {
+            player_id: _VotingPower(game_state.get_player_planets(player_id))
+            for player_id in self._voting_order
+        }
+        self._voted: set[str] = set()
+        self._tally: dict[str, int] = {}
+
+    @property
+    def voting_order(self) -> tuple[str, ...]:
+        """Player IDs in voting order."""
+        return self._voting_order
+
+    def get_votable_influence(self, player_id: str) -> int:
+        """Get the influence a player can still spend on votes.
+
+        Args:
+            player_id: The player ID
+
+        Returns:
+            Total influence of the player's ready planets (no trade goods)
+        """
+        power = self._power.get(player_id)
+        return power.total if power is not None else 0
+
+    def has_voted(self, player_id: str) -> bool:
+        """Check whether a player has voted (or abstained) on this agenda."""
+        return player_id in self._voted
+
+    def get_vote_tally(self) -> dict[str, int]:
+        """Get the votes cast for each outcome of the current agenda."""
+        return self._tally.copy()
+
+    def start_agenda(self) -> None:
+        """Clear the tallies for the next agenda; spent influence stays spent."""
+        self._voted.clear()
+        self._tally.clear()
+
+    def refresh_player(self, player_id: str) -> None:
+        """Re-read a player's ready planets after changes outside the engine."""
+        if player_id in self._power:
+            self._power[player_id] = _VotingPower(
+                self.game_state.get_player_planets(player_id)
+            )
+
+    def cast_votes(
+        self,
+        votes: Iterable[PlayerVote],
+        valid_outcomes: Collection[str] | None = None,
+        atomic: bool = False,
+    ) -> BatchVotingResult:
+        """Cast a batch of votes in voting order.
+
+        Each vote exhausts the planets whose influence covers it with the
+        smallest overspend; the votes cast are the total influence of the
+        exhausted planets. Invalid votes fail without affecting the others,
+        unless the batch is atomic.
+
+        Args:
+            votes: Votes of players who have not voted on this agenda yet
+            valid_outcomes: Outcomes of the agenda (None to accept any)
+            atomic: Cast no vote unless every vote in the batch can be cast
+
+        Returns:
+            The outcome of each vote (in voting order) and the tally
+        """
+        ordered = self._in_voting_order(votes)
+        if atomic:
+            return self._cast_atomically(ordered, valid_outcomes)
+        result = BatchVotingResult()
+        for vote in ordered:
+            error = self._validate(vote, self._voted, valid_outcomes)
+            if error is not None:
+                outcome = VotingOutcome(success=False, error_message=error)
+            else:
+                outcome, _exhausted = self._cast(vote)
+            result.outcomes.append((vote, outcome))
+        result.vote_tally = self.get_vote_tally()
+        return result
+
+    def what_if(
+        self,
+        votes: Iterable[PlayerVote],
+        valid_outcomes: Collection[str] | None = None,
+    ) -> dict[str, int]:
+        """Tally hypothetical votes on top of the votes already cast.
+
+        Nothing is exhausted and no state changes.
+
+        Args:
+            votes: Hypothetical votes of players who have not voted yet
+            valid_outcomes: Outcomes of the agenda (None to accept any)
+
+        Returns:
+            The resulting votes for each outcome
+
+        Raises:
+            ValueError: If a hypothetical vote could not be cast
+        """
+        tally = self._tally.copy()
+        voted = set(self._voted)
+        for vote in self._in_voting_order(votes):
+            error = self._validate(vote, voted, valid_outcomes)
+            if error is not None:
+                raise ValueError(error)
+            voted.add(vote.player_id)
+            if vote.abstains:
+                continue
+            assert vote.outcome is not None
+            votes_cast = self._power[vote.player_id].plan(vote.influence).total_value
+            tally[vote.outcome] = tally.get(vote.outcome, 0) + votes_cast
+        return tally
+
+    def evaluate_vote_splits(
+        self,
+        splits: Iterable[Iterable[PlayerVote]],
+        valid_outcomes: Collection[str] | None = None,
+    ) -> list[dict[str, int]]:
+        """Tally several alternative sets of hypothetical votes.
+
+        Args:
+            splits: Alternative vote sets, each evaluated independently
+            valid_outcomes: Outcomes of the agenda (None to accept any)
+
+        Returns:
+            One tally per vote set, in the same order
+        """
+        return [self.what_if(votes, valid_outcomes) for votes in splits]
+
+    def _in_voting_order(self, votes: Iterable[PlayerVote]) -> list[PlayerVote]:
+        # Unknown players sort last; they fail validation
+        last = len(self._voting_order)
+        return sorted(
+            votes, key=lambda vote: self._order_index.get(vote.player_id, last)
+        )
+
+    def _validate(
+        self,
+        vote: PlayerVote,
+        voted: set[str],
+        valid_outcomes: Collection[str] | None,
+    ) -> str | None:
+        """Return why a vote cannot be cast, or None if it can."""
+        power = self._power.get(vote.player_id)
+        if power is None:
+            return f"Player {vote.player_id} is not voting on this agenda"
+        if vote.player_id in voted:
+            return f"Player {vote.player_id} has already voted for this agenda"
+        if vote.abstains:
+            return None
+        if valid_outcomes is not None and vote.outcome not in valid_outcomes:
+            return f"Invalid outcome '{vote.outcome}' for agenda"
+        available = power.total
+        if vote.influence > available:
+            return (
+                f"Insufficient influence for voting: need {vote.influence}, "
+                f"have {available} (trade goods cannot be used for voting per "
+                "Rule 47.3)"
+            )
+        return None
+
+    def _cast_atomically(
+        self,
+        votes: list[PlayerVote],
+        valid_outcomes: Collection[str] | None,
+    ) -> BatchVotingResult:
+        """Cast every vote, or none if any of them fails."""
+        voted = set(self._voted)
+        errors: list[str | None] = []
+        for vote in votes:
+            errors.append(self._validate(vote, voted, valid_outcomes))
+            voted.add(vote.player_id)
+
+        if not any(errors):
+            cast: list[tuple[PlayerVote, VotingOutcome, list[Any]]] = []
+            for index, vote in enumerate(votes):
+                outcome, exhausted = self._cast(vote)
+                if not outcome.success:
+                    # Exhausting failed after validation; undo the batch
+                    for done in reversed(cast):
+                        self._undo(*done)
+                    errors[index] = outcome.error_message or "Vote failed"
+                    break
+                cast.append((vote, outcome, exhausted))
+            else:
+                return BatchVotingResult(
+                    outcomes=[(vote, outcome) for vote, outcome, _ in cast],
+                    vote_tally=self.get_vote_tally(),
+                )
+
+        return BatchVotingResult(
+            outcomes=[
+                (vote, VotingOutcome(success=False, error_message=error or _NOT_CAST))
+                for vote, error in zip(votes, errors, strict=True)
+            ],
+            vote_tally=self.get_vote_tally(),
+        )
+
+    def _cast(self, vote: PlayerVote) -> tuple[VotingOutcome, list[Any]]:
+        """Exhaust planets for a validated vote and add it to the tally.
+
+        Returns:
+            The outcome and the planets exhausted for it
+        """
+        self._voted.add(vote.player_id)
+        if vote.abstains:
+            return VotingOutcome(success=True, votes_cast=0), []
+        assert vote.outcome is not None
+
+        power = self._power[vote.player_id]
+        selection = power.plan(vote.influence)
+        planets = [power.planets[name] for name in selection.planets_to_exhaust]
+        if not all(planet.can_spend_influence() for planet in planets):
+            # A planet was exhausted outside the engine; plan again from scratch
+            self.refresh_player(vote.player_id)
+            power = self._power[vote.player_id]
+            if vote.influence > power.total:
+                self._voted.discard(vote.player_id)
+                outcome = VotingOutcome(
+                    success=False,
+                    error_message=(
+                        f"Insufficient influence for voting: need {vote.influence}, "
+                        f"have {power.total}"
+                    ),
+                )
+                return outcome, []
+            selection = power.plan(vote.influence)
+            planets = [power.planets[name] for name in selection.planets_to_exhaust]
+
+        exhausted: list[Any] = []
+        try:
+            for planet in planets:
+                planet.exhaust()
+                exhausted.append(planet)
+        except Exception as exc:
+            for planet in exhausted:
+                planet.ready()
+            self._voted.discard(vote.player_id)
+            return VotingOutcome(success=False, error_message=str(exc)), []
+
+        power.spend(selection.planets_to_exhaust)
+        votes_cast = selection.total_value
+        self._tally[vote.outcome] = self._tally.get(vote.outcome, 0) + votes_cast
+        outcome = VotingOutcome(
+            success=True, votes_cast=votes_cast, outcome=vote.outcome
+        )
+        return outcome, exhausted
+
+    def _undo(
+        self, vote: PlayerVote, outcome: VotingOutcome, exhausted: list[Any]
+    ) -> None:
+        """Ready the planets of a cast vote and remove it from the tally."""
+        for planet in exhausted:
+            planet.ready()
+        self._power[vote.player_id].restore(exhausted)
+        if outcome.outcome is not None:
+            remaining = self._tally[outcome.outcome] - outcome.votes_cast
+            if remaining:
+                self._tally[outcome.outcome] = remaining
+            else:
+                del self._tally[outcome.outcome]
+        self._voted.discard(vote.player_id)
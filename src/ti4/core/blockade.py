@@ -2,13 +2,23 @@
 
 This module implements Rule 14: BLOCKADED mechanics according to the TI4 LRR.
 Handles blockade detection, production restrictions, unit return, and capture prevention.
+
+Blockade status is checked per production unit, often for every unit of a
+production step. Rather than searching the galaxy for the unit's system and
+scanning its ships on each check, BlockadeIndex keeps each system's ship
+owners and production units, and from them the blockaded systems of each
+player with their blockaders. Only systems that report a change (units placed
+or removed in space or on planets, see System.add_occupancy_listener) are
+re-read. The index of a galaxy is shared by all blockade managers using it
+(get_blockade_index).
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
 
-from .constants import UnitType
+from .constants import GameConstants, UnitType
 
 if TYPE_CHECKING:
     from .capture import CaptureManager
@@ -16,6 +26,142 @@ if TYPE_CHECKING:
     from .system import System
     from .unit import Unit
 
+# Rule 14.0: units with production (space docks) can be blockaded
+PRODUCTION_UNIT_TYPES = frozenset({UnitType.SPACE_DOCK})
+
+
+class BlockadeIndex:
+    """Blockade status of the production units of a galaxy (Rule 14.0)."""
+
+    def __init__(self, systems: Mapping[str, Any]) -> None:
+        """Initialize the index; systems are read on first use.
+
+        Args:
+            systems: System objects by ID
+        """
+        self.systems = systems
+        self._reset()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> None:
+        # Derived data: a copied galaxy builds its own index on demand
+        return None
+
+    def _reset(self) -> None:
+        self._known_count = len(self.systems)
+        self._dirty: set[str] = set(self.systems)
+        # id(unit) -> (unit, system ID) for production units
+        self._unit_system: dict[int, tuple[Any, str]] = {}
+        self._production_units: dict[str, tuple[Any, ...]] = {}
+        # player -> blockaded system -> blockading players
+        self._blockaded: dict[str, dict[str, frozenset[str]]] = {}
+        self._system_of: dict[Any, str] = {}
+
+    def on_occupancy_changed(self, source: Any) -> None:
+        """Mark the system of a changed system or planet for re-reading."""
+        system_id = self._system_of.get(source)
+        if system_id is not None:
+            self._dirty.add(system_id)
+
+    def invalidate(self) -> None:
+        """Re-read every system."""
+        self._reset()
+
+    def get_unit_system_id(self, unit: Any) -> str | None:
+        """Get the system containing a production unit, if any."""
+        self._refresh()
+        entry = self._unit_system.get(id(unit))
+        if entry is None or entry[0] is not unit:
+            return None
+        return entry[1]
+
+    def get_blockading_players(self, unit: Any) -> frozenset[str]:
+        """Get the players blockading a production unit (empty if none)."""
+        system_id = self.get_unit_system_id(unit)
+        if system_id is None:
+            return frozenset()
+        return self._blockaded.get(unit.owner, {}).get(system_id, frozenset())
+
+    def is_unit_blockaded(self, unit: Any) -> bool:
+        """Check whether a production unit is blockaded."""
+        return bool(self.get_blockading_players(unit))
+
+    def get_blockaded_systems(self, player_id: str) -> dict[str, frozenset[str]]:
+        """Get a player's blockaded systems with their blockading players."""
+        self._refresh()
+        return dict(self._blockaded.get(player_id, {}))
+
+    def _refresh(self) -> None:
+        if len(self.systems) != self._known_count:
+            self._reset()
+        while self._dirty:
+            system_id = self._dirty.pop()
+            self._forget(system_id)
+            system = self.systems.get(system_id)
+            if system is not None:
+                self._read_system(system_id, system)
+
+    def _forget(self, system_id: str) -> None:
+        for unit in self._production_units.pop(system_id, ()):
+            self._unit_system.pop(id(unit), None)
+            blockaded = self._blockaded.get(unit.owner)
+            if blockaded is not None:
+                blockaded.pop(system_id, None)
+                if not blockaded:
+                    del self._blockaded[unit.owner]
+
+    def _read_system(self, system_id: str, system: Any) -> None:
+        self._observe(system_id, system)
+        ship_owners = frozenset(
+            unit.owner
+            for unit in system.space_units
+            if unit.unit_type in GameConstants.SHIP_TYPES
+        )
+        located = list(system.space_units)
+        for planet in system.planets:
+            located.extend(planet.units)
+        production_units = tuple(
+            unit for unit in located if unit.unit_type in PRODUCTION_UNIT_TYPES
+        )
+        self._production_units[system_id] = production_units
+        for unit in production_units:
+            self._unit_system[id(unit)] = (unit, system_id)
+            # Rule 14.0: enemy ships and no friendly ships
+            if ship_owners and unit.owner not in ship_owners:
+                self._blockaded.setdefault(unit.owner, {})[system_id] = ship_owners
+
+    def _observe(self, system_id: str, system: Any) -> None:
+        if hasattr(system, "add_occupancy_listener"):
+            system.add_occupancy_listener(self)
+            self._system_of[system] = system_id
+        for planet in system.planets:
+            if hasattr(planet, "add_occupancy_listener"):
+                planet.add_occupancy_listener(self)
+                self._system_of[planet] = system_id
+
+
+def get_blockade_index(galaxy: Galaxy) -> BlockadeIndex:
+    """Get the blockade index of a galaxy.
+
+    The index is cached on the galaxy and rebuilt when systems are
+    registered.
+
+    Args:
+        galaxy: The galaxy
+
+    Returns:
+        The blockade index (created on first use)
+    """
+    systems = galaxy.system_objects
+    index = getattr(galaxy, "_blockade_index", None)
+    if isinstance(index, BlockadeIndex) and index.systems is systems:
+        return index
+    index = BlockadeIndex(systems)
+    try:
+        object.__setattr__(galaxy, "_blockade_index", index)
+    except AttributeError:
+        pass
+    return index
+
 
 class BlockadeManager:
     """Manages blockade mechanics according to Rule 14.
@@ -64,16 +210,8 @@ class BlockadeManager:
         if self._galaxy is None:
             return False
 
-        # Find the system containing this unit
-        unit_system = self._find_unit_system(unit)
-        if unit_system is None:
-            return False
-
         # Rule 14.0: Blockaded if system contains enemy ships but no friendly ships
-        has_friendly_ships = self._system_has_friendly_ships(unit_system, unit.owner)
-        has_enemy_ships = self._system_has_enemy_ships(unit_system, unit.owner)
-
-        return has_enemy_ships and not has_friendly_ships
+        return get_blockade_index(self._galaxy).is_unit_blockaded(unit)
 
     def can_produce_ships(self, unit: Unit) -> bool:
         """Check if a unit can produce ships according to Rule 14.1.
@@ -130,17 +268,13 @@ class BlockadeManager:
         if self._galaxy is None:
             return True
 
-        # Find systems where capturing player has blockaded production units
-        blockaded_systems = self._find_blockaded_systems_for_player(capturing_player)
-
-        for system in blockaded_systems:
-            # Check if target unit's owner is blockading this system
-            if self._is_player_blockading_system(
-                target_unit.owner, system, capturing_player
-            ):
-                return False
-
-        return True
+        # Systems where capturing player has blockaded production units
+        blockaded_systems = get_blockade_index(self._galaxy).get_blockaded_systems(
+            capturing_player
+        )
+        return not any(
+            target_unit.owner in blockaders for blockaders in blockaded_systems.values()
+        )
 
     def get_blockading_players(self, unit: Unit) -> set[str]:
         """Get the set of players blockading the given unit.
@@ -151,23 +285,27 @@ class BlockadeManager:
         Returns:
             Set of player IDs who are blockading the unit
         """
-        if not self.is_unit_blockaded(unit):
+        if unit is None or self._galaxy is None:
             return set()
-
-        if self._galaxy is None:
+        if not self._has_production_ability(unit):
             return set()
 
-        unit_system = self._find_unit_system(unit)
-        if unit_system is None:
-            return set()
+        # Enemy players with ships in the unit's system
+        return set(get_blockade_index(self._galaxy).get_blockading_players(unit))
 
-        # Find all enemy players with ships in the system
-        blockading_players = set()
-        for space_unit in unit_system.space_units:
-            if space_unit.owner != unit.owner:
-                blockading_players.add(space_unit.owner)
+    def get_blockaded_systems(self, player_id: str) -> dict[str, set[str]]:
+        """Get the systems where a player's production units are blockaded.
 
-        return blockading_players
+        Args:
+            player_id: The player to check
+
+        Returns:
+            Blockaded system IDs with the players blockading each
+        """
+        if self._galaxy is None:
+            return {}
+        blockaded = get_blockade_index(self._galaxy).get_blockaded_systems(player_id)
+        return {system_id: set(players) for system_id, players in blockaded.items()}
 
     def _has_production_ability(self, unit: Unit) -> bool:
         """Check if a unit has production ability.
@@ -179,7 +317,7 @@ class BlockadeManager:
             True if unit has production ability
         """
         # Space docks have production ability
-        return unit.unit_type == UnitType.SPACE_DOCK
+        return unit.unit_type in PRODUCTION_UNIT_TYPES
 
     def _find_unit_system(self, unit: Unit) -> System | None:
         """Find the system containing the given unit.
@@ -193,13 +331,14 @@ class BlockadeManager:
         if self._galaxy is None:
             return None
 
-        # Search all systems for the unit
-        for _system_id, system in self._galaxy.system_objects.items():
-            # Check space units
+        system_id = get_blockade_index(self._galaxy).get_unit_system_id(unit)
+        if system_id is not None:
+            return self._galaxy.system_objects.get(system_id)
+
+        # Units without production are not indexed
+        for system in self._galaxy.system_objects.values():
             if unit in system.space_units:
                 return system
-
-            # Check planet units
             for planet in system.planets:
                 if unit in planet.units:
                     return system
@@ -245,16 +384,7 @@ class BlockadeManager:
         Returns:
             True if unit is a ship
         """
-        ship_types = {
-            UnitType.CARRIER,
-            UnitType.CRUISER,
-            UnitType.DESTROYER,
-            UnitType.DREADNOUGHT,
-            UnitType.FIGHTER,
-            UnitType.FLAGSHIP,
-            UnitType.WAR_SUN,
-        }
-        return unit.unit_type in ship_types
+        return unit.unit_type in GameConstants.SHIP_TYPES
 
     def _return_captured_units_from_player(
         self, capturing_player: str, original_owner: str
@@ -289,20 +419,12 @@ class BlockadeManager:
         if self._galaxy is None:
             return []
 
-        blockaded_systems = []
-        for _system_id, system in self._galaxy.system_objects.items():
-            # Check for player's production units in this system
-            for planet in system.planets:
-                for unit in planet.units:
-                    if (
-                        unit.owner == player_id
-                        and self._has_production_ability(unit)
-                        and self.is_unit_blockaded(unit)
-                    ):
-                        blockaded_systems.append(system)
-                        break
-
-        return blockaded_systems
+        blockaded = get_blockade_index(self._galaxy).get_blockaded_systems(player_id)
+        return [
+            self._galaxy.system_objects[system_id]
+            for system_id in blockaded
+            if system_id in self._galaxy.system_objects
+        ]
 
     def _is_player_blockading_system(
         self, potential_blockader: str, system: System, blockaded_player: str
@@ -290,38 +290,36 @@ class BombardmentSystem:
         if not planet_targets:
             raise ValueError("Bombardment targets must be declared before rolling")
 
-        results: dict[str, dict[str, Any]] = {}
+        from .pre_combat_rolls import PreCombatAbility, PreCombatRollBatch
 
-        for planet_name, bombardment_units in planet_targets.items():
+        # Validate every target before any die is rolled
+        planets = {}
+        for planet_name in planet_targets:
             planet = system.get_planet_by_name(planet_name)
             if not planet:
                 raise ValueError(f"Planet {planet_name} not found in system")
 
             # Check if planet can be bombarded (unless L1Z1X Harrow ability)
-            can_bombard = self.can_bombard_planet(planet)
-            if not can_bombard:
+            if not self.can_bombard_planet(planet):
                 # Check for L1Z1X Harrow ability exception
                 from .constants import Faction
 
-                if player_faction == Faction.L1Z1X:
-                    # L1Z1X can bombard through planetary shields with Harrow
-                    can_bombard = True
-                else:
+                # L1Z1X can bombard through planetary shields with Harrow
+                if player_faction != Faction.L1Z1X:
                     raise ValueError("Bombardment blocked by planetary shield")
+            planets[planet_name] = planet
 
-            total_hits = 0
-
-            # Roll for each bombardment unit
+        # Roll for every bombardment unit at once
+        technologies = list(player_technologies) if player_technologies else None
+        batch = PreCombatRollBatch()
+        for planet_name, bombardment_units in planet_targets.items():
             for unit in bombardment_units:
-                bombardment_value, dice_count = self._get_unit_bombardment_stats(unit)
-                if bombardment_value > 0:  # Unit has bombardment ability
-                    technologies: list[str | Technology] | None = (
-                        list(player_technologies) if player_technologies else None
-                    )
-                    roll = BombardmentRoll(bombardment_value, dice_count, technologies)
-                    dice_results = roll.roll_dice()
-                    hits = roll.calculate_hits(dice_results)
-                    total_hits += hits
+                batch.add_bombardment(unit, planet_name, technologies)
+        hits_by_planet = batch.roll().hits_by_target(PreCombatAbility.BOMBARDMENT)
+
+        results: dict[str, dict[str, Any]] = {}
+        for planet_name, planet in planets.items():
+            total_hits = hits_by_planet.get(planet_name, 0)
 
             # Assign hits to ground forces
             destroyed_units = []
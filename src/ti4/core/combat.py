@@ -16,6 +16,7 @@ from .unit_stats import UnitStatsProvider
 
 if TYPE_CHECKING:
     from .game_controller import GameController
+    from .pre_combat_rolls import PreCombatRollBatch
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -1151,8 +1152,53 @@ class CombatResolver:
 
         return self.perform_anti_fighter_barrage_enhanced(unit, target_units)
 
+    def add_anti_fighter_barrage_rolls(
+        self,
+        batch: PreCombatRollBatch,
+        units: list[Unit],
+        target_units: list[Unit],
+        target: str | None = None,
+    ) -> None:
+        """Add the AFB rolls of units to a batch of pre-combat rolls.
+
+        Units are validated as by perform_anti_fighter_barrage_enhanced;
+        units without AFB, or without fighters to target, roll no dice.
+
+        Args:
+            batch: The batch to add the rolls to
+            units: Units that may perform anti-fighter barrage
+            target_units: Potential target units
+            target: Player targeted by the rolls, if any
+
+        Raises:
+            InvalidGameStateError: If unit stats are corrupted
+            ValueError: If AFB parameters are invalid
+
+        LRR References:
+            - Rule 10: Anti-Fighter Barrage - covers AFB mechanics and timing
+        """
+        from .pre_combat_rolls import PreCombatAbility
+
+        for unit in units:
+            afb_params = self._validate_and_prepare_afb_with_error_handling(
+                unit, target_units
+            )
+            if afb_params is not None:
+                dice_count, afb_value = afb_params
+                batch.add(
+                    unit,
+                    PreCombatAbility.ANTI_FIGHTER_BARRAGE,
+                    dice_count,
+                    afb_value,
+                    target,
+                )
+
     def resolve_anti_fighter_barrage_phase(
-        self, system: System, attacker_id: str, defender_id: str
+        self,
+        system: System,
+        attacker_id: str,
+        defender_id: str,
+        batched: bool = False,
     ) -> AntiFighterBarrageResult:
         """Resolve AFB phase with comprehensive error handling.
 
@@ -1160,6 +1206,10 @@ class CombatResolver:
             system: The system where combat is occurring
             attacker_id: The attacking player ID
             defender_id: The defending player ID
+            batched: If True, roll every unit's AFB dice in one batch (see
+                pre_combat_rolls). Off by default: the unit-by-unit path
+                goes through perform_anti_fighter_barrage_enhanced, which
+                callers override or patch per unit, and batched rolls skip it
 
         Returns:
             AntiFighterBarrageResult with hits and destroyed fighters
@@ -1203,19 +1253,37 @@ class CombatResolver:
                 f"No units found for player '{defender_id}' in system"
             )
 
-        # Calculate AFB hits for attacker
-        attacker_hits = 0
-        for unit in attacker_units:
-            if unit.has_anti_fighter_barrage():
-                hits = self.perform_anti_fighter_barrage_enhanced(unit, defender_units)
-                attacker_hits += hits
-
-        # Calculate AFB hits for defender
-        defender_hits = 0
-        for unit in defender_units:
-            if unit.has_anti_fighter_barrage():
-                hits = self.perform_anti_fighter_barrage_enhanced(unit, attacker_units)
-                defender_hits += hits
+        if batched:
+            from .pre_combat_rolls import PreCombatRollBatch
+
+            batch = PreCombatRollBatch()
+            self.add_anti_fighter_barrage_rolls(
+                batch, attacker_units, defender_units, defender_id
+            )
+            self.add_anti_fighter_barrage_rolls(
+                batch, defender_units, attacker_units, attacker_id
+            )
+            hits_by_player = batch.roll().hits_by_player()
+            attacker_hits = hits_by_player.get(attacker_id, 0)
+            defender_hits = hits_by_player.get(defender_id, 0)
+        else:
+            # Calculate AFB hits for attacker
+            attacker_hits = 0
+            for unit in attacker_units:
+                if unit.has_anti_fighter_barrage():
+                    hits = self.perform_anti_fighter_barrage_enhanced(
+                        unit, defender_units
+                    )
+                    attacker_hits += hits
+
+            # Calculate AFB hits for defender
+            defender_hits = 0
+            for unit in defender_units:
+                if unit.has_anti_fighter_barrage():
+                    hits = self.perform_anti_fighter_barrage_enhanced(
+                        unit, attacker_units
+                    )
+                    defender_hits += hits
 
         # Collect all fighters for hit assignment
         # Collect all fighter-type units eligible for AFB
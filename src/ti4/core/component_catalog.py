@@ -0,0 +1,422 @@
+"""Load-once catalogs for the TI4 component data files.
+
+The component CSVs (objectives, systems, planets and the ability compendium)
+are parsed at most once per process, on first access, into frozen records
+with a primary index and cached secondary indexes. When a prebuilt data
+bundle is installed (see ``ti4.core.data_bundle``) records are taken from
+it and the CSVs are not parsed at all.
+
+Data files are looked up as package resources first (``ti4/data`` inside an
+installed wheel) and then in ``docs/component_details`` of a source checkout.
+"""
+
+import csv
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import cache
+from importlib import resources
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+OBJECTIVE_CARDS_FILE = "TI4_objective_cards.csv"
+SYSTEMS_FILE = "TI4 Systems.csv"
+PLANETS_FILE = "Ti4 Planets.csv"
+ABILITY_COMPENDIUM_FILE = "TI4 ability compendium.csv"
+
+# Location of the data files inside the installed package and the source tree
+_PACKAGED_DATA_DIR = ("data", "component_details")
+_SOURCE_DATA_DIR = ("docs", "component_details")
+
+# Commas inside CSV text fields are encoded as § to avoid delimiter conflicts
+_ENCODED_COMMA = "§"
+
+
+@cache
+def resolve_component_data_path(filename: str) -> Path:
+    """Locate a component data file.
+
+    Args:
+        filename: Name of the CSV file (e.g. ``TI4 Systems.csv``)
+
+    Returns:
+        Path to the data file
+
+    Raises:
+        FileNotFoundError: If the file is neither packaged nor in the source tree
+    """
+    packaged = resources.files("ti4")
+    for part in (*_PACKAGED_DATA_DIR, filename):
+        packaged = packaged.joinpath(part)
+    if packaged.is_file():
+        return Path(str(packaged))
+
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current / "pyproject.toml").exists() or (current / "setup.py").exists():
+            candidate = current.joinpath(*_SOURCE_DATA_DIR, filename)
+            if candidate.is_file():
+                return candidate
+            break
+        current = current.parent
+    raise FileNotFoundError(f"Component data file not found: {filename}")
+
+
+def _decode_text(value: str | None) -> str:
+    """Strip a CSV field and restore encoded commas."""
+    return (value or "").strip().replace(_ENCODED_COMMA, ",")
+
+
+def _optional_text(value: str | None) -> str | None:
+    """Decode a CSV field, mapping blank values to None."""
+    text = _decode_text(value)
+    return text or None
+
+
+def _split_words(value: str | None) -> tuple[str, ...]:
+    """Split a space separated multi-value field (e.g. ``Alpha Beta``)."""
+    return tuple(_decode_text(value).split())
+
+
+def _parse_int(value: str | None, default: int = 0) -> int:
+    """Parse an integer field, allowing blanks."""
+    text = (value or "").strip()
+    return int(text) if text else default
+
+
+@dataclass(frozen=True)
+class ObjectiveRecord:
+    """A row of the objective cards data file."""
+
+    name: str
+    condition: str
+    points: int
+    expansion: str
+    phase: str
+    type: str
+
+
+@dataclass(frozen=True)
+class SystemRecord:
+    """A row of the systems data file."""
+
+    system_id: str
+    back_colour: str
+    is_home_system: bool
+    faction: str | None
+    expansion: str
+    anomalies: tuple[str, ...]
+    wormholes: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class PlanetRecord:
+    """A row of the planets data file."""
+
+    name: str
+    trait: str | None
+    resources: int
+    influence: int
+    expansion: str
+    technology_specialty: str | None
+    faction: str | None
+    legendary: bool
+    system_id: str | None
+    flavour: str
+
+
+@dataclass(frozen=True)
+class AbilityRecord:
+    """A row of the ability compendium data file."""
+
+    name: str
+    number_in_deck: int
+    play: str
+    play_2: str
+    effect: str
+    flavor_text: str
+    type: str
+    expansion: str
+    faction: str | None
+    promissory_note_owner: str | None
+    prerequisites: str | None
+
+
+def _parse_objective(row: dict[str, str]) -> ObjectiveRecord:
+    return ObjectiveRecord(
+        name=_decode_text(row["Name"]),
+        condition=_decode_text(row["Condition"]),
+        points=_parse_int(row["Points"]),
+        expansion=_decode_text(row["Expansion"]),
+        phase=_decode_text(row["Phase"]),
+        type=_decode_text(row["Type"]),
+    )
+
+
+def _parse_system(row: dict[str, str]) -> SystemRecord:
+    return SystemRecord(
+        system_id=_decode_text(row["System ID"]),
+        back_colour=_decode_text(row["Back Colour"]),
+        is_home_system=_decode_text(row["Is Home System"]).upper() == "TRUE",
+        faction=_optional_text(row["Faction"]),
+        expansion=_decode_text(row["Expansion"]),
+        anomalies=tuple(
+            anomaly.strip()
+            for anomaly in _decode_text(row["Anomalies"]).split(",")
+            if anomaly.strip()
+        ),
+        wormholes=_split_words(row["Wormholes"]),
+    )
+
+
+def _parse_planet(row: dict[str, str]) -> PlanetRecord:
+    return PlanetRecord(
+        name=_decode_text(row["Name"]),
+        trait=_optional_text(row["Trait"]),
+        resources=int(row["Resources"]),
+        influence=int(row["Influence"]),
+        expansion=_decode_text(row["Expansion"]),
+        technology_specialty=_optional_text(row["Technology Specialties"]),
+        faction=_optional_text(row["Faction"]),
+        legendary=_decode_text(row["Legendary "]).upper() == "TRUE",
+        system_id=_optional_text(row["System ID"]),
+        flavour=_decode_text(row["Flavour"]),
+    )
+
+
+def _parse_ability(row: dict[str, str]) -> AbilityRecord:
+    return AbilityRecord(
+        name=_decode_text(row["Name"]),
+        number_in_deck=_parse_int(row["Number in Deck"]),
+        play=_decode_text(row["Play"]),
+        play_2=_decode_text(row["Play 2"]),
+        effect=_decode_text(row["Effect"]),
+        flavor_text=_decode_text(row["Flavor Text"]),
+        type=_decode_text(row["Type"]),
+        expansion=_decode_text(row["Expansion"]),
+        faction=_optional_text(row["Faction"]),
+        promissory_note_owner=_optional_text(row["Promissory Note Owner"]),
+        prerequisites=_optional_text(row["Unlock/Prrequisites"]),
+    )
+
+
+RecordT = TypeVar("RecordT")
+
+
+class ComponentCatalog(Generic[RecordT]):
+    """Immutable, lazily loaded collection of records from one data file.
+
+    The file is parsed on first access only; afterwards every lookup is a
+    dictionary access. Rows that cannot be parsed are logged and skipped.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        record_type: type[RecordT],
+        parse_row: Callable[[dict[str, str]], RecordT],
+        key: Callable[[RecordT], str],
+        required_columns: frozenset[str],
+    ) -> None:
+        """Initialize the catalog without reading the data file.
+
+        Args:
+            filename: Name of the CSV data file
+            record_type: Frozen dataclass the records are stored as
+            parse_row: Converts a CSV row into a record
+            key: Returns the primary key of a record
+            required_columns: Columns the file header must contain
+        """
+        self._filename = filename
+        self._record_type = record_type
+        self._parse_row = parse_row
+        self._key = key
+        self._required_columns = required_columns
+        self._lock = threading.Lock()
+        self._records: tuple[RecordT, ...] | None = None
+        self._by_key: MappingProxyType[str, RecordT] = MappingProxyType({})
+        self._indexes: dict[str, MappingProxyType[Any, tuple[RecordT, ...]]] = {}
+
+    @property
+    def filename(self) -> str:
+        """Name of the underlying data file."""
+        return self._filename
+
+    @property
+    def record_type(self) -> type[RecordT]:
+        """Dataclass type of the records."""
+        return self._record_type
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the data file has been parsed."""
+        return self._records is not None
+
+    @property
+    def records(self) -> tuple[RecordT, ...]:
+        """All records in file order."""
+        return self._load()
+
+    def get(self, key: str) -> RecordT | None:
+        """Get a record by primary key (the first one for duplicate keys)."""
+        self._load()
+        return self._by_key.get(key)
+
+    def __getitem__(self, key: str) -> RecordT:
+        record = self.get(key)
+        if record is None:
+            raise KeyError(key)
+        return record
+
+    def __contains__(self, key: object) -> bool:
+        self._load()
+        return key in self._by_key
+
+    def __iter__(self) -> Iterator[RecordT]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def index_by(self, attribute: str) -> MappingProxyType[Any, tuple[RecordT, ...]]:
+        """Get records grouped by the value of an attribute.
+
+        The index is built on first request and cached for the process.
+
+        Args:
+            attribute: Record attribute to group by (e.g. ``"type"``)
+
+        Returns:
+            Read-only mapping from attribute value to matching records
+        """
+        index = self._indexes.get(attribute)
+        if index is None:
+            grouped: dict[Any, list[RecordT]] = {}
+            for record in self._load():
+                grouped.setdefault(getattr(record, attribute), []).append(record)
+            index = MappingProxyType(
+                {value: tuple(records) for value, records in grouped.items()}
+            )
+            self._indexes[attribute] = index
+        return index
+
+    def preload(self) -> None:
+        """Parse the data file now instead of on first access."""
+        self._load()
+
+    def _load(self) -> tuple[RecordT, ...]:
+        records = self._records
+        if records is not None:
+            return records
+        with self._lock:
+            if self._records is None:
+                self._records = self._records_from_bundle() or self._read_records()
+                by_key: dict[str, RecordT] = {}
+                for record in self._records:
+                    by_key.setdefault(self._key(record), record)
+                self._by_key = MappingProxyType(by_key)
+            return self._records
+
+    def _records_from_bundle(self) -> tuple[RecordT, ...] | None:
+        from .data_bundle import get_installed_bundle
+
+        bundle = get_installed_bundle()
+        if bundle is None:
+            return None
+        return bundle.get_catalog_records(self._filename, self._record_type)
+
+    def _read_records(self) -> tuple[RecordT, ...]:
+        path = resolve_component_data_path(self._filename)
+        records: list[RecordT] = []
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            header = set(reader.fieldnames or [])
+            if not self._required_columns.issubset(header):
+                missing = self._required_columns - header
+                raise ValueError(
+                    f"{self._filename} missing required columns: {missing}"
+                )
+            first_column = reader.fieldnames[0] if reader.fieldnames else ""
+            for row in reader:
+                # Skip empty rows
+                if not (row.get(first_column) or "").strip():
+                    continue
+                try:
+                    records.append(self._parse_row(row))
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(
+                        "Skipping malformed row in %s: %s (%s)",
+                        self._filename,
+                        row.get(first_column),
+                        e,
+                    )
+        return tuple(records)
+
+
+OBJECTIVE_CATALOG: ComponentCatalog[ObjectiveRecord] = ComponentCatalog(
+    OBJECTIVE_CARDS_FILE,
+    ObjectiveRecord,
+    _parse_objective,
+    key=lambda record: record.name,
+    required_columns=frozenset(
+        {"Name", "Condition", "Points", "Expansion", "Type", "Phase"}
+    ),
+)
+
+SYSTEM_CATALOG: ComponentCatalog[SystemRecord] = ComponentCatalog(
+    SYSTEMS_FILE,
+    SystemRecord,
+    _parse_system,
+    key=lambda record: record.system_id,
+    required_columns=frozenset(
+        {"System ID", "Back Colour", "Is Home System", "Faction", "Expansion"}
+    ),
+)
+
+PLANET_CATALOG: ComponentCatalog[PlanetRecord] = ComponentCatalog(
+    PLANETS_FILE,
+    PlanetRecord,
+    _parse_planet,
+    key=lambda record: record.name,
+    required_columns=frozenset({"Name", "Trait", "Resources", "Influence"}),
+)
+
+ABILITY_CATALOG: ComponentCatalog[AbilityRecord] = ComponentCatalog(
+    ABILITY_COMPENDIUM_FILE,
+    AbilityRecord,
+    _parse_ability,
+    key=lambda record: record.name,
+    required_columns=frozenset({"Name", "Effect", "Type"}),
+)
+
+
+ALL_CATALOGS: tuple[ComponentCatalog[Any], ...] = (
+    OBJECTIVE_CATALOG,
+    SYSTEM_CATALOG,
+    PLANET_CATALOG,
+    ABILITY_CATALOG,
+)
+
+
+def get_objective_catalog() -> ComponentCatalog[ObjectiveRecord]:
+    """Get the process-wide objective card catalog."""
+    return OBJECTIVE_CATALOG
+
+
+def get_system_catalog() -> ComponentCatalog[SystemRecord]:
+    """Get the process-wide system tile catalog."""
+    return SYSTEM_CATALOG
+
+
+def get_planet_catalog() -> ComponentCatalog[PlanetRecord]:
+    """Get the process-wide planet catalog."""
+    return PLANET_CATALOG
+
+
+def get_ability_catalog() -> ComponentCatalog[AbilityRecord]:
+    """Get the process-wide ability compendium catalog."""
+    return ABILITY_CATALOG
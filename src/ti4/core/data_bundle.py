@@ -0,0 +1,411 @@
+"""Prebuilt binary bundle of the static TI4 game data.
+
+Parsing the component CSVs and rebuilding the static registries is repeated
+by every process that needs them (worker processes, test modules). The
+bundle stores the already-parsed data in a single versioned file that is
+memory-mapped and decoded at startup instead.
+
+Bundle layout::
+
+    magic (4 bytes) | format version (uint16) | marshal version (uint16)
+    | Python major, minor (2 x uint8) | source fingerprint (32 bytes, sha256)
+    | marshal payload
+
+The payload only contains builtin types (marshal cannot execute code on
+load) and is rebuilt with ``python scripts/build_data_bundle.py``. A bundle
+whose format, marshal or Python version does not match the running
+interpreter, or whose fingerprint does not match the contents of the source
+files, is ignored and the data is loaded from source as usual. The
+fingerprint only covers file contents, not paths or modification times, so a
+bundle built in a source checkout stays valid after the wheel is installed.
+"""
+
+import dataclasses
+import hashlib
+import logging
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+from importlib import resources
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from .constants import Faction, Technology
+    from .leaders import LeaderType
+    from .technology_cards.specifications import TechnologySpecification
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_MAGIC = b"TI4B"
+BUNDLE_FORMAT_VERSION = 3
+BUNDLE_FILENAME = "ti4_static_data.bundle"
+
+# Environment variable that overrides the bundle location
+BUNDLE_PATH_ENV_VAR = "TI4_DATA_BUNDLE"
+
+_HEADER = struct.Struct("<4sHHBB32s")
+
+# Module sources (relative to this package) that define data in the bundle.
+# Located by path so that fingerprinting does not import them.
+_SOURCE_MODULES = (
+    ("component_catalog.py",),
+    ("technology_cards", "specifications.py"),
+    ("leaders.py",),
+)
+
+RecordT = TypeVar("RecordT")
+
+
+class DataBundleError(Exception):
+    """Raised when a data bundle cannot be read."""
+
+    pass
+
+
+class DataBundle:
+    """Decoded contents of a static data bundle."""
+
+    def __init__(self, payload: dict[str, Any], fingerprint: bytes) -> None:
+        """Initialize from a decoded payload.
+
+        Args:
+            payload: The marshal payload read from the bundle
+            fingerprint: Source fingerprint recorded in the bundle header
+        """
+        self._catalogs: dict[str, list[tuple[Any, ...]]] = payload["catalogs"]
+        self._technology_specifications: list[tuple[Any, ...]] = payload[
+            "technology_specifications"
+        ]
+        self._leader_definitions: dict[tuple[str, str], dict[str, Any]] = {
+            (faction, leader_type): {
+                "name": name,
+                "unlock_conditions": list(unlock_conditions),
+            }
+            for faction, leader_type, name, unlock_conditions in payload[
+                "leader_definitions"
+            ]
+        }
+        self._fingerprint = fingerprint
+        self._decoded_specifications: (
+            dict[Technology, TechnologySpecification] | None
+        ) = None
+
+    @property
+    def fingerprint(self) -> bytes:
+        """Source fingerprint the bundle was built from."""
+        return self._fingerprint
+
+    def get_catalog_records(
+        self, filename: str, record_type: type[RecordT]
+    ) -> tuple[RecordT, ...] | None:
+        """Get the records of a component catalog.
+
+        Args:
+            filename: Data file name of the catalog
+            record_type: Record dataclass to rebuild the rows as
+
+        Returns:
+            The records, or None if the catalog is not in the bundle
+        """
+        rows = self._catalogs.get(filename)
+        if rows is None:
+            return None
+        return tuple(record_type(*row) for row in rows)
+
+    def get_technology_specifications(
+        self,
+    ) -> "dict[Technology, TechnologySpecification]":
+        """Get the technology specifications stored in the bundle.
+
+        Specifications are immutable, so they are decoded once and shared.
+        """
+        if self._decoded_specifications is None:
+            self._decoded_specifications = self._decode_technology_specifications()
+        return dict(self._decoded_specifications)
+
+    def _decode_technology_specifications(
+        self,
+    ) -> "dict[Technology, TechnologySpecification]":
+        from .constants import (
+            AbilityCondition,
+            AbilityEffectType,
+            AbilityTrigger,
+            Expansion,
+            Faction,
+            Technology,
+        )
+        from .technology import TechnologyColor
+        from .technology_cards.specifications import (
+            AbilitySpecification,
+            TechnologySpecification,
+        )
+
+        specifications = {}
+        for (
+            technology,
+            name,
+            color,
+            prerequisites,
+            faction_restriction,
+            expansion,
+            abilities,
+        ) in self._technology_specifications:
+            spec = TechnologySpecification(
+                technology=Technology(technology),
+                name=name,
+                color=TechnologyColor(color) if color is not None else None,
+                prerequisites=tuple(TechnologyColor(p) for p in prerequisites),
+                faction_restriction=(
+                    Faction(faction_restriction)
+                    if faction_restriction is not None
+                    else None
+                ),
+                expansion=Expansion(expansion),
+                abilities=tuple(
+                    AbilitySpecification(
+                        trigger=AbilityTrigger(trigger),
+                        effect=AbilityEffectType(effect),
+                        conditions=tuple(AbilityCondition(c) for c in conditions),
+                        mandatory=mandatory,
+                        passive=passive,
+                    )
+                    for trigger, effect, conditions, mandatory, passive in abilities
+                ),
+            )
+            specifications[spec.technology] = spec
+        return specifications
+
+    def get_leader_definition(
+        self, faction: "Faction", leader_type: "LeaderType"
+    ) -> dict[str, Any] | None:
+        """Get a leader definition, or None if it is not in the bundle."""
+        definition = self._leader_definitions.get((faction.value, leader_type.value))
+        if definition is None:
+            return None
+        return {
+            "name": definition["name"],
+            "unlock_conditions": list(definition["unlock_conditions"]),
+        }
+
+
+def _source_files() -> list[tuple[str, Path | None]]:
+    """Get the data files and modules the bundle contents are derived from.
+
+    Returns:
+        (name, path) pairs; the path is None for data files that do not exist
+    """
+    from .component_catalog import ALL_CATALOGS, resolve_component_data_path
+
+    sources: list[tuple[str, Path | None]] = []
+    for catalog in ALL_CATALOGS:
+        try:
+            path: Path | None = resolve_component_data_path(catalog.filename)
+        except FileNotFoundError:
+            path = None
+        sources.append((catalog.filename, path))
+    package_dir = Path(__file__).resolve().parent
+    for parts in _SOURCE_MODULES:
+        module_path = package_dir.joinpath(*parts)
+        if module_path.is_file():
+            sources.append(("/".join(parts), module_path))
+    return sources
+
+
+def compute_source_fingerprint() -> bytes:
+    """Hash the names and contents of the bundle's source files."""
+    digest = hashlib.sha256()
+    digest.update(str(BUNDLE_FORMAT_VERSION).encode())
+    for name, path in _source_files():
+        digest.update(name.encode())
+        if path is not None:
+            contents = path.read_bytes()
+            digest.update(len(contents).to_bytes(8, "little"))
+            digest.update(contents)
+    return digest.digest()
+
+
+def default_bundle_path() -> Path:
+    """Get the bundle location (``TI4_DATA_BUNDLE`` or inside the package)."""
+    override = os.environ.get(BUNDLE_PATH_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path(str(resources.files("ti4").joinpath("data").joinpath(BUNDLE_FILENAME)))
+
+
+def build_bundle(path: Path | None = None) -> Path:
+    """Compile all static game data into a bundle file.
+
+    Args:
+        path: Where to write the bundle (defaults to default_bundle_path())
+
+    Returns:
+        The path the bundle was written to
+    """
+    from .component_catalog import ALL_CATALOGS
+    from .constants import Faction
+    from .leaders import LeaderRegistry, LeaderType
+    from .technology_cards.specifications import TechnologySpecificationRegistry
+
+    target = path or default_bundle_path()
+
+    catalogs = {
+        # Parse the data files directly so a stale bundle is never copied
+        catalog.filename: [
+            dataclasses.astuple(record) for record in catalog._read_records()
+        ]
+        for catalog in ALL_CATALOGS
+    }
+
+    technology_specifications = [
+        (
+            spec.technology.value,
+            spec.name,
+            spec.color.value if spec.color is not None else None,
+            tuple(color.value for color in spec.prerequisites),
+            spec.faction_restriction.value if spec.faction_restriction else None,
+            spec.expansion.value,
+            tuple(
+                (
+                    ability.trigger.value,
+                    ability.effect.value,
+                    tuple(condition.value for condition in ability.conditions),
+                    ability.mandatory,
+                    ability.passive,
+                )
+                for ability in spec.abilities
+            ),
+        )
+        for spec in TechnologySpecificationRegistry(
+            use_bundle=False
+        ).get_all_specifications()
+    ]
+
+    leader_registry = LeaderRegistry()
+    leader_definitions = []
+    for faction in Faction:
+        for leader_type in LeaderType:
+            definition = leader_registry.get_leader_definition(
+                faction, leader_type, use_bundle=False
+            )
+            leader_definitions.append(
+                (
+                    faction.value,
+                    leader_type.value,
+                    definition["name"],
+                    tuple(definition["unlock_conditions"]),
+                )
+            )
+
+    payload = marshal.dumps(
+        {
+            "catalogs": catalogs,
+            "technology_specifications": technology_specifications,
+            "leader_definitions": leader_definitions,
+        }
+    )
+    header = _HEADER.pack(
+        BUNDLE_MAGIC,
+        BUNDLE_FORMAT_VERSION,
+        marshal.version,
+        sys.version_info.major,
+        sys.version_info.minor,
+        compute_source_fingerprint(),
+    )
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.with_suffix(target.suffix + ".tmp")
+    temporary.write_bytes(header + payload)
+    os.replace(temporary, target)
+    return target
+
+
+def load_bundle(path: Path, verify: bool = True) -> DataBundle:
+    """Memory-map and decode a bundle file.
+
+    Args:
+        path: Bundle file to read
+        verify: Reject the bundle if the contents of its sources changed
+
+    Returns:
+        The decoded bundle
+
+    Raises:
+        DataBundleError: If the file is not a valid, current bundle
+        FileNotFoundError: If the file does not exist
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) < _HEADER.size:
+            raise DataBundleError(f"Bundle {path} is truncated")
+        magic, version, marshal_version, major, minor, fingerprint = (
+            _HEADER.unpack_from(mm)
+        )
+        if magic != BUNDLE_MAGIC:
+            raise DataBundleError(f"{path} is not a TI4 data bundle")
+        if version != BUNDLE_FORMAT_VERSION:
+            raise DataBundleError(
+                f"Bundle format version {version} does not match "
+                f"{BUNDLE_FORMAT_VERSION}"
+            )
+        if (marshal_version, major, minor) != (marshal.version, *sys.version_info[:2]):
+            raise DataBundleError(
+                f"Bundle {path} was built by Python {major}.{minor} "
+                f"(marshal version {marshal_version}); rebuild it"
+            )
+        if verify and fingerprint != compute_source_fingerprint():
+            raise DataBundleError(f"Bundle {path} is out of date; rebuild it")
+        # Decode straight from the mapped pages; views must be released
+        # before the mapping is closed
+        with memoryview(mm) as view, view[_HEADER.size :] as payload_view:
+            try:
+                # Only builtin types are written by build_bundle and marshal
+                # cannot execute code on load
+                payload = marshal.loads(payload_view)  # noqa: S302
+            except (EOFError, ValueError, TypeError) as e:
+                raise DataBundleError(f"Bundle {path} is corrupt: {e}") from e
+    return DataBundle(payload, fingerprint)
+
+
+_installed_bundle: DataBundle | None = None
+_bundle_resolved = False
+_bundle_lock = threading.Lock()
+
+
+def get_installed_bundle() -> DataBundle | None:
+    """Get the process-wide bundle, loading it on first use.
+
+    Returns None when no usable bundle exists, in which case callers load
+    data from source.
+    """
+    global _installed_bundle, _bundle_resolved
+    if _bundle_resolved:
+        return _installed_bundle
+    with _bundle_lock:
+        if not _bundle_resolved:
+            path = default_bundle_path()
+            if path.is_file():
+                try:
+                    _installed_bundle = load_bundle(path)
+                except (DataBundleError, OSError) as e:
+                    logger.warning("Ignoring data bundle %s: %s", path, e)
+            _bundle_resolved = True
+    return _installed_bundle
+
+
+def install_bundle(bundle: DataBundle | None) -> None:
+    """Replace the process-wide bundle (None disables bundle use)."""
+    global _installed_bundle, _bundle_resolved
+    with _bundle_lock:
+        _installed_bundle = bundle
+        _bundle_resolved = True
+
+
+def reset_installed_bundle() -> None:
+    """Forget the process-wide bundle so the next access looks it up again."""
+    global _installed_bundle, _bundle_resolved
+    with _bundle_lock:
+        _installed_bundle = None
+        _bundle_resolved = False
@@ -5,12 +5,18 @@ building upon the existing transaction system to provide component-based exchang
 that can be objectively validated and enforced by the game system.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, MutableMapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import chain
 from typing import TYPE_CHECKING, Any, Optional
 
+from .economy_ledger import get_economy_ledger
+from .transaction_concurrency import (
+    OptimisticTransactionExecutor,
+    TransactionConflictMetrics,
+)
 from .transactions import PromissoryNote, PromissoryNoteType, TransactionOffer
 
 if TYPE_CHECKING:
@@ -351,9 +357,8 @@ class ComponentValidator:
             ValueError: If player_id is empty or amount is negative
         """
         self._validate_resource_check_inputs(player_id, amount)
-        return self._validate_player_resource(
-            player_id, amount, lambda player: player.get_trade_goods()
-        )
+        trade_goods = get_economy_ledger(self._game_state).get_trade_goods(player_id)
+        return trade_goods is not None and trade_goods >= amount
 
     def validate_commodity_availability(self, player_id: str, amount: int) -> bool:
         """Validate player has sufficient commodities.
@@ -560,8 +565,9 @@ class ComponentValidator:
             TransactionValidationError: With detailed error message if insufficient
         """
         if not self.validate_trade_goods_availability(player_id, amount):
-            player = self._find_player(player_id)
-            current_amount = player.get_trade_goods() if player else 0
+            current_amount = (
+                get_economy_ledger(self._game_state).get_trade_goods(player_id) or 0
+            )
             error_msg = (
                 f"Player {player_id} has insufficient trade goods. "
                 f"Required: {amount}, Available: {current_amount}"
@@ -612,10 +618,10 @@ class ResourceManager:
         Raises:
             ValueError: If player not found
         """
-        player = self._find_player(player_id)
-        if player is None:
+        trade_goods = get_economy_ledger(self._game_state).get_trade_goods(player_id)
+        if trade_goods is None:
             raise ValueError(f"Player {player_id} not found")
-        return player.get_trade_goods()
+        return trade_goods
 
     def get_commodities(self, player_id: str) -> int:
         """Get player's current commodity count.
@@ -1208,6 +1214,127 @@ class TransactionNotificationSystem:
         return self._pending_notifications.copy()
 
 
+class TransactionStore(MutableMapping[str, ComponentTransaction]):
+    """Transactions by ID, indexed by involved player and by status.
+
+    Behaves like the ``dict`` it replaces; every write re-indexes the stored
+    transaction, so pending offers of one player are found without scanning
+    all transactions ever proposed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._transactions: dict[str, ComponentTransaction] = {}
+        # Dicts with None values keep insertion order like ordered sets
+        self._by_player: dict[str, dict[str, None]] = {}
+        self._by_status: dict[TransactionStatus, dict[str, None]] = {}
+
+    def __getitem__(self, transaction_id: str) -> ComponentTransaction:
+        return self._transactions[transaction_id]
+
+    def __setitem__(
+        self, transaction_id: str, transaction: ComponentTransaction
+    ) -> None:
+        old = self._transactions.get(transaction_id)
+        if old is not None:
+            self._by_status[old.status].pop(transaction_id, None)
+            if self._players(old) != self._players(transaction):
+                for player_id in self._players(old):
+                    self._by_player[player_id].pop(transaction_id, None)
+        self._transactions[transaction_id] = transaction
+        for player_id in self._players(transaction):
+            self._by_player.setdefault(player_id, {})[transaction_id] = None
+        self._by_status.setdefault(transaction.status, {})[transaction_id] = None
+
+    def __delitem__(self, transaction_id: str) -> None:
+        old = self._transactions.pop(transaction_id)
+        for player_id in self._players(old):
+            self._by_player[player_id].pop(transaction_id, None)
+        self._by_status[old.status].pop(transaction_id, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._transactions)
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    def get_by_status(
+        self, status: TransactionStatus, player_id: str | None = None
+    ) -> list[ComponentTransaction]:
+        """Get transactions with a status, optionally involving a player.
+
+        Args:
+            status: Status to look up
+            player_id: Player who proposed or received the transactions, or
+                None for all players
+
+        Returns:
+            Matching transactions in no particular order
+        """
+        ids = self._by_status.get(status, {})
+        if player_id is not None:
+            player_ids = self._by_player.get(player_id, {})
+            if len(player_ids) < len(ids):
+                ids, player_ids = player_ids, ids
+            ids = {tid: None for tid in ids if tid in player_ids}
+        return [self._transactions[tid] for tid in ids]
+
+    def get_for_player(self, player_id: str) -> list[ComponentTransaction]:
+        """Get every transaction a player proposed or received, oldest first."""
+        return [self._transactions[tid] for tid in self._by_player.get(player_id, {})]
+
+    @staticmethod
+    def _players(transaction: ComponentTransaction) -> tuple[str, str]:
+        return (transaction.proposing_player, transaction.target_player)
+
+
+class TransactionHistoryIndex:
+    """Completed transaction history (Rule 28) grouped by player.
+
+    GameState keeps the history as a list (plus an archived tuple after
+    compaction) that is replaced on every change. The index is rebuilt only
+    when those objects change, so repeated history queries between
+    transactions cost one dict lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._archived: Any = None
+        self._history: Any = None
+        self._length = -1
+        self._by_player: dict[str, list[Any]] = {}
+
+    def get(self, game_state: "GameState", player_id: str) -> list[Any]:
+        """Get the history entries a player proposed or received.
+
+        Args:
+            game_state: Game state holding the transaction history
+            player_id: Player ID to get history for
+
+        Returns:
+            Entries involving the player, oldest first
+        """
+        # Entries archived by state compaction precede the recent ones
+        archived = getattr(game_state, "archived_transaction_history", ())
+        if not isinstance(archived, tuple):
+            archived = ()
+        history = game_state.transaction_history
+        if (
+            archived is not self._archived
+            or history is not self._history
+            or len(history) != self._length
+        ):
+            self._by_player = {}
+            for entry in chain(archived, history):
+                players = {entry.proposing_player, entry.target_player}
+                for involved in players:
+                    self._by_player.setdefault(involved, []).append(entry)
+            self._archived = archived
+            self._history = history
+            self._length = len(history)
+        return list(self._by_player.get(player_id, ()))
+
+
 class EnhancedTransactionManager:
     """Enhanced transaction manager for Rule 28 component deals.
 
@@ -1228,8 +1355,10 @@ class EnhancedTransactionManager:
         self._resource_manager = ResourceManager(game_state)
 
         # Track active transactions
-        self._transactions: dict[str, ComponentTransaction] = {}
+        self._transactions = TransactionStore()
+        self._history_index = TransactionHistoryIndex()
         self._transaction_counter = 0
+        self._optimistic_executor: OptimisticTransactionExecutor | None = None
 
         # Track game phase and active player for timing rules
         self._current_phase: GamePhase | None = None
@@ -1451,6 +1580,108 @@ class EnhancedTransactionManager:
                 success=False, transaction=transaction, error_message=error_msg
             )
 
+    def accept_transactions_concurrently(
+        self, transaction_ids: list[str], max_workers: int = 1
+    ) -> list[TransactionResult]:
+        """Accept and execute several pending transactions at once.
+
+        Deals are applied with optimistic concurrency control: each one
+        commits against a versioned snapshot of its two players and is
+        retried if another deal changed them first. Deals between different
+        player pairs do not conflict.
+
+        Args:
+            transaction_ids: IDs of the transactions to accept
+            max_workers: Threads validating and committing the deals
+
+        Returns:
+            One TransactionResult per ID, in the given order. Failed deals
+            stay pending.
+
+        Raises:
+            TransactionNotFoundError: If a transaction doesn't exist
+        """
+        for transaction_id in transaction_ids:
+            if transaction_id not in self._transactions:
+                raise TransactionNotFoundError(
+                    f"Transaction {transaction_id} not found"
+                )
+
+        if not hasattr(self._game_state, "players"):
+            # No component snapshot to work on; accept one by one
+            return [self.accept_transaction(tid) for tid in transaction_ids]
+
+        results: dict[str, TransactionResult] = {}
+        completed: list[ComponentTransaction] = []
+        # dict.fromkeys drops repeated IDs so a deal is applied only once
+        for transaction_id in dict.fromkeys(transaction_ids):
+            transaction = self._transactions[transaction_id]
+            if transaction.status != TransactionStatus.PENDING:
+                results[transaction_id] = TransactionResult(
+                    success=False,
+                    transaction=transaction,
+                    error_message=f"Transaction {transaction_id} is not pending",
+                )
+                continue
+            validation_result = self._validator.validate_transaction(transaction)
+            if not validation_result.is_valid:
+                results[transaction_id] = TransactionResult(
+                    success=False,
+                    transaction=transaction,
+                    error_message="Transaction validation failed: "
+                    + ", ".join(validation_result.error_messages),
+                )
+                continue
+            completed.append(
+                ComponentTransaction(
+                    transaction_id=transaction.transaction_id,
+                    proposing_player=transaction.proposing_player,
+                    target_player=transaction.target_player,
+                    offer=transaction.offer,
+                    request=transaction.request,
+                    status=TransactionStatus.ACCEPTED,
+                    timestamp=transaction.timestamp,
+                    completion_timestamp=datetime.now(),
+                )
+            )
+
+        if self._optimistic_executor is None:
+            self._optimistic_executor = OptimisticTransactionExecutor()
+        try:
+            execution = self._optimistic_executor.execute(
+                self._game_state, completed, max_workers=max_workers
+            )
+        except ValueError as e:
+            # The batch left an invalid game state; none of it is applied
+            failed: dict[str, str] = dict.fromkeys(
+                (transaction.transaction_id for transaction in completed), str(e)
+            )
+        else:
+            self._game_state = execution.game_state
+            failed = execution.failed
+
+        for transaction in completed:
+            transaction_id = transaction.transaction_id
+            error = failed.get(transaction_id)
+            if error is None:
+                self._transactions[transaction_id] = transaction
+                results[transaction_id] = TransactionResult(
+                    success=True, transaction=transaction
+                )
+            else:
+                results[transaction_id] = TransactionResult(
+                    success=False,
+                    transaction=self._transactions[transaction_id],
+                    error_message=f"Failed to execute transaction: {error}",
+                )
+        return [results[transaction_id] for transaction_id in transaction_ids]
+
+    def get_concurrency_metrics(self) -> TransactionConflictMetrics:
+        """Get the conflict counters of concurrently accepted transactions."""
+        if self._optimistic_executor is None:
+            return TransactionConflictMetrics()
+        return self._optimistic_executor.metrics
+
     def reject_transaction(self, transaction_id: str) -> TransactionResult:
         """Reject a pending transaction.
 
@@ -1534,18 +1765,7 @@ class EnhancedTransactionManager:
 
         Requirements: 6.4
         """
-        pending = []
-        for transaction in self._transactions.values():
-            if transaction.status == TransactionStatus.PENDING:
-                if player_id is None:
-                    # Return all pending transactions
-                    pending.append(transaction)
-                elif (
-                    transaction.proposing_player == player_id
-                    or transaction.target_player == player_id
-                ):
-                    # Return transactions for specific player
-                    pending.append(transaction)
+        pending = self._transactions.get_by_status(TransactionStatus.PENDING, player_id)
 
         # Sort by timestamp to ensure FIFO ordering (Requirement 6.4)
         pending.sort(key=lambda t: t.timestamp)
@@ -1563,11 +1783,7 @@ class EnhancedTransactionManager:
             List of completed transaction history entries involving the player
         """
         # Delegate to GameState as single source of truth
-        history = []
-        for entry in self._game_state.transaction_history:
-            if entry.proposing_player == player_id or entry.target_player == player_id:
-                history.append(entry)
-        return history
+        return self._history_index.get(self._game_state, player_id)
 
     def _execute_transaction(self, transaction: ComponentTransaction) -> None:
         """Execute the resource transfers for a transaction.
@@ -1693,13 +1909,12 @@ class EnhancedTransactionManager:
             raise ValueError("Player ID cannot be empty")
 
         # Find all pending transactions involving the eliminated player
-        transactions_to_cancel = []
-        for transaction in self._transactions.values():
-            if transaction.status == TransactionStatus.PENDING and (
-                transaction.proposing_player == player_id
-                or transaction.target_player == player_id
-            ):
-                transactions_to_cancel.append(transaction.transaction_id)
+        transactions_to_cancel = [
+            transaction.transaction_id
+            for transaction in self._transactions.get_by_status(
+                TransactionStatus.PENDING, player_id
+            )
+        ]
 
         # Cancel all found transactions
         for transaction_id in transactions_to_cancel:
@@ -0,0 +1,252 @@
+"""Incrementally maintained per-player economy totals for TI4.
+
+Implements the bookkeeping behind Rule 75: RESOURCES and Rule 47: INFLUENCE
+reads. Instead of walking every controlled planet on each query, a
+PlayerEconomy keeps running totals of the player's ready resources and
+influence. Planets notify it when they are exhausted or readied, so those
+updates are O(1). Trade goods are read straight from the player's command
+sheet, which is already O(1).
+
+GameState is copy-on-write: gaining or losing a planet produces a new
+controlled-planet list. A PlayerEconomy notices that its list was replaced
+(an O(1) identity check) and re-synchronizes only then.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .planet import Planet
+
+if TYPE_CHECKING:
+    from .player import Player
+
+
+class PlayerEconomy:
+    """Running totals of one player's ready planets and trade goods."""
+
+    def __init__(
+        self, player: Player, planets: list[Planet], initial_version: int = 0
+    ) -> None:
+        """Initialize from the player's controlled planets.
+
+        Args:
+            player: The player whose economy is tracked
+            planets: The player's controlled planet list
+            initial_version: Starting version, so a rebuilt economy never
+                reuses a version of the one it replaces
+        """
+        self.player = player
+        self._planets_list = planets
+        self._planet_count = len(planets)
+        self._planets: dict[str, Planet] = {}
+        self._resource_ready: dict[str, Planet] = {}
+        self._influence_ready: dict[str, Planet] = {}
+        # Planet-like objects that cannot notify us are re-read on each query
+        self._unobserved: list[Any] = []
+        self._ready_resources = 0
+        self._ready_influence = 0
+        self._version = initial_version
+        for planet in planets:
+            self._track(planet)
+
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever the ready planets change."""
+        return self._version
+
+    @property
+    def trade_goods(self) -> int:
+        """The player's current trade goods."""
+        return self.player.get_trade_goods()
+
+    @property
+    def ready_resources(self) -> int:
+        """Total resources of the player's ready planets."""
+        unobserved: int = sum(
+            planet.resources
+            for planet in self._unobserved
+            if planet.can_spend_resources()
+        )
+        return self._ready_resources + unobserved
+
+    @property
+    def ready_influence(self) -> int:
+        """Total influence of the player's ready planets."""
+        unobserved: int = sum(
+            planet.influence
+            for planet in self._unobserved
+            if planet.can_spend_influence()
+        )
+        return self._ready_influence + unobserved
+
+    def get_ready_resource_planets(self) -> dict[str, int]:
+        """Get ready planet name -> resources for planets with resources."""
+        ready = {
+            name: planet.resources
+            for name, planet in self._resource_ready.items()
+            if planet.resources > 0
+        }
+        for planet in self._unobserved:
+            if planet.can_spend_resources() and planet.resources > 0:
+                ready[planet.name] = planet.resources
+        return ready
+
+    def get_ready_influence_planets(self) -> dict[str, int]:
+        """Get ready planet name -> influence for planets with influence."""
+        ready = {
+            name: planet.influence
+            for name, planet in self._influence_ready.items()
+            if planet.influence > 0
+        }
+        for planet in self._unobserved:
+            if planet.can_spend_influence() and planet.influence > 0:
+                ready[planet.name] = planet.influence
+        return ready
+
+    def get_ready_planet_values(self) -> dict[str, tuple[int, int]]:
+        """Get ready planet name -> (resources, influence)."""
+        ready = {
+            name: (planet.resources, planet.influence)
+            for name, planet in self._resource_ready.items()
+            if name in self._influence_ready
+        }
+        for planet in self._unobserved:
+            if planet.can_spend_resources() and planet.can_spend_influence():
+                ready[planet.name] = (planet.resources, planet.influence)
+        return ready
+
+    def tracks(self, player: Player, planets: list[Planet]) -> bool:
+        """Check whether this economy still describes the given player state."""
+        if player is not self.player or len(planets) != self._planet_count:
+            return False
+        # GameState hands out a fresh empty list for players without planets
+        return planets is self._planets_list or not planets
+
+    def on_planet_exhaust_changed(self, planet: Planet) -> None:
+        """Update the totals after a tracked planet was exhausted or readied."""
+        if self._planets.get(planet.name) is not planet:
+            return
+        self._remove_ready(planet)
+        self._add_ready(planet)
+        self._version += 1
+
+    def _track(self, planet: Any) -> None:
+        if not isinstance(planet, Planet):
+            self._unobserved.append(planet)
+            return
+        self._planets[planet.name] = planet
+        planet.add_exhaust_listener(self)
+        self._add_ready(planet)
+
+    def _add_ready(self, planet: Planet) -> None:
+        if planet.can_spend_resources() and planet.name not in self._resource_ready:
+            self._resource_ready[planet.name] = planet
+            self._ready_resources += planet.resources
+        if planet.can_spend_influence() and planet.name not in self._influence_ready:
+            self._influence_ready[planet.name] = planet
+            self._ready_influence += planet.influence
+
+    def _remove_ready(self, planet: Planet) -> None:
+        if self._resource_ready.pop(planet.name, None) is not None:
+            self._ready_resources -= planet.resources
+        if self._influence_ready.pop(planet.name, None) is not None:
+            self._ready_influence -= planet.influence
+
+
+class EconomyLedger:
+    """Per-player economies for one game state."""
+
+    def __init__(self, game_state: Any) -> None:
+        """Initialize an empty ledger; economies are built on first use.
+
+        Args:
+            game_state: The game state (or any object with ``players`` and
+                ``get_player_planets``) to track
+        """
+        self.game_state = game_state
+        self._economies: dict[str, PlayerEconomy] = {}
+        self._players_list: list[Player] = []
+        self._player_index: dict[str, int] = {}
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> None:
+        # Derived data: a copied game state builds its own ledger on demand
+        return None
+
+    def get_player_economy(self, player_id: str) -> PlayerEconomy | None:
+        """Get the up-to-date economy of a player.
+
+        Args:
+            player_id: The player ID
+
+        Returns:
+            The player's economy, or None if the player is not in the game
+        """
+        player = self.find_player(player_id)
+        if player is None:
+            return None
+
+        planets = self.game_state.get_player_planets(player_id)
+        economy = self._economies.get(player_id)
+        if economy is None or not economy.tracks(player, planets):
+            initial_version = economy.version + 1 if economy is not None else 0
+            economy = PlayerEconomy(player, planets, initial_version)
+            self._economies[player_id] = economy
+        return economy
+
+    def find_player(self, player_id: str) -> Player | None:
+        """Find a player by ID using an index over the player list."""
+        players = self.game_state.players
+        index = self._player_index.get(player_id)
+        if (
+            players is not self._players_list
+            or index is None
+            or index >= len(players)
+            or players[index].id != player_id
+        ):
+            self._players_list = players
+            self._player_index = {
+                player.id: position for position, player in enumerate(players)
+            }
+            index = self._player_index.get(player_id)
+            if index is None:
+                return None
+        player: Player = players[index]
+        return player
+
+    def get_trade_goods(self, player_id: str) -> int | None:
+        """Get a player's trade goods, or None if the player is not in the game."""
+        player = self.find_player(player_id)
+        return player.get_trade_goods() if player is not None else None
+
+    def get_revision(self) -> tuple[tuple[str, int, int], ...]:
+        """Get a token that changes whenever any player's economy changes.
+
+        Costs O(players), independent of the number of planets.
+        """
+        revision = []
+        for player in self.game_state.players:
+            economy = self.get_player_economy(player.id)
+            assert economy is not None
+            revision.append((player.id, economy.version, economy.trade_goods))
+        return tuple(revision)
+
+
+def get_economy_ledger(game_state: Any) -> EconomyLedger:
+    """Get the economy ledger shared by all readers of a game state.
+
+    Args:
+        game_state: The game state
+
+    Returns:
+        The ledger cached on the game state (created on first use)
+    """
+    ledger = getattr(game_state, "_economy_ledger", None)
+    if isinstance(ledger, EconomyLedger) and ledger.game_state is game_state:
+        return ledger
+    ledger = EconomyLedger(game_state)
+    try:
+        object.__setattr__(game_state, "_economy_ledger", ledger)
+    except AttributeError:
+        pass
+    return ledger
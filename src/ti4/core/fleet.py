@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from .constants import UnitType
+from .fleet_counters import SpaceAreaCounters
 from .unit import Unit
 
 
@@ -23,24 +24,30 @@ class Fleet:
         self.owner = owner
         self.system_id = system_id
         self.units: list[Unit] = []
+        # Capacity and carried units, updated as units are added and removed
+        self._counters = SpaceAreaCounters(self.units)
 
     def add_unit(self, unit: Unit) -> None:
         """Add a unit to the fleet."""
         self.units.append(unit)
+        self._counters.unit_added(self.units, unit)
+
+    def remove_unit(self, unit: Unit) -> None:
+        """Remove a unit from the fleet."""
+        self.units.remove(unit)
+        self._counters.unit_removed(self.units, unit)
+
+    def refresh_counts(self) -> None:
+        """Recount the fleet, e.g. after a unit upgrade changed capacity."""
+        self._counters.recount(self.units)
 
     def get_total_capacity(self) -> int:
         """Get the total capacity of all capacity‑providing units in the fleet."""
-        total_capacity = 0
-        for unit in self.units:
-            cap = unit.get_capacity()
-            if cap > 0:
-                total_capacity += cap
-        return total_capacity
+        return self._counters.get_total(self.units).capacity
 
     def get_carried_units_count(self) -> int:
         """Get the count of units that need to be carried (fighters and infantry)."""
-        # Use unit stats to determine if unit needs to be carried
-        return sum(1 for unit in self.units if self._unit_needs_capacity(unit))
+        return self._counters.get_total(self.units).capacity_consumers
 
     def _unit_needs_capacity(self, unit: Unit) -> bool:
         """Check if a unit needs to be carried (no independent movement)."""
@@ -165,7 +172,7 @@ class FleetCapacityEnforcer:
         removed_units: list[Unit] = []
 
         for unit in units_to_remove:
-            fleet.units.remove(unit)
+            fleet.remove_unit(unit)
             removed_units.append(unit)
 
         return removed_units
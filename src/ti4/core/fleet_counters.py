@@ -0,0 +1,323 @@
+"""Fleet pool and capacity counters (Rule 16: CAPACITY, Rule 37: FLEET POOL).
+
+Fleet pool and capacity limits are checked after every movement and every
+production step. Counting a player's non-fighter ships, capacity and
+capacity-consuming units by walking a system's space area on every check, and
+walking every system to check fleet supply, makes those checks grow with the
+board. Instead:
+
+- Each system and each fleet keeps SpaceAreaCounters: per player counts of
+  non-fighter ships, capacity and units that consume capacity, updated unit
+  by unit when units are placed or removed (System.place_unit_in_space,
+  System.remove_unit_from_space, Fleet.add_unit, Fleet.remove_unit). Unit
+  lists edited directly (appended to or replaced) are recounted on the next
+  query.
+- FleetSupplyIndex keeps, for each player, the number of non-fighter ships
+  in each system containing them. Only systems that report a change (see
+  System.add_occupancy_listener) are re-read, so fleet supply checks do not
+  walk the board.
+- audit_fleet_counts() recounts every system from scratch and compares the
+  result with the counters. It is a debugging aid
+  (GameState.is_fleet_supply_consistent(audit=True)), not part of normal
+  validation.
+
+Counters record a unit's capacity when it is counted. Unit upgrades do not
+notify; call System.refresh_fleet_counts() or Fleet.refresh_counts() after
+one changes capacity. Researching a unit upgrade does so through
+GameState.upgrade_player_units.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .constants import GameConstants, UnitType
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Rule 16.1: fighters and ground forces in space count against capacity
+CAPACITY_CONSUMING_TYPES = GameConstants.GROUND_FORCE_TYPES | {UnitType.FIGHTER}
+
+
+@dataclass(frozen=True)
+class FleetCounts:
+    """Counts of one player's units in one space area."""
+
+    # Ships other than fighters; each system containing one uses a fleet
+    # pool token (Rule 37.1)
+    non_fighter_ships: int = 0
+    capacity: int = 0
+    capacity_consumers: int = 0
+
+    def __add__(self, other: FleetCounts) -> FleetCounts:
+        return FleetCounts(
+            self.non_fighter_ships + other.non_fighter_ships,
+            self.capacity + other.capacity,
+            self.capacity_consumers + other.capacity_consumers,
+        )
+
+    def __sub__(self, other: FleetCounts) -> FleetCounts:
+        return FleetCounts(
+            self.non_fighter_ships - other.non_fighter_ships,
+            self.capacity - other.capacity,
+            self.capacity_consumers - other.capacity_consumers,
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.non_fighter_ships or self.capacity or self.capacity_consumers)
+
+    @property
+    def is_within_capacity(self) -> bool:
+        """Check whether the capacity-consuming units fit (Rule 16.3)."""
+        return self.capacity_consumers <= self.capacity
+
+
+NO_UNITS = FleetCounts()
+
+
+def unit_fleet_counts(unit: Any) -> FleetCounts:
+    """Get what one unit adds to the counts of its space area."""
+    unit_type = getattr(unit, "unit_type", None)
+    try:
+        capacity = unit.get_capacity() if hasattr(unit, "get_capacity") else 0
+    except ValueError:
+        # No stats without a faction (flagships): no known capacity
+        capacity = 0
+    return FleetCounts(
+        non_fighter_ships=int(unit_type in GameConstants.NON_FIGHTER_SHIP_TYPES),
+        capacity=capacity if isinstance(capacity, int) and capacity > 0 else 0,
+        capacity_consumers=int(unit_type in CAPACITY_CONSUMING_TYPES),
+    )
+
+
+def count_units(units: Sequence[Any]) -> dict[str, FleetCounts]:
+    """Count a list of units from scratch, per owner."""
+    counts: dict[str, FleetCounts] = {}
+    for unit in units:
+        added = unit_fleet_counts(unit)
+        if added:
+            counts[unit.owner] = counts.get(unit.owner, NO_UNITS) + added
+    return counts
+
+
+class SpaceAreaCounters:
+    """Per-player counts of a list of units, kept up to date unit by unit."""
+
+    def __init__(self, units: list[Any]) -> None:
+        """Initialize the counters by counting a unit list.
+
+        Args:
+            units: The list of units to follow (not copied)
+        """
+        self.recount(units)
+
+    def unit_added(self, units: list[Any], unit: Any) -> None:
+        """Count a unit just appended to the followed list."""
+        if self._units is units and self._tallied == len(units) - 1:
+            self._apply(unit, adding=True)
+
+    def unit_removed(self, units: list[Any], unit: Any) -> None:
+        """Stop counting a unit just removed from the followed list."""
+        if self._units is units and self._tallied == len(units) + 1:
+            self._apply(unit, adding=False)
+
+    def get(self, units: list[Any], player_id: str) -> FleetCounts:
+        """Get a player's counts in the unit list."""
+        self._sync(units)
+        return self._counts.get(player_id, NO_UNITS)
+
+    def get_total(self, units: list[Any]) -> FleetCounts:
+        """Get the counts of every unit in the list, whoever owns it."""
+        self._sync(units)
+        return self._total
+
+    def get_all(self, units: list[Any]) -> dict[str, FleetCounts]:
+        """Get the counts of every player with units in the list."""
+        self._sync(units)
+        return dict(self._counts)
+
+    def recount(self, units: list[Any]) -> None:
+        """Count the unit list from scratch."""
+        self._units = units
+        self._tallied = len(units)
+        self._counts = count_units(units)
+        self._total = sum(self._counts.values(), NO_UNITS)
+
+    def _sync(self, units: list[Any]) -> None:
+        # Lists replaced or edited without add/remove are recounted
+        if self._units is not units or self._tallied != len(units):
+            self.recount(units)
+
+    def _apply(self, unit: Any, adding: bool) -> None:
+        self._tallied += 1 if adding else -1
+        changed = unit_fleet_counts(unit)
+        if not changed:
+            return
+        counts = self._counts.get(unit.owner, NO_UNITS)
+        if adding:
+            counts += changed
+            self._total += changed
+        else:
+            counts -= changed
+            self._total -= changed
+        if counts:
+            self._counts[unit.owner] = counts
+        else:
+            self._counts.pop(unit.owner, None)
+
+
+def get_space_area_counts(system: Any) -> dict[str, FleetCounts]:
+    """Get the counts of every player in a system's space area."""
+    get_all = getattr(system, "get_all_fleet_counts", None)
+    if callable(get_all):
+        counts: dict[str, FleetCounts] = get_all()
+        return counts
+    return count_units(system.space_units)
+
+
+class FleetSupplyIndex:
+    """The non-fighter ships each player has per system (Rule 37.1).
+
+    Fleet pool tokens limit the non-fighter ships a player can have in each
+    system, as checked by FleetPoolManager.is_fleet_pool_valid.
+    """
+
+    def __init__(self, systems: Mapping[str, Any]) -> None:
+        """Initialize the index; systems are read on first use.
+
+        Args:
+            systems: System objects by ID
+        """
+        self.systems = systems
+        self._reset()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> None:
+        # Derived data: a copied game state builds its own index on demand
+        return None
+
+    def _reset(self) -> None:
+        self._known_count = len(self.systems)
+        self._dirty: set[str] = set(self.systems)
+        # system -> players with non-fighter ships there
+        self._players_in: dict[str, frozenset[str]] = {}
+        # player -> system -> their non-fighter ships there
+        self._fleet_systems: dict[str, dict[str, int]] = {}
+        self._system_of: dict[Any, str] = {}
+
+    def on_occupancy_changed(self, source: Any) -> None:
+        """Mark a changed system for re-reading."""
+        system_id = self._system_of.get(source)
+        if system_id is not None:
+            self._dirty.add(system_id)
+
+    def invalidate(self) -> None:
+        """Re-read every system."""
+        self._reset()
+
+    def get_fleet_supply_used(self, player_id: str) -> int:
+        """Get the most non-fighter ships a player has in any one system."""
+        self._refresh()
+        return max(self._fleet_systems.get(player_id, {}).values(), default=0)
+
+    def get_fleet_systems(self, player_id: str) -> set[str]:
+        """Get the systems containing a player's non-fighter ships."""
+        self._refresh()
+        return set(self._fleet_systems.get(player_id, ()))
+
+    def get_players(self) -> list[str]:
+        """Get the players with non-fighter ships anywhere."""
+        self._refresh()
+        return sorted(self._fleet_systems)
+
+    def is_within_fleet_supply(self, player_id: str, fleet_tokens: int) -> bool:
+        """Check a player's ships in each system against their fleet pool."""
+        return self.get_fleet_supply_used(player_id) <= fleet_tokens
+
+    def _refresh(self) -> None:
+        if len(self.systems) != self._known_count:
+            self._reset()
+        while self._dirty:
+            system_id = self._dirty.pop()
+            for player_id in self._players_in.pop(system_id, ()):
+                fleet_systems = self._fleet_systems[player_id]
+                del fleet_systems[system_id]
+                if not fleet_systems:
+                    del self._fleet_systems[player_id]
+            system = self.systems.get(system_id)
+            if system is None:
+                continue
+            if hasattr(system, "add_occupancy_listener"):
+                system.add_occupancy_listener(self)
+                self._system_of[system] = system_id
+            ships = {
+                player_id: counts.non_fighter_ships
+                for player_id, counts in get_space_area_counts(system).items()
+                if counts.non_fighter_ships
+            }
+            if ships:
+                self._players_in[system_id] = frozenset(ships)
+            for player_id, count in ships.items():
+                self._fleet_systems.setdefault(player_id, {})[system_id] = count
+
+
+def get_fleet_supply_index(game_state: Any) -> FleetSupplyIndex:
+    """Get the fleet supply index of a game state.
+
+    The index is cached on the game state and reused by later states that
+    share the same systems.
+
+    Args:
+        game_state: The game state
+
+    Returns:
+        The fleet supply index (created on first use)
+    """
+    systems = game_state.systems
+    index = getattr(game_state, "_fleet_supply_index", None)
+    if isinstance(index, FleetSupplyIndex) and index.systems is systems:
+        return index
+    index = FleetSupplyIndex(systems)
+    try:
+        object.__setattr__(game_state, "_fleet_supply_index", index)
+    except AttributeError:
+        pass
+    return index
+
+
+def audit_fleet_counts(game_state: Any) -> list[str]:
+    """Recount every system and report counters that disagree.
+
+    Debugging aid: this walks the whole board.
+
+    Args:
+        game_state: The game state
+
+    Returns:
+        A description of each discrepancy (empty when consistent)
+    """
+    index = get_fleet_supply_index(game_state)
+    problems = []
+    expected_systems: dict[str, set[str]] = {}
+    for system_id, system in game_state.systems.items():
+        recounted = count_units(system.space_units)
+        counted = get_space_area_counts(system)
+        if counted != recounted:
+            problems.append(
+                f"System {system_id}: counters {counted} != recount {recounted}"
+            )
+        for player_id, counts in recounted.items():
+            if counts.non_fighter_ships:
+                expected_systems.setdefault(player_id, set()).add(system_id)
+    players = set(expected_systems).union(index.get_players())
+    for player_id in sorted(players):
+        indexed = index.get_fleet_systems(player_id)
+        expected = expected_systems.get(player_id, set())
+        if indexed != expected:
+            problems.append(
+                f"Player {player_id}: fleet supply {sorted(indexed)} != "
+                f"recount {sorted(expected)}"
+            )
+    return problems
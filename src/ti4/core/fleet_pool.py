@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from .constants import UnitType
+from .constants import GameConstants, UnitType
 
 if TYPE_CHECKING:
     from .command_sheet import CommandSheet
@@ -103,16 +103,9 @@ class FleetPoolManager:
 
         LRR Reference: Rule 37.1 - Non-fighter ship counting
         """
-        count = 0
-
-        # Count ships in space (exclude planet-based units per Rule 37.1a)
-        for unit in system.space_units:
-            if unit.owner == player and self._is_non_fighter_ship(unit):
-                # Rule 37.1a: Units that count against capacity don't count against fleet pool
-                if not self._counts_against_capacity(unit):
-                    count += 1
-
-        return count
+        # Space area counters exclude planet-based units (Rule 37.1a) and are
+        # kept up to date as units are placed and removed
+        return system.get_fleet_counts(player).non_fighter_ships
 
     def _is_non_fighter_ship(self, unit: Unit) -> bool:
         """Check if a unit is a non-fighter ship.
@@ -126,15 +119,7 @@ class FleetPoolManager:
         LRR Reference: Rule 37.1 - Non-fighter ship identification
         """
         # All ships except fighters count against fleet pool
-        ship_types = {
-            UnitType.CARRIER,
-            UnitType.CRUISER,
-            UnitType.DESTROYER,
-            UnitType.DREADNOUGHT,
-            UnitType.FLAGSHIP,
-            UnitType.WAR_SUN,
-        }
-        return unit.unit_type in ship_types
+        return unit.unit_type in GameConstants.NON_FIGHTER_SHIP_TYPES
 
     def _counts_against_capacity(self, unit: Unit) -> bool:
         """Check if a unit counts against capacity.
@@ -262,7 +247,7 @@ class FleetPoolManager:
         # Remove excess ships (player choice would be handled by UI)
         removed_ships = non_fighter_ships[:excess_count]
         for ship in removed_ships:
-            system.space_units.remove(ship)
+            system.remove_unit_from_space(ship)
 
         return removed_ships
 
@@ -289,7 +274,7 @@ class FleetPoolManager:
         # Rule 37.3: "they choose and remove excess ships"
         for ship in ships_to_remove:
             if ship in system.space_units:
-                system.space_units.remove(ship)
+                system.remove_unit_from_space(ship)
 
         return ships_to_remove
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .hex_coordinate import HexCoordinate
 from .system import System
@@ -20,14 +20,45 @@ class Galaxy:
         self.system_coordinates: dict[str, HexCoordinate] = {}
         self.system_objects: dict[str, System] = {}
         self.hyperlane_connections: set[tuple[str, str]] = set()
+        # Rule 60 neighbor matrix; cleared when units move, planet control
+        # changes or adjacency changes (see on_occupancy_changed)
+        self._player_systems: dict[str, frozenset[str]] | None = None
+        self._neighbor_matrix: dict[tuple[str, str], bool] = {}
+        # Blockade index (see blockade.get_blockade_index), built on first use
+        self._blockade_index: Any = None
+        # Bumped whenever adjacency may change (systems placed or registered,
+        # hyperlanes added) so caches of adjacent systems can be keyed on it
+        self.topology_version = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Copies of systems and planets do not notify this galaxy's copy, so
+        # the cache is rebuilt (and listeners re-registered) on first use
+        state = self.__dict__.copy()
+        state["_player_systems"] = None
+        state["_neighbor_matrix"] = {}
+        state["_blockade_index"] = None
+        return state
 
     def place_system(self, coordinate: HexCoordinate, system_id: str) -> None:
         """Place a system at the given coordinate."""
         self.system_coordinates[system_id] = coordinate
+        self.topology_version += 1
+        self._invalidate_neighbors()
 
     def register_system(self, system: System) -> None:
         """Register a system object in the galaxy."""
         self.system_objects[system.system_id] = system
+        self.topology_version += 1
+        self._invalidate_neighbors()
+        self._blockade_index = None
+
+    def on_occupancy_changed(self, source: Any) -> None:
+        """Clear the neighbor matrix when a system or planet changes."""
+        self._invalidate_neighbors()
+
+    def _invalidate_neighbors(self) -> None:
+        self._player_systems = None
+        self._neighbor_matrix.clear()
 
     def get_system_coordinate(self, system_id: str) -> HexCoordinate | None:
         """Get the coordinate of a system by its ID."""
@@ -148,6 +179,8 @@ class Galaxy:
         # Store both directions for easier lookup
         self.hyperlane_connections.add((system_id1, system_id2))
         self.hyperlane_connections.add((system_id2, system_id1))
+        self.topology_version += 1
+        self._invalidate_neighbors()
 
     def is_unit_adjacent_to_system(self, unit: Unit, target_system_id: str) -> bool:
         """
@@ -248,54 +281,67 @@ class Galaxy:
 
         Players are neighbors if they both have a unit or control a planet
         in the same system or in systems that are adjacent to each other.
+
+        Results are kept in a per-pair matrix until a unit moves, planet
+        control changes or system adjacency changes.
         """
-        # Get all systems where each player has presence
+        key = (
+            (player_id1, player_id2)
+            if player_id1 <= player_id2
+            else (player_id2, player_id1)
+        )
+        cached = self._neighbor_matrix.get(key)
+        if cached is not None:
+            return cached
+
         player1_systems = self._get_player_systems(player_id1)
         player2_systems = self._get_player_systems(player_id2)
 
-        # Check if players share any systems
-        shared_systems = player1_systems.intersection(player2_systems)
-        if shared_systems:
-            return True
-
-        # Check if any of player1's systems are adjacent to any of player2's systems
-        for system1_id in player1_systems:
-            for system2_id in player2_systems:
-                if self.are_systems_adjacent(system1_id, system2_id):
-                    return True
-
-        return False
+        # Players sharing a system are neighbors; otherwise check whether any
+        # of player1's systems is adjacent to any of player2's systems
+        neighbors = not player1_systems.isdisjoint(player2_systems) or any(
+            self.are_systems_adjacent(system1_id, system2_id)
+            for system1_id in player1_systems
+            for system2_id in player2_systems
+        )
+        self._neighbor_matrix[key] = neighbors
+        return neighbors
 
-    def _get_player_systems(self, player_id: str) -> set[str]:
+    def _get_player_systems(self, player_id: str) -> frozenset[str]:
         """
         Get all system IDs where a player has units or controls planets.
 
         Returns a set of system IDs where the player has presence.
         """
-        player_systems = set()
+        if self._player_systems is None:
+            self._player_systems = self._scan_player_systems()
+        return self._player_systems.get(player_id, frozenset())
 
-        # Check all registered systems for player presence
+    def _scan_player_systems(self) -> dict[str, frozenset[str]]:
+        """Find the systems of every player in one pass over the galaxy.
+
+        Registers this galaxy as an occupancy listener of every system and
+        planet it reads, so the result stays valid until one of them changes.
+        """
+        presence: dict[str, set[str]] = {}
         for system_id, system in self.system_objects.items():
+            system.add_occupancy_listener(self)
             # Check space units
             for unit in system.space_units:
-                if unit.owner == player_id:
-                    player_systems.add(system_id)
-                    break
+                presence.setdefault(unit.owner, set()).add(system_id)
 
             # Check planet units and control
             for planet in system.planets:
-                # Check units on planet
+                planet.add_occupancy_listener(self)
                 for unit in planet.units:
-                    if unit.owner == player_id:
-                        player_systems.add(system_id)
-                        break
-
-                # Check planet control
-                if planet.controlled_by == player_id:
-                    player_systems.add(system_id)
-                    break
-
-        return player_systems
+                    presence.setdefault(unit.owner, set()).add(system_id)
+                if planet.controlled_by is not None:
+                    presence.setdefault(planet.controlled_by, set()).add(system_id)
+
+        return {
+            player_id: frozenset(system_ids)
+            for player_id, system_ids in presence.items()
+        }
 
     def find_path(
         self, start_system_id: str, end_system_id: str, max_distance: int = 10
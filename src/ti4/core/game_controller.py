@@ -234,7 +234,7 @@ class GameController:
         import logging
 
         logger = logging.getLogger(__name__)
-        logger.debug(f"Resolving end-of-turn abilities for player {player_id}")
+        logger.debug("Resolving end-of-turn abilities for player %s", player_id)
 
         # Placeholder for end of turn ability resolution
         # Future implementation will handle faction abilities, technology abilities, etc.
@@ -255,7 +255,7 @@ class GameController:
         import logging
 
         logger = logging.getLogger(__name__)
-        logger.debug(f"Resolving transactions for player {player_id}")
+        logger.debug("Resolving transactions for player %s", player_id)
 
         # Placeholder for transaction resolution
         # Future implementation will handle trade goods, commodities, etc.
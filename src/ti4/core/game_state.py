@@ -16,7 +16,10 @@ from .promissory_notes import PromissoryNoteManager
 from .resource_management import ResourceManager
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .agenda_cards.law_manager import LawManager
+    from .constants import Technology
     from .deals import ComponentTransaction, TransactionHistoryEntry
     from .galaxy import Galaxy
     from .objective import Objective, ObjectiveCard, ObjectiveType
@@ -155,6 +158,9 @@ class GameState:
     transaction_history: list[Any] = field(
         default_factory=list, hash=False
     )  # Transaction history for Rule 28 deals
+    archived_transaction_history: tuple[Any, ...] = field(
+        default=(), hash=False
+    )  # Older history entries moved out by state compaction (oldest first)
 
     # Pending transactions system (Rule 28)
     pending_transactions: dict[str, Any] = field(
@@ -166,6 +172,33 @@ class GameState:
         default_factory=list, hash=False, init=False
     )  # Observers for transaction notifications
 
+    # Per-player economy totals (see economy_ledger), built on first use
+    _economy_ledger: Any = field(
+        default=None, hash=False, init=False, repr=False, compare=False
+    )
+
+    # Space cannon coverage (see space_cannon_coverage), built on first use
+    # and shared with later states that keep the same systems
+    _space_cannon_coverage: Any = field(
+        default=None, hash=False, init=False, repr=False, compare=False
+    )
+
+    # Threat heatmap (see threat_heatmap), shared like the coverage above
+    _threat_heatmap: Any = field(
+        default=None, hash=False, init=False, repr=False, compare=False
+    )
+
+    # Fleet supply index (see fleet_counters), shared like the coverage above
+    _fleet_supply_index: Any = field(
+        default=None, hash=False, init=False, repr=False, compare=False
+    )
+
+    # Leader unlock condition results (see leaders.LeaderUnlockCache), shared
+    # with later states since results are keyed by their dependencies
+    _leader_unlock_cache: Any = field(
+        default=None, hash=False, init=False, repr=False, compare=False
+    )
+
     # Agenda deck state tracking (Rule 7)
     agenda_deck_state: dict[str, Any] = field(
         default_factory=lambda: {
@@ -576,6 +609,9 @@ class GameState:
             transaction_history=kwargs.get(
                 "transaction_history", self.transaction_history
             ),
+            archived_transaction_history=kwargs.get(
+                "archived_transaction_history", self.archived_transaction_history
+            ),
             # Pending transactions system
             pending_transactions=kwargs.get(
                 "pending_transactions", self.pending_transactions
@@ -611,6 +647,12 @@ class GameState:
         object.__setattr__(
             new_state, "_transaction_observers", self._transaction_observers.copy()
         )
+        object.__setattr__(
+            new_state, "_space_cannon_coverage", self._space_cannon_coverage
+        )
+        object.__setattr__(new_state, "_threat_heatmap", self._threat_heatmap)
+        object.__setattr__(new_state, "_fleet_supply_index", self._fleet_supply_index)
+        object.__setattr__(new_state, "_leader_unlock_cache", self._leader_unlock_cache)
 
         return new_state
 
@@ -1421,26 +1463,42 @@ class GameState:
 
         Requirements: 8.1
         """
-        # Remove from pending transactions
-        new_pending = self.pending_transactions.copy()
-        if transaction.transaction_id in new_pending:
-            del new_pending[transaction.transaction_id]
+        return self.complete_transactions([transaction])
 
-        # Add to transaction history
-        new_history = self.transaction_history.copy()
+    def complete_transactions(
+        self, transactions: Iterable[ComponentTransaction]
+    ) -> GameState:
+        """Complete several transactions in one new state.
+
+        Args:
+            transactions: Completed ComponentTransactions, in completion order
+
+        Returns:
+            New GameState with the transactions moved from pending to history
+
+        Requirements: 8.1
+        """
         from .deals import TransactionHistoryEntry
 
-        history_entry = TransactionHistoryEntry(
-            transaction_id=transaction.transaction_id,
-            proposing_player=transaction.proposing_player,
-            target_player=transaction.target_player,
-            offer=transaction.offer,
-            request=transaction.request,
-            status=transaction.status,
-            timestamp=transaction.timestamp,
-            completion_timestamp=transaction.completion_timestamp,
-        )
-        new_history.append(history_entry)
+        new_pending = self.pending_transactions.copy()
+        new_history = self.transaction_history.copy()
+        for transaction in transactions:
+            # Remove from pending transactions
+            new_pending.pop(transaction.transaction_id, None)
+
+            # Add to transaction history
+            new_history.append(
+                TransactionHistoryEntry(
+                    transaction_id=transaction.transaction_id,
+                    proposing_player=transaction.proposing_player,
+                    target_player=transaction.target_player,
+                    offer=transaction.offer,
+                    request=transaction.request,
+                    status=transaction.status,
+                    timestamp=transaction.timestamp,
+                    completion_timestamp=transaction.completion_timestamp,
+                )
+            )
 
         return self._create_new_state(
             pending_transactions=new_pending, transaction_history=new_history
@@ -1481,23 +1539,48 @@ class GameState:
         new_state = new_state.complete_transaction(transaction)
 
         # Notify observers after successful completion
-        new_state._notify_transaction_observers(transaction)
+        new_state.notify_transaction_observers(transaction)
 
         return new_state
 
     def apply_concurrent_transaction_effects(
-        self, transactions: list[Any]
+        self,
+        transactions: list[Any],
+        optimistic: bool = False,
+        max_workers: int = 1,
     ) -> GameState:
         """Apply effects of multiple concurrent transactions.
 
         Args:
             transactions: List of completed ComponentTransactions
+            optimistic: Apply the transactions with optimistic concurrency
+                control (see transaction_concurrency) instead of one by one
+            max_workers: Threads used in optimistic mode
 
         Returns:
             New GameState with all transaction effects applied
 
+        Raises:
+            ValueError: If any transaction cannot be applied; no effects are
+                applied in that case
+
         Requirements: 8.5
         """
+        if optimistic:
+            from .transaction_concurrency import OptimisticTransactionExecutor
+
+            result = OptimisticTransactionExecutor(max_workers=max_workers).execute(
+                self, transactions
+            )
+            if result.failed:
+                raise ValueError(
+                    "; ".join(
+                        f"{transaction_id}: {error}"
+                        for transaction_id, error in result.failed.items()
+                    )
+                )
+            return result.game_state
+
         current_state = self
 
         # Apply transactions in order
@@ -1530,43 +1613,43 @@ class GameState:
         """
 
         # Create new players list with updated resources
-        new_players = []
-
-        for player in self.players:
-            if player.id == transaction.proposing_player:
-                # Proposing player: lose offer, gain request
-                # Use deep copy to avoid mutating the original player (Requirements: 3.1, 3.4)
-                updated_player = copy.deepcopy(player)
-
-                # Apply the offer (what proposing player gives)
-                self._apply_transaction_offer(
-                    updated_player, transaction.offer, player.id
-                )
-
-                # Apply the request (what proposing player receives)
-                self._apply_transaction_receipt(updated_player, transaction.request)
+        new_players = [
+            self.apply_transaction_to_player(player, transaction)
+            if player.id in (transaction.proposing_player, transaction.target_player)
+            else player
+            for player in self.players
+        ]
 
-                new_players.append(updated_player)
+        return self._create_new_state(players=new_players)
 
-            elif player.id == transaction.target_player:
-                # Target player: gain offer, lose request
-                # Use deep copy to avoid mutating the original player (Requirements: 3.1, 3.4)
-                updated_player = copy.deepcopy(player)
+    def apply_transaction_to_player(
+        self, player: Player, transaction: ComponentTransaction
+    ) -> Player:
+        """Apply the resource effects of a transaction to one of its players.
 
-                # Apply the request (what target player gives)
-                self._apply_transaction_offer(
-                    updated_player, transaction.request, player.id
-                )
+        Args:
+            player: The proposing or target player of the transaction
+            transaction: ComponentTransaction to apply
 
-                # Apply the offer (what target player receives)
-                self._apply_transaction_receipt(updated_player, transaction.offer)
+        Returns:
+            An updated copy of the player; the player itself is unchanged
 
-                new_players.append(updated_player)
-            else:
-                # Other players unchanged
-                new_players.append(player)
+        Raises:
+            ValueError: If the player cannot give what the transaction requires
 
-        return self._create_new_state(players=new_players)
+        Requirements: 3.1, 3.4, 8.2
+        """
+        # Use deep copy to avoid mutating the original player (Requirements: 3.1, 3.4)
+        updated_player = copy.deepcopy(player)
+        if player.id == transaction.proposing_player:
+            # Proposing player: lose offer, gain request
+            given, received = transaction.offer, transaction.request
+        else:
+            # Target player: gain offer, lose request
+            given, received = transaction.request, transaction.offer
+        self._apply_transaction_offer(updated_player, given, player.id)
+        self._apply_transaction_receipt(updated_player, received)
+        return updated_player
 
     def _apply_transaction_offer(
         self,
@@ -1672,24 +1755,9 @@ class GameState:
 
         Requirements: 3.2, 3.3, 3.4
         """
-        from .promissory_notes import PromissoryNoteManager
-
-        new_manager = PromissoryNoteManager()
-
-        # Copy player hands (Requirements: 3.2, 3.3)
-        new_manager._player_hands = {
-            player_id: hand.copy()
-            for player_id, hand in self.promissory_note_manager._player_hands.items()
-        }
-
-        # Copy available notes (Requirements: 3.2, 3.3)
-        new_manager._available_notes = (
-            self.promissory_note_manager._available_notes.copy()
-        )
-
-        return new_manager
+        return self.promissory_note_manager.copy()
 
-    def _notify_transaction_observers(self, transaction: ComponentTransaction) -> None:
+    def notify_transaction_observers(self, transaction: ComponentTransaction) -> None:
         """Notify all registered observers of a completed transaction.
 
         Args:
@@ -1710,17 +1778,64 @@ class GameState:
                         f"Transaction observer failed: {e}. Continuing with remaining observers."
                     )
 
-    def is_fleet_supply_consistent(self) -> bool:
+    def is_fleet_supply_consistent(self, audit: bool = False) -> bool:
         """Check if fleet supply is consistent after transactions.
 
+        No system may hold more of a player's non-fighter ships than the
+        tokens in their fleet pool (Rule 37.1). The check reads the fleet
+        supply index, which is updated as units are placed and removed.
+
+        Args:
+            audit: Debug mode; also recount every system and fail if the
+                counters disagree with the recount
+
         Returns:
             True if fleet supply is consistent
 
         Requirements: 8.3
         """
-        # Placeholder implementation - actual fleet supply validation would go here
+        from .fleet_counters import audit_fleet_counts, get_fleet_supply_index
+
+        if audit and audit_fleet_counts(self):
+            return False
+        index = get_fleet_supply_index(self)
+        for player in self.players:
+            command_sheet = getattr(player, "command_sheet", None)
+            if command_sheet is None:
+                continue
+            if not index.is_within_fleet_supply(player.id, command_sheet.fleet_pool):
+                return False
         return True
 
+    def upgrade_player_units(self, player_id: str, technology: Technology) -> None:
+        """Give a player's units on the board a researched unit upgrade.
+
+        Units read their stats from their own technologies, and changing
+        them does not notify the counters and indices derived from the
+        board, so the player's capacity counts and space cannon coverage
+        are refreshed here.
+
+        Args:
+            player_id: The player who researched the upgrade
+            technology: The unit upgrade technology
+        """
+        for system in self.systems.values():
+            units = list(system.space_units)
+            for planet in system.planets:
+                units.extend(planet.units)
+            fleets = [fleet for fleet in system.fleets if fleet.owner == player_id]
+            for fleet in fleets:
+                units.extend(fleet.units)
+            owned = [unit for unit in units if unit.owner == player_id]
+            for unit in owned:
+                unit.add_technology(technology)
+            if owned:
+                system.refresh_fleet_counts()
+            for fleet in fleets:
+                fleet.refresh_counts()
+        if self._space_cannon_coverage is not None:
+            self._space_cannon_coverage.refresh_player(player_id)
+
     def is_production_system_consistent(self) -> bool:
         """Check if production system is consistent after transactions.
 
@@ -1742,6 +1857,16 @@ class GameState:
         """
         return len(self.secret_objective_deck)
 
+    def get_full_transaction_history(self) -> list[Any]:
+        """Get the archived and recent transaction history, oldest first.
+
+        Returns:
+            All transaction history entries
+        """
+        if not self.archived_transaction_history:
+            return self.transaction_history
+        return [*self.archived_transaction_history, *self.transaction_history]
+
     def add_transaction_to_history(
         self, transaction_entry: TransactionHistoryEntry
     ) -> GameState:
@@ -2867,7 +2992,7 @@ class GameState:
     def _check_law_violation(self, law: Any, context: Any) -> str | None:
         """Check if a specific law is violated by the context."""
         # Fleet pool regulations
-        if "fleet pool" in law.effect_description.lower():
+        if "fleet_pool" in law.effect_categories:
             fleet_size = (
                 context.additional_data.get("fleet_pool_size", 0)
                 if context.additional_data
@@ -2901,7 +3026,7 @@ class GameState:
         for law_data in serialized_state["active_laws"]:
             try:
                 active_law = ActiveLaw.from_dict(law_data)
-                self.law_manager._active_laws.append(active_law)
+                self.law_manager.restore_law(active_law)
             except (KeyError, ValueError, TypeError):
                 # Skip invalid law data rather than failing completely
                 continue
@@ -2911,11 +3036,7 @@ class GameState:
         if self.law_manager is None:
             return []
 
-        affecting_laws = []
-        for law in self.law_manager.get_active_laws():
-            if law.elected_target == player_id:
-                affecting_laws.append(law)
-        return affecting_laws
+        return self.law_manager.get_laws_affecting_player(player_id)
 
     def set_agenda_deck(self, deck: Any) -> None:
         """Set the agenda deck for the game state."""
@@ -1,11 +1,14 @@
 """Game-level technology management integration.
 
 This module provides the bridge between Rule 90 TechnologyManager and the game state system.
+
+Technology names are converted to TechnologyMasks bits in one pass per player,
+and research writes back only the researching player's technologies.
 """
 
 from .constants import Technology
 from .game_state import GameState
-from .technology import TechnologyManager
+from .technology import TECHNOLOGY_MASKS, TechnologyManager
 
 
 class GameTechnologyManager:
@@ -29,16 +32,11 @@ class GameTechnologyManager:
 
     def _sync_from_game_state(self) -> None:
         """Sync technology manager with existing game state data."""
-        # First try to sync from player_technologies dict
+        # Unknown names are skipped (might be faction-specific)
         for player_id, tech_names in self.game_state.player_technologies.items():
-            for tech_name in tech_names:
-                try:
-                    # Convert string to Technology enum
-                    technology = Technology(tech_name)
-                    self.technology_manager.gain_technology(player_id, technology)
-                except ValueError:
-                    # Skip unknown technologies (might be faction-specific)
-                    continue
+            self.technology_manager.gain_technology_mask(
+                player_id, TECHNOLOGY_MASKS.mask_from_values(tech_names)
+            )
 
         # For mock game states, also check player state technologies
         if hasattr(self.game_state, "players") and isinstance(
@@ -46,46 +44,35 @@ class GameTechnologyManager:
         ):
             for player_id, player_state in self.game_state.players.items():
                 if hasattr(player_state, "technologies"):
-                    for tech_name in player_state.technologies:
-                        try:
-                            # Convert string to Technology enum
-                            technology = Technology(tech_name)
-                            self.technology_manager.gain_technology(
-                                player_id, technology
-                            )
-                        except ValueError:
-                            # Skip unknown technologies (might be faction-specific)
-                            continue
+                    self.technology_manager.gain_technology_mask(
+                        player_id,
+                        TECHNOLOGY_MASKS.mask_from_values(player_state.technologies),
+                    )
 
     def _sync_to_game_state(self) -> None:
         """Sync technology manager data back to game state."""
         # Handle both real GameState (list of Player objects) and mock GameState (dict)
         if isinstance(self.game_state.players, list):
-            # Real GameState with list of Player objects
-            for player in self.game_state.players:
-                player_id = player.id
-                player_technologies = self.technology_manager.get_player_technologies(
-                    player_id
-                )
-                tech_names = {tech.value for tech in player_technologies}
-
-                # Update GameState technology tracking
-                self.game_state.player_technologies[player_id] = list(tech_names)
+            player_ids = [player.id for player in self.game_state.players]
         else:
-            # Mock GameState with dict of player_id -> player_state
-            for player_id in self.game_state.players.keys():
-                player_technologies = self.technology_manager.get_player_technologies(
-                    player_id
-                )
-                tech_names = {tech.value for tech in player_technologies}
+            player_ids = list(self.game_state.players.keys())
+        for player_id in player_ids:
+            self._sync_player_to_game_state(player_id)
+
+    def _sync_player_to_game_state(self, player_id: str) -> None:
+        """Sync one player's technologies back to game state."""
+        tech_names = TECHNOLOGY_MASKS.values(
+            self.technology_manager.get_player_technology_mask(player_id)
+        )
 
-                # Update GameState technology tracking
-                self.game_state.player_technologies[player_id] = list(tech_names)
+        # Update GameState technology tracking
+        self.game_state.player_technologies[player_id] = tech_names
 
-                # Also update mock player state if it exists
-                player_state = self.game_state.players.get(player_id)
-                if player_state and hasattr(player_state, "technologies"):
-                    player_state.technologies = tech_names
+        # Also update mock player state if it exists
+        if isinstance(self.game_state.players, dict):
+            player_state = self.game_state.players.get(player_id)
+            if player_state and hasattr(player_state, "technologies"):
+                player_state.technologies = set(tech_names)
 
     def can_research_technology(self, player_id: str, technology: Technology) -> bool:
         """Check if a player can research a technology.
@@ -112,14 +99,22 @@ class GameTechnologyManager:
         success = self.technology_manager.research_technology(player_id, technology)
 
         if success:
-            # Sync back to game state
-            self._sync_to_game_state()
+            # Sync back to game state; only this player's technologies changed
+            self._sync_player_to_game_state(player_id)
+            if self.is_unit_upgrade(technology):
+                self._upgrade_player_units(player_id, technology)
 
             # Note: Research history tracking would be handled by the game controller
             # that manages the GameState transitions, not by this manager directly
 
         return success
 
+    def _upgrade_player_units(self, player_id: str, technology: Technology) -> None:
+        """Apply a researched unit upgrade to the player's units on the board."""
+        # Mock game states have no board to upgrade
+        if isinstance(self.game_state, GameState):
+            self.game_state.upgrade_player_units(player_id, technology)
+
     def get_player_technologies(self, player_id: str) -> set[Technology]:
         """Get all technologies owned by a player.
 
@@ -131,6 +126,17 @@ class GameTechnologyManager:
         """
         return self.technology_manager.get_player_technologies(player_id)
 
+    def get_researchable_technologies(self, player_id: str) -> set[Technology]:
+        """Get every technology a player can research now.
+
+        Args:
+            player_id: The player attempting to research
+
+        Returns:
+            Set of technologies the player can research
+        """
+        return self.technology_manager.get_researchable_technologies(player_id)
+
     def get_technology_deck(self, player_id: str) -> set[Technology]:
         """Get all technologies available in a player's deck.
 
@@ -256,8 +256,8 @@ class InvasionController:
     ) -> None:
         """Execute space cannon defense against committed ground forces"""
         # Target only committed ground forces (infantry/mechs) of the active player
-        from .combat import CombatResolver
         from .constants import UnitType
+        from .pre_combat_rolls import PreCombatRollBatch
 
         committed_forces = [
             u
@@ -268,10 +268,10 @@ class InvasionController:
         if not committed_forces:
             return
 
-        resolver = CombatResolver()
-        total_hits = 0
+        batch = PreCombatRollBatch()
         for sc_unit in space_cannon_units:
-            total_hits += resolver.perform_space_cannon(sc_unit, committed_forces)
+            batch.add_space_cannon(sc_unit, planet.name)
+        total_hits = batch.roll().total_hits()
 
         # Destroy up to total_hits committed ground forces (deterministic order)
         for _ in range(min(total_hits, len(committed_forces))):
@@ -4,6 +4,15 @@ This module implements the core leader system including:
 - Leader types (Agent, Commander, Hero)
 - Leader state management (locked/unlocked, readied/exhausted, purged)
 - Base leader class and ability result structures
+- Memoized unlock condition checks
+
+Unlock conditions are checked for every locked leader whenever the game
+state may have changed, although most conditions read only a few parts of
+the state. Leaders may declare those parts (get_unlock_dependencies); the
+LeaderUnlockCache of a game state then keeps the last result per leader with
+a fingerprint of the declared parts, and re-runs check_unlock_conditions only
+when the fingerprint changes. Leaders that declare nothing are always
+re-checked.
 
 LRR References:
 - Rule 51: LEADERS
@@ -11,12 +20,16 @@ LRR References:
 
 from __future__ import annotations
 
+import weakref
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .constants import Faction
     from .game_state import GameState
     from .player import Player
@@ -45,6 +58,17 @@ class LeaderReadyStatus(Enum):
     EXHAUSTED = "exhausted"
 
 
+class UnlockDependency(Enum):
+    """Parts of the game state that leader unlock conditions can depend on."""
+
+    PLANETS = "planets"
+    TECHNOLOGIES = "technologies"
+    VICTORY_POINTS = "victory_points"
+    OBJECTIVES = "objectives"
+    TRADE_GOODS = "trade_goods"
+    UNITS = "units"
+
+
 @dataclass
 class LeaderAbilityResult:
     """Result of leader ability execution with standardized outcomes.
@@ -340,6 +364,14 @@ class BaseLeader(ABC):
         """Check if this leader's unlock conditions are met."""
         pass
 
+    def get_unlock_dependencies(self) -> frozenset[UnlockDependency] | None:
+        """Get the parts of the game state the unlock conditions read.
+
+        Returns:
+            The dependencies, or None if undeclared (always re-checked)
+        """
+        return None
+
     @abstractmethod
     def execute_ability(
         self, game_state: GameState, **kwargs: Any
@@ -1228,13 +1260,15 @@ class LeaderRegistry:
         return [agent, commander, hero]
 
     def get_leader_definition(
-        self, faction: Faction, leader_type: LeaderType
+        self, faction: Faction, leader_type: LeaderType, use_bundle: bool = True
     ) -> dict[str, Any]:
         """Get leader definition information for a specific faction and type.
 
         Args:
             faction: The faction to get leader definition for
             leader_type: The type of leader (AGENT, COMMANDER, or HERO)
+            use_bundle: Read the definition from the installed static data
+                bundle when one is available
 
         Returns:
             Dictionary containing leader definition information
@@ -1256,6 +1290,15 @@ class LeaderRegistry:
         if not isinstance(leader_type, LeaderType):
             raise TypeError("leader_type must be a LeaderType enum value")
 
+        if use_bundle:
+            from .data_bundle import get_installed_bundle
+
+            bundle = get_installed_bundle()
+            if bundle is not None:
+                definition = bundle.get_leader_definition(faction, leader_type)
+                if definition is not None:
+                    return definition
+
         # Placeholder implementation - actual definitions would come from compendium
         return {
             "name": f"{faction.value.title()} {leader_type.value.title()}",
@@ -1306,6 +1349,194 @@ class LeaderRegistry:
         return list(FactionEnum)
 
 
+# Memoized unlock condition checks
+
+
+def _is_plain(value: Any) -> bool:
+    return value is None or isinstance(value, (bool, int, float, str, Enum))
+
+
+def _plain_tuple(values: Any) -> tuple[Any, ...] | None:
+    if values is None:
+        return ()
+    values = tuple(values)
+    return values if all(_is_plain(value) for value in values) else None
+
+
+def _find_player(game_state: GameState, player_id: str) -> Any:
+    if hasattr(game_state, "get_player"):
+        return game_state.get_player(player_id)
+    for player in getattr(game_state, "players", []):
+        if getattr(player, "id", None) == player_id:
+            return player
+    return None
+
+
+def _read_planets(game_state: GameState, player: Any, player_id: str) -> Any:
+    planets: Sequence[Any] = ()
+    if hasattr(game_state, "get_player_planets"):
+        planets = game_state.get_player_planets(player_id)
+    names = _plain_tuple(getattr(planet, "name", None) for planet in planets or ())
+    return (
+        names,
+        getattr(player, "controlled_planets", None),
+        getattr(player, "controls_mecatol_rex", None),
+    )
+
+
+def _read_technologies(game_state: GameState, player: Any, player_id: str) -> Any:
+    return _plain_tuple(game_state.player_technologies.get(player_id))
+
+
+def _read_victory_points(game_state: GameState, player: Any, player_id: str) -> Any:
+    return (
+        game_state.victory_points.get(player_id),
+        getattr(player, "victory_points", None),
+    )
+
+
+def _read_objectives(game_state: GameState, player: Any, player_id: str) -> Any:
+    return (
+        _plain_tuple(game_state.completed_objectives.get(player_id)),
+        getattr(player, "completed_objectives", None),
+    )
+
+
+def _read_trade_goods(game_state: GameState, player: Any, player_id: str) -> Any:
+    trade_goods = None
+    if hasattr(player, "get_trade_goods"):
+        trade_goods = player.get_trade_goods()
+    return (trade_goods, getattr(player, "trade_goods", None))
+
+
+def _read_units(game_state: GameState, player: Any, player_id: str) -> Any:
+    counts: Counter[tuple[str, Any, Any]] = Counter()
+    for system_id, system in game_state.systems.items():
+        for unit in system.space_units:
+            if unit.owner == player_id:
+                counts[(system_id, None, unit.unit_type)] += 1
+        for planet in system.planets:
+            for unit in planet.units:
+                if unit.owner == player_id:
+                    counts[(system_id, planet.name, unit.unit_type)] += 1
+    return frozenset(counts.items())
+
+
+_DEPENDENCY_READERS = {
+    UnlockDependency.PLANETS: _read_planets,
+    UnlockDependency.TECHNOLOGIES: _read_technologies,
+    UnlockDependency.VICTORY_POINTS: _read_victory_points,
+    UnlockDependency.OBJECTIVES: _read_objectives,
+    UnlockDependency.TRADE_GOODS: _read_trade_goods,
+    UnlockDependency.UNITS: _read_units,
+}
+
+
+def _is_plain_fingerprint(value: Any) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_plain_fingerprint(item) for item in value)
+    return _is_plain(value)
+
+
+def get_unlock_fingerprint(
+    leader: BaseLeader, game_state: GameState
+) -> tuple[Any, ...] | None:
+    """Read the parts of the game state a leader's unlock conditions depend on.
+
+    Args:
+        leader: The leader
+        game_state: Current game state
+
+    Returns:
+        A comparable snapshot of the declared dependencies, or None if they
+        are undeclared or cannot be read (the conditions must be checked)
+    """
+    dependencies = leader.get_unlock_dependencies()
+    if dependencies is None:
+        return None
+    try:
+        player = _find_player(game_state, leader.player_id)
+        fingerprint = (leader.player_id, player is not None) + tuple(
+            _DEPENDENCY_READERS[dependency](game_state, player, leader.player_id)
+            for dependency in sorted(dependencies, key=lambda d: d.value)
+        )
+    except (TypeError, AttributeError):
+        return None
+    # Values that cannot be compared reliably (e.g. mocks) are never cached
+    return fingerprint if _is_plain_fingerprint(fingerprint) else None
+
+
+class LeaderUnlockCache:
+    """Last unlock condition result of each leader, with its fingerprint."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._results: weakref.WeakKeyDictionary[
+            BaseLeader, tuple[tuple[Any, ...], bool]
+        ] = weakref.WeakKeyDictionary()
+        self.checks = 0
+        self.hits = 0
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> None:
+        # Derived data: a copied game state builds its own cache on demand
+        return None
+
+    def check(self, leader: BaseLeader, game_state: GameState) -> bool:
+        """Check a leader's unlock conditions, reusing the last result.
+
+        The conditions are re-checked only if the leader's declared
+        dependencies changed since the last check.
+
+        Args:
+            leader: The leader to check
+            game_state: Current game state
+
+        Returns:
+            True if the unlock conditions are met
+        """
+        self.checks += 1
+        fingerprint = get_unlock_fingerprint(leader, game_state)
+        if fingerprint is None:
+            return bool(leader.check_unlock_conditions(game_state))
+        entry = self._results.get(leader)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            return entry[1]
+        result = bool(leader.check_unlock_conditions(game_state))
+        self._results[leader] = (fingerprint, result)
+        return result
+
+    def invalidate(self, leader: BaseLeader | None = None) -> None:
+        """Forget the result of one leader, or of all leaders."""
+        if leader is None:
+            self._results.clear()
+        else:
+            self._results.pop(leader, None)
+
+
+def get_leader_unlock_cache(game_state: GameState) -> LeaderUnlockCache:
+    """Get the unlock condition cache of a game state.
+
+    The cache is shared with later states derived from this one; cached
+    results stay valid because they are keyed by fingerprint.
+
+    Args:
+        game_state: The game state
+
+    Returns:
+        The cache (created on first use)
+    """
+    cache = getattr(game_state, "_leader_unlock_cache", None)
+    if isinstance(cache, LeaderUnlockCache):
+        return cache
+    cache = LeaderUnlockCache()
+    try:
+        object.__setattr__(game_state, "_leader_unlock_cache", cache)
+    except AttributeError:
+        pass
+    return cache
+
+
 # Leader Validation Framework
 
 
@@ -1780,7 +2011,7 @@ class LeaderAbilityValidator:
             return f"{leader.get_leader_type().value.title()} {leader.get_name()} has been purged and cannot be unlocked"
 
         # Check if unlock conditions are met
-        if not leader.check_unlock_conditions(game_state):
+        if not get_leader_unlock_cache(game_state).check(leader, game_state):
             conditions = leader.get_unlock_conditions()
             conditions_str = (
                 ", ".join(conditions) if conditions else "unknown conditions"
@@ -2016,7 +2247,8 @@ class LeaderManager:
 
         Iterates through all leaders for the specified player and checks if their
         unlock conditions are met. If conditions are met, automatically unlocks
-        the leader.
+        the leader. Leaders whose declared dependencies are unchanged since the
+        last check reuse its result (see LeaderUnlockCache).
 
         Args:
             player_id: The ID of the player whose leaders to check
@@ -2029,10 +2261,11 @@ class LeaderManager:
         - Requirements 8.1, 8.2, 8.3, 9.1, 9.2, 9.3, 9.4, 9.5
         """
         player = self._get_player(player_id)
+        cache = get_leader_unlock_cache(self.game_state)
 
         for leader in player.leader_sheet.get_all_leaders():
             if leader.lock_status == LeaderLockStatus.LOCKED:
-                if leader.check_unlock_conditions(self.game_state):
+                if cache.check(leader, self.game_state):
                     leader.unlock()
 
     def ready_agents(self, player_id: str) -> None:
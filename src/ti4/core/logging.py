@@ -1,16 +1,114 @@
-"""Enhanced logging system for TI4 game framework."""
+"""Enhanced logging system for TI4 game framework.
+
+Logging sits on hot paths (every executed command is logged), so nothing is
+formatted or serialized unless a handler will actually emit the record:
+
+- Messages use deferred ``%``-style arguments instead of f-strings.
+- Structured payloads are built only when the level is enabled, and are
+  JSON-encoded by the formatter, i.e. only for records that are emitted.
+- AsyncLogHandler moves formatting and I/O to a background thread so log
+  output never blocks game threads.
+"""
 
 import json
 import logging
+import logging.handlers
+import queue
+import threading
+from collections.abc import Callable, Iterator, Mapping
 from typing import Any
 
 from .events import GameEvent
 from .exceptions import TI4GameError
 
 
+class LazyPayload(Mapping[str, Any]):
+    """Structured data that is built on first use.
+
+    Lets callers attach expensive structured data to a record without paying
+    for it when the record is filtered out or never formatted. It is a
+    read-only mapping, so handlers can read it like the dict it replaces.
+    """
+
+    __slots__ = ("_builder", "_value")
+
+    def __init__(self, builder: Callable[[], dict[str, Any]]) -> None:
+        """Initialize with the function that builds the payload."""
+        self._builder: Callable[[], dict[str, Any]] | None = builder
+        self._value: dict[str, Any] | None = None
+
+    def resolve(self) -> dict[str, Any]:
+        """Build the payload (once) and return it."""
+        if self._builder is not None:
+            self._value = self._builder()
+            self._builder = None
+        assert self._value is not None
+        return self._value
+
+    def __getitem__(self, key: str) -> Any:
+        return self.resolve()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __repr__(self) -> str:
+        return repr(self.resolve())
+
+
+def is_logging_enabled(logger: logging.Logger, level: int) -> bool:
+    """Check whether a record at ``level`` would reach any handler.
+
+    Stricter than ``Logger.isEnabledFor``: a logger whose handlers all have
+    a higher level also counts as disabled.
+
+    Args:
+        logger: The logger to check
+        level: The record level
+
+    Returns:
+        True if at least one handler would emit the record
+    """
+    if not logger.isEnabledFor(level):
+        return False
+    current: logging.Logger | None = logger
+    found_handler = False
+    while current is not None:
+        for handler in current.handlers:
+            found_handler = True
+            if level >= handler.level:
+                return True
+        if not current.propagate:
+            break
+        current = current.parent
+    # Records without any handler go to logging.lastResort
+    last_resort = logging.lastResort
+    return (
+        not found_handler and last_resort is not None and (level >= last_resort.level)
+    )
+
+
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured logging output."""
 
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        indent: int | None = 2,
+    ) -> None:
+        """Initialize the formatter.
+
+        Args:
+            fmt: Message format string
+            datefmt: Date format string
+            indent: JSON indentation of structured data (None for one line)
+        """
+        super().__init__(fmt, datefmt)
+        self.indent = indent
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with structured data."""
         # Start with basic message
@@ -19,12 +117,160 @@ class StructuredFormatter(logging.Formatter):
         # Add structured data if present
         if hasattr(record, "structured_data"):
             structured_data = record.structured_data
-            structured_json = json.dumps(structured_data, indent=2)
+            if isinstance(structured_data, LazyPayload):
+                structured_data = structured_data.resolve()
+            structured_json = json.dumps(
+                structured_data, indent=self.indent, default=str
+            )
             message = f"{message}\nStructured Data: {structured_json}"
 
         return message
 
 
+# Stop sentinel of the listener thread (the value QueueListener checks for)
+_STOP_SENTINEL = None
+
+
+class _AsyncLogListener(logging.handlers.QueueListener):
+    """Queue listener that can be stopped while its queue is full."""
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord | None]",
+        *handlers: logging.Handler,
+        sentinel_timeout: float = 1.0,
+    ) -> None:
+        """Initialize the listener.
+
+        Args:
+            log_queue: Queue the records are read from
+            handlers: Handlers that format and write the records
+            sentinel_timeout: Seconds to wait for room for the stop sentinel
+                before pending records are discarded
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._log_queue = log_queue
+        self.sentinel_timeout = sentinel_timeout
+        self.discarded_records = 0
+
+    def enqueue_sentinel(self) -> None:
+        """Enqueue the stop sentinel without blocking forever.
+
+        The listener thread frees room as it handles records. If it does not
+        within sentinel_timeout, the pending records are discarded and the
+        put is retried.
+        """
+        while True:
+            try:
+                self._log_queue.put(_STOP_SENTINEL, timeout=self.sentinel_timeout)
+                return
+            except queue.Full:
+                self._discard_pending()
+
+    def _discard_pending(self) -> None:
+        """Drop every record still waiting in the queue."""
+        while True:
+            try:
+                self._log_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._log_queue.task_done()
+            self.discarded_records += 1
+
+
+class AsyncLogHandler(logging.handlers.QueueHandler):
+    """Queue-based handler that emits records on a background thread.
+
+    The calling thread only enqueues the record; message formatting,
+    structured payload serialization and I/O are done by the target
+    handlers on a listener thread. Records are passed by reference, so
+    structured data must not be mutated after it is logged.
+    """
+
+    def __init__(self, *handlers: logging.Handler, max_queue_size: int = 0) -> None:
+        """Initialize and start the listener thread.
+
+        Args:
+            handlers: Handlers that format and write the records
+            max_queue_size: Maximum number of pending records (0 = unbounded).
+                When the queue is full, new records are dropped rather than
+                blocking the game thread. Records still pending when the
+                handler is closed and the queue stays full are dropped too.
+        """
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(max_queue_size)
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self.dropped_records = 0
+        self._dropped_lock = threading.Lock()
+        self.listener = _AsyncLogListener(log_queue, *handlers)
+        self.listener.start()
+        self._running = True
+
+    @property
+    def target_handlers(self) -> tuple[logging.Handler, ...]:
+        """The handlers records are forwarded to."""
+        return tuple(self.listener.handlers)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through unformatted; the listener formats it."""
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, dropping it if the queue is full."""
+        try:
+            self._log_queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped_records += 1
+
+    def flush(self) -> None:
+        """Wait until all queued records have been handled."""
+        if self._running:
+            self._log_queue.join()
+
+    def close(self) -> None:
+        """Stop the listener after draining the queue."""
+        if self._running:
+            self._running = False
+            self.listener.stop()
+            with self._dropped_lock:
+                self.dropped_records += self.listener.discarded_records
+        super().close()
+
+
+def enable_async_logging(
+    logger: logging.Logger, max_queue_size: int = 0
+) -> AsyncLogHandler:
+    """Move a logger's handlers behind an AsyncLogHandler.
+
+    Args:
+        logger: The logger whose output should no longer block callers
+        max_queue_size: Maximum number of pending records (0 = unbounded)
+
+    Returns:
+        The installed handler (already async loggers return their handler)
+    """
+    for handler in logger.handlers:
+        if isinstance(handler, AsyncLogHandler):
+            return handler
+    targets = list(logger.handlers)
+    for handler in targets:
+        logger.removeHandler(handler)
+    async_handler = AsyncLogHandler(*targets, max_queue_size=max_queue_size)
+    logger.addHandler(async_handler)
+    return async_handler
+
+
+def disable_async_logging(logger: logging.Logger) -> None:
+    """Restore the handlers replaced by enable_async_logging()."""
+    for handler in list(logger.handlers):
+        if isinstance(handler, AsyncLogHandler):
+            logger.removeHandler(handler)
+            handler.close()
+            for target in handler.target_handlers:
+                logger.addHandler(target)
+
+
 class GameLogger:
     """Enhanced logging with structured data for game events and operations."""
 
@@ -52,6 +298,10 @@ class GameLogger:
         # Prevent propagation to avoid duplicate logs
         self.logger.propagate = False
 
+    def enable_async(self, max_queue_size: int = 0) -> AsyncLogHandler:
+        """Write this game's log output from a background thread."""
+        return enable_async_logging(self.logger, max_queue_size)
+
     def _build_base_extra(self, **additional_fields: Any) -> dict[str, Any]:
         """Build base extra data for logging with game_id and additional fields."""
         extra = {"game_id": self.game_id}
@@ -64,71 +314,86 @@ class GameLogger:
         result: str,
         context: dict[str, Any] | None = None,
     ) -> None:
-        """Log command execution with structured context."""
+        """Log command execution with structured context.
 
-        message = f"Command executed: {command.__class__.__name__}"
-        command_type = command.serialize().get(
-            "type", command.__class__.__name__.lower()
-        )
+        The command is only serialized if the record will be emitted. At
+        DEBUG level the structured data also includes the full serialized
+        command.
+        """
+        if not is_logging_enabled(self.logger, logging.INFO):
+            return
+
+        serialized = command.serialize()
+        command_type = serialized.get("type", command.__class__.__name__.lower())
         context = context or {}
+        include_command = self.logger.isEnabledFor(logging.DEBUG)
 
-        # Build structured data
-        structured_data = {
-            "game_id": self.game_id,
-            "command_type": command_type,
-            "result": result,
-            "context": context,
-        }
+        def build_structured_data() -> dict[str, Any]:
+            structured_data = {
+                "game_id": self.game_id,
+                "command_type": command_type,
+                "result": result,
+                "context": context,
+            }
+            if include_command:
+                structured_data["command"] = serialized
+            return structured_data
 
         # Log with structured data as extra
         extra = self._build_base_extra(
             command_type=command_type,
             result=result,
             context=context,
-            structured_data=structured_data,
+            structured_data=LazyPayload(build_structured_data),
+        )
+        self.logger.info(
+            "Command executed: %s", command.__class__.__name__, extra=extra
         )
-        self.logger.info(message, extra=extra)
 
     def log_event(self, event: GameEvent) -> None:
         """Log game events with structured data."""
-        message = f"Game event: {event.event_type}"
+        if not is_logging_enabled(self.logger, logging.INFO):
+            return
 
-        # Build structured data
-        structured_data = {
-            "game_id": self.game_id,
-            "event_type": event.event_type,
-            "event_data": event.data,
-            "timestamp": event.timestamp,
-        }
+        def build_structured_data() -> dict[str, Any]:
+            return {
+                "game_id": self.game_id,
+                "event_type": event.event_type,
+                "event_data": event.data,
+                "timestamp": event.timestamp,
+            }
 
         # Log with structured data as extra
         extra = self._build_base_extra(
             event_type=event.event_type,
             event_data=event.data,
-            structured_data=structured_data,
+            structured_data=LazyPayload(build_structured_data),
         )
-        self.logger.info(message, extra=extra)
+        self.logger.info("Game event: %s", event.event_type, extra=extra)
 
     def log_error(
         self, error: Exception, context: dict[str, Any] | None = None
     ) -> None:
         """Log errors with full context information."""
-        message = f"Game error occurred: {str(error)}"
+        if not is_logging_enabled(self.logger, logging.ERROR):
+            return
+
         context = context or {}
         error_context = getattr(error, "context", {})
 
-        # Build structured data
-        structured_data = {
-            "game_id": self.game_id,
-            "error_type": error.__class__.__name__,
-            "error_message": str(error),
-            "additional_context": context,
-        }
+        def build_structured_data() -> dict[str, Any]:
+            structured_data = {
+                "game_id": self.game_id,
+                "error_type": error.__class__.__name__,
+                "error_message": str(error),
+                "additional_context": context,
+            }
 
-        # Add TI4GameError specific context if available
-        if isinstance(error, TI4GameError):
-            structured_data["error_context"] = error.context
-            structured_data["error_timestamp"] = str(error.timestamp)
+            # Add TI4GameError specific context if available
+            if isinstance(error, TI4GameError):
+                structured_data["error_context"] = error.context
+                structured_data["error_timestamp"] = str(error.timestamp)
+            return structured_data
 
         # Log with structured data as extra
         extra = self._build_base_extra(
@@ -136,6 +401,6 @@ class GameLogger:
             error_message=str(error),
             error_context=error_context,
             additional_context=context,
-            structured_data=structured_data,
+            structured_data=LazyPayload(build_structured_data),
         )
-        self.logger.error(message, extra=extra)
+        self.logger.error("Game error occurred: %s", error, extra=extra)
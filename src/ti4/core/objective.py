@@ -1,16 +1,19 @@
 """Objective card system for TI4."""
 
-import csv
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .component_catalog import ObjectiveRecord
     from .constants import Expansion
+    from .events import CombatStartedEvent, GameEvent, GameEventBus, UnitMovedEvent
     from .game_phase import GamePhase
     from .game_state import GameState
 
@@ -82,6 +85,44 @@ class ObjectiveCategory(Enum):
     SPECIAL = "special"
 
 
+class ObjectiveStateFacet(Enum):
+    """Parts of the game state that objective requirements read.
+
+    Used by ObjectiveEligibilityTracker to re-evaluate only the objectives
+    affected by a state change.
+    """
+
+    PLANETS = "planets"
+    TECHNOLOGIES = "technologies"
+    UNITS = "units"
+    VICTORY_POINTS = "victory_points"
+    TRADE_GOODS = "trade_goods"
+    SPENDING = "spending"
+
+
+_Validator = TypeVar("_Validator", bound=Callable[..., bool])
+
+
+def reads_state_facets(
+    *facets: ObjectiveStateFacet,
+) -> Callable[[_Validator], _Validator]:
+    """Declare the game state facets a requirement validator reads.
+
+    Objectives whose validator declares no facets are re-evaluated on every
+    eligibility check.
+
+    Example:
+        >>> @reads_state_facets(ObjectiveStateFacet.PLANETS)
+        ... def validator(player_id: str, game_state: "GameState") -> bool: ...
+    """
+
+    def declare(validator: _Validator) -> _Validator:
+        setattr(validator, "state_facets", frozenset(facets))  # noqa: B010
+        return validator
+
+    return declare
+
+
 class CompletableObjective(ABC):
     """Abstract base class for objectives that can be completed by players.
 
@@ -156,6 +197,17 @@ class ObjectiveCard:
         if not callable(self.requirement_validator):
             raise ValueError("Requirement validator must be callable")
 
+    @property
+    def state_facets(self) -> frozenset[ObjectiveStateFacet] | None:
+        """Game state facets declared by the requirement validator.
+
+        Returns:
+            The declared facets, or None if the validator declares none (see
+            reads_state_facets)
+        """
+        facets = getattr(self.requirement_validator, "state_facets", None)
+        return facets if isinstance(facets, frozenset) else None
+
 
 @dataclass(frozen=True)
 class ObjectiveRequirement:
@@ -503,10 +555,16 @@ class ObjectiveCardFactory:
 
     # Class-level placeholder validator to avoid creating multiple instances
     @staticmethod
+    @reads_state_facets()
     def _placeholder_validator(player_id: str, game_state: "GameState") -> bool:
         """Placeholder validator function - will be implemented in later tasks."""
         return False
 
+    # Objective cards are immutable, so they are built once per process and
+    # shared; each entry point hands out a fresh container.
+    _objectives: MappingProxyType[str, ObjectiveCard] | None = None
+    _objectives_by_type: dict[ObjectiveType, tuple[ObjectiveCard, ...]] = {}
+
     @staticmethod
     def create_all_objectives() -> dict[str, ObjectiveCard]:
         """Create all 80 official TI4 objective cards.
@@ -518,98 +576,88 @@ class ObjectiveCardFactory:
             FileNotFoundError: If the objective cards CSV file is not found
             ValueError: If CSV data is malformed or invalid
         """
+        return dict(ObjectiveCardFactory._get_objectives())
+
+    @staticmethod
+    def _get_objectives() -> MappingProxyType[str, ObjectiveCard]:
+        """Get the shared objective cards, building them on first use."""
+        objectives = ObjectiveCardFactory._objectives
+        if objectives is not None:
+            return objectives
+
+        from .component_catalog import get_objective_catalog
+
         try:
-            csv_path = ObjectiveCardFactory._get_csv_path()
-            raw_data = ObjectiveCardFactory._load_csv_data(csv_path)
-            return ObjectiveCardFactory._create_objectives_from_data(raw_data)
+            records = get_objective_catalog().records
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Objective cards CSV file not found: {e}") from e
         except Exception as e:
             raise ValueError(f"Error creating objectives from CSV data: {e}") from e
 
-    @staticmethod
-    def _get_csv_path() -> str:
-        """Get the path to the objective cards CSV file."""
-        # Get project root by finding a known marker file
-        module_path = Path(__file__).resolve()
-        current = module_path
-        while current.parent != current:
-            if (current / "pyproject.toml").exists() or (current / "setup.py").exists():
-                csv_path = (
-                    current / "docs" / "component_details" / "TI4_objective_cards.csv"
-                )
-                return str(csv_path)
-            current = current.parent
-        raise FileNotFoundError("Could not locate project root")
+        objectives = MappingProxyType(
+            ObjectiveCardFactory._create_objectives_from_records(records)
+        )
+        by_type: dict[ObjectiveType, list[ObjectiveCard]] = {
+            objective_type: [] for objective_type in ObjectiveType
+        }
+        for objective in objectives.values():
+            by_type[objective.type].append(objective)
+        ObjectiveCardFactory._objectives_by_type = {
+            objective_type: tuple(cards) for objective_type, cards in by_type.items()
+        }
+        ObjectiveCardFactory._objectives = objectives
+        return objectives
 
     @staticmethod
-    def _load_csv_data(csv_path: str) -> list[dict[str, str]]:
-        """Load and validate CSV data from file."""
-        data = []
-        with open(csv_path, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            required = {"Name", "Condition", "Points", "Expansion", "Type", "Phase"}
-            header = set(reader.fieldnames or [])
-            if not required.issubset(header):
-                missing = required - header
-                raise ValueError(f"CSV missing required columns: {missing}")
-            for row in reader:
-                # Skip empty rows
-                if not row.get("Name", "").strip():
-                    continue
-                data.append(row)
-        return data
+    def _get_objectives_of_type(objective_type: ObjectiveType) -> list[ObjectiveCard]:
+        """Get the shared objective cards of one type."""
+        ObjectiveCardFactory._get_objectives()
+        return list(ObjectiveCardFactory._objectives_by_type[objective_type])
 
     @staticmethod
-    def _create_objectives_from_data(
-        raw_data: list[dict[str, str]],
+    def _create_objectives_from_records(
+        records: "Iterable[ObjectiveRecord]",
     ) -> dict[str, ObjectiveCard]:
-        """Create ObjectiveCard instances from raw CSV data."""
+        """Create ObjectiveCard instances from catalog records."""
         objectives = {}
 
-        for row in raw_data:
+        for record in records:
             try:
-                objective = ObjectiveCardFactory._create_single_objective(row)
+                objective = ObjectiveCardFactory._create_single_objective(record)
                 objectives[objective.id] = objective
             except Exception as e:
                 # Log error but continue processing other objectives
                 logger.warning(
-                    f"Failed to create objective from row {row.get('Name', 'Unknown')}: {e}"
+                    f"Failed to create objective from row {record.name}: {e}"
                 )
                 continue
 
         return objectives
 
     @staticmethod
-    def _create_single_objective(row: dict[str, str]) -> ObjectiveCard:
-        """Create a single ObjectiveCard from a CSV row."""
+    def _create_single_objective(record: "ObjectiveRecord") -> ObjectiveCard:
+        """Create a single ObjectiveCard from a catalog record."""
         # Create objective ID from name
-        obj_id = ObjectiveCardFactory._create_objective_id(row["Name"])
+        obj_id = ObjectiveCardFactory._create_objective_id(record.name)
 
         # Parse and validate data
-        expansion = ObjectiveCardFactory._parse_expansion(row["Expansion"])
-        phase = ObjectiveCardFactory._parse_phase(row["Phase"])
-        obj_type = ObjectiveCardFactory._parse_type(row["Type"])
+        expansion = ObjectiveCardFactory._parse_expansion(record.expansion)
+        phase = ObjectiveCardFactory._parse_phase(record.phase)
+        obj_type = ObjectiveCardFactory._parse_type(record.type)
 
-        # Process condition text
-        # Restore commas that were encoded as § in CSV to avoid delimiter conflicts
-        condition = row["Condition"].replace("§", ",")
+        # Encoded commas are already restored by the catalog
+        condition = record.condition
         category = ObjectiveCardFactory._determine_category(condition)
         dependencies = ObjectiveCardFactory._determine_dependencies(category)
 
-        # Validate points
-        try:
-            points = int(row["Points"])
-            if points <= 0:
-                raise ValueError(f"Points must be positive, got {points}")
-        except ValueError as e:
-            raise ValueError(f"Invalid points value '{row['Points']}': {e}") from e
+        if record.points <= 0:
+            raise ValueError(f"Points must be positive, got {record.points}")
 
         return ObjectiveCard(
             id=obj_id,
-            name=row["Name"].strip(),
+            name=record.name,
             condition=condition,
-            points=points,
+            points=record.points,
             expansion=expansion,
             phase=phase,
             type=obj_type,
@@ -733,30 +781,21 @@ class ObjectiveCardFactory:
     @staticmethod
     def create_stage_i_objectives() -> list[ObjectiveCard]:
         """Create all 20 Stage I public objectives."""
-        all_objectives = ObjectiveCardFactory.create_all_objectives()
-        return [
-            obj
-            for obj in all_objectives.values()
-            if obj.type == ObjectiveType.PUBLIC_STAGE_I
-        ]
+        return ObjectiveCardFactory._get_objectives_of_type(
+            ObjectiveType.PUBLIC_STAGE_I
+        )
 
     @staticmethod
     def create_stage_ii_objectives() -> list[ObjectiveCard]:
         """Create all 20 Stage II public objectives."""
-        all_objectives = ObjectiveCardFactory.create_all_objectives()
-        return [
-            obj
-            for obj in all_objectives.values()
-            if obj.type == ObjectiveType.PUBLIC_STAGE_II
-        ]
+        return ObjectiveCardFactory._get_objectives_of_type(
+            ObjectiveType.PUBLIC_STAGE_II
+        )
 
     @staticmethod
     def create_secret_objectives() -> list[ObjectiveCard]:
         """Create all 40 secret objectives."""
-        all_objectives = ObjectiveCardFactory.create_all_objectives()
-        return [
-            obj for obj in all_objectives.values() if obj.type == ObjectiveType.SECRET
-        ]
+        return ObjectiveCardFactory._get_objectives_of_type(ObjectiveType.SECRET)
 
 
 class ConcreteObjectiveRequirements:
@@ -766,6 +805,7 @@ class ConcreteObjectiveRequirements:
     players meet the requirements for specific TI4 objective cards.
     """
 
+    @reads_state_facets(ObjectiveStateFacet.PLANETS)
     def validate_corner_the_market(
         self, player_id: str, game_state: "GameState"
     ) -> bool:
@@ -790,6 +830,7 @@ class ConcreteObjectiveRequirements:
         # Check if any trait has 4 or more planets
         return any(count >= 4 for count in trait_counts.values())
 
+    @reads_state_facets(ObjectiveStateFacet.SPENDING)
     def validate_erect_monument(self, player_id: str, game_state: "GameState") -> bool:
         """Spend 8 resources.
 
@@ -809,6 +850,7 @@ class ConcreteObjectiveRequirements:
         # If no tracking exists, return False
         return False
 
+    @reads_state_facets(ObjectiveStateFacet.PLANETS)
     def validate_expand_borders(self, player_id: str, game_state: "GameState") -> bool:
         """Control 6 planets in non-home systems.
 
@@ -833,6 +875,7 @@ class ConcreteObjectiveRequirements:
 
         return non_home_planets >= 6
 
+    @reads_state_facets(ObjectiveStateFacet.SPENDING)
     def validate_found_golden_age(
         self, player_id: str, game_state: "GameState"
     ) -> bool:
@@ -856,6 +899,7 @@ class ConcreteObjectiveRequirements:
 
     # Technology-based objective validators
 
+    @reads_state_facets(ObjectiveStateFacet.TECHNOLOGIES)
     def validate_develop_weaponry(
         self, player_id: str, game_state: "GameState"
     ) -> bool:
@@ -883,6 +927,7 @@ class ConcreteObjectiveRequirements:
 
         return unit_upgrade_count >= 2
 
+    @reads_state_facets(ObjectiveStateFacet.TECHNOLOGIES)
     def validate_diversify_research(
         self, player_id: str, game_state: "GameState"
     ) -> bool:
@@ -1232,17 +1277,164 @@ class VictoryPointScoreboard:
         return standings
 
 
+def _planets_snapshot(game_state: "GameState") -> object:
+    """Snapshot planet control and exhaustion of every player."""
+    return tuple(
+        (player_id, tuple((p.name, p.controlled_by, p.is_exhausted()) for p in planets))
+        for player_id, planets in game_state.player_planets.items()
+    )
+
+
+def _technologies_snapshot(game_state: "GameState") -> object:
+    """Snapshot the technologies owned by every player."""
+    owned: list[object] = [
+        (player_id, tuple(technologies))
+        for player_id, technologies in game_state.player_technologies.items()
+    ]
+    owned.extend(
+        (player_id, tuple(card.name for card in cards))
+        for player_id, cards in game_state.player_technology_cards.items()
+    )
+    manager = getattr(game_state, "technology_manager", None)
+    if manager is not None:
+        owned.extend(
+            (player.id, manager.get_player_technology_mask(player.id))
+            for player in game_state.players
+        )
+    return tuple(owned)
+
+
+def _units_snapshot(game_state: "GameState") -> object:
+    """Snapshot the owner and type of every unit in the galaxy."""
+    units: list[object] = []
+    for system_id, system in game_state.systems.items():
+        units.append(
+            (system_id, tuple((u.owner, u.unit_type) for u in system.space_units))
+        )
+        units.extend(
+            (planet.name, tuple((u.owner, u.unit_type) for u in planet.units))
+            for planet in system.planets
+        )
+    return tuple(units)
+
+
+def _victory_points_snapshot(game_state: "GameState") -> object:
+    """Snapshot the victory points of every player."""
+    return tuple(game_state.victory_points.items())
+
+
+def _trade_goods_snapshot(game_state: "GameState") -> object:
+    """Snapshot the trade goods and commodities of every player."""
+    return tuple(
+        (player.id, player.get_trade_goods(), player.get_commodities())
+        for player in game_state.players
+    )
+
+
+def _spending_snapshot(game_state: "GameState") -> object:
+    """Snapshot the resources and influence spent this turn."""
+    return tuple(
+        tuple(getattr(game_state, name, {}).items())
+        for name in ("resource_spending_this_turn", "influence_spending_this_turn")
+    )
+
+
+_FACET_SNAPSHOTS: dict[ObjectiveStateFacet, Callable[["GameState"], object]] = {
+    ObjectiveStateFacet.PLANETS: _planets_snapshot,
+    ObjectiveStateFacet.TECHNOLOGIES: _technologies_snapshot,
+    ObjectiveStateFacet.UNITS: _units_snapshot,
+    ObjectiveStateFacet.VICTORY_POINTS: _victory_points_snapshot,
+    ObjectiveStateFacet.TRADE_GOODS: _trade_goods_snapshot,
+    ObjectiveStateFacet.SPENDING: _spending_snapshot,
+}
+
+
+def _take_facet_snapshots(
+    game_state: "GameState",
+) -> dict[ObjectiveStateFacet, object]:
+    """Snapshot every state facet for change detection.
+
+    A facet that cannot be read (e.g. on a partial game state) gets a unique
+    snapshot, so it always compares as changed.
+    """
+    snapshots: dict[ObjectiveStateFacet, object] = {}
+    for facet, snapshot in _FACET_SNAPSHOTS.items():
+        try:
+            snapshots[facet] = snapshot(game_state)
+        except Exception:
+            snapshots[facet] = object()
+    return snapshots
+
+
 class ObjectiveEligibilityTracker:
     """Tracks and detects objective eligibility for players.
 
-    This class provides caching and tracking mechanisms for objective
-    eligibility to improve performance and provide helpful notifications.
+    Objectives are loaded once per tracker. Eligibility is cached per player
+    together with a snapshot of every state facet. A check compares the
+    current facets with the snapshot, whether the game state was replaced or
+    mutated in place, and re-evaluates only the objectives that declare a
+    changed facet (see reads_state_facets). Objectives that declare no facets
+    are re-evaluated on every check.
     """
 
-    def __init__(self) -> None:
-        """Initialize the objective eligibility tracker."""
+    def __init__(self, objectives: dict[str, ObjectiveCard] | None = None) -> None:
+        """Initialize the objective eligibility tracker.
+
+        Args:
+            objectives: Objectives to track; loaded from the objective card
+                data on first use when not provided
+        """
+        self._objectives = objectives
+        self._objectives_by_facet: dict[ObjectiveStateFacet, list[str]] | None = None
+        self._undeclared_objectives: list[str] = []
         self._eligibility_cache: dict[str, dict[str, bool]] = {}
-        self._last_game_state_hash: str | None = None
+        self._facet_snapshots: dict[str, dict[ObjectiveStateFacet, object]] = {}
+        self._changed_facets: dict[str, set[ObjectiveStateFacet]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._total_checks = 0
+
+    def notify_state_changed(
+        self,
+        facets: "Iterable[ObjectiveStateFacet]",
+        player_id: str | None = None,
+    ) -> None:
+        """Record that part of the game state changed.
+
+        Changes are also detected by comparing facet snapshots; notifications
+        cover changes the snapshots cannot see.
+
+        Args:
+            facets: The state facets that changed
+            player_id: The affected player, or None if all players are affected
+        """
+        changed = set(facets)
+        player_ids = list(self._eligibility_cache) if player_id is None else [player_id]
+        for affected_player in player_ids:
+            if affected_player in self._eligibility_cache:
+                self._changed_facets.setdefault(affected_player, set()).update(changed)
+
+    def invalidate(self, player_id: str | None = None) -> None:
+        """Drop cached eligibility so the next check re-evaluates everything.
+
+        Args:
+            player_id: The player to invalidate, or None for all players
+        """
+        if player_id is None:
+            self._eligibility_cache.clear()
+            self._facet_snapshots.clear()
+            self._changed_facets.clear()
+        else:
+            self._eligibility_cache.pop(player_id, None)
+            self._facet_snapshots.pop(player_id, None)
+            self._changed_facets.pop(player_id, None)
+
+    def register_with_bus(self, event_bus: "GameEventBus") -> None:
+        """Subscribe to game events that change objective-relevant state."""
+        from .constants import EventConstants
+
+        event_bus.subscribe(EventConstants.UNIT_MOVED, self._handle_unit_moved)
+        event_bus.subscribe(EventConstants.COMBAT_STARTED, self._handle_combat_started)
 
     def check_all_objective_eligibility(
         self, player_id: str, game_state: "GameState"
@@ -1256,40 +1448,42 @@ class ObjectiveEligibilityTracker:
         Returns:
             Dictionary mapping objective IDs to eligibility status
         """
-        # Get all available objectives
-        try:
-            all_objectives = ObjectiveCardFactory.create_all_objectives()
-        except (FileNotFoundError, ValueError):
-            # If objective factory fails, return empty dict
-            return {}
-        except Exception:
-            # Catch any other exceptions
+        all_objectives = self._get_objectives()
+        if not all_objectives:
             return {}
 
-        eligibility = {}
+        self._total_checks += 1
+        snapshots = _take_facet_snapshots(game_state)
+        cached = self._eligibility_cache.get(player_id)
+        previous = self._facet_snapshots.get(player_id)
+        to_evaluate: list[str] | set[str]
+        if cached is None or previous is None:
+            to_evaluate = list(all_objectives)
+            cached = self._eligibility_cache[player_id] = {}
+            self._changed_facets.pop(player_id, None)
+        else:
+            changed = self._changed_facets.pop(player_id, set())
+            changed.update(
+                facet
+                for facet, snapshot in snapshots.items()
+                if previous.get(facet) != snapshot
+            )
+            to_evaluate = self._objectives_affected_by(changed)
+        self._facet_snapshots[player_id] = snapshots
 
-        for obj_id, objective in all_objectives.items():
+        self._cache_hits += len(all_objectives) - len(to_evaluate)
+        self._cache_misses += len(to_evaluate)
+
+        for obj_id in to_evaluate:
             try:
-                is_eligible = objective.requirement_validator(player_id, game_state)
-                eligibility[obj_id] = is_eligible
+                cached[obj_id] = all_objectives[obj_id].requirement_validator(
+                    player_id, game_state
+                )
             except Exception:
                 # If validation fails, mark as not eligible
-                eligibility[obj_id] = False
-
-        # Update cache
-        self._eligibility_cache[player_id] = eligibility
-
-        # Track game state version for cache invalidation using stable attributes
-        # Use a composite key of relevant state that affects objective eligibility
-        state_key_parts = [
-            str(getattr(game_state, "victory_points", {})),
-            str(getattr(game_state, "completed_objectives", {})),
-            str(getattr(game_state, "phase", "unknown")),
-            str(getattr(game_state, "round_number", 0)),
-        ]
-        self._last_game_state_hash = "|".join(state_key_parts)
+                cached[obj_id] = False
 
-        return eligibility
+        return dict(cached)
 
     def get_newly_eligible_objectives(
         self, player_id: str, game_state: "GameState"
@@ -1311,23 +1505,12 @@ class ObjectiveEligibilityTracker:
             player_id, game_state
         )
 
-        # Find newly eligible objectives
-        newly_eligible = []
-
-        try:
-            all_objectives = ObjectiveCardFactory.create_all_objectives()
-
-            for obj_id, is_currently_eligible in current_eligibility.items():
-                was_previously_eligible = previous_eligibility.get(obj_id, False)
-
-                if is_currently_eligible and not was_previously_eligible:
-                    if obj_id in all_objectives:
-                        newly_eligible.append(all_objectives[obj_id])
-        except (FileNotFoundError, ValueError):
-            # If objective factory fails, return empty list
-            pass
-
-        return newly_eligible
+        all_objectives = self._get_objectives()
+        return [
+            all_objectives[obj_id]
+            for obj_id, is_currently_eligible in current_eligibility.items()
+            if is_currently_eligible and not previous_eligibility.get(obj_id, False)
+        ]
 
     def update_eligibility_cache(self, game_state: "GameState") -> None:
         """Update cached eligibility data for performance.
@@ -1344,6 +1527,51 @@ class ObjectiveEligibilityTracker:
             for player_id in game_state.victory_points.keys():
                 self.check_all_objective_eligibility(player_id, game_state)
 
+    def _get_objectives(self) -> dict[str, ObjectiveCard]:
+        """Get the tracked objectives, loading them on first use."""
+        if self._objectives is None:
+            try:
+                self._objectives = ObjectiveCardFactory.create_all_objectives()
+            except Exception:
+                # If objective factory fails, track nothing until the next attempt
+                return {}
+        return self._objectives
+
+    def _objectives_affected_by(self, facets: set[ObjectiveStateFacet]) -> set[str]:
+        """Get the IDs of objectives that read any of the given facets.
+
+        Objectives that declare no facets are always included.
+        """
+        if self._objectives_by_facet is None:
+            index: dict[ObjectiveStateFacet, list[str]] = {
+                facet: [] for facet in ObjectiveStateFacet
+            }
+            undeclared: list[str] = []
+            for obj_id, objective in self._get_objectives().items():
+                declared = objective.state_facets
+                if declared is None:
+                    undeclared.append(obj_id)
+                    continue
+                for facet in declared:
+                    index[facet].append(obj_id)
+            self._objectives_by_facet = index
+            self._undeclared_objectives = undeclared
+        affected = set(self._undeclared_objectives)
+        for facet in facets:
+            affected.update(self._objectives_by_facet[facet])
+        return affected
+
+    def _handle_unit_moved(self, event: "GameEvent | UnitMovedEvent") -> None:
+        """Mark unit-dependent objectives as changed for the moving player."""
+        player_id = event.data.get("player_id")
+        if player_id:
+            self.notify_state_changed([ObjectiveStateFacet.UNITS], player_id)
+
+    def _handle_combat_started(self, event: "GameEvent | CombatStartedEvent") -> None:
+        """Mark unit-dependent objectives as changed for combat participants."""
+        for player_id in event.data.get("participants", []):
+            self.notify_state_changed([ObjectiveStateFacet.UNITS], player_id)
+
     def validate_master_the_sciences(
         self, player_id: str, game_state: "GameState"
     ) -> bool:
@@ -1383,10 +1611,9 @@ class ObjectiveEligibilityTracker:
         Returns:
             Dictionary with cache statistics including hits, misses, etc.
         """
-        # Return basic statistics for now
         return {
-            "cache_hits": 0,
-            "cache_misses": 0,
-            "total_checks": 0,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "total_checks": self._total_checks,
             "cached_players": len(self._eligibility_cache),
         }
@@ -1,9 +1,12 @@
 """Event observer implementations for TI4 game framework."""
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 
+from ti4.performance.histogram import LatencyHistogram
+
 from .events import (
     CombatStartedEvent,
     CustodiansTokenRemovedEvent,
@@ -222,6 +225,7 @@ class StatisticsCollector(EventObserver):
             "player_actions": {},
             "current_round": 1,
         }
+        self._event_latencies: dict[str, LatencyHistogram] = {}
 
     def handle_event(
         self,
@@ -242,6 +246,7 @@ class StatisticsCollector(EventObserver):
         """
         base_event = self._ensure_game_event(event)
         event_type = self._extract_event_type_identifier(base_event)
+        self._record_event_latency(event_type, base_event.timestamp)
 
         from .constants import EventConstants
 
@@ -270,6 +275,18 @@ class StatisticsCollector(EventObserver):
         """Get collected statistics."""
         return self._statistics.copy()
 
+    def get_event_latency_stats(self, event_type: str) -> dict[str, float]:
+        """Get delivery latency statistics (p50/p95/p99/max) for an event type."""
+        histogram = self._event_latencies.get(event_type)
+        return (histogram or LatencyHistogram()).summary()
+
+    def _record_event_latency(self, event_type: str, timestamp: float) -> None:
+        """Record the delay between an event's creation and its handling."""
+        histogram = self._event_latencies.get(event_type)
+        if histogram is None:
+            histogram = self._event_latencies[event_type] = LatencyHistogram()
+        histogram.record(max(0.0, time.time() - timestamp))
+
 
 class AITrainingDataCollector(EventObserver):
     """Observer that collects data for AI training."""
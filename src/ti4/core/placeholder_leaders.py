@@ -16,7 +16,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from .leaders import Agent, BaseLeader, Commander, Hero, LeaderAbilityResult
+from .leaders import (
+    Agent,
+    BaseLeader,
+    Commander,
+    Hero,
+    LeaderAbilityResult,
+    UnlockDependency,
+)
 
 if TYPE_CHECKING:
     from .constants import Faction
@@ -323,6 +330,10 @@ class UnlockableCommander(Commander):
         """Get unlock conditions for this commander."""
         return ["Control 3 or more planets", "Have at least 5 trade goods"]
 
+    def get_unlock_dependencies(self) -> frozenset[UnlockDependency]:
+        """Unlock conditions read controlled planets and trade goods."""
+        return frozenset({UnlockDependency.PLANETS, UnlockDependency.TRADE_GOODS})
+
     def check_unlock_conditions(self, game_state: GameState) -> bool:
         """Check if unlock conditions are met.
 
@@ -481,6 +492,16 @@ class PowerfulHero(Hero):
             "Have at least 10 victory points",
         ]
 
+    def get_unlock_dependencies(self) -> frozenset[UnlockDependency]:
+        """Unlock conditions read planets, objectives and victory points."""
+        return frozenset(
+            {
+                UnlockDependency.PLANETS,
+                UnlockDependency.OBJECTIVES,
+                UnlockDependency.VICTORY_POINTS,
+            }
+        )
+
     def check_unlock_conditions(self, game_state: GameState) -> bool:
         """Check if unlock conditions are met.
 
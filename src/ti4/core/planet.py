@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import weakref
+from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from .custodians_token import CustodiansToken
@@ -10,14 +11,30 @@ if TYPE_CHECKING:
     from .unit import Unit
 
 
+class PlanetExhaustListener(Protocol):
+    """Receives notifications when a planet is exhausted or readied."""
+
+    def on_planet_exhaust_changed(self, planet: Planet) -> None: ...
+
+
+class OccupancyListener(Protocol):
+    """Receives notifications when units move or planet control changes."""
+
+    def on_occupancy_changed(self, source: Any) -> None: ...
+
+
 class Planet:
     """Represents a planet within a system."""
 
     def __init__(self, name: str, resources: int, influence: int) -> None:
+        # Weakly held, like the exhaust listeners (e.g. a galaxy's neighbor cache)
+        self._occupancy_listeners: weakref.WeakSet[OccupancyListener] = (
+            weakref.WeakSet()
+        )
         self.name = name
         self._resources = resources
         self._influence = influence
-        self.controlled_by: str | None = None
+        self._controlled_by: str | None = None
         self.units: list[Unit] = []
         self._exhausted = False  # Rule 34: Track exhausted state
         self.traits: list[str] = []  # Rule 35: Planet traits for exploration
@@ -27,6 +44,49 @@ class Planet:
         self._custodians_token: CustodiansToken | None = (
             None  # Rule 27: Custodians token
         )
+        # Weakly held so short-lived readers (e.g. economy ledgers) can be freed
+        self._exhaust_listeners: weakref.WeakSet[PlanetExhaustListener] = (
+            weakref.WeakSet()
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Listeners belong to the original planet, not to copies
+        state = self.__dict__.copy()
+        del state["_exhaust_listeners"]
+        del state["_occupancy_listeners"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._exhaust_listeners = weakref.WeakSet()
+        self._occupancy_listeners = weakref.WeakSet()
+
+    def add_exhaust_listener(self, listener: PlanetExhaustListener) -> None:
+        """Notify a listener whenever this planet is exhausted or readied."""
+        self._exhaust_listeners.add(listener)
+
+    def _notify_exhaust_changed(self) -> None:
+        for listener in list(self._exhaust_listeners):
+            listener.on_planet_exhaust_changed(self)
+
+    def add_occupancy_listener(self, listener: OccupancyListener) -> None:
+        """Notify a listener whenever units or control of this planet change."""
+        self._occupancy_listeners.add(listener)
+
+    def _notify_occupancy_changed(self) -> None:
+        for listener in list(self._occupancy_listeners):
+            listener.on_occupancy_changed(self)
+
+    @property
+    def controlled_by(self) -> str | None:
+        """The player controlling this planet, if any."""
+        return self._controlled_by
+
+    @controlled_by.setter
+    def controlled_by(self, player_id: str | None) -> None:
+        if player_id != self._controlled_by:
+            self._controlled_by = player_id
+            self._notify_occupancy_changed()
 
     def set_control(self, player_id: str) -> None:
         """Set the controlling player of this planet."""
@@ -35,10 +95,12 @@ class Planet:
     def place_unit(self, unit: Unit) -> None:
         """Place a unit on this planet."""
         self.units.append(unit)
+        self._notify_occupancy_changed()
 
     def remove_unit(self, unit: Unit) -> None:
         """Remove a unit from this planet."""
         self.units.remove(unit)
+        self._notify_occupancy_changed()
 
     # Rule 34: Exhausted state mechanics
     def is_exhausted(self) -> bool:
@@ -54,10 +116,13 @@ class Planet:
         if self._exhausted:
             raise ValueError("Card is already exhausted")
         self._exhausted = True
+        self._notify_exhaust_changed()
 
     def ready(self) -> None:
         """Ready this planet (flip faceup)."""
-        self._exhausted = False
+        if self._exhausted:
+            self._exhausted = False
+            self._notify_exhaust_changed()
 
     def can_spend_resources(self) -> bool:
         """Check if this planet can spend resources.
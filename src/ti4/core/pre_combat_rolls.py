@@ -0,0 +1,211 @@
+"""Batched rolls for unit abilities resolved before combat.
+
+Anti-fighter barrage (Rule 10), bombardment (Rule 15) and space cannon
+(Rule 77) each have every participating unit roll its own dice against its
+own value. Rolling unit by unit means one random call and one hit count per
+die in Python. PreCombatRollBatch instead gathers every participating unit's
+dice count and hit value, rolls all dice of the batch in one call and counts
+hits with a single element-wise comparison of the results against the
+expanded hit values. Hits can then be totalled per player, per target or per
+ability before hits are assigned.
+
+None of these rolls are combat rolls: effects that modify combat rolls do not
+apply to bombardment (Rule 15.1c), so batches take hit values as given.
+
+Anti-fighter barrage is only batched on request
+(CombatResolver.resolve_anti_fighter_barrage_phase(batched=True)); the
+perform_anti_fighter_barrage* methods still roll one unit at a time.
+Dice are rolled with ti4.core.dice.roll_dice unless another roller is given.
+"""
+
+from __future__ import annotations
+
+import operator
+from dataclasses import dataclass
+from enum import Enum
+from itertools import accumulate, chain, pairwise, repeat
+from typing import TYPE_CHECKING, Any
+
+from . import dice
+from .constants import GameConstants
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from .unit import Unit
+
+_DIE_FACES = range(1, GameConstants.DEFAULT_COMBAT_DICE_SIDES + 1)
+
+
+class PreCombatAbility(Enum):
+    """Unit abilities rolled before combat."""
+
+    ANTI_FIGHTER_BARRAGE = "anti_fighter_barrage"
+    BOMBARDMENT = "bombardment"
+    SPACE_CANNON = "space_cannon"
+
+
+@dataclass(frozen=True)
+class AbilityRoll:
+    """The dice one unit rolls for one ability."""
+
+    unit: Unit
+    ability: PreCombatAbility
+    dice: int
+    hit_value: int
+    # Planet or player the roll is directed at, if declared
+    target: str | None = None
+
+    @property
+    def player_id(self) -> str:
+        """The player rolling."""
+        return self.unit.owner
+
+
+@dataclass(frozen=True)
+class PreCombatRollResult:
+    """Dice and hits of every roll of a batch, in the order they were added."""
+
+    rolls: tuple[AbilityRoll, ...]
+    dice_results: tuple[tuple[int, ...], ...]
+    hits: tuple[int, ...]
+
+    def total_hits(
+        self,
+        ability: PreCombatAbility | None = None,
+        player_id: str | None = None,
+        target: str | None = None,
+    ) -> int:
+        """Total hits of the rolls matching all given filters."""
+        return sum(
+            hits
+            for roll, hits in zip(self.rolls, self.hits, strict=True)
+            if (ability is None or roll.ability == ability)
+            and (player_id is None or roll.player_id == player_id)
+            and (target is None or roll.target == target)
+        )
+
+    def hits_by_player(self, ability: PreCombatAbility | None = None) -> dict[str, int]:
+        """Hits per rolling player."""
+        totals: dict[str, int] = {}
+        for roll, hits in zip(self.rolls, self.hits, strict=True):
+            if ability is None or roll.ability == ability:
+                totals[roll.player_id] = totals.get(roll.player_id, 0) + hits
+        return totals
+
+    def hits_by_target(
+        self, ability: PreCombatAbility | None = None
+    ) -> dict[str | None, int]:
+        """Hits per declared target, in the order targets were first added."""
+        totals: dict[str | None, int] = {}
+        for roll, hits in zip(self.rolls, self.hits, strict=True):
+            if ability is None or roll.ability == ability:
+                totals[roll.target] = totals.get(roll.target, 0) + hits
+        return totals
+
+
+class PreCombatRollBatch:
+    """Collects ability rolls and resolves them together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty batch."""
+        self._rolls: list[AbilityRoll] = []
+
+    def __len__(self) -> int:
+        return len(self._rolls)
+
+    @property
+    def rolls(self) -> list[AbilityRoll]:
+        """The rolls added so far."""
+        return list(self._rolls)
+
+    def add(
+        self,
+        unit: Unit,
+        ability: PreCombatAbility,
+        dice: int,
+        hit_value: int,
+        target: str | None = None,
+    ) -> None:
+        """Add one unit's roll.
+
+        Raises:
+            ValueError: If the dice count is negative or the hit value is not
+                a die face
+        """
+        if dice < 0:
+            raise ValueError("dice count cannot be negative")
+        if hit_value not in _DIE_FACES:
+            raise ValueError(f"hit value must be between 1 and {_DIE_FACES[-1]}")
+        if dice:
+            self._rolls.append(AbilityRoll(unit, ability, dice, hit_value, target))
+
+    def add_bombardment(
+        self,
+        unit: Unit,
+        planet_name: str,
+        technologies: Iterable[Any] | None = None,
+    ) -> None:
+        """Add a unit's bombardment roll against a planet (Rule 15.1).
+
+        Units without bombardment are skipped. Technologies that add dice
+        (Plasma Scoring) are applied as by BombardmentRoll.
+        """
+        if not unit.has_bombardment():
+            return
+        from .bombardment import BombardmentRoll
+
+        roll = BombardmentRoll(
+            unit.get_bombardment_value(),
+            unit.get_bombardment_dice_count(),
+            list(technologies) if technologies else None,
+        )
+        self.add(
+            unit,
+            PreCombatAbility.BOMBARDMENT,
+            roll.get_total_dice_count(),
+            roll.bombardment_value,
+            planet_name,
+        )
+
+    def add_space_cannon(self, unit: Unit, target: str | None = None) -> None:
+        """Add a unit's space cannon roll (Rule 77); others are skipped."""
+        if not unit.has_space_cannon():
+            return
+        stats = unit.get_stats()
+        if stats.space_cannon_value is None:
+            return
+        self.add(
+            unit,
+            PreCombatAbility.SPACE_CANNON,
+            stats.space_cannon_dice,
+            stats.space_cannon_value,
+            target,
+        )
+
+    def roll(
+        self, roll_dice: Callable[[int], Sequence[int]] | None = None
+    ) -> PreCombatRollResult:
+        """Roll every die of the batch at once and count hits.
+
+        Args:
+            roll_dice: Rolls a number of dice and returns their results;
+                defaults to ti4.core.dice.roll_dice
+        """
+        if roll_dice is None:
+            roll_dice = dice.roll_dice
+        rolls = tuple(self._rolls)
+        total = sum(roll.dice for roll in rolls)
+        results = list(roll_dice(total))
+        hit_values = chain.from_iterable(
+            repeat(roll.hit_value, roll.dice) for roll in rolls
+        )
+        successes = list(map(operator.ge, results, hit_values))
+
+        bounds = list(accumulate((roll.dice for roll in rolls), initial=0))
+        spans = list(pairwise(bounds))
+        return PreCombatRollResult(
+            rolls=rolls,
+            dice_results=tuple(tuple(results[start:end]) for start, end in spans),
+            hits=tuple(sum(successes[start:end]) for start, end in spans),
+        )
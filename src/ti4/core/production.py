@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from .blockade import BlockadeManager
     from .game_state import GameState
     from .planet import Planet
+    from .production_planner import ProductionPlanner
     from .resource_management import (
         CostValidationResult,
         CostValidator,
@@ -303,6 +304,50 @@ class ProductionManager:
                 error_message=f"Production validation failed: {str(e)}",
             )
 
+    def create_production_planner(
+        self,
+        system: System,
+        player_id: str,
+        reinforcements: dict[UnitType, int],
+        faction: Faction | None = None,
+        technologies: set[Technology] | None = None,
+        blockade_manager: BlockadeManager | None = None,
+    ) -> ProductionPlanner:
+        """Create a planner validating whole production orders for a system.
+
+        The planner reads production capacity, blockade status and available
+        resources once, so many candidate orders can be checked cheaply.
+
+        Args:
+            system: The system producing units
+            player_id: The producing player
+            reinforcements: Units available in reinforcements by type
+            faction: Optional faction for cost modifiers
+            technologies: Optional technologies for cost modifiers
+            blockade_manager: Optional blockade manager (Rule 14.1)
+
+        Returns:
+            A ProductionPlanner for the system
+
+        Raises:
+            ValueError: If CostValidator not provided
+        """
+        if not self.cost_validator:
+            raise ValueError("CostValidator required for production planning")
+
+        from .production_planner import ProductionPlanner
+
+        return ProductionPlanner(
+            system,
+            player_id,
+            self.cost_validator,
+            reinforcements,
+            faction=faction,
+            technologies=technologies,
+            production_manager=self,
+            blockade_manager=blockade_manager,
+        )
+
     def execute_production(
         self,
         player_id: str,
@@ -0,0 +1,345 @@
+"""Production planning for a whole production step (Rules 14, 26, 67 and 68).
+
+ProductionManager.validate_production checks one unit type and quantity at a
+time, and each call recomputes the player's available resources, the
+system's production capacity and its blockade status. A production step
+usually mixes unit types, and AI agents compare many candidate builds.
+ProductionPlanner reads everything a system's production depends on once:
+
+- the combined production capacity of the player's units (Rule 68.1a)
+- whether ships can be produced (Rule 67.6 and Rule 14.1)
+- the player's available resources and each unit type's modified cost
+  (CostValidator)
+
+Orders are then validated in one pass against reinforcements (Rule 67.5),
+production capacity (each fighter and infantry counts, Rule 68.1b), cost and
+blockade. Fighters and infantry are bought in pairs; producing one of a pair
+still costs the full price (Rule 68.1c).
+
+enumerate_builds() lists the Pareto-optimal affordable builds: the builds to
+which no further unit can be added without exceeding reinforcements,
+production capacity or resources. Every other affordable build produces a
+subset of one of them.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import TYPE_CHECKING
+
+from .constants import GameConstants, UnitType
+
+if TYPE_CHECKING:
+    from .blockade import BlockadeManager
+    from .constants import Faction, Technology
+    from .production import ProductionManager
+    from .production_ability import ProductionAbilityManager
+    from .resource_management import CostValidator
+    from .system import System
+    from .unit import Unit
+
+# Units bought two at a time (Rule 67.2)
+PAIRED_UNIT_TYPES = frozenset({UnitType.FIGHTER, UnitType.INFANTRY})
+
+# Unit types considered by enumerate_builds() by default; structures have no
+# cost and cannot be produced normally (Rule 26.3)
+PRODUCIBLE_UNIT_TYPES = (
+    UnitType.WAR_SUN,
+    UnitType.FLAGSHIP,
+    UnitType.DREADNOUGHT,
+    UnitType.CARRIER,
+    UnitType.CRUISER,
+    UnitType.DESTROYER,
+    UnitType.FIGHTER,
+    UnitType.MECH,
+    UnitType.INFANTRY,
+)
+
+
+@dataclass(frozen=True)
+class ProductionBuild:
+    """A set of units to produce in one system."""
+
+    units: tuple[tuple[UnitType, int], ...]
+    resource_cost: int
+    production_used: int
+
+    @property
+    def units_produced(self) -> int:
+        """Total number of units produced."""
+        return sum(count for _unit_type, count in self.units)
+
+    def as_dict(self) -> dict[UnitType, int]:
+        """Get the unit counts by type."""
+        return dict(self.units)
+
+
+@dataclass(frozen=True)
+class ProductionOrderResult:
+    """Result of validating a production order."""
+
+    is_valid: bool
+    build: ProductionBuild
+    errors: tuple[str, ...] = ()
+
+    @property
+    def error_message(self) -> str | None:
+        """All errors joined, or None for a valid order."""
+        return "; ".join(self.errors) if self.errors else None
+
+
+class ProductionPlanner:
+    """Validates and enumerates production orders for one player in one system."""
+
+    def __init__(
+        self,
+        system: System,
+        player_id: str,
+        cost_validator: CostValidator,
+        reinforcements: Mapping[UnitType, int],
+        faction: Faction | None = None,
+        technologies: set[Technology] | None = None,
+        production_manager: ProductionManager | None = None,
+        production_ability_manager: ProductionAbilityManager | None = None,
+        blockade_manager: BlockadeManager | None = None,
+    ) -> None:
+        """Read the system's production capacity, blockade and resources.
+
+        Args:
+            system: The system producing units
+            player_id: The producing player
+            cost_validator: CostValidator for unit costs and resources
+            reinforcements: Units available in reinforcements by type
+            faction: Optional faction for cost modifiers
+            technologies: Optional technologies for cost modifiers
+            production_manager: Manager for the Rule 67.6 ship check
+            production_ability_manager: Manager for production values
+            blockade_manager: Optional blockade manager (Rule 14.1)
+        """
+        if production_manager is None:
+            from .production import ProductionManager
+
+            production_manager = ProductionManager()
+        if production_ability_manager is None:
+            from .production_ability import ProductionAbilityManager
+
+            production_ability_manager = ProductionAbilityManager()
+
+        self.system = system
+        self.player_id = player_id
+        self.reinforcements = dict(reinforcements)
+        self._cost_validator = cost_validator
+        self._faction = faction
+        self._technologies = technologies
+        self._unit_costs: dict[UnitType, Fraction | None] = {}
+
+        self.production_capacity = (
+            production_ability_manager.get_combined_production_in_system(
+                system, player_id
+            )
+        )
+        self.available_resources = (
+            cost_validator.resource_manager.calculate_available_resources(player_id)
+        )
+        self.blockaded = blockade_manager is not None and any(
+            blockade_manager.is_unit_blockaded(unit)
+            for unit in _player_units_in_system(system, player_id)
+        )
+        self.can_produce_ships = (
+            production_manager.can_produce_ships_in_system(system, player_id)
+            and not self.blockaded
+        )
+
+    def get_resource_cost(self, order: Mapping[UnitType, int]) -> int:
+        """Get the resources needed for an order.
+
+        Raises:
+            ValueError: If a unit type has no cost (Rule 26.3)
+        """
+        total = Fraction(0)
+        for unit_type, count in order.items():
+            cost = self._type_cost(unit_type, count)
+            if cost is None:
+                raise ValueError(f"{unit_type.name.lower()} cannot be produced")
+            total += cost
+        return math.ceil(total)
+
+    def validate(self, order: Mapping[UnitType, int]) -> ProductionOrderResult:
+        """Validate a whole production order in one pass.
+
+        Args:
+            order: Number of units to produce by type (not pairs)
+
+        Returns:
+            ProductionOrderResult listing every violated rule
+        """
+        errors = []
+        total = Fraction(0)
+        production_used = 0
+        for unit_type, count in order.items():
+            name = unit_type.name.lower()
+            if count < 0:
+                errors.append(f"Quantity of {name} cannot be negative")
+                continue
+            if count == 0:
+                continue
+            # Rule 68.1b: each unit counts, fighters and infantry included
+            production_used += count
+            available = self.reinforcements.get(unit_type, 0)
+            if count > available:
+                errors.append(
+                    f"Insufficient reinforcements for {name}: need {count}, "
+                    f"have {available}"
+                )
+            if unit_type in GameConstants.SHIP_TYPES and not self.can_produce_ships:
+                reason = "blockaded" if self.blockaded else "enemy ships present"
+                errors.append(f"Cannot produce {name} in this system ({reason})")
+            cost = self._type_cost(unit_type, count)
+            if cost is None:
+                errors.append(f"{name} cannot be produced normally (Rule 26.3)")
+            else:
+                total += cost
+
+        if production_used > self.production_capacity:
+            errors.append(
+                f"Production capacity exceeded: need {production_used}, "
+                f"have {self.production_capacity}"
+            )
+        resource_cost = math.ceil(total)
+        if resource_cost > self.available_resources:
+            errors.append(
+                f"Insufficient resources: need {resource_cost}, "
+                f"have {self.available_resources}"
+            )
+
+        build = ProductionBuild(
+            units=tuple(
+                (unit_type, count) for unit_type, count in order.items() if count > 0
+            ),
+            resource_cost=resource_cost,
+            production_used=production_used,
+        )
+        return ProductionOrderResult(
+            is_valid=not errors, build=build, errors=tuple(errors)
+        )
+
+    def enumerate_builds(
+        self,
+        unit_types: Iterable[UnitType] | None = None,
+        budget: int | None = None,
+    ) -> list[ProductionBuild]:
+        """Enumerate the Pareto-optimal affordable builds.
+
+        Args:
+            unit_types: Unit types to consider (default PRODUCIBLE_UNIT_TYPES)
+            budget: Resources to spend at most (default all available)
+
+        Returns:
+            Builds to which no unit can be added, most units first
+        """
+        resources = self.available_resources
+        if budget is not None:
+            resources = min(resources, budget)
+
+        # Per type: (unit type, maximum count, cost of a unit or pair)
+        options: list[tuple[UnitType, int, Fraction]] = []
+        for unit_type in unit_types or PRODUCIBLE_UNIT_TYPES:
+            limit = min(self.reinforcements.get(unit_type, 0), self.production_capacity)
+            if unit_type in GameConstants.SHIP_TYPES and not self.can_produce_ships:
+                limit = 0
+            cost = self._type_cost(unit_type, 1)
+            if limit > 0 and cost is not None and cost <= resources:
+                options.append((unit_type, limit, cost))
+
+        builds: list[ProductionBuild] = []
+        counts = [0] * len(options)
+
+        def extendable(spent: Fraction, used: int) -> bool:
+            if used >= self.production_capacity:
+                return False
+            for index, (unit_type, limit, cost) in enumerate(options):
+                count = counts[index]
+                if count >= limit:
+                    continue
+                # The second unit of a pair is already paid for
+                if unit_type in PAIRED_UNIT_TYPES and count % 2:
+                    return True
+                if math.ceil(spent + cost) <= resources:
+                    return True
+            return False
+
+        def search(index: int, spent: Fraction, used: int) -> None:
+            if index == len(options):
+                if not extendable(spent, used):
+                    builds.append(self._build(options, counts, spent, used))
+                return
+            unit_type, limit, cost = options[index]
+            room = min(limit, self.production_capacity - used)
+            for count in range(room, -1, -1):
+                added = self._cost_of(unit_type, count, cost)
+                if math.ceil(spent + added) > resources:
+                    continue
+                counts[index] = count
+                search(index + 1, spent + added, used + count)
+            counts[index] = 0
+
+        search(0, Fraction(0), 0)
+        builds.sort(key=lambda build: (-build.units_produced, build.resource_cost))
+        return builds
+
+    def _type_cost(self, unit_type: UnitType, count: int) -> Fraction | None:
+        if unit_type not in self._unit_costs:
+            from .resource_management import CostCalculationError
+
+            try:
+                cost = self._cost_validator.get_unit_cost(
+                    unit_type, self._faction, self._technologies
+                )
+            except CostCalculationError:
+                cost = 0
+            if not cost:
+                self._unit_costs[unit_type] = None
+            elif unit_type in PAIRED_UNIT_TYPES:
+                self._unit_costs[unit_type] = Fraction(cost) * 2
+            else:
+                self._unit_costs[unit_type] = Fraction(cost)
+        unit_cost = self._unit_costs[unit_type]
+        if unit_cost is None:
+            return None
+        return self._cost_of(unit_type, count, unit_cost)
+
+    @staticmethod
+    def _cost_of(unit_type: UnitType, count: int, unit_cost: Fraction) -> Fraction:
+        # Rule 68.1c: one unit of a pair costs the whole pair
+        if unit_type in PAIRED_UNIT_TYPES:
+            return unit_cost * math.ceil(count / 2)
+        return unit_cost * count
+
+    @staticmethod
+    def _build(
+        options: list[tuple[UnitType, int, Fraction]],
+        counts: list[int],
+        spent: Fraction,
+        used: int,
+    ) -> ProductionBuild:
+        return ProductionBuild(
+            units=tuple(
+                (unit_type, count)
+                for (unit_type, _limit, _cost), count in zip(
+                    options, counts, strict=True
+                )
+                if count
+            ),
+            resource_cost=math.ceil(spent),
+            production_used=used,
+        )
+
+
+def _player_units_in_system(system: System, player_id: str) -> list[Unit]:
+    units = [unit for unit in system.space_units if unit.owner == player_id]
+    for planet in system.planets:
+        units.extend(unit for unit in planet.units if unit.owner == player_id)
+    return units
@@ -4,6 +4,7 @@ This module implements Rule 69: PROMISSORY NOTES mechanics according to the TI4
 Handles promissory note management, ownership, resolution, and lifecycle.
 """
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from .transactions import PromissoryNote, PromissoryNoteType
@@ -82,6 +83,36 @@ class PromissoryNoteManager:
         """
         return self._player_hands.get(player_id, [])
 
+    def get_player_hands(self) -> dict[str, list[PromissoryNote]]:
+        """Get a copy of every player's promissory note hand.
+
+        Returns:
+            Dictionary mapping player IDs to copies of their hands
+        """
+        return {
+            player_id: hand.copy() for player_id, hand in self._player_hands.items()
+        }
+
+    def set_player_hand(self, player_id: str, notes: Iterable[PromissoryNote]) -> None:
+        """Replace a player's promissory note hand.
+
+        Args:
+            player_id: The player whose hand to replace
+            notes: The notes the player now holds
+        """
+        self._player_hands[player_id] = list(notes)
+
+    def copy(self) -> "PromissoryNoteManager":
+        """Create a copy with the same player hands and available notes.
+
+        Returns:
+            New PromissoryNoteManager whose hands can change independently
+        """
+        new_manager = PromissoryNoteManager()
+        new_manager._player_hands = self.get_player_hands()
+        new_manager._available_notes = self._available_notes.copy()
+        return new_manager
+
     def return_note_after_use(
         self,
         note: PromissoryNote,
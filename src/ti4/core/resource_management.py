@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from .constants import Faction, Technology, UnitType
+from .economy_ledger import PlayerEconomy, get_economy_ledger
 
 if TYPE_CHECKING:
     from .game_state import GameState
@@ -296,6 +297,424 @@ class ProductionCost:
         return self.total_cost / self.units_produced
 
 
+@dataclass(frozen=True)
+class PlanetSelection:
+    """Planets and trade goods chosen by a SpendingPlanner for one payment."""
+
+    planets_to_exhaust: dict[str, int]  # planet_name -> value
+    trade_goods_to_spend: int
+    total_value: int
+    overspend: int
+
+
+class SpendingPlanner:
+    """Optimal planet selection for resource or influence payments.
+
+    A planet cannot be partially exhausted, so choosing which planets to exhaust is a subset-sum problem. The planner
+    builds one 0/1 knapsack table over every reachable planet total and then
+    answers any number of payment amounts from it in O(1) plus the size of
+    the selection. For a given amount it picks, in order of priority:
+
+    1. No trade goods unless the ready planets cannot cover the amount
+    2. The smallest overspend
+    3. The fewest planets exhausted
+    4. The least preserved value exhausted (e.g. the influence lost when a
+       planet is exhausted for its resources), which keeps dual-value
+       planets available for the other kind of payment
+    """
+
+    def __init__(
+        self,
+        planet_values: dict[str, int],
+        trade_goods: int,
+        preserved_values: dict[str, int] | None = None,
+    ) -> None:
+        """Initialize with the spendable planets and trade goods.
+
+        Args:
+            planet_values: Ready planet name -> resource or influence value
+            trade_goods: Trade goods that may cover what planets cannot
+            preserved_values: Planet name -> value lost when it is exhausted
+                that should be kept where possible (tie-breaker only)
+        """
+        preserved = preserved_values or {}
+        # Sorted for deterministic selections between equally good plans
+        self._planets = sorted(
+            (
+                (name, value, preserved.get(name, 0))
+                for name, value in planet_values.items()
+                if value > 0
+            ),
+            key=lambda planet: (planet[1], planet[0]),
+        )
+        self._trade_goods = trade_goods
+        self._total_planet_value = sum(value for _, value, _ in self._planets)
+        # _best[total] = (planets exhausted, preserved value, selection bitmask)
+        self._best: list[tuple[int, int, int] | None] | None = None
+        # _next_reachable[amount] = smallest reachable planet total >= amount
+        self._next_reachable: list[int] = []
+
+    @property
+    def trade_goods(self) -> int:
+        """Trade goods available to the planner."""
+        return self._trade_goods
+
+    @property
+    def total_available(self) -> int:
+        """Total value of all planets plus trade goods."""
+        return self._total_planet_value + self._trade_goods
+
+    def can_afford(self, amount: int) -> bool:
+        """Check whether the amount can be paid at all."""
+        return amount <= self.total_available
+
+    def plan(self, amount: int) -> PlanetSelection:
+        """Select planets and trade goods to pay the amount.
+
+        When the amount cannot be covered, every planet and all trade goods
+        are selected so callers can report the shortfall.
+
+        Args:
+            amount: The resource or influence amount to pay
+
+        Returns:
+            The optimal PlanetSelection for the amount
+        """
+        if amount <= 0:
+            return PlanetSelection({}, 0, 0, 0)
+
+        best = self._get_table()
+        if amount <= self._total_planet_value:
+            planet_total = self._next_reachable[amount]
+            trade_goods = 0
+        else:
+            planet_total = self._total_planet_value
+            trade_goods = min(amount - planet_total, self._trade_goods)
+
+        entry = best[planet_total]
+        assert entry is not None
+        mask = entry[2]
+        planets = {
+            name: value
+            for index, (name, value, _) in enumerate(self._planets)
+            if mask >> index & 1
+        }
+        total_value = planet_total + trade_goods
+        return PlanetSelection(
+            planets_to_exhaust=planets,
+            trade_goods_to_spend=trade_goods,
+            total_value=total_value,
+            overspend=max(0, total_value - amount),
+        )
+
+    def plan_batch(self, amounts: list[int]) -> list[PlanetSelection]:
+        """Plan several independent payments from the shared table."""
+        return [self.plan(amount) for amount in amounts]
+
+    def _get_table(self) -> list[tuple[int, int, int] | None]:
+        """Build the subset-sum table on first use."""
+        if self._best is not None:
+            return self._best
+
+        total = self._total_planet_value
+        best: list[tuple[int, int, int] | None] = [None] * (total + 1)
+        best[0] = (0, 0, 0)
+        for index, (_, value, preserved) in enumerate(self._planets):
+            bit = 1 << index
+            # Descending totals so each planet is used at most once
+            for planet_total in range(total, value - 1, -1):
+                previous = best[planet_total - value]
+                if previous is None:
+                    continue
+                count = previous[0] + 1
+                preserved_total = previous[1] + preserved
+                current = best[planet_total]
+                if current is None or (count, preserved_total) < current[:2]:
+                    best[planet_total] = (count, preserved_total, previous[2] | bit)
+
+        next_reachable = [total] * (total + 1)
+        nearest = total
+        for planet_total in range(total, -1, -1):
+            if best[planet_total] is not None:
+                nearest = planet_total
+            next_reachable[planet_total] = nearest
+
+        self._next_reachable = next_reachable
+        self._best = best
+        return best
+
+
+class JointSpendingPlanner:
+    """Joint planet allocation for simultaneous resource and influence costs.
+
+    Each ready planet can be exhausted for its resources or its influence,
+    never both, so planning the two costs separately can double-book a
+    planet. The planner keeps, for every reachable (resources, influence)
+    pair, the fewest planets that produce exactly that pair (then the least
+    value lost from exhausting a planet for its other value). Plans are
+    chosen from these states by the same priorities as SpendingPlanner:
+    shortfall, trade goods spent, overspend, then planets exhausted.
+
+    The Pareto frontier of the states is condensed into a table of the most
+    influence that can be paid alongside each resource amount (trade goods
+    included), so affordability checks are a single lookup. Readying or
+    gaining a planet extends the states incrementally; exhausting or losing
+    one rebuilds them.
+    """
+
+    def __init__(
+        self,
+        planets: dict[str, tuple[int, int]],
+        trade_goods: int,
+        for_voting: bool = False,
+    ) -> None:
+        """Initialize with the player's ready planets and trade goods.
+
+        Args:
+            planets: Ready planet name -> (resources, influence)
+            trade_goods: Trade goods available to cover either cost
+            for_voting: If True, trade goods cannot pay influence (Rule 47.3)
+        """
+        self._trade_goods = trade_goods
+        self._for_voting = for_voting
+        self._planets: list[tuple[str, int, int]] = []
+        self._planet_values: dict[str, tuple[int, int]] = {}
+        # (resources, influence) -> (planets, value lost, resource mask,
+        # influence mask)
+        self._states: dict[tuple[int, int], tuple[int, int, int, int]] = {
+            (0, 0): (0, 0, 0, 0)
+        }
+        # _affordable_influence[r] = most influence payable alongside r resources
+        self._affordable_influence: list[int] | None = None
+        for name in sorted(planets):
+            self.add_planet(name, *planets[name])
+
+    @property
+    def trade_goods(self) -> int:
+        """Trade goods available to the planner."""
+        return self._trade_goods
+
+    @property
+    def planet_values(self) -> dict[str, tuple[int, int]]:
+        """Planet name -> (resources, influence) of the planets planned over."""
+        return dict(self._planet_values)
+
+    def add_planet(self, name: str, resources: int, influence: int) -> None:
+        """Add a ready planet, extending the reachable states in place."""
+        if name in self._planet_values:
+            self.remove_planet(name)
+        bit = 1 << len(self._planets)
+        self._planets.append((name, resources, influence))
+        self._planet_values[name] = (resources, influence)
+
+        updated = dict(self._states)
+        for (resource_total, influence_total), state in self._states.items():
+            count, lost, resource_mask, influence_mask = state
+            if resources > 0:
+                self._offer(
+                    updated,
+                    (resource_total + resources, influence_total),
+                    (count + 1, lost + influence, resource_mask | bit, influence_mask),
+                )
+            if influence > 0:
+                self._offer(
+                    updated,
+                    (resource_total, influence_total + influence),
+                    (count + 1, lost + resources, resource_mask, influence_mask | bit),
+                )
+        self._states = updated
+        self._affordable_influence = None
+
+    def remove_planet(self, name: str) -> None:
+        """Remove a planet that was exhausted or lost."""
+        if name in self._planet_values:
+            remaining = self.planet_values
+            del remaining[name]
+            self.sync(remaining, self._trade_goods)
+
+    def sync(self, planets: dict[str, tuple[int, int]], trade_goods: int) -> None:
+        """Bring the planner up to date with the current ready planets.
+
+        Newly ready planets are added incrementally; the states are only
+        rebuilt when a planet was exhausted, lost or changed value.
+        """
+        if any(
+            planets.get(name) != values for name, values in self._planet_values.items()
+        ):
+            self._planets = []
+            self._planet_values = {}
+            self._states = {(0, 0): (0, 0, 0, 0)}
+            self._affordable_influence = None
+        for name in sorted(planets.keys() - self._planet_values.keys()):
+            self.add_planet(name, *planets[name])
+        if trade_goods != self._trade_goods:
+            self._trade_goods = trade_goods
+            self._affordable_influence = None
+
+    def get_frontier(self) -> list[tuple[int, int]]:
+        """Get the Pareto-optimal (resources, influence) totals from planets.
+
+        Returns:
+            Non-dominated totals, ordered by increasing resources
+        """
+        best_influence: dict[int, int] = {}
+        for resource_total, influence_total in self._states:
+            if influence_total > best_influence.get(resource_total, -1):
+                best_influence[resource_total] = influence_total
+        frontier: list[tuple[int, int]] = []
+        for resource_total in sorted(best_influence, reverse=True):
+            influence_total = best_influence[resource_total]
+            if not frontier or influence_total > frontier[-1][1]:
+                frontier.append((resource_total, influence_total))
+        frontier.reverse()
+        return frontier
+
+    def can_afford(self, resource_amount: int, influence_amount: int) -> bool:
+        """Check whether both costs can be paid together in O(1)."""
+        table = self._get_affordable_influence()
+        if resource_amount >= len(table):
+            return False
+        return table[max(0, resource_amount)] >= influence_amount
+
+    def plan(
+        self, resource_amount: int, influence_amount: int
+    ) -> tuple[PlanetSelection, PlanetSelection]:
+        """Allocate planets and trade goods to both costs without overlap.
+
+        When the costs cannot be covered, the allocation with the smallest
+        shortfall is returned so callers can report it.
+
+        Args:
+            resource_amount: Resources needed
+            influence_amount: Influence needed
+
+        Returns:
+            The (resource, influence) selections
+        """
+        best_key: tuple[int, int, int, int, int] | None = None
+        best: tuple[int, int, int, int, int, int] | None = None
+        for (resource_total, influence_total), state in self._states.items():
+            resource_gap = max(0, resource_amount - resource_total)
+            influence_gap = max(0, influence_amount - influence_total)
+            resource_trade_goods = min(resource_gap, self._trade_goods)
+            influence_trade_goods = (
+                0
+                if self._for_voting
+                else min(influence_gap, self._trade_goods - resource_trade_goods)
+            )
+            key = (
+                resource_gap
+                + influence_gap
+                - resource_trade_goods
+                - influence_trade_goods,
+                resource_trade_goods + influence_trade_goods,
+                max(0, resource_total - resource_amount)
+                + max(0, influence_total - influence_amount),
+                state[0],
+                state[1],
+            )
+            if best_key is None or key < best_key:
+                best_key = key
+                best = (
+                    resource_total,
+                    influence_total,
+                    resource_trade_goods,
+                    influence_trade_goods,
+                    state[2],
+                    state[3],
+                )
+
+        assert best is not None
+        (
+            resource_total,
+            influence_total,
+            resource_trade_goods,
+            influence_trade_goods,
+            resource_mask,
+            influence_mask,
+        ) = best
+        return (
+            self._selection(
+                resource_mask,
+                False,
+                resource_total,
+                resource_trade_goods,
+                resource_amount,
+            ),
+            self._selection(
+                influence_mask,
+                True,
+                influence_total,
+                influence_trade_goods,
+                influence_amount,
+            ),
+        )
+
+    def _selection(
+        self,
+        mask: int,
+        use_influence: bool,
+        planet_total: int,
+        trade_goods: int,
+        amount: int,
+    ) -> PlanetSelection:
+        if amount <= 0:
+            return PlanetSelection({}, 0, 0, 0)
+        planets: dict[str, int] = {}
+        for index, (name, resources, influence) in enumerate(self._planets):
+            if mask >> index & 1:
+                planets[name] = influence if use_influence else resources
+        total_value = planet_total + trade_goods
+        return PlanetSelection(
+            planets_to_exhaust=planets,
+            trade_goods_to_spend=trade_goods,
+            total_value=total_value,
+            overspend=max(0, total_value - amount),
+        )
+
+    @staticmethod
+    def _offer(
+        states: dict[tuple[int, int], tuple[int, int, int, int]],
+        key: tuple[int, int],
+        candidate: tuple[int, int, int, int],
+    ) -> None:
+        current = states.get(key)
+        if current is None or candidate[:2] < current[:2]:
+            states[key] = candidate
+
+    def _get_affordable_influence(self) -> list[int]:
+        """Build the affordability table from the Pareto frontier."""
+        if self._affordable_influence is not None:
+            return self._affordable_influence
+
+        frontier = self.get_frontier()
+        max_resources = frontier[-1][0]
+        # Most influence from planets alongside at least r resources
+        planet_influence = [0] * (max_resources + 1)
+        point = len(frontier) - 1
+        for resource_total in range(max_resources, -1, -1):
+            while point > 0 and frontier[point - 1][0] >= resource_total:
+                point -= 1
+            planet_influence[resource_total] = frontier[point][1]
+
+        trade_goods = self._trade_goods
+        table = []
+        for resource_amount in range(max_resources + trade_goods + 1):
+            if self._for_voting:
+                # Trade goods can only make up resources
+                table.append(planet_influence[max(0, resource_amount - trade_goods)])
+                continue
+            best = -1
+            for spent in range(min(trade_goods, resource_amount) + 1):
+                covered = resource_amount - spent
+                if covered > max_resources:
+                    continue
+                best = max(best, planet_influence[covered] + trade_goods - spent)
+            table.append(best)
+        self._affordable_influence = table
+        return table
+
+
 class ResourceManager:
     """Central manager for resource and influence operations.
 
@@ -306,6 +725,7 @@ class ResourceManager:
     def __init__(self, game_state: GameState) -> None:
         """Initialize with game state for planet and player access."""
         self.game_state = game_state
+        self._joint_planners: dict[tuple[str, bool], JointSpendingPlanner] = {}
 
     def calculate_available_resources(self, player_id: str) -> int:
         """Calculate total resources available from ready planets + trade goods.
@@ -319,32 +739,20 @@ class ResourceManager:
         Raises:
             ResourceOperationError: If player is not found
         """
-        logger.info(f"Calculating available resources for player {player_id}")
-
-        # Validate player exists
-        player = self._get_player(player_id)
-        if not player:
-            raise ResourceOperationError(
-                operation="calculate_available_resources",
-                player_id=player_id,
-                reason="Player not found",
-                context={"available_players": [p.id for p in self.game_state.players]},
-            )
+        logger.info("Calculating available resources for player %s", player_id)
 
-        # Get player's controlled planets
-        planets = self.game_state.get_player_planets(player_id)
-
-        # Sum resources from ready (unexhausted) planets
-        planet_resources = sum(
-            planet.resources for planet in planets if planet.can_spend_resources()
-        )
-
-        # Get player's trade goods
-        trade_goods = player.get_trade_goods()
+        # Running totals of ready planets and trade goods (O(1))
+        economy = self._get_economy(player_id, "calculate_available_resources")
+        planet_resources = economy.ready_resources
+        trade_goods = economy.trade_goods
 
         total_resources = planet_resources + trade_goods
         logger.debug(
-            f"Player {player_id} has {total_resources} resources ({planet_resources} from planets, {trade_goods} from trade goods)"
+            "Player %s has %s resources (%s from planets, %s from trade goods)",
+            player_id,
+            total_resources,
+            planet_resources,
+            trade_goods,
         )
 
         return total_resources
@@ -365,39 +773,30 @@ class ResourceManager:
             ResourceOperationError: If player is not found
         """
         logger.info(
-            f"Calculating available influence for player {player_id} (for_voting={for_voting})"
+            "Calculating available influence for player %s (for_voting=%s)",
+            player_id,
+            for_voting,
         )
 
-        # Validate player exists
-        player = self._get_player(player_id)
-        if not player:
-            raise ResourceOperationError(
-                operation="calculate_available_influence",
-                player_id=player_id,
-                reason="Player not found",
-                context={
-                    "available_players": [p.id for p in self.game_state.players],
-                    "for_voting": for_voting,
-                },
-            )
-
-        # Get player's controlled planets
-        planets = self.game_state.get_player_planets(player_id)
-
-        # Sum influence from ready (unexhausted) planets
-        planet_influence = sum(
-            planet.influence for planet in planets if planet.can_spend_influence()
+        # Running totals of ready planets and trade goods (O(1))
+        economy = self._get_economy(
+            player_id, "calculate_available_influence", for_voting=for_voting
         )
+        planet_influence = economy.ready_influence
 
         # Get player's trade goods (0 if for voting per Rule 47.3)
         if for_voting:
             trade_goods = 0
         else:
-            trade_goods = player.get_trade_goods()
+            trade_goods = economy.trade_goods
 
         total_influence = planet_influence + trade_goods
         logger.debug(
-            f"Player {player_id} has {total_influence} influence ({planet_influence} from planets, {trade_goods} from trade goods)"
+            "Player %s has %s influence (%s from planets, %s from trade goods)",
+            player_id,
+            total_influence,
+            planet_influence,
+            trade_goods,
         )
 
         return total_influence
@@ -414,30 +813,15 @@ class ResourceManager:
         Raises:
             ResourceOperationError: If player is not found
         """
-        logger.debug(f"Getting resource sources for player {player_id}")
+        logger.debug("Getting resource sources for player %s", player_id)
 
-        # Validate player exists
-        player = self._get_player(player_id)
-        if not player:
-            raise ResourceOperationError(
-                operation="get_resource_sources",
-                player_id=player_id,
-                reason="Player not found",
-                context={"available_players": [p.id for p in self.game_state.players]},
-            )
-
-        # Get player's controlled planets
-        planets = self.game_state.get_player_planets(player_id)
+        economy = self._get_economy(player_id, "get_resource_sources")
 
         # Build planet resource mapping (only ready planets with resources > 0)
-        planet_resources = {
-            planet.name: planet.resources
-            for planet in planets
-            if planet.can_spend_resources() and planet.resources > 0
-        }
+        planet_resources = economy.get_ready_resource_planets()
 
         # Get player's trade goods
-        trade_goods = player.get_trade_goods()
+        trade_goods = economy.trade_goods
 
         total_available = sum(planet_resources.values()) + trade_goods
 
@@ -463,37 +847,23 @@ class ResourceManager:
             ResourceOperationError: If player is not found
         """
         logger.debug(
-            f"Getting influence sources for player {player_id} (for_voting={for_voting})"
+            "Getting influence sources for player %s (for_voting=%s)",
+            player_id,
+            for_voting,
         )
 
-        # Validate player exists
-        player = self._get_player(player_id)
-        if not player:
-            raise ResourceOperationError(
-                operation="get_influence_sources",
-                player_id=player_id,
-                reason="Player not found",
-                context={
-                    "available_players": [p.id for p in self.game_state.players],
-                    "for_voting": for_voting,
-                },
-            )
-
-        # Get player's controlled planets
-        planets = self.game_state.get_player_planets(player_id)
+        economy = self._get_economy(
+            player_id, "get_influence_sources", for_voting=for_voting
+        )
 
         # Build planet influence mapping (only ready planets with influence > 0)
-        planet_influence = {
-            planet.name: planet.influence
-            for planet in planets
-            if planet.can_spend_influence() and planet.influence > 0
-        }
+        planet_influence = economy.get_ready_influence_planets()
 
         # Get player's trade goods (0 if for voting per Rule 47.3)
         if for_voting:
             trade_goods = 0
         else:
-            trade_goods = player.get_trade_goods()
+            trade_goods = economy.trade_goods
 
         total_available = sum(planet_influence.values()) + trade_goods
 
@@ -504,37 +874,135 @@ class ResourceManager:
             for_voting=for_voting,
         )
 
+    def get_resource_planner(self, player_id: str) -> SpendingPlanner:
+        """Get a spending planner for the player's ready resource sources.
+
+        The planner prefers exhausting planets whose influence is low, so
+        planets worth spending for influence stay ready.
+
+        Args:
+            player_id: The player ID
+
+        Returns:
+            SpendingPlanner over the player's resources and trade goods
+
+        Raises:
+            ResourceOperationError: If player is not found
+        """
+        sources = self.get_resource_sources(player_id)
+        return SpendingPlanner(
+            sources.planets,
+            sources.trade_goods,
+            preserved_values={
+                planet.name: planet.influence
+                for planet in self.game_state.get_player_planets(player_id)
+            },
+        )
+
+    def get_influence_planner(
+        self, player_id: str, for_voting: bool = False
+    ) -> SpendingPlanner:
+        """Get a spending planner for the player's ready influence sources.
+
+        Args:
+            player_id: The player ID
+            for_voting: If True, excludes trade goods per Rule 47.3
+
+        Returns:
+            SpendingPlanner over the player's influence and trade goods
+
+        Raises:
+            ResourceOperationError: If player is not found
+        """
+        sources = self.get_influence_sources(player_id, for_voting)
+        return SpendingPlanner(
+            sources.planets,
+            sources.trade_goods,
+            preserved_values={
+                planet.name: planet.resources
+                for planet in self.game_state.get_player_planets(player_id)
+            },
+        )
+
+    def get_joint_planner(
+        self, player_id: str, for_voting: bool = False
+    ) -> JointSpendingPlanner:
+        """Get the player's joint resource+influence planner.
+
+        The planner is kept per player and synchronized with the current
+        ready planets on each call, so planets readied since the last call
+        are added incrementally.
+
+        Args:
+            player_id: The player ID
+            for_voting: If True, trade goods cannot pay influence (Rule 47.3)
+
+        Returns:
+            Up-to-date JointSpendingPlanner for the player
+
+        Raises:
+            ResourceOperationError: If player is not found
+        """
+        economy = self._get_economy(
+            player_id, "get_joint_planner", for_voting=for_voting
+        )
+        ready_planets = economy.get_ready_planet_values()
+        trade_goods = economy.trade_goods
+
+        key = (player_id, for_voting)
+        planner = self._joint_planners.get(key)
+        if planner is None:
+            planner = JointSpendingPlanner(ready_planets, trade_goods, for_voting)
+            self._joint_planners[key] = planner
+        else:
+            planner.sync(ready_planets, trade_goods)
+        return planner
+
     def create_spending_plan(
         self,
         player_id: str,
         resource_amount: int = 0,
         influence_amount: int = 0,
         for_voting: bool = False,
+        resource_planner: SpendingPlanner | None = None,
+        influence_planner: SpendingPlanner | None = None,
     ) -> SpendingPlan:
         """Create a plan for spending resources/influence from available sources.
 
+        Planets are chosen by SpendingPlanner to minimize overspend and the
+        number of planets exhausted. When both costs are requested they are
+        allocated jointly by JointSpendingPlanner, so no planet is counted
+        towards both.
+
         Args:
             player_id: The player ID
             resource_amount: Amount of resources needed
             influence_amount: Amount of influence needed
             for_voting: If True, excludes trade goods from influence per Rule 47.3
+            resource_planner: Planner to reuse across several plans for the
+                same player state (built from the game state if omitted)
+            influence_planner: Influence planner to reuse, matching for_voting
 
         Returns:
             SpendingPlan with details of how to spend resources/influence
         """
-        # Get available sources
-        resource_sources = self.get_resource_sources(player_id)
-        influence_sources = self.get_influence_sources(player_id, for_voting)
+        if resource_amount > 0 and influence_amount > 0:
+            resource_selection, influence_selection = self.get_joint_planner(
+                player_id, for_voting
+            ).plan(resource_amount, influence_amount)
+        else:
+            if resource_planner is None:
+                resource_planner = self.get_resource_planner(player_id)
+            if influence_planner is None:
+                influence_planner = self.get_influence_planner(player_id, for_voting)
+            resource_selection = resource_planner.plan(resource_amount)
+            influence_selection = influence_planner.plan(influence_amount)
 
         # Create resource spending plan
-        resource_spending = self._create_resource_spending(
-            resource_sources, resource_amount
-        )
+        resource_spending = self._create_resource_spending(resource_selection)
 
         # Create influence spending plan
-        influence_spending = self._create_influence_spending(
-            influence_sources, influence_amount
-        )
+        influence_spending = self._create_influence_spending(influence_selection)
 
         # Check if plan is valid
         is_valid = (
@@ -590,9 +1058,21 @@ class ResourceManager:
             ResourceOperationError: If player is not found
         """
         logger.debug(
-            f"Checking if player {player_id} can afford {resource_amount} resources and {influence_amount} influence (for_voting={for_voting})"
+            "Checking if player %s can afford %s resources and %s influence (for_voting=%s)",
+            player_id,
+            resource_amount,
+            influence_amount,
+            for_voting,
         )
 
+        if resource_amount > 0 and influence_amount > 0:
+            # A planet pays either resources or influence, never both
+            can_afford = self.get_joint_planner(player_id, for_voting).can_afford(
+                resource_amount, influence_amount
+            )
+            logger.debug("Player %s can afford: %s", player_id, can_afford)
+            return can_afford
+
         # These methods will raise ResourceOperationError if player doesn't exist
         available_resources = self.calculate_available_resources(player_id)
         available_influence = self.calculate_available_influence(player_id, for_voting)
@@ -602,7 +1082,7 @@ class ResourceManager:
             and available_influence >= influence_amount
         )
 
-        logger.debug(f"Player {player_id} can afford: {can_afford}")
+        logger.debug("Player %s can afford: %s", player_id, can_afford)
         return can_afford
 
     def execute_spending_plan(self, plan: SpendingPlan) -> SpendingResult:
@@ -619,15 +1099,19 @@ class ResourceManager:
         Raises:
             GameStateIntegrityError: If game state integrity is compromised
         """
-        logger.info(f"Executing spending plan for player {plan.player_id}")
+        logger.info("Executing spending plan for player %s", plan.player_id)
         logger.debug(
-            f"Plan details: resources={plan.total_resource_cost}, influence={plan.total_influence_cost}"
+            "Plan details: resources=%s, influence=%s",
+            plan.total_resource_cost,
+            plan.total_influence_cost,
         )
 
         # Validate plan first
         if not plan.is_valid:
             logger.warning(
-                f"Spending plan for player {plan.player_id} is invalid: {plan.error_message}"
+                "Spending plan for player %s is invalid: %s",
+                plan.player_id,
+                plan.error_message,
             )
             return SpendingResult(
                 success=False,
@@ -661,11 +1145,11 @@ class ResourceManager:
         total_trade_goods_spent = 0
 
         try:
-            logger.debug(f"Starting planet exhaustion for player {plan.player_id}")
+            logger.debug("Starting planet exhaustion for player %s", plan.player_id)
 
             # Exhaust planets for resource spending
             for planet_name in plan.resource_spending.planets_to_exhaust:
-                logger.debug(f"Exhausting planet {planet_name} for resources")
+                logger.debug("Exhausting planet %s for resources", planet_name)
                 planet = self._get_player_planet(plan.player_id, planet_name)
                 if not planet:
                     raise ValueError(
@@ -676,12 +1160,12 @@ class ResourceManager:
 
                 planet.exhaust()
                 exhausted_planets.append(planet_name)
-                logger.debug(f"Successfully exhausted planet {planet_name}")
+                logger.debug("Successfully exhausted planet %s", planet_name)
 
             # Exhaust planets for influence spending (if not already exhausted)
             for planet_name in plan.influence_spending.planets_to_exhaust:
                 if planet_name not in exhausted_planets:  # Don't double-exhaust
-                    logger.debug(f"Exhausting planet {planet_name} for influence")
+                    logger.debug("Exhausting planet %s for influence", planet_name)
                     planet = self._get_player_planet(plan.player_id, planet_name)
                     if not planet:
                         raise ValueError(
@@ -692,13 +1176,15 @@ class ResourceManager:
 
                     planet.exhaust()
                     exhausted_planets.append(planet_name)
-                    logger.debug(f"Successfully exhausted planet {planet_name}")
+                    logger.debug("Successfully exhausted planet %s", planet_name)
 
             # Spend trade goods
             total_trade_goods_to_spend = plan.get_total_trade_goods_to_spend()
             if total_trade_goods_to_spend > 0:
                 logger.debug(
-                    f"Spending {total_trade_goods_to_spend} trade goods for player {plan.player_id}"
+                    "Spending %s trade goods for player %s",
+                    total_trade_goods_to_spend,
+                    plan.player_id,
                 )
                 if not player.spend_trade_goods(total_trade_goods_to_spend):
                     raise ValueError(
@@ -706,12 +1192,14 @@ class ResourceManager:
                     )
                 total_trade_goods_spent = total_trade_goods_to_spend
                 logger.debug(
-                    f"Successfully spent {total_trade_goods_spent} trade goods"
+                    "Successfully spent %s trade goods",
+                    total_trade_goods_spent,
                 )
 
             # Success!
             logger.info(
-                f"Successfully executed spending plan for player {plan.player_id}"
+                "Successfully executed spending plan for player %s",
+                plan.player_id,
             )
             return SpendingResult(
                 success=True,
@@ -722,29 +1210,34 @@ class ResourceManager:
 
         except Exception as e:
             logger.warning(
-                f"Spending plan execution failed for player {plan.player_id}: {str(e)}"
+                "Spending plan execution failed for player %s: %s",
+                plan.player_id,
+                e,
             )
-            logger.info(f"Starting rollback for player {plan.player_id}")
+            logger.info("Starting rollback for player %s", plan.player_id)
 
             # Rollback: ready all planets we exhausted
             for planet_name in exhausted_planets:
-                logger.debug(f"Rolling back planet exhaustion for {planet_name}")
+                logger.debug("Rolling back planet exhaustion for %s", planet_name)
                 planet = self._get_player_planet(plan.player_id, planet_name)
                 if planet and planet.is_exhausted():
                     planet.ready()
-                    logger.debug(f"Successfully rolled back planet {planet_name}")
+                    logger.debug("Successfully rolled back planet %s", planet_name)
 
             # Rollback: restore trade goods
             if total_trade_goods_spent > 0:
                 logger.debug(
-                    f"Rolling back {total_trade_goods_spent} trade goods for player {plan.player_id}"
+                    "Rolling back %s trade goods for player %s",
+                    total_trade_goods_spent,
+                    plan.player_id,
                 )
                 player.gain_trade_goods(total_trade_goods_spent)
                 logger.debug(
-                    f"Successfully rolled back {total_trade_goods_spent} trade goods"
+                    "Successfully rolled back %s trade goods",
+                    total_trade_goods_spent,
                 )
 
-            logger.info(f"Rollback completed for player {plan.player_id}")
+            logger.info("Rollback completed for player %s", plan.player_id)
             return SpendingResult(
                 success=False,
                 planets_exhausted=[],
@@ -774,6 +1267,23 @@ class ResourceManager:
             if player:
                 player.gain_trade_goods(spending_result.trade_goods_spent)
 
+    def _get_economy(
+        self, player_id: str, operation: str, **context: Any
+    ) -> PlayerEconomy:
+        """Get the player's ledger entry, raising if the player is unknown."""
+        economy = get_economy_ledger(self.game_state).get_player_economy(player_id)
+        if economy is None:
+            raise ResourceOperationError(
+                operation=operation,
+                player_id=player_id,
+                reason="Player not found",
+                context={
+                    "available_players": [p.id for p in self.game_state.players],
+                    **context,
+                },
+            )
+        return economy
+
     def _get_player(self, player_id: str) -> Player | None:
         """Get player by ID from game state."""
         for player in self.game_state.players:
@@ -789,84 +1299,22 @@ class ResourceManager:
                 return planet
         return None
 
-    def _create_resource_spending(
-        self, sources: ResourceSources, amount: int
-    ) -> ResourceSpending:
-        """Create resource spending plan from available sources."""
-        if amount == 0:
-            return ResourceSpending(
-                planets_to_exhaust={}, trade_goods_to_spend=0, total_resources=0
-            )
-
-        planets_to_exhaust = {}
-        remaining = amount
-
-        # Use planets first (sorted by value for determinism and efficiency)
-        for planet_name, planet_resources in sorted(
-            sources.planets.items(), key=lambda kv: kv[1]
-        ):
-            if remaining <= 0:
-                break
-            if remaining >= planet_resources:
-                planets_to_exhaust[planet_name] = planet_resources
-                remaining -= planet_resources
-            else:
-                # Can't partially exhaust a planet, so we'll use it fully
-                planets_to_exhaust[planet_name] = planet_resources
-                remaining -= planet_resources
-
-        # Use trade goods if needed and available
-        trade_goods_to_spend = 0
-        if remaining > 0 and sources.trade_goods > 0:
-            trade_goods_to_spend = min(remaining, sources.trade_goods)
-            remaining -= trade_goods_to_spend
-
-        total_resources = sum(planets_to_exhaust.values()) + trade_goods_to_spend
-
+    def _create_resource_spending(self, selection: PlanetSelection) -> ResourceSpending:
+        """Create resource spending plan from a planet selection."""
         return ResourceSpending(
-            planets_to_exhaust=planets_to_exhaust,
-            trade_goods_to_spend=trade_goods_to_spend,
-            total_resources=total_resources,
+            planets_to_exhaust=selection.planets_to_exhaust,
+            trade_goods_to_spend=selection.trade_goods_to_spend,
+            total_resources=selection.total_value,
         )
 
     def _create_influence_spending(
-        self, sources: InfluenceSources, amount: int
+        self, selection: PlanetSelection
     ) -> InfluenceSpending:
-        """Create influence spending plan from available sources."""
-        if amount == 0:
-            return InfluenceSpending(
-                planets_to_exhaust={}, trade_goods_to_spend=0, total_influence=0
-            )
-
-        planets_to_exhaust = {}
-        remaining = amount
-
-        # Use planets first (sorted by value for determinism and efficiency)
-        for planet_name, planet_influence in sorted(
-            sources.planets.items(), key=lambda kv: kv[1]
-        ):
-            if remaining <= 0:
-                break
-            if remaining >= planet_influence:
-                planets_to_exhaust[planet_name] = planet_influence
-                remaining -= planet_influence
-            else:
-                # Can't partially exhaust a planet, so we'll use it fully
-                planets_to_exhaust[planet_name] = planet_influence
-                remaining -= planet_influence
-
-        # Use trade goods if needed and available (not for voting)
-        trade_goods_to_spend = 0
-        if remaining > 0 and sources.trade_goods > 0:
-            trade_goods_to_spend = min(remaining, sources.trade_goods)
-            remaining -= trade_goods_to_spend
-
-        total_influence = sum(planets_to_exhaust.values()) + trade_goods_to_spend
-
+        """Create influence spending plan from a planet selection."""
         return InfluenceSpending(
-            planets_to_exhaust=planets_to_exhaust,
-            trade_goods_to_spend=trade_goods_to_spend,
-            total_influence=total_influence,
+            planets_to_exhaust=selection.planets_to_exhaust,
+            trade_goods_to_spend=selection.trade_goods_to_spend,
+            total_influence=selection.total_value,
         )
 
 
@@ -953,7 +1401,10 @@ class CostValidator:
             final_cost = max(0.0, unit_stats.cost)
 
             logger.debug(
-                f"Calculated cost for {unit_type.name}: {final_cost} (raw: {unit_stats.cost})"
+                "Calculated cost for %s: %s (raw: %s)",
+                unit_type.name,
+                final_cost,
+                unit_stats.cost,
             )
             return final_cost
 
@@ -1211,14 +1662,15 @@ class CachedResourceManager(ResourceManager):
     """ResourceManager with caching for improved performance.
 
     Caches resource/influence calculations when game state hasn't changed.
-    Implements cache invalidation when game state is modified.
+    Changes are detected from the economy ledger's revision token, which
+    costs O(players) instead of hashing every planet.
     """
 
     def __init__(self, game_state: GameState) -> None:
         """Initialize with game state and empty cache."""
         super().__init__(game_state)
         self._cache: dict[str, Any] = {}
-        self._game_state_hash: int = self._calculate_game_state_hash()
+        self._state_revision = self._get_state_revision()
         self._cache_stats = {"total_requests": 0, "cache_hits": 0, "cache_misses": 0}
 
     def calculate_available_resources(self, player_id: str) -> int:
@@ -1276,10 +1728,10 @@ class CachedResourceManager(ResourceManager):
         self._cache_stats["total_requests"] += 1
 
         # Check if game state has changed
-        current_hash = self._calculate_game_state_hash()
-        if current_hash != self._game_state_hash:
+        current_revision = self._get_state_revision()
+        if current_revision != self._state_revision:
             self._invalidate_cache()
-            self._game_state_hash = current_hash
+            self._state_revision = current_revision
 
         # Check cache
         if cache_key in self._cache:
@@ -1292,23 +1744,9 @@ class CachedResourceManager(ResourceManager):
         self._cache[cache_key] = result
         return result
 
-    def _calculate_game_state_hash(self) -> int:
-        """Calculate a hash of the game state for cache invalidation."""
-        # Simple hash based on player count, planet states, and trade goods
-        # This is a simplified approach - in practice, you might want more sophisticated tracking
-        hash_components = []
-
-        for player in self.game_state.players:
-            hash_components.append(f"player_{player.id}_{player.get_trade_goods()}")
-
-            # Include planet states
-            planets = self.game_state.get_player_planets(player.id)
-            for planet in planets:
-                hash_components.append(
-                    f"planet_{planet.name}_{planet.is_exhausted()}_{planet.resources}_{planet.influence}"
-                )
-
-        return hash(tuple(sorted(hash_components)))
+    def _get_state_revision(self) -> tuple[tuple[str, int, int], ...]:
+        """Get the economy revision used for cache invalidation."""
+        return get_economy_ledger(self.game_state).get_revision()
 
     def _invalidate_cache(self) -> None:
         """Clear the cache when game state changes."""
@@ -1401,13 +1839,16 @@ class BatchCostValidator:
             List of CostValidationResult for each request
         """
         logger.debug(
-            f"Batch validating {len(production_requests)} production costs for player {player_id}"
+            "Batch validating %s production costs for player %s",
+            len(production_requests),
+            player_id,
         )
 
-        # Pre-calculate player resources once for all validations
-        available_resources = self.resource_manager.calculate_available_resources(
-            player_id
-        )
+        # Pre-calculate player sources once; every suggested plan is answered
+        # from the same spending planner tables
+        resource_planner = self.resource_manager.get_resource_planner(player_id)
+        influence_planner = self.resource_manager.get_influence_planner(player_id)
+        available_resources = resource_planner.total_available
 
         results = []
         for unit_type, quantity, faction, technologies in production_requests:
@@ -1434,7 +1875,10 @@ class BatchCostValidator:
                     # Create suggested spending plan
                     suggested_spending_plan = (
                         self.resource_manager.create_spending_plan(
-                            player_id, resource_amount=required_resources
+                            player_id,
+                            resource_amount=required_resources,
+                            resource_planner=resource_planner,
+                            influence_planner=influence_planner,
                         )
                     )
 
@@ -1463,7 +1907,9 @@ class BatchCostValidator:
                 )
 
         logger.debug(
-            f"Batch validation completed: {sum(1 for r in results if r.is_valid)}/{len(results)} valid"
+            "Batch validation completed: %s/%s valid",
+            sum(1 for r in results if r.is_valid),
+            len(results),
         )
         return results
 
@@ -1492,67 +1938,34 @@ class BatchResourceManager:
             List of SpendingPlan for each request
         """
         logger.debug(
-            f"Batch creating {len(spending_requests)} spending plans for player {player_id}"
+            "Batch creating %s spending plans for player %s",
+            len(spending_requests),
+            player_id,
         )
 
-        # Pre-calculate resource and influence sources once
-        resource_sources = self.resource_manager.get_resource_sources(player_id)
-        influence_sources_normal = self.resource_manager.get_influence_sources(
+        # Pre-calculate sources once; all plans share the planner tables
+        resource_planner = self.resource_manager.get_resource_planner(player_id)
+        influence_planner_normal = self.resource_manager.get_influence_planner(
             player_id, for_voting=False
         )
-        influence_sources_voting = self.resource_manager.get_influence_sources(
+        influence_planner_voting = self.resource_manager.get_influence_planner(
             player_id, for_voting=True
         )
 
         results = []
         for resource_amount, influence_amount, for_voting in spending_requests:
             try:
-                # Use pre-calculated sources
-                influence_sources = (
-                    influence_sources_voting if for_voting else influence_sources_normal
+                influence_planner = (
+                    influence_planner_voting if for_voting else influence_planner_normal
                 )
-
-                # Create spending plans using pre-calculated sources
-                resource_spending = self.resource_manager._create_resource_spending(
-                    resource_sources, resource_amount
-                )
-                influence_spending = self.resource_manager._create_influence_spending(
-                    influence_sources, influence_amount
-                )
-
-                # Check if plan is valid
-                is_valid = (
-                    resource_spending.total_resources >= resource_amount
-                    and influence_spending.total_influence >= influence_amount
-                )
-
-                error_message = None
-                if not is_valid:
-                    errors = []
-                    if resource_spending.total_resources < resource_amount:
-                        shortfall = resource_amount - resource_spending.total_resources
-                        errors.append(
-                            f"Insufficient resources: need {resource_amount}, have {resource_spending.total_resources} (shortfall: {shortfall})"
-                        )
-                    if influence_spending.total_influence < influence_amount:
-                        shortfall = (
-                            influence_amount - influence_spending.total_influence
-                        )
-                        voting_context = " for voting" if for_voting else ""
-                        errors.append(
-                            f"Insufficient influence{voting_context}: need {influence_amount}, have {influence_spending.total_influence} (shortfall: {shortfall})"
-                        )
-                    error_message = "; ".join(errors)
-
                 results.append(
-                    SpendingPlan(
-                        player_id=player_id,
-                        resource_spending=resource_spending,
-                        influence_spending=influence_spending,
-                        total_resource_cost=resource_amount,
-                        total_influence_cost=influence_amount,
-                        is_valid=is_valid,
-                        error_message=error_message,
+                    self.resource_manager.create_spending_plan(
+                        player_id,
+                        resource_amount=resource_amount,
+                        influence_amount=influence_amount,
+                        for_voting=for_voting,
+                        resource_planner=resource_planner,
+                        influence_planner=influence_planner,
                     )
                 )
 
@@ -1571,6 +1984,8 @@ class BatchResourceManager:
                 )
 
         logger.debug(
-            f"Batch spending plan creation completed: {sum(1 for p in results if p.is_valid)}/{len(results)} valid"
+            "Batch spending plan creation completed: %s/%s valid",
+            sum(1 for p in results if p.is_valid),
+            len(results),
         )
         return results
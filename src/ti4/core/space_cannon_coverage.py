@@ -0,0 +1,376 @@
+"""Space cannon coverage per player (Rule 77: SPACE CANNON).
+
+Finding the units that can fire space cannon into an activated system used to
+mean reading the stats of every unit in the system and testing every other
+system for adjacency (for PDS II, Rule 77.3c). SpaceCannonCoverageIndex keeps,
+for each player, the systems their space cannon units can fire into with the
+dice and hit values of those units:
+
+- Each system's space cannon units are read once and re-read only when the
+  system or one of its planets reports a change (units placed or removed,
+  see System.add_occupancy_listener), so placing or destroying a PDS updates
+  only its own system.
+- Units that fire into adjacent systems contribute to every adjacent system.
+  Adjacency is computed once per system and dropped when wormholes or the
+  galaxy layout change (Galaxy.topology_version).
+- Unit upgrades (new technologies, PDS II) do not notify; call
+  refresh_player() after one. Researching a unit upgrade does so through
+  GameState.upgrade_player_units.
+
+The same index serves the space cannon offense step and AI threat maps
+(get_threat_map).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .constants import UnitType
+
+if TYPE_CHECKING:
+    from .unit import Unit
+    from .unit_stats import UnitStatsProvider
+
+_stats_provider: UnitStatsProvider | None = None
+
+
+def has_space_cannon(unit: Any) -> bool:
+    """Check whether a unit's type has the space cannon ability."""
+    global _stats_provider
+    if not hasattr(unit, "unit_type"):
+        return False
+    if _stats_provider is None:
+        from .unit_stats import UnitStatsProvider
+
+        _stats_provider = UnitStatsProvider()
+    return bool(_stats_provider.get_unit_stats(UnitType(unit.unit_type)).space_cannon)
+
+
+def fires_into_adjacent_systems(unit: Any) -> bool:
+    """Check whether a unit can fire space cannon into adjacent systems.
+
+    LRR Reference: Rule 77.3c - PDS II can target ships in adjacent systems
+    """
+    return unit.unit_type == UnitType.PDS and bool(
+        getattr(unit, "_has_pds_ii_upgrade", False)
+    )
+
+
+@dataclass(frozen=True)
+class SpaceCannonSource:
+    """A unit able to fire space cannon, and where it is."""
+
+    unit: Unit
+    system_id: str
+    # None for units in the space area
+    planet_name: str | None
+    dice: int
+    hit_value: int | None
+    fires_into_adjacent: bool
+
+    @property
+    def owner(self) -> str:
+        """The player owning the unit."""
+        return self.unit.owner
+
+
+_Sources = tuple[SpaceCannonSource, ...]
+
+
+@dataclass(frozen=True)
+class SpaceCannonThreat:
+    """The space cannon fire one player can direct into one system."""
+
+    player_id: str
+    system_id: str
+    sources: tuple[SpaceCannonSource, ...]
+
+    @property
+    def dice(self) -> int:
+        """Total space cannon dice."""
+        return sum(source.dice for source in self.sources)
+
+    @property
+    def hit_value(self) -> int | None:
+        """Best (lowest) hit value among the units, if any has one."""
+        values = [s.hit_value for s in self.sources if s.hit_value is not None]
+        return min(values) if values else None
+
+    @property
+    def expected_hits(self) -> float:
+        """Expected number of hits from all dice."""
+        return sum(
+            source.dice * min(1.0, max(0.0, (11 - source.hit_value) / 10))
+            for source in self.sources
+            if source.hit_value is not None
+        )
+
+
+class SpaceCannonCoverageIndex:
+    """Per-player space cannon coverage of the systems of a game."""
+
+    def __init__(self, systems: Mapping[str, Any], galaxy: Any = None) -> None:
+        """Initialize the index; systems are read on first use.
+
+        Args:
+            systems: System objects by ID
+            galaxy: Galaxy used for adjacency (None for no adjacency)
+        """
+        self.systems = systems
+        self.galaxy = galaxy
+        self._reset()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> None:
+        # Derived data: a copied game state builds its own index on demand
+        return None
+
+    def _reset(self) -> None:
+        self._known_count = len(self.systems)
+        self._order = {system_id: i for i, system_id in enumerate(self.systems)}
+        self._dirty: set[str] = set(self.systems)
+        self._sources: dict[str, _Sources] = {}
+        # player -> target system -> origin system -> sources firing from there
+        self._coverage: dict[str, dict[str, dict[str, _Sources]]] = {}
+        self._adjacent: dict[str, frozenset[str]] = {}
+        self._wormholes: dict[str, tuple[str, ...]] = {}
+        self._topology = self._topology_version()
+        self._system_of: dict[Any, str] = {}
+
+    def on_occupancy_changed(self, source: Any) -> None:
+        """Mark the system of a changed system or planet for re-reading."""
+        system_id = self._system_of.get(source)
+        if system_id is not None:
+            self._dirty.add(system_id)
+
+    def invalidate(self) -> None:
+        """Re-read everything, e.g. after the galaxy layout changed."""
+        self._reset()
+
+    def refresh_player(self, player_id: str) -> None:
+        """Re-read a player's units, e.g. after researching a unit upgrade.
+
+        Every system holding one of the player's units is re-read, since an
+        upgrade may also give a unit the space cannon ability.
+        """
+        for system_id, system in self.systems.items():
+            units = list(system.space_units)
+            for planet in system.planets:
+                units.extend(planet.units)
+            if any(unit.owner == player_id for unit in units):
+                self._dirty.add(system_id)
+
+    def get_system_sources(self, system_id: str) -> list[SpaceCannonSource]:
+        """Get the space cannon units located in a system."""
+        self._refresh()
+        return list(self._sources.get(system_id, ()))
+
+    def get_units_in_system(self, system: Any) -> list[Any]:
+        """Get the space cannon units on the planets of a system object.
+
+        Systems that are not part of the index are read directly.
+        """
+        system_id = getattr(system, "system_id", None)
+        if system_id is None or self.systems.get(system_id) is not system:
+            sources = find_space_cannon_sources(system)
+        else:
+            self._refresh()
+            sources = self._sources.get(system_id, ())
+        return [source.unit for source in sources if source.planet_name is not None]
+
+    def get_threat(self, player_id: str, system_id: str) -> SpaceCannonThreat:
+        """Get the space cannon fire a player can direct into a system.
+
+        Rule 77.3: units in the system itself, plus units in adjacent
+        systems that fire into adjacent systems.
+        """
+        self._refresh()
+        origins = self._coverage.get(player_id, {}).get(system_id, {})
+        ordered = sorted(
+            origins,
+            key=lambda origin: (origin != system_id, self._order.get(origin, 0)),
+        )
+        return SpaceCannonThreat(
+            player_id=player_id,
+            system_id=system_id,
+            sources=tuple(s for origin in ordered for s in origins[origin]),
+        )
+
+    def get_coverage(self, player_id: str) -> dict[str, SpaceCannonThreat]:
+        """Get every system a player can fire space cannon into."""
+        self._refresh()
+        return {
+            system_id: self.get_threat(player_id, system_id)
+            for system_id in self._coverage.get(player_id, {})
+        }
+
+    def get_players_covering(self, system_id: str) -> list[str]:
+        """Get the players who can fire space cannon into a system."""
+        self._refresh()
+        return sorted(
+            player_id
+            for player_id, targets in self._coverage.items()
+            if targets.get(system_id)
+        )
+
+    def get_threat_map(self) -> dict[str, dict[str, SpaceCannonThreat]]:
+        """Get the coverage of every player, for AI threat assessment."""
+        self._refresh()
+        return {player_id: self.get_coverage(player_id) for player_id in self._coverage}
+
+    def _refresh(self) -> None:
+        """Re-read the systems that changed since the last query."""
+        if len(self.systems) != self._known_count:
+            self._reset()
+        topology = self._topology_version()
+        if topology != self._topology:
+            # Systems placed or hyperlanes added: re-target every ranged unit
+            self._topology = topology
+            self._retarget_ranged()
+        while self._dirty:
+            system_id = self._dirty.pop()
+            self._remove_contributions(system_id)
+            system = self.systems.get(system_id)
+            if system is None:
+                continue
+
+            wormholes = tuple(getattr(system, "wormholes", ()))
+            if self._wormholes.setdefault(system_id, wormholes) != wormholes:
+                # Wormhole adjacency changed: re-target every ranged unit
+                self._wormholes[system_id] = wormholes
+                self._retarget_ranged()
+
+            self._observe(system_id, system)
+            sources = find_space_cannon_sources(system, system_id)
+            self._sources[system_id] = sources
+            self._add_contributions(system_id, sources)
+
+    def _topology_version(self) -> int | None:
+        return getattr(self.galaxy, "topology_version", None)
+
+    def _retarget_ranged(self) -> None:
+        """Drop adjacency and re-read units that fire into adjacent systems."""
+        ranged = [
+            origin
+            for origin, sources in self._sources.items()
+            if any(source.fires_into_adjacent for source in sources)
+        ]
+        for origin in ranged:
+            self._remove_contributions(origin)
+        self._adjacent.clear()
+        self._dirty.update(ranged)
+
+    def _observe(self, system_id: str, system: Any) -> None:
+        if hasattr(system, "add_occupancy_listener"):
+            system.add_occupancy_listener(self)
+            self._system_of[system] = system_id
+        for planet in system.planets:
+            if hasattr(planet, "add_occupancy_listener"):
+                planet.add_occupancy_listener(self)
+                self._system_of[planet] = system_id
+
+    def _targets(self, system_id: str, source: SpaceCannonSource) -> list[str]:
+        if not source.fires_into_adjacent:
+            return [system_id]
+        return [system_id, *self._adjacent_systems(system_id)]
+
+    def _adjacent_systems(self, system_id: str) -> frozenset[str]:
+        adjacent = self._adjacent.get(system_id)
+        if adjacent is None:
+            adjacent = frozenset()
+            if self.galaxy:
+                adjacent = frozenset(
+                    other_id
+                    for other_id in self.systems
+                    if other_id != system_id
+                    and self.galaxy.are_systems_adjacent(other_id, system_id)
+                )
+            self._adjacent[system_id] = adjacent
+        return adjacent
+
+    def _add_contributions(self, system_id: str, sources: _Sources) -> None:
+        grouped: dict[tuple[str, str], list[SpaceCannonSource]] = {}
+        for source in sources:
+            for target in self._targets(system_id, source):
+                grouped.setdefault((source.owner, target), []).append(source)
+        for (player_id, target), player_sources in grouped.items():
+            self._coverage.setdefault(player_id, {}).setdefault(target, {})[
+                system_id
+            ] = tuple(player_sources)
+
+    def _remove_contributions(self, system_id: str) -> None:
+        for source in self._sources.pop(system_id, ()):
+            targets = self._coverage.get(source.owner)
+            if targets is None:
+                continue
+            for target in self._targets(system_id, source):
+                origins = targets.get(target)
+                if origins is not None:
+                    origins.pop(system_id, None)
+                    if not origins:
+                        del targets[target]
+            if not targets:
+                del self._coverage[source.owner]
+
+
+def find_space_cannon_sources(system: Any, system_id: str | None = None) -> _Sources:
+    """Read the space cannon units of one system, space area first.
+
+    Args:
+        system: The system to read
+        system_id: ID recorded in the sources (defaults to the system's ID)
+    """
+    if system_id is None:
+        system_id = str(getattr(system, "system_id", ""))
+    located: list[tuple[Any, str | None]] = [
+        (unit, None) for unit in system.space_units
+    ]
+    for planet in system.planets:
+        located.extend((unit, planet.name) for unit in planet.units)
+
+    sources = []
+    for unit, planet_name in located:
+        if not has_space_cannon(unit):
+            continue
+        stats = unit.get_stats()
+        sources.append(
+            SpaceCannonSource(
+                unit=unit,
+                system_id=system_id,
+                planet_name=planet_name,
+                dice=getattr(stats, "space_cannon_dice", 1),
+                hit_value=getattr(stats, "space_cannon_value", None),
+                fires_into_adjacent=fires_into_adjacent_systems(unit),
+            )
+        )
+    return tuple(sources)
+
+
+def get_space_cannon_coverage(game_state: Any) -> SpaceCannonCoverageIndex:
+    """Get the space cannon coverage index of a game state.
+
+    The index is cached on the game state and reused by later states that
+    share the same systems and galaxy.
+
+    Args:
+        game_state: The game state
+
+    Returns:
+        The coverage index (created on first use)
+    """
+    systems = game_state.systems
+    galaxy = getattr(game_state, "galaxy", None)
+    index = getattr(game_state, "_space_cannon_coverage", None)
+    if (
+        isinstance(index, SpaceCannonCoverageIndex)
+        and index.systems is systems
+        and index.galaxy is galaxy
+    ):
+        return index
+    index = SpaceCannonCoverageIndex(systems, galaxy)
+    try:
+        object.__setattr__(game_state, "_space_cannon_coverage", index)
+    except AttributeError:
+        pass
+    return index
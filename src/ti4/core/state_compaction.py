@@ -0,0 +1,311 @@
+"""Compaction of long-lived game states.
+
+Supports requirement 12.3 (memory usage optimization for large game states).
+A game state accumulates bookkeeping that costs memory without carrying
+information:
+
+- Per-player tables keep empty entries for players with no cards, objectives
+  or planets. Every accessor already treats a missing entry as empty.
+- Player IDs, card and objective names are equal strings held as separate
+  objects. Interning makes equal strings share one object.
+- The transaction history (Rule 28) grows without bound. Older entries are
+  moved into an immutable archived segment, which later states share instead
+  of copying.
+- Exhausted strategy cards are a set of enum members. An EnumBitSet stores
+  the same information in one integer.
+
+Compaction never changes what the game state reports; it returns a new state
+through GameState's copy-on-write path.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, MutableSet
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+E = TypeVar("E", bound=Enum)
+
+# Per-player tables whose empty entries are equivalent to missing entries
+PER_PLAYER_FIELDS = (
+    "player_technologies",
+    "player_planets",
+    "player_technology_cards",
+    "completed_objectives",
+    "status_phase_scoring",
+    "player_secret_objectives",
+    "player_planet_cards",
+    "player_agenda_cards",
+    "player_action_cards",
+)
+
+# Tables whose string keys (and string list values) are interned
+STRING_TABLE_FIELDS = (
+    *PER_PLAYER_FIELDS,
+    "victory_points",
+    "strategy_card_assignments",
+    "planet_control_mapping",
+)
+
+DEFAULT_TRANSACTION_HISTORY_LIMIT = 50
+
+_enum_indexes: dict[type[Enum], dict[Enum, int]] = {}
+
+
+def _enum_index(enum_type: type[Enum]) -> dict[Enum, int]:
+    index = _enum_indexes.get(enum_type)
+    if index is None:
+        index = {member: bit for bit, member in enumerate(enum_type)}
+        _enum_indexes[enum_type] = index
+    return index
+
+
+class EnumBitSet(MutableSet[E], Generic[E]):
+    """A mutable set of members of one enum, stored as a bitmask.
+
+    Behaves like ``set`` for membership, iteration (in definition order),
+    equality and ``copy()``, so it can replace a set of enum members.
+    """
+
+    __slots__ = ("_enum_type", "_bits")
+
+    def __init__(self, enum_type: type[E], members: Iterable[E] = ()) -> None:
+        """Initialize the set.
+
+        Args:
+            enum_type: The enum whose members can be stored
+            members: Initial members
+        """
+        self._enum_type = enum_type
+        self._bits = 0
+        for member in members:
+            self.add(member)
+
+    @property
+    def bits(self) -> int:
+        """The bitmask; bit ``n`` is the ``n``-th member of the enum."""
+        return self._bits
+
+    def __contains__(self, item: object) -> bool:
+        bit = _enum_index(self._enum_type).get(item)  # type: ignore[call-overload]
+        return bit is not None and bool(self._bits >> bit & 1)
+
+    def __iter__(self) -> Iterator[E]:
+        bits = self._bits
+        for member, bit in _enum_index(self._enum_type).items():
+            if bits >> bit & 1:
+                yield member  # type: ignore[misc]
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def add(self, value: E) -> None:
+        """Add a member of the enum."""
+        bit = _enum_index(self._enum_type).get(value)
+        if bit is None:
+            raise TypeError(f"{value!r} is not a member of {self._enum_type.__name__}")
+        self._bits |= 1 << bit
+
+    def discard(self, value: E) -> None:
+        """Remove a member if present."""
+        bit = _enum_index(self._enum_type).get(value)
+        if bit is not None:
+            self._bits &= ~(1 << bit)
+
+    def _from_iterable(self, it: Iterable[E]) -> EnumBitSet[E]:  # type: ignore[override]
+        """Build operator results (``|``, ``&``, ``-``, ``^``) of the same enum.
+
+        Set defines this as a classmethod that calls ``cls(it)``, which
+        would pass the iterable as the enum type.
+        """
+        return EnumBitSet(self._enum_type, it)
+
+    def copy(self) -> EnumBitSet[E]:
+        """Return a shallow copy."""
+        copied = EnumBitSet(self._enum_type)
+        copied._bits = self._bits
+        return copied
+
+    def __repr__(self) -> str:
+        members = ", ".join(repr(member) for member in self)
+        return f"EnumBitSet({self._enum_type.__name__}, {{{members}}})"
+
+
+@dataclass(frozen=True, slots=True)
+class CompactionStats:
+    """What a compaction pass changed."""
+
+    empty_entries_removed: int = 0
+    strings_interned: int = 0
+    transactions_archived: int = 0
+    bitsets_created: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """Whether the compaction produced a new state."""
+        return bool(
+            self.empty_entries_removed
+            or self.strings_interned
+            or self.transactions_archived
+            or self.bitsets_created
+        )
+
+
+class GameStateCompactor:
+    """Produces compacted copies of game states."""
+
+    def __init__(
+        self, transaction_history_limit: int = DEFAULT_TRANSACTION_HISTORY_LIMIT
+    ) -> None:
+        """Initialize the compactor.
+
+        Args:
+            transaction_history_limit: Number of most recent transaction
+                history entries kept in ``transaction_history``; older ones
+                are archived
+        """
+        if transaction_history_limit < 0:
+            raise ValueError("transaction_history_limit must be non-negative")
+        self.transaction_history_limit = transaction_history_limit
+
+    def compact(self, game_state: GameState) -> tuple[GameState, CompactionStats]:
+        """Compact a game state.
+
+        Args:
+            game_state: The game state to compact
+
+        Returns:
+            Tuple of (compacted state, stats). The state is the same object
+            if there was nothing to compact.
+        """
+        updates: dict[str, Any] = {}
+        empty_entries = 0
+        interned = 0
+
+        for name in STRING_TABLE_FIELDS:
+            table = getattr(game_state, name, None)
+            if not isinstance(table, dict):
+                continue
+            drop_empty = name in PER_PLAYER_FIELDS
+            compacted, removed, count = self._compact_table(table, drop_empty)
+            if compacted is not table:
+                updates[name] = compacted
+                empty_entries += removed
+                interned += count
+
+        archived_count = 0
+        archived = self._archive_transactions(game_state)
+        if archived is not None:
+            updates["archived_transaction_history"] = archived[0]
+            updates["transaction_history"] = archived[1]
+            archived_count = len(game_state.transaction_history) - len(archived[1])
+
+        bitsets = 0
+        exhausted = self._to_bitset(
+            getattr(game_state, "exhausted_strategy_cards", None)
+        )
+        if exhausted is not None:
+            updates["exhausted_strategy_cards"] = exhausted
+            bitsets += 1
+
+        stats = CompactionStats(
+            empty_entries_removed=empty_entries,
+            strings_interned=interned,
+            transactions_archived=archived_count,
+            bitsets_created=bitsets,
+        )
+        if not updates:
+            return game_state, stats
+        return game_state._create_new_state(**updates), stats
+
+    @staticmethod
+    def _compact_table(
+        table: dict[Any, Any], drop_empty: bool
+    ) -> tuple[dict[Any, Any], int, int]:
+        """Drop empty entries and intern strings of one table.
+
+        Value containers other than lists of strings are kept as the same
+        objects, so identity-based caches (e.g. the economy ledger) stay valid.
+
+        Returns:
+            Tuple of (table, entries removed, strings interned); the table is
+            the input object if nothing changed
+        """
+        removed = 0
+        interned = 0
+        changed = False
+        compacted: dict[Any, Any] = {}
+        for key, value in table.items():
+            if drop_empty and not value and hasattr(value, "__len__"):
+                removed += 1
+                changed = True
+                continue
+            if type(key) is str and sys.intern(key) is not key:
+                key = sys.intern(key)
+                interned += 1
+                changed = True
+            if type(value) is str and sys.intern(value) is not value:
+                value = sys.intern(value)
+                interned += 1
+                changed = True
+            elif type(value) is list and any(
+                type(item) is str and sys.intern(item) is not item for item in value
+            ):
+                interned += sum(
+                    1
+                    for item in value
+                    if type(item) is str and sys.intern(item) is not item
+                )
+                value = [
+                    sys.intern(item) if type(item) is str else item for item in value
+                ]
+                changed = True
+            compacted[key] = value
+        if not changed:
+            return table, 0, 0
+        return compacted, removed, interned
+
+    def _archive_transactions(
+        self, game_state: GameState
+    ) -> tuple[tuple[Any, ...], list[Any]] | None:
+        """Split off history entries beyond the limit.
+
+        Returns:
+            Tuple of (archived segment, recent entries), or None if the history
+            is within the limit
+        """
+        history = getattr(game_state, "transaction_history", None)
+        archived_history = getattr(game_state, "archived_transaction_history", ())
+        if not isinstance(history, list) or not isinstance(archived_history, tuple):
+            return None
+        overflow = len(history) - self.transaction_history_limit
+        if overflow <= 0:
+            return None
+        archived = (*archived_history, *history[:overflow])
+        return archived, history[overflow:]
+
+    @staticmethod
+    def _to_bitset(members: Any) -> EnumBitSet[Any] | None:
+        """Convert a set of members of one enum to an EnumBitSet.
+
+        Returns:
+            The bitset, or None if the value is already compact or is not a
+            set of enum members
+        """
+        if not isinstance(members, set):
+            return None
+        enum_types = {type(member) for member in members}
+        if len(enum_types) > 1 or not all(
+            issubclass(enum_type, Enum) for enum_type in enum_types
+        ):
+            return None
+        if not enum_types:
+            from .strategic_action import StrategyCardType
+
+            return EnumBitSet(StrategyCardType)
+        return EnumBitSet(enum_types.pop(), members)
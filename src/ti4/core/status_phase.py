@@ -8,8 +8,13 @@ LRR References:
 - Rule 34.2: Ready Cards step
 """
 
+import dataclasses
+import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -38,6 +43,8 @@ if TYPE_CHECKING:
         StatusPhasePerformanceReport,
     )
 
+logger = logging.getLogger(__name__)
+
 
 # Apply comprehensive error handling enhancements
 def _apply_error_handling_enhancements() -> None:
@@ -454,6 +461,210 @@ class RoundTransitionManager:
 # Orchestrator Class
 
 
+# Step Dependencies
+
+# Steps each status phase step must run after (Rule 81). Scoring reads the
+# board before anything is removed, readied or repaired; revealed objectives
+# cannot be scored this round; tokens removed in step 4 return to the
+# reinforcements that step 5 gains from; strategy cards are returned last.
+STATUS_PHASE_STEP_DEPENDENCIES: dict[int, frozenset[int]] = {
+    1: frozenset(),
+    2: frozenset({1}),
+    3: frozenset({1}),
+    4: frozenset({1}),
+    5: frozenset({1, 4}),
+    6: frozenset({1}),
+    7: frozenset({1}),
+    8: frozenset({2, 3, 4, 5, 6, 7}),
+}
+
+# Game state each step writes. Plain names are GameState fields replaced by
+# the step; dotted names are objects the step mutates in place. Steps in the
+# same stage must not share any entry.
+STATUS_PHASE_STEP_WRITES: dict[int, frozenset[str]] = {
+    1: frozenset(
+        {
+            "victory_points",
+            "completed_objectives",
+            "status_phase_scoring",
+            "player_secret_objectives",
+        }
+    ),
+    2: frozenset({"speaker_id", "revealed_public_objectives"}),
+    3: frozenset({"player_action_cards"}),
+    4: frozenset({"systems.command_tokens"}),
+    5: frozenset({"players.command_sheet"}),
+    6: frozenset(
+        {
+            "exhausted_strategy_cards",
+            "player_planets",
+            "player_technology_cards",
+            "players.leader_sheet",
+        }
+    ),
+    7: frozenset({"systems.units"}),
+    8: frozenset({"strategy_card_assignments"}),
+}
+
+# GameState fields that GameState._create_new_state rebuilds for every new
+# state; a step changed them if their contents differ from the base state
+_CLONED_FIELDS = frozenset(
+    {"planet_card_deck", "player_planet_cards", "planet_attachment_tokens"}
+)
+
+# GameState fields that GameState._create_new_state does not take; they are
+# set on the merged state directly, as _create_phase_transition does
+_FIXED_FIELDS = frozenset({"game_id", "galaxy", "phase"})
+
+
+@cache
+def _state_fields() -> tuple[str, ...]:
+    """Get the names of the GameState fields a step can change."""
+    from .game_state import GameState
+
+    return tuple(f.name for f in dataclasses.fields(GameState) if f.init)
+
+
+def _field_contents(name: str, value: Any) -> Any:
+    """Get a comparable view of a field that is cloned for every new state."""
+    if name == "planet_card_deck":
+        return {
+            planet_name: _planet_card_contents(card)
+            for planet_name, card in value.items()
+        }
+    if name == "player_planet_cards":
+        return {
+            player_id: [_planet_card_contents(card) for card in cards]
+            for player_id, cards in value.items()
+        }
+    return value
+
+
+def _planet_card_contents(card: Any) -> tuple[Any, ...]:
+    return (card.name, card.is_exhausted(), card.get_attached_cards())
+
+
+class StatusPhaseStepGraph:
+    """Dependency graph of the 8 status phase steps.
+
+    Groups the steps into stages: every step in a stage only depends on
+    steps of earlier stages and writes different game state than the other
+    steps of its stage, so the steps of a stage can run concurrently from
+    the same input state and their results be merged.
+
+    LRR References:
+    - Rule 81: Status Phase - Step order
+    """
+
+    def __init__(
+        self,
+        dependencies: dict[int, frozenset[int]] | None = None,
+        writes: dict[int, frozenset[str]] | None = None,
+    ) -> None:
+        """Initialize the graph.
+
+        Args:
+            dependencies: Step number -> steps it must run after
+            writes: Step number -> game state it writes
+        """
+        self.dependencies = dependencies or STATUS_PHASE_STEP_DEPENDENCIES
+        self.writes = writes or STATUS_PHASE_STEP_WRITES
+        self._stages: list[tuple[int, ...]] | None = None
+
+    def get_execution_stages(self) -> list[tuple[int, ...]]:
+        """Get the steps grouped into stages, in execution order.
+
+        Raises:
+            StepValidationError: If the dependencies contain a cycle
+        """
+        if self._stages is None:
+            self._stages = self._build_stages()
+        return list(self._stages)
+
+    def _build_stages(self) -> list[tuple[int, ...]]:
+        remaining = sorted(self.dependencies)
+        done: set[int] = set()
+        stages: list[tuple[int, ...]] = []
+        while remaining:
+            stage: list[int] = []
+            stage_writes: set[str] = set()
+            for step in remaining:
+                if not self.dependencies[step] <= done:
+                    continue
+                step_writes = self.writes.get(step, frozenset())
+                if stage_writes & step_writes:
+                    continue
+                stage.append(step)
+                stage_writes |= step_writes
+            if not stage:
+                raise StepValidationError(
+                    f"Status phase steps {remaining} have cyclic dependencies"
+                )
+            stages.append(tuple(stage))
+            done.update(stage)
+            remaining = [step for step in remaining if step not in done]
+        return stages
+
+    def merge_step_states(
+        self, base_state: "GameState", step_states: dict[int, "GameState"]
+    ) -> "GameState":
+        """Merge the states produced by steps run from the same base state.
+
+        Args:
+            base_state: The state every step started from
+            step_states: Step number -> state returned by the step
+
+        Returns:
+            A single state containing every step's changes
+
+        Raises:
+            StatusPhaseGameStateError: If a step replaced state it does not
+                declare, or two steps replaced the same field
+        """
+        updates: dict[str, Any] = {}
+        for step, state in sorted(step_states.items()):
+            if state is base_state:
+                continue
+            declared = self.writes.get(step, frozenset())
+            for name in _state_fields():
+                value = getattr(state, name)
+                base_value = getattr(base_state, name)
+                if value is base_value:
+                    continue
+                if name in _CLONED_FIELDS and _field_contents(
+                    name, value
+                ) == _field_contents(name, base_value):
+                    continue
+                if name not in declared:
+                    raise StatusPhaseGameStateError(
+                        f"Step {step} replaced undeclared game state '{name}'"
+                    )
+                if name in updates:
+                    raise StatusPhaseGameStateError(
+                        f"Step {step} and another step both replaced '{name}'"
+                    )
+                updates[name] = value
+        if not updates:
+            return base_state
+        fixed = {name: updates.pop(name) for name in _FIXED_FIELDS & updates.keys()}
+        merged_state = base_state._create_new_state(**updates)
+        for name, value in fixed.items():
+            # Use object.__setattr__ to bypass frozen dataclass restriction
+            object.__setattr__(merged_state, name, value)
+        return merged_state
+
+
+@dataclass(slots=True)
+class _StepOutcome:
+    """Result, resulting state and duration of one executed step."""
+
+    result: StepResult
+    state: "GameState"
+    execution_time_ms: float
+    # False if the step raised instead of returning a result
+    completed: bool = True
+
+
 class StatusPhaseOrchestrator:
     """Orchestrates the complete 8-step status phase sequence.
 
@@ -465,11 +676,27 @@ class StatusPhaseOrchestrator:
     - Rule 81: Status Phase - Complete 8-step sequence coordination
     """
 
-    def __init__(self) -> None:
-        """Initialize the status phase orchestrator."""
+    def __init__(
+        self, parallel_steps: bool | None = None, max_workers: int = 1
+    ) -> None:
+        """Initialize the status phase orchestrator.
+
+        Args:
+            parallel_steps: Run independent steps from the same input state
+                and merge their results (only for real GameState objects).
+                Defaults to True only if max_workers > 1, since running a
+                stage in one thread is serial execution plus merge overhead.
+            max_workers: Threads used to run the steps of a stage. With 1, a
+                stage runs in the calling thread.
+        """
         # Non-optional optimizer via a Null-object implementation.
         # This avoids Any and Optional, providing a safe default that satisfies the protocol.
         self.optimizer: PerformanceOptimizerProtocol = _NullPerformanceOptimizer()
+        self.parallel_steps = (
+            max_workers > 1 if parallel_steps is None else parallel_steps
+        )
+        self.max_workers = max_workers
+        self.step_graph = StatusPhaseStepGraph()
 
     def get_performance_report(self) -> "StatusPhasePerformanceReport | None":
         """Return a performance report if available.
@@ -521,8 +748,6 @@ class StatusPhaseOrchestrator:
         Raises:
             StatusPhaseError: If status phase execution fails
         """
-        import time
-
         start_time = time.time()
 
         try:
@@ -553,46 +778,27 @@ class StatusPhaseOrchestrator:
                 return result, game_state
 
             # Execute all 8 steps with graceful degradation
-            step_results = {}
-            steps_completed = []
+            step_outcomes: dict[int, _StepOutcome] = {}
             current_state = game_state
             overall_success = True
             critical_failure = False
 
-            for step_num in range(1, 9):
-                try:
-                    step_result, current_state = self.execute_step(
-                        step_num, current_state
-                    )
-                    step_results[step_num] = step_result
-                    steps_completed.append(step_result.step_name)
-
-                    # Check for critical failures that should halt execution
-                    if not step_result.success and self._is_critical_step(step_num):
-                        critical_failure = True
-                        overall_success = False
-                        break
-                    elif not step_result.success:
-                        # Non-critical failure - continue with graceful degradation
-                        # Don't change overall_success here - let it be determined at the end
-                        pass
+            for stage in self.get_execution_stages(current_state):
+                outcomes, current_state = self._execute_stage(stage, current_state)
+                step_outcomes.update(outcomes)
 
-                except Exception as e:
-                    # Handle unexpected errors during step execution
-                    step_result = StepResult(
-                        success=False,
-                        step_name=f"Step {step_num}",
-                        error_message=f"Unexpected error: {str(e)}",
-                    )
-                    step_results[step_num] = step_result
+                # Check for critical failures that should halt execution.
+                # Non-critical failures continue with graceful degradation.
+                if any(
+                    not outcomes[step_num].result.success
+                    and self._is_critical_step(step_num)
+                    for step_num in stage
+                ):
+                    critical_failure = True
+                    overall_success = False
+                    break
 
-                    if self._is_critical_step(step_num):
-                        critical_failure = True
-                        overall_success = False
-                        break
-                    else:
-                        # Continue execution for non-critical step failures
-                        overall_success = True
+            step_results, steps_completed = self._collect_step_results(step_outcomes)
 
             # Determine final success status
             if critical_failure:
@@ -659,6 +865,110 @@ class StatusPhaseOrchestrator:
         critical_steps = {8}  # Only strategy card return is truly critical
         return step_number in critical_steps
 
+    def get_execution_stages(self, game_state: "GameState") -> list[tuple[int, ...]]:
+        """Get the stages the steps are executed in for a game state.
+
+        Independent steps share a stage when parallel execution is enabled
+        and the state can be merged; otherwise every step is its own stage.
+
+        Args:
+            game_state: The game state the status phase runs on
+
+        Returns:
+            Step numbers grouped into stages, in execution order
+        """
+        from .game_state import GameState
+
+        if self.parallel_steps and isinstance(game_state, GameState):
+            return self.step_graph.get_execution_stages()
+        return [(step_number,) for step_number in range(1, 9)]
+
+    def _run_step(self, step_number: int, game_state: "GameState") -> _StepOutcome:
+        """Execute one step, converting unexpected errors to a failed result."""
+        start_time = time.perf_counter()
+        try:
+            result, new_state = self.execute_step(step_number, game_state)
+            completed = True
+        except Exception as e:
+            result = StepResult(
+                success=False,
+                step_name=f"Step {step_number}",
+                error_message=f"Unexpected error: {str(e)}",
+            )
+            new_state = game_state
+            completed = False
+        return _StepOutcome(
+            result=result,
+            state=new_state,
+            execution_time_ms=(time.perf_counter() - start_time) * 1000,
+            completed=completed,
+        )
+
+    def _collect_step_results(
+        self, step_outcomes: dict[int, _StepOutcome]
+    ) -> tuple[dict[int, StepResult], list[str]]:
+        """Get step results and completed step names in step order."""
+        step_results: dict[int, StepResult] = {}
+        steps_completed: list[str] = []
+        for step_num in sorted(step_outcomes):
+            outcome = step_outcomes[step_num]
+            step_results[step_num] = outcome.result
+            if outcome.completed:
+                steps_completed.append(outcome.result.step_name)
+        return step_results, steps_completed
+
+    def _execute_stage(
+        self, stage: tuple[int, ...], game_state: "GameState"
+    ) -> tuple[dict[int, _StepOutcome], "GameState"]:
+        """Execute the steps of a stage and merge their resulting states.
+
+        Args:
+            stage: Step numbers that do not depend on each other
+            game_state: The state every step of the stage starts from
+
+        Returns:
+            A tuple of (step number -> outcome, merged game state)
+        """
+        if len(stage) == 1:
+            outcome = self._run_step(stage[0], game_state)
+            return {stage[0]: outcome}, outcome.state
+
+        if self.max_workers > 1:
+            workers = min(self.max_workers, len(stage))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="status-phase"
+            ) as executor:
+                futures = {
+                    step_number: executor.submit(
+                        self._run_step, step_number, game_state
+                    )
+                    for step_number in stage
+                }
+                outcomes = {
+                    step_number: future.result()
+                    for step_number, future in futures.items()
+                }
+        else:
+            outcomes = {
+                step_number: self._run_step(step_number, game_state)
+                for step_number in stage
+            }
+
+        try:
+            merged_state = self.step_graph.merge_step_states(
+                game_state,
+                {step: outcome.state for step, outcome in outcomes.items()},
+            )
+        except StatusPhaseGameStateError as e:
+            # In-place changes of these steps are idempotent, so replaying
+            # the stage one step at a time gives the serial result
+            logger.warning("Cannot merge status phase stage %s: %s", stage, e)
+            merged_state = game_state
+            for step_number in stage:
+                outcomes[step_number] = self._run_step(step_number, merged_state)
+                merged_state = outcomes[step_number].state
+        return outcomes, merged_state
+
     def execute_step(
         self, step_number: int, game_state: "GameState"
     ) -> tuple[StepResult, "GameState"]:
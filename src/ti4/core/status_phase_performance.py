@@ -7,10 +7,14 @@ Requirements addressed:
 - 12.1: Complete status phase execution in <500ms
 - 12.2: Individual steps execution in <100ms each
 - 12.3: Memory usage optimization for large game states
+
+Memory is measured with tracemalloc (bytes allocated by Python), and only
+while tracing is active: start it with ``trace_memory=True`` or
+``tracemalloc.start()``. Monitoring never forces a garbage collection.
 """
 
-import gc
 import time
+import tracemalloc
 from dataclasses import dataclass, field
 from types import TracebackType
 from typing import (
@@ -26,11 +30,16 @@ from ti4.performance.optimizer_protocol import (
     PerformanceOptimizerProtocol,
 )
 
+from .state_compaction import (
+    DEFAULT_TRANSACTION_HISTORY_LIMIT,
+    CompactionStats,
+    GameStateCompactor,
+)
 from .status_phase import (
     RoundTransitionManager,
     StatusPhaseOrchestrator,
     StatusPhaseResult,
-    StepResult,
+    _StepOutcome,
 )
 
 if TYPE_CHECKING:
@@ -79,6 +88,8 @@ class StatusPhasePerformanceReport:
     overall_metrics: PerformanceMetrics | None = None
     memory_optimization_enabled: bool = False
     performance_warnings: list[str] = field(default_factory=list)
+    # Serial time / wall time of the stage each step ran in
+    step_speedups: dict[int, float] = field(default_factory=dict)
 
     def add_step_metrics(self, step_number: int, metrics: PerformanceMetrics) -> None:
         """Add performance metrics for a specific step."""
@@ -90,6 +101,32 @@ class StatusPhasePerformanceReport:
                 f"Step {step_number} exceeded timing requirement: {metrics.execution_time_ms:.2f}ms"
             )
 
+    def add_stage_timing(self, steps: tuple[int, ...], wall_time_ms: float) -> None:
+        """Record the speedup of a stage of steps executed together.
+
+        The speedup is the time the steps would have taken one after another
+        (the sum of their own execution times) divided by the wall-clock time
+        of the stage. Every step of the stage is credited with it.
+
+        Args:
+            steps: Step numbers executed in the stage
+            wall_time_ms: Wall-clock time of the whole stage
+        """
+        serial_time_ms = sum(
+            self.step_metrics[step].execution_time_ms
+            for step in steps
+            if step in self.step_metrics
+        )
+        speedup = 1.0
+        if len(steps) > 1 and wall_time_ms > 0:
+            speedup = serial_time_ms / wall_time_ms
+        for step in steps:
+            self.step_speedups[step] = speedup
+
+    def get_step_speedup(self, step_number: int) -> float:
+        """Get the recorded speedup of a step (1.0 if it ran on its own)."""
+        return self.step_speedups.get(step_number, 1.0)
+
     def get_slowest_step(self) -> tuple[int, PerformanceMetrics] | None:
         """Get the slowest executing step."""
         if not self.step_metrics:
@@ -126,18 +163,38 @@ class StatusPhasePerformanceOptimizer:
     """
 
     def __init__(
-        self, enable_caching: bool = True, enable_memory_optimization: bool = True
+        self,
+        enable_caching: bool = True,
+        enable_memory_optimization: bool = True,
+        trace_memory: bool = False,
+        transaction_history_limit: int = DEFAULT_TRANSACTION_HISTORY_LIMIT,
     ):
         """Initialize the performance optimizer.
 
         Args:
             enable_caching: Whether to enable result caching
             enable_memory_optimization: Whether to enable memory optimization
+            trace_memory: Whether to start tracemalloc so that memory use is
+                measured (tracing slows down allocation-heavy code)
+            transaction_history_limit: Recent transaction history entries
+                kept by state compaction; older ones are archived
         """
         self.enable_caching = enable_caching
         self.enable_memory_optimization = enable_memory_optimization
         self._cache: dict[str, Any] = {}
         self._performance_history: list[StatusPhasePerformanceReport] = []
+        self._compactor = GameStateCompactor(transaction_history_limit)
+        self._last_compaction: CompactionStats | None = None
+        self._started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop_memory_tracing(self) -> None:
+        """Stop tracemalloc if this optimizer started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
 
     def monitor_performance(self, operation_name: str) -> CMProtocol:
         """Create a context manager for monitoring operation performance.
@@ -162,7 +219,6 @@ class StatusPhasePerformanceOptimizer:
 
             def __enter__(self) -> MetricsProtocol:
                 if self._outer.enable_memory_optimization:
-                    gc.collect()
                     self._metrics.memory_before = self._outer._get_memory_usage()
                 self._start_time = time.perf_counter()
                 return self._metrics
@@ -177,6 +233,7 @@ class StatusPhasePerformanceOptimizer:
                 self._metrics.execution_time_ms = (end_time - self._start_time) * 1000
                 if self._outer.enable_memory_optimization:
                     self._metrics.memory_after = self._outer._get_memory_usage()
+                    self._metrics.memory_peak = self._outer._get_memory_peak()
                 if exc is not None:
                     self._metrics.success = False
                     self._metrics.error_message = str(exc)
@@ -197,14 +254,24 @@ class StatusPhasePerformanceOptimizer:
         return latest.meets_performance_requirements()
 
     def _get_memory_usage(self) -> int:
-        """Get current memory load proxy (simplified).
+        """Get the memory currently allocated by Python.
 
         Returns:
-            Approximate object count (proxy for memory usage)
+            Traced bytes, or 0 if tracemalloc is not tracing
         """
-        # Use object count as a proxy for memory usage
-        # In production, you might use psutil or similar for actual memory measurement
-        return len(gc.get_objects())
+        if not tracemalloc.is_tracing():
+            return 0
+        return tracemalloc.get_traced_memory()[0]
+
+    def _get_memory_peak(self) -> int:
+        """Get the peak of traced memory since tracing started.
+
+        Returns:
+            Peak traced bytes, or 0 if tracemalloc is not tracing
+        """
+        if not tracemalloc.is_tracing():
+            return 0
+        return tracemalloc.get_traced_memory()[1]
 
     def optimize_for_large_game_states(self, game_state: "GameState") -> "GameState":
         """Optimize game state for better performance with large states.
@@ -218,12 +285,13 @@ class StatusPhasePerformanceOptimizer:
         if not self.enable_memory_optimization:
             return game_state
 
-        # For now, return the same state
-        # In a full implementation, you might:
-        # - Compress unused data
-        # - Cache frequently accessed computations
-        # - Optimize data structures
-        return game_state
+        from .game_state import GameState
+
+        if not isinstance(game_state, GameState):
+            return game_state
+
+        compacted, self._last_compaction = self._compactor.compact(game_state)
+        return compacted
 
     def clear_cache(self) -> None:
         """Clear the performance cache."""
@@ -239,6 +307,7 @@ class StatusPhasePerformanceOptimizer:
             "cache_size": len(self._cache),
             "cache_enabled": self.enable_caching,
             "memory_optimization_enabled": self.enable_memory_optimization,
+            "last_compaction": self._last_compaction,
         }
 
     def add_performance_report(self, report: StatusPhasePerformanceReport) -> None:
@@ -312,13 +381,23 @@ class OptimizedStatusPhaseOrchestrator(StatusPhaseOrchestrator):
 
     # Optimizer is guaranteed to be present in this optimized variant.
 
-    def __init__(self, optimizer: StatusPhasePerformanceOptimizer | None = None):
+    def __init__(
+        self,
+        optimizer: StatusPhasePerformanceOptimizer | None = None,
+        parallel_steps: bool | None = None,
+        max_workers: int = 1,
+    ):
         """Initialize the optimized orchestrator.
 
         Args:
             optimizer: Performance optimizer instance (creates default if None)
+            parallel_steps: Run independent steps from the same input state
+                (defaults to True only if max_workers > 1)
+            max_workers: Threads used to run the steps of a stage
         """
-        super().__init__()
+        super().__init__(parallel_steps=parallel_steps, max_workers=max_workers)
+        # Metrics of the steps of the stage being executed, by step number
+        self._step_metrics: dict[int, PerformanceMetrics] = {}
         # In the optimized orchestrator, the optimizer is always present.
         # Narrow the type for static type checkers.
         self.optimizer: PerformanceOptimizerProtocol = (
@@ -367,11 +446,6 @@ class OptimizedStatusPhaseOrchestrator(StatusPhaseOrchestrator):
         # Add to performance history
         self.optimizer.add_performance_report(report)
 
-        # Proactively trigger garbage collection when memory optimization is enabled
-        # to minimize transient object retention after execution.
-        if self.optimizer.enable_memory_optimization:
-            gc.collect()
-
         return result, final_state
 
     def _execute_with_monitoring(
@@ -412,51 +486,28 @@ class OptimizedStatusPhaseOrchestrator(StatusPhaseOrchestrator):
             )
             return result, game_state
 
-        step_results = {}
-        steps_completed = []
+        step_outcomes: dict[int, _StepOutcome] = {}
         current_state = game_state
         overall_success = True
 
-        # Execute each step with monitoring
-        for step_num in range(1, 9):
-            step_metrics: MetricsProtocol
-            with self.optimizer.monitor_performance(f"step_{step_num}") as step_metrics:
-                try:
-                    step_result, current_state = self.execute_step(
-                        step_num, current_state
-                    )
-                    step_results[step_num] = step_result
-                    steps_completed.append(step_result.step_name)
-
-                    step_metrics.success = step_result.success
-                    if not step_result.success:
-                        step_metrics.error_message = step_result.error_message
-                        if self._is_critical_step(step_num):
-                            overall_success = False
-                            break
-
-                except Exception as e:
-                    step_metrics.success = False
-                    step_metrics.error_message = str(e)
-
-                    step_result = StepResult(
-                        success=False,
-                        step_name=f"Step {step_num}",
-                        error_message=str(e),
-                    )
-                    step_results[step_num] = step_result
-
-                    if self._is_critical_step(step_num):
-                        overall_success = False
-                        break
-
-            # Add step metrics to report
-            report.add_step_metrics(step_num, cast(PerformanceMetrics, step_metrics))
-
-            # Opportunistic garbage collection between steps when enabled to
-            # reduce transient allocations and keep object growth bounded.
-            if self.optimizer.enable_memory_optimization:
-                gc.collect()
+        # Execute each stage of independent steps with per-step monitoring
+        for stage in self.get_execution_stages(current_state):
+            stage_start = time.perf_counter()
+            outcomes, current_state = self._execute_stage(stage, current_state)
+            stage_time_ms = (time.perf_counter() - stage_start) * 1000
+
+            step_outcomes.update(outcomes)
+            for step_num in stage:
+                outcome = outcomes[step_num]
+                report.add_step_metrics(step_num, self._step_metrics.pop(step_num))
+                if not outcome.result.success and self._is_critical_step(step_num):
+                    overall_success = False
+            report.add_stage_timing(stage, stage_time_ms)
+
+            if not overall_success:
+                break
+
+        step_results, steps_completed = self._collect_step_results(step_outcomes)
 
         # Determine next phase and apply transition (mirror base orchestrator)
         transition_manager = RoundTransitionManager()
@@ -482,6 +533,17 @@ class OptimizedStatusPhaseOrchestrator(StatusPhaseOrchestrator):
 
         return result, final_state
 
+    def _run_step(self, step_number: int, game_state: "GameState") -> _StepOutcome:
+        """Execute one step inside a performance monitor."""
+        step_metrics: MetricsProtocol
+        with self.optimizer.monitor_performance(f"step_{step_number}") as step_metrics:
+            outcome = super()._run_step(step_number, game_state)
+            step_metrics.success = outcome.result.success
+            if not outcome.result.success:
+                step_metrics.error_message = outcome.result.error_message
+        self._step_metrics[step_number] = cast(PerformanceMetrics, step_metrics)
+        return outcome
+
     def get_performance_report(self) -> StatusPhasePerformanceReport | None:
         """Get the most recent performance report.
 
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING, Any
 
+from .fleet_counters import SpaceAreaCounters
 from .unit import Unit
 
 if TYPE_CHECKING:
     from .constants import AnomalyType, WormholeType
     from .fleet import Fleet
-    from .planet import Planet
+    from .fleet_counters import FleetCounts
+    from .planet import OccupancyListener, Planet
 
 
 class System:
@@ -32,6 +35,32 @@ class System:
         self.anomaly_types: list[
             AnomalyType
         ] = []  # List of anomaly types in this system
+        self._occupancy_listeners: weakref.WeakSet[OccupancyListener] = (
+            weakref.WeakSet()
+        )
+        self._fleet_counters = SpaceAreaCounters(self.space_units)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Listeners belong to the original system, not to copies
+        state = self.__dict__.copy()
+        del state["_occupancy_listeners"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._occupancy_listeners = weakref.WeakSet()
+
+    def add_occupancy_listener(self, listener: OccupancyListener) -> None:
+        """Notify a listener whenever units, planets or wormholes change here.
+
+        Planet-level changes (units on planets, control) are reported by the
+        planets themselves; see Planet.add_occupancy_listener.
+        """
+        self._occupancy_listeners.add(listener)
+
+    def _notify_occupancy_changed(self) -> None:
+        for listener in list(self._occupancy_listeners):
+            listener.on_occupancy_changed(self)
 
     def place_command_token(self, player_id: str) -> None:
         """Place a command token for a player in this system (Rule 20.4)."""
@@ -72,10 +101,30 @@ class System:
     def place_unit_in_space(self, unit: Unit) -> None:
         """Place a unit in the space area of this system."""
         self.space_units.append(unit)
+        self._fleet_counters.unit_added(self.space_units, unit)
+        self._notify_occupancy_changed()
 
     def remove_unit_from_space(self, unit: Unit) -> None:
         """Remove a unit from the space area of this system."""
         self.space_units.remove(unit)
+        self._fleet_counters.unit_removed(self.space_units, unit)
+        self._notify_occupancy_changed()
+
+    def get_fleet_counts(self, player_id: str) -> FleetCounts:
+        """Get a player's non-fighter ships, capacity and carried units here.
+
+        Counts cover the space area only (Rule 37.1a) and are kept up to date
+        as units are placed and removed.
+        """
+        return self._fleet_counters.get(self.space_units, player_id)
+
+    def get_all_fleet_counts(self) -> dict[str, FleetCounts]:
+        """Get the fleet counts of every player with units in the space area."""
+        return self._fleet_counters.get_all(self.space_units)
+
+    def refresh_fleet_counts(self) -> None:
+        """Recount the space area, e.g. after a unit upgrade changed capacity."""
+        self._fleet_counters.recount(self.space_units)
 
     def place_unit_on_planet(self, unit: Unit, planet_name: str) -> None:
         """Place a unit on a specific planet in this system."""
@@ -99,6 +148,7 @@ class System:
     def add_planet(self, planet: Planet) -> None:
         """Add a planet to this system."""
         self.planets.append(planet)
+        self._notify_occupancy_changed()
 
     def add_fleet(self, fleet: Fleet) -> None:
         """Add a fleet to this system."""
@@ -137,6 +187,7 @@ class System:
         # Avoid duplicates
         if wormhole_str not in self.wormholes:
             self.wormholes.append(wormhole_str)
+            self._notify_occupancy_changed()
 
     def has_wormhole(self, wormhole_type: str) -> bool:
         """
@@ -171,6 +222,7 @@ class System:
         """
         if wormhole_type in self.wormholes:
             self.wormholes.remove(wormhole_type)
+            self._notify_occupancy_changed()
             return True
         return False
 
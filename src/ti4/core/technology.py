@@ -1,5 +1,15 @@
-"""Technology system for TI4."""
-
+"""Technology system for TI4.
+
+Research legality (Rule 90.12) is checked often, for example once per
+technology when an AI lists its options. TechnologyMasks gives every
+technology a bit, so a player's technologies form one integer. The technologies
+of each color and the prerequisites of each technology are encoded once, so
+counting a player's colors is one popcount per color and the technologies a
+player can research are found with a few integer operations for all
+technologies at once.
+"""
+
+from collections.abc import Iterable
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
@@ -82,6 +92,166 @@ class TechnologyCard:
 # Legacy TechnologyTree class removed - replaced by TechnologyManager
 
 
+# Technologies in every player's technology deck (Rule 90.2)
+_TECHNOLOGY_DECK = frozenset(
+    {
+        TechnologyEnum.CRUISER_II,
+        TechnologyEnum.FIGHTER_II,
+        TechnologyEnum.GRAVITY_DRIVE,
+        TechnologyEnum.CARRIER_II,
+        TechnologyEnum.DREADNOUGHT_II,
+        TechnologyEnum.DESTROYER_II,
+        TechnologyEnum.FLEET_LOGISTICS,
+        TechnologyEnum.LIGHT_WAVE_DEFLECTOR,
+        TechnologyEnum.PLASMA_SCORING,
+        TechnologyEnum.ANTIMASS_DEFLECTORS,
+        TechnologyEnum.DARK_ENERGY_TAP,  # New framework technology
+    }
+)
+
+# CONFIRMED NON-UNIT-UPGRADE TECHNOLOGY DATA - DO NOT MODIFY WITHOUT USER APPROVAL
+_CONFIRMED_COLORS = {
+    TechnologyEnum.GRAVITY_DRIVE: TechnologyColor.BLUE,  # Blue tech (confirmed)
+    TechnologyEnum.ANTIMASS_DEFLECTORS: TechnologyColor.BLUE,  # Blue tech, no prerequisites (confirmed)
+    TechnologyEnum.QUANTUM_DATAHUB_NODE: TechnologyColor.YELLOW,  # Yellow tech, Hacan faction (confirmed)
+    TechnologyEnum.DARK_ENERGY_TAP: TechnologyColor.BLUE,  # Blue tech, confirmed through framework
+    TechnologyEnum.AI_DEVELOPMENT_ALGORITHM: TechnologyColor.YELLOW,  # Yellow tech, confirmed through framework
+    # Note: SPEC_OPS_II is a unit upgrade and has no color
+}
+
+# CONFIRMED PREREQUISITE DATA - DO NOT MODIFY WITHOUT USER APPROVAL
+_CONFIRMED_PREREQUISITES = {
+    TechnologyEnum.CRUISER_II: (
+        TechnologyColor.YELLOW,
+        TechnologyColor.RED,
+        TechnologyColor.GREEN,
+    ),  # Confirmed: 1Y+1R+1G
+    TechnologyEnum.GRAVITY_DRIVE: (TechnologyColor.BLUE,),  # Confirmed: 1 Blue
+    TechnologyEnum.FIGHTER_II: (
+        TechnologyColor.BLUE,
+        TechnologyColor.GREEN,
+    ),  # Confirmed: 1 Blue + 1 Green
+    TechnologyEnum.ANTIMASS_DEFLECTORS: (),  # Confirmed: No prerequisites (Level 0)
+    TechnologyEnum.SPEC_OPS_II: (
+        TechnologyColor.GREEN,
+        TechnologyColor.GREEN,
+    ),  # Confirmed: 2x Green (Sol faction tech)
+    TechnologyEnum.QUANTUM_DATAHUB_NODE: (
+        TechnologyColor.YELLOW,
+        TechnologyColor.YELLOW,
+        TechnologyColor.YELLOW,
+    ),  # Confirmed: 3x Yellow (Hacan faction tech)
+    TechnologyEnum.DARK_ENERGY_TAP: (),  # Confirmed: No prerequisites (Level 0), confirmed through framework
+    TechnologyEnum.AI_DEVELOPMENT_ALGORITHM: (),  # Confirmed: No prerequisites (Level 0), confirmed through framework
+}
+
+# CONFIRMED UNIT UPGRADE DATA - DO NOT MODIFY WITHOUT USER APPROVAL
+_CONFIRMED_UNIT_UPGRADES = frozenset(
+    {
+        TechnologyEnum.CRUISER_II,  # Confirmed: Unit upgrade
+        TechnologyEnum.FIGHTER_II,  # Confirmed: Unit upgrade
+        TechnologyEnum.SPEC_OPS_II,  # Confirmed: Unit upgrade (Sol faction)
+    }
+)
+
+# Technologies whose unit upgrade status is confirmed
+_CONFIRMED_UPGRADE_STATUS = frozenset(
+    {
+        TechnologyEnum.CRUISER_II,
+        TechnologyEnum.GRAVITY_DRIVE,
+        TechnologyEnum.FIGHTER_II,
+        TechnologyEnum.ANTIMASS_DEFLECTORS,
+        TechnologyEnum.SPEC_OPS_II,
+        TechnologyEnum.QUANTUM_DATAHUB_NODE,
+        TechnologyEnum.DARK_ENERGY_TAP,  # Confirmed through framework
+        TechnologyEnum.AI_DEVELOPMENT_ALGORITHM,  # Confirmed through framework
+    }
+)
+
+
+class TechnologyMasks:
+    """Bit encoding of technologies, colors and prerequisites (Rule 90.12).
+
+    Technologies without a confirmed color (unit upgrades included) count
+    toward no color. Technologies without confirmed prerequisites are never
+    researchable.
+    """
+
+    def __init__(self) -> None:
+        """Encode the confirmed technology data."""
+        self.technologies = tuple(TechnologyEnum)
+        self.bits = {
+            technology: 1 << index for index, technology in enumerate(self.technologies)
+        }
+        self._value_bits = {
+            technology.value: bit for technology, bit in self.bits.items()
+        }
+        self.colors = tuple(TechnologyColor)
+        self.deck_mask = self.to_mask(_TECHNOLOGY_DECK)
+        self.color_masks = tuple(
+            self.to_mask(
+                technology
+                for technology, technology_color in _CONFIRMED_COLORS.items()
+                if technology_color == color
+            )
+            for color in self.colors
+        )
+        # Prerequisite color counts -> technologies requiring exactly them
+        groups: dict[tuple[int, ...], int] = {}
+        for technology, prerequisites in _CONFIRMED_PREREQUISITES.items():
+            required = tuple(prerequisites.count(color) for color in self.colors)
+            groups[required] = groups.get(required, 0) | self.bits[technology]
+        self._requirement_groups = tuple(groups.items())
+
+    def to_mask(self, technologies: Iterable[TechnologyEnum]) -> int:
+        """Encode technologies as a bitmask."""
+        mask = 0
+        for technology in technologies:
+            mask |= self.bits[technology]
+        return mask
+
+    def mask_from_values(self, names: Iterable[Any]) -> int:
+        """Encode technology values (or enums), skipping unknown names."""
+        mask = 0
+        for name in names:
+            if isinstance(name, TechnologyEnum):
+                mask |= self.bits[name]
+            else:
+                mask |= self._value_bits.get(name, 0)
+        return mask
+
+    def from_mask(self, mask: int) -> set[TechnologyEnum]:
+        """Decode a bitmask into technologies."""
+        return {technology for technology, bit in self.bits.items() if mask & bit}
+
+    def values(self, mask: int) -> list[str]:
+        """Decode a bitmask into technology values, in enum order."""
+        return [technology.value for technology, bit in self.bits.items() if mask & bit]
+
+    def color_counts(self, mask: int) -> tuple[int, ...]:
+        """Count the technologies of each color (in TechnologyColor order)."""
+        return tuple((mask & color_mask).bit_count() for color_mask in self.color_masks)
+
+    def prerequisites_met(self, owned_mask: int) -> int:
+        """Get the technologies whose prerequisites the owned ones satisfy."""
+        counts = self.color_counts(owned_mask)
+        met = 0
+        for required, technologies in self._requirement_groups:
+            if all(
+                count >= needed for count, needed in zip(counts, required, strict=True)
+            ):
+                met |= technologies
+        return met
+
+    def researchable(self, owned_mask: int) -> int:
+        """Get the deck technologies a player owning owned_mask can research."""
+        return self.prerequisites_met(owned_mask) & self.deck_mask & ~owned_mask
+
+
+# Shared encoding; the confirmed data it is built from never changes
+TECHNOLOGY_MASKS = TechnologyMasks()
+
+
 class TechnologyManager:
     """Manages technology ownership, research, and validation for players.
 
@@ -96,6 +266,8 @@ class TechnologyManager:
         """Initialize the technology manager."""
         # Track technologies owned by each player (Rule 90.1)
         self._player_technologies: dict[str, set[TechnologyEnum]] = {}
+        # player -> bitmask of owned technologies, kept in step with the sets
+        self._player_masks: dict[str, int] = {}
 
     def get_player_technologies(self, player_id: str) -> set[TechnologyEnum]:
         """Get all technologies owned by a player.
@@ -104,11 +276,11 @@ class TechnologyManager:
             player_id: The player to get technologies for
 
         Returns:
-            Set of technologies owned by the player
+            Copy of the set of technologies owned by the player
 
         LRR Reference: Rule 90.1 - Each player places any technology they have gained faceup
         """
-        return self._player_technologies.get(player_id, set())
+        return set(self._player_technologies.get(player_id, ()))
 
     def gain_technology(self, player_id: str, technology: TechnologyEnum) -> None:
         """Give a technology to a player.
@@ -119,9 +291,31 @@ class TechnologyManager:
 
         LRR Reference: Rule 90.1 - Players place gained technology faceup near faction sheet
         """
-        if player_id not in self._player_technologies:
-            self._player_technologies[player_id] = set()
-        self._player_technologies[player_id].add(technology)
+        self.gain_technology_mask(player_id, TECHNOLOGY_MASKS.bits[technology])
+
+    def gain_technology_mask(self, player_id: str, mask: int) -> None:
+        """Give a player every technology of a bitmask (see TechnologyMasks).
+
+        Args:
+            player_id: The player gaining the technologies
+            mask: The technologies being gained
+        """
+        owned_mask = self.get_player_technology_mask(player_id)
+        technologies = self._player_technologies.setdefault(player_id, set())
+        if mask & ~owned_mask:
+            technologies.update(TECHNOLOGY_MASKS.from_mask(mask & ~owned_mask))
+        self._player_masks[player_id] = owned_mask | mask
+
+    def get_player_technology_mask(self, player_id: str) -> int:
+        """Get the technologies owned by a player as a bitmask.
+
+        Args:
+            player_id: The player to get technologies for
+
+        Returns:
+            Bitmask of owned technologies (see TechnologyMasks)
+        """
+        return self._player_masks.get(player_id, 0)
 
     def get_technology_deck(self, player_id: str) -> set[TechnologyEnum]:
         """Get all technologies available in a player's deck (not yet owned).
@@ -134,24 +328,9 @@ class TechnologyManager:
 
         LRR Reference: Rule 90.2 - A player does not own any technology card that is in their technology deck
         """
-        # Get all available technologies (including new framework technologies)
-        all_technologies = {
-            TechnologyEnum.CRUISER_II,
-            TechnologyEnum.FIGHTER_II,
-            TechnologyEnum.GRAVITY_DRIVE,
-            TechnologyEnum.CARRIER_II,
-            TechnologyEnum.DREADNOUGHT_II,
-            TechnologyEnum.DESTROYER_II,
-            TechnologyEnum.FLEET_LOGISTICS,
-            TechnologyEnum.LIGHT_WAVE_DEFLECTOR,
-            TechnologyEnum.PLASMA_SCORING,
-            TechnologyEnum.ANTIMASS_DEFLECTORS,
-            TechnologyEnum.DARK_ENERGY_TAP,  # New framework technology
-        }
-
         # Remove technologies the player already owns
-        owned_technologies = self.get_player_technologies(player_id)
-        return all_technologies - owned_technologies
+        owned_mask = self.get_player_technology_mask(player_id)
+        return TECHNOLOGY_MASKS.from_mask(TECHNOLOGY_MASKS.deck_mask & ~owned_mask)
 
     def can_research_technology(
         self, player_id: str, technology: TechnologyEnum
@@ -171,32 +350,37 @@ class TechnologyManager:
         if not player_id:
             return False
 
-        # Get player's current technologies
-        player_technologies = self.get_player_technologies(player_id)
+        owned_mask = self.get_player_technology_mask(player_id)
+        bit = TECHNOLOGY_MASKS.bits[technology]
 
-        # Check if technology is already owned
-        if technology in player_technologies:
+        # Check if technology is already owned or not in the player's deck
+        if owned_mask & bit or not TECHNOLOGY_MASKS.deck_mask & bit:
             return False
 
-        # Check if technology is in the player's deck
-        deck = self.get_technology_deck(player_id)
-        if technology not in deck:
-            return False
+        # Unconfirmed prerequisites raise
+        if technology not in _CONFIRMED_PREREQUISITES:
+            self.get_technology_prerequisites(technology)
 
-        # Check prerequisites
-        prerequisites = self.get_technology_prerequisites(technology)
-        if not prerequisites:
-            return True  # No prerequisites needed
+        # Owned technologies without a color count toward no prerequisite
+        return bool(TECHNOLOGY_MASKS.prerequisites_met(owned_mask) & bit)
 
-        # Count colors of owned technologies
-        owned_colors = [self.get_technology_color(tech) for tech in player_technologies]
+    def get_researchable_technologies(self, player_id: str) -> set[TechnologyEnum]:
+        """Get every technology a player can research now.
 
-        # Check if all prerequisite colors are satisfied
-        for required_color in prerequisites:
-            if owned_colors.count(required_color) < prerequisites.count(required_color):
-                return False
+        Technologies with unconfirmed prerequisites are left out.
 
-        return True
+        Args:
+            player_id: The player attempting to research
+
+        Returns:
+            Set of technologies the player can research
+
+        LRR Reference: Rule 90.12 - Player must satisfy each prerequisite by owning one technology of matching color
+        """
+        if not player_id:
+            return set()
+        owned_mask = self.get_player_technology_mask(player_id)
+        return TECHNOLOGY_MASKS.from_mask(TECHNOLOGY_MASKS.researchable(owned_mask))
 
     def research_technology(self, player_id: str, technology: TechnologyEnum) -> bool:
         """Research a technology for a player.
@@ -233,19 +417,9 @@ class TechnologyManager:
                 f"Technology {technology} is a unit upgrade and has no color"
             )
 
-        # CONFIRMED NON-UNIT-UPGRADE TECHNOLOGY DATA - DO NOT MODIFY WITHOUT USER APPROVAL
-        confirmed_technology_data = {
-            TechnologyEnum.GRAVITY_DRIVE: TechnologyColor.BLUE,  # Blue tech (confirmed)
-            TechnologyEnum.ANTIMASS_DEFLECTORS: TechnologyColor.BLUE,  # Blue tech, no prerequisites (confirmed)
-            TechnologyEnum.QUANTUM_DATAHUB_NODE: TechnologyColor.YELLOW,  # Yellow tech, Hacan faction (confirmed)
-            TechnologyEnum.DARK_ENERGY_TAP: TechnologyColor.BLUE,  # Blue tech, confirmed through framework
-            TechnologyEnum.AI_DEVELOPMENT_ALGORITHM: TechnologyColor.YELLOW,  # Yellow tech, confirmed through framework
-            # Note: SPEC_OPS_II is a unit upgrade and has no color
-        }
-
         # Return confirmed data or raise error for unconfirmed technologies
-        if technology in confirmed_technology_data:
-            return confirmed_technology_data[technology]
+        if technology in _CONFIRMED_COLORS:
+            return _CONFIRMED_COLORS[technology]
         else:
             raise ValueError(
                 f"Technology {technology} color not confirmed. Please ask user for specification."
@@ -264,35 +438,9 @@ class TechnologyManager:
 
         LRR Reference: Rule 90.8 - Most technology cards have prerequisites displayed as colored symbols
         """
-        # CONFIRMED PREREQUISITE DATA - DO NOT MODIFY WITHOUT USER APPROVAL
-        confirmed_prerequisites = {
-            TechnologyEnum.CRUISER_II: [
-                TechnologyColor.YELLOW,
-                TechnologyColor.RED,
-                TechnologyColor.GREEN,
-            ],  # Confirmed: 1Y+1R+1G
-            TechnologyEnum.GRAVITY_DRIVE: [TechnologyColor.BLUE],  # Confirmed: 1 Blue
-            TechnologyEnum.FIGHTER_II: [
-                TechnologyColor.BLUE,
-                TechnologyColor.GREEN,
-            ],  # Confirmed: 1 Blue + 1 Green
-            TechnologyEnum.ANTIMASS_DEFLECTORS: [],  # Confirmed: No prerequisites (Level 0)
-            TechnologyEnum.SPEC_OPS_II: [
-                TechnologyColor.GREEN,
-                TechnologyColor.GREEN,
-            ],  # Confirmed: 2x Green (Sol faction tech)
-            TechnologyEnum.QUANTUM_DATAHUB_NODE: [
-                TechnologyColor.YELLOW,
-                TechnologyColor.YELLOW,
-                TechnologyColor.YELLOW,
-            ],  # Confirmed: 3x Yellow (Hacan faction tech)
-            TechnologyEnum.DARK_ENERGY_TAP: [],  # Confirmed: No prerequisites (Level 0), confirmed through framework
-            TechnologyEnum.AI_DEVELOPMENT_ALGORITHM: [],  # Confirmed: No prerequisites (Level 0), confirmed through framework
-        }
-
         # Return confirmed data or raise error for unconfirmed technologies
-        if technology in confirmed_prerequisites:
-            return confirmed_prerequisites[technology]
+        if technology in _CONFIRMED_PREREQUISITES:
+            return list(_CONFIRMED_PREREQUISITES[technology])
         else:
             raise ValueError(
                 f"Technology {technology} prerequisites not confirmed. Please ask user for specification."
@@ -309,29 +457,13 @@ class TechnologyManager:
 
         LRR Reference: Rule 90.6 - Some technologies are unit upgrades that share a name with a unit
         """
-        # CONFIRMED UNIT UPGRADE DATA - DO NOT MODIFY WITHOUT USER APPROVAL
-        confirmed_unit_upgrades = {
-            TechnologyEnum.CRUISER_II,  # Confirmed: Unit upgrade
-            TechnologyEnum.FIGHTER_II,  # Confirmed: Unit upgrade
-            TechnologyEnum.SPEC_OPS_II,  # Confirmed: Unit upgrade (Sol faction)
-        }
-
         # For unconfirmed technologies, ask user
-        if technology not in {
-            TechnologyEnum.CRUISER_II,
-            TechnologyEnum.GRAVITY_DRIVE,
-            TechnologyEnum.FIGHTER_II,
-            TechnologyEnum.ANTIMASS_DEFLECTORS,
-            TechnologyEnum.SPEC_OPS_II,
-            TechnologyEnum.QUANTUM_DATAHUB_NODE,
-            TechnologyEnum.DARK_ENERGY_TAP,  # Confirmed through framework
-            TechnologyEnum.AI_DEVELOPMENT_ALGORITHM,  # Confirmed through framework
-        }:
+        if technology not in _CONFIRMED_UPGRADE_STATUS:
             raise ValueError(
                 f"Technology {technology} unit upgrade status not confirmed. Please ask user for specification."
             )
 
-        return technology in confirmed_unit_upgrades
+        return technology in _CONFIRMED_UNIT_UPGRADES
 
     def get_upgraded_unit_type(self, technology: TechnologyEnum) -> UnitType:
         """Get the unit type that a technology upgrades.
@@ -11,7 +11,11 @@ from .base import (
     PassiveTechnologyCard,
     UnitUpgradeTechnologyCard,
 )
-from .factory import TechnologyCardFactory
+from .factory import (
+    TechnologyCardFactory,
+    get_shared_technology_card,
+    warm_up_technology_cards,
+)
 from .integration import (
     TechnologyFrameworkIntegration,
     get_technology_framework_integration,
@@ -38,6 +42,8 @@ __all__ = [
     "TechnologyCardRegistry",
     # Factory
     "TechnologyCardFactory",
+    "get_shared_technology_card",
+    "warm_up_technology_cards",
     # Integration
     "TechnologyFrameworkIntegration",
     "get_technology_framework_integration",
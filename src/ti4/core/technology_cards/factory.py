@@ -4,21 +4,129 @@ Technology card factory system.
 This module provides the TechnologyCardFactory for instantiating technology cards
 using enum-based specifications with caching functionality.
 
-The factory follows the singleton pattern for technology card instances,
-ensuring that each technology type has only one instance throughout the
-application lifecycle.
+Card instances are process-wide flyweights: every factory, and so every game,
+hands out the same instance of a technology. Shared cards hold only immutable
+definition data (name, color, prerequisites, ability specifications).
+Exhaustible cards keep whether they are exhausted, which differs between games,
+so they are still created per factory. warm_up_technology_cards() creates every
+shared card once at startup so that no game pays for card construction.
 """
 
 from ti4.core.constants import Technology
+from ti4.core.technology_cards.base.exhaustible_tech import (
+    ExhaustibleTechnologyCard,
+)
 from ti4.core.technology_cards.protocols import TechnologyCardProtocol
 
+# Implementation classes by technology, registered on first use
+_implementations: dict[Technology, type[TechnologyCardProtocol]] = {}
+
+# Process-wide card instances shared by all factories
+_shared_cards: dict[Technology, TechnologyCardProtocol] = {}
+
+
+def _get_implementations() -> dict[Technology, type[TechnologyCardProtocol]]:
+    """Get the implementation classes, importing them on first use.
+
+    New implementations should be added here to make them available through
+    the factory.
+
+    Note:
+        Imports are done locally to avoid circular import issues and to
+        keep the factory lightweight when not all implementations are needed.
+    """
+    if not _implementations:
+        # Import concrete implementations
+        from ti4.core.technology_cards.concrete.dark_energy_tap import DarkEnergyTap
+        from ti4.core.technology_cards.concrete.gravity_drive import GravityDrive
+
+        # Register implementations with their corresponding Technology enum
+        _implementations[Technology.DARK_ENERGY_TAP] = DarkEnergyTap
+        _implementations[Technology.GRAVITY_DRIVE] = GravityDrive
+    return _implementations
+
+
+def _create_technology_card(technology: Technology) -> TechnologyCardProtocol:
+    """
+    Create a new card instance of a technology.
+
+    Args:
+        technology: The Technology enum to create a card for
+
+    Returns:
+        A new card instance
+
+    Raises:
+        ValueError: If no implementation is found for the technology
+    """
+    implementations = _get_implementations()
+    if technology not in implementations:
+        supported = [tech.name for tech in implementations.keys()]
+        raise ValueError(
+            f"No implementation found for {technology.name}. "
+            f"Supported technologies: {', '.join(supported)}"
+        )
+
+    try:
+        return implementations[technology]()
+    except Exception as e:
+        raise ValueError(f"Failed to create instance of {technology.name}: {e}") from e
+
+
+def _is_shareable(technology: Technology) -> bool:
+    """Check if a technology's card holds no per-game state."""
+    implementation = _get_implementations().get(technology)
+    return implementation is None or not issubclass(
+        implementation, ExhaustibleTechnologyCard
+    )
+
+
+def get_shared_technology_card(technology: Technology) -> TechnologyCardProtocol:
+    """
+    Get the process-wide card instance of a technology.
+
+    Args:
+        technology: The Technology enum to get the card for
+
+    Returns:
+        The shared card instance (created on first use)
+
+    Raises:
+        ValueError: If no implementation is found for the technology, or if
+            its card is exhaustible and so cannot be shared between games
+    """
+    card = _shared_cards.get(technology)
+    if card is not None:
+        return card
+
+    if not _is_shareable(technology):
+        raise ValueError(
+            f"{technology.name} is exhaustible and is created per game, not shared"
+        )
+    card = _create_technology_card(technology)
+    _shared_cards[technology] = card
+    return card
+
+
+def warm_up_technology_cards() -> int:
+    """
+    Create every shareable technology card once, ahead of any game.
+
+    Returns:
+        Number of shared technology cards
+    """
+    for technology in _get_implementations():
+        if _is_shareable(technology):
+            get_shared_technology_card(technology)
+    return len(_shared_cards)
+
 
 class TechnologyCardFactory:
     """
     Factory for instantiating technology cards using enum-based specifications.
 
     This factory provides centralized creation of technology card instances
-    with caching to ensure single instances per technology type. The factory
+    with caching, so it returns one instance per technology type. The factory
     automatically registers all available concrete implementations and provides
     methods for querying supported technologies.
 
@@ -39,7 +147,10 @@ class TechnologyCardFactory:
         Automatically registers all available technology card implementations
         and initializes the instance cache.
         """
+        # Cards handed out by this factory
         self._cache: dict[Technology, TechnologyCardProtocol] = {}
+        # Whether shareable cards come from the process-wide instances
+        self._use_shared_cards = True
         self._implementations: dict[Technology, type[TechnologyCardProtocol]] = {}
         self._register_implementations()
 
@@ -63,29 +174,18 @@ class TechnologyCardFactory:
         """
         Register all available technology card implementations.
 
-        This method imports and registers concrete technology card implementations.
-        New implementations should be added here to make them available through
-        the factory.
-
-        Note:
-            Imports are done locally to avoid circular import issues and to
-            keep the factory lightweight when not all implementations are needed.
+        The implementation table is shared by all factories (see
+        _get_implementations()).
         """
-        # Import concrete implementations
-        from ti4.core.technology_cards.concrete.dark_energy_tap import DarkEnergyTap
-        from ti4.core.technology_cards.concrete.gravity_drive import GravityDrive
-
-        # Register implementations with their corresponding Technology enum
-        self._implementations[Technology.DARK_ENERGY_TAP] = DarkEnergyTap
-        self._implementations[Technology.GRAVITY_DRIVE] = GravityDrive
+        self._implementations = _get_implementations()
 
     def create_card(self, technology: Technology) -> TechnologyCardProtocol:
         """
         Create a technology card instance with caching.
 
-        This method returns a cached instance if one exists, otherwise creates
-        a new instance and caches it for future use. This ensures that each
-        technology type has only one instance throughout the application.
+        This method returns the process-wide instance of the technology,
+        creating it on first use. Exhaustible cards, and all cards after
+        clear_cache(), are instead created once for this factory.
 
         Args:
             technology: The Technology enum to create a card for
@@ -108,26 +208,11 @@ class TechnologyCardFactory:
         if technology in self._cache:
             return self._cache[technology]
 
-        # Check if implementation exists
-        if technology not in self._implementations:
-            supported = [tech.name for tech in self._implementations.keys()]
-            raise ValueError(
-                f"No implementation found for {technology.name}. "
-                f"Supported technologies: {', '.join(supported)}"
-            )
-
-        # Create new instance
-        implementation_class = self._implementations[technology]
-        try:
-            instance = implementation_class()
-        except Exception as e:
-            raise ValueError(
-                f"Failed to create instance of {technology.name}: {e}"
-            ) from e
-
-        # Cache the instance
+        if self._use_shared_cards and _is_shareable(technology):
+            instance = get_shared_technology_card(technology)
+        else:
+            instance = _create_technology_card(technology)
         self._cache[technology] = instance
-
         return instance
 
     def clear_cache(self) -> None:
@@ -140,9 +225,11 @@ class TechnologyCardFactory:
 
         Note:
             Clearing the cache does not affect the registered implementations,
-            only the cached instances.
+            only the cached instances. The process-wide instances that other
+            factories rely on are kept; this factory creates its own from now on.
         """
         self._cache.clear()
+        self._use_shared_cards = False
 
     def is_supported(self, technology: Technology) -> bool:
         """
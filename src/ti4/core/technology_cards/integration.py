@@ -4,6 +4,11 @@ Technology card framework integration system.
 This module provides the complete integration of the technology card framework
 with existing game systems, ensuring that Dark Energy Tap and Gravity Drive
 are properly registered and available throughout the game.
+
+Each integration serves one game. Its registry refers to the shared card
+instances (see factory), so constructing an integration creates no shareable
+cards once they are warmed up; only exhaustible cards and the per-game ability
+and unit stat registrations are new.
 """
 
 from ti4.core.abilities import AbilityManager
@@ -58,7 +63,7 @@ class TechnologyFrameworkIntegration:
         Args:
             technology: The technology to register
         """
-        # Create the technology card instance
+        # Get the technology card instance (shared unless exhaustible)
         card = self.factory.create_card(technology)
 
         # Register with the technology card registry
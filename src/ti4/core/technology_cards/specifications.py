@@ -72,9 +72,21 @@ class TechnologySpecificationRegistry:
     and supports filtering and validation operations.
     """
 
-    def __init__(self) -> None:
-        """Initialize the registry with confirmed technology specifications."""
+    def __init__(self, use_bundle: bool = True) -> None:
+        """Initialize the registry with confirmed technology specifications.
+
+        Args:
+            use_bundle: Take the specifications from the installed static data
+                bundle when one is available instead of rebuilding them
+        """
         self._specifications: dict[Technology, TechnologySpecification] = {}
+        if use_bundle:
+            from ti4.core.data_bundle import get_installed_bundle
+
+            bundle = get_installed_bundle()
+            if bundle is not None:
+                self._specifications = bundle.get_technology_specifications()
+                return
         self._initialize_confirmed_specifications()
 
     def _initialize_confirmed_specifications(self) -> None:
@@ -0,0 +1,432 @@
+"""Galaxy-wide threat and influence heatmap for AI planning.
+
+For every player and every system, ThreatHeatmapEngine tracks the fleet
+strength the player could bring into the system in one tactical action
+(Rule 58: MOVEMENT) together with the space cannon fire they can direct into
+it (Rule 77: SPACE CANNON):
+
+- expected hits per combat round (combat dice times the chance to hit),
+- hit points (one per ship, two for ships that can still sustain damage),
+- capacity (Rule 16) and expected space cannon hits.
+
+Ships reach every system within their maximum movement range
+(MovementRuleEngine.get_max_movement_range with the owner's technologies).
+Fighters without movement ride along with the fastest ship of their system
+while capacity lasts. Movement blocking (enemy ships, anomalies) is not
+applied, so the values are an upper bound of the threat.
+
+The values are kept as one row per player with one column per system, like a
+players x systems matrix, and are maintained incrementally:
+
+- Each system's ships are read once; placing, removing or moving a unit
+  notifies its systems (System.add_occupancy_listener) and only those
+  systems' contributions are subtracted and re-added.
+- Reachability is a breadth-first search over cached adjacency lists and is
+  recomputed only when wormholes or the galaxy layout change.
+- A change in a player's technologies re-reads the systems holding that
+  player's ships. Sustained damage and unit upgrades do not notify; call
+  refresh_player() after one.
+
+Expected hits are accumulated in tenths of a hit so repeated updates stay
+exact.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .constants import GameConstants, Technology
+from .space_cannon_coverage import SpaceCannonCoverageIndex, get_space_cannon_coverage
+
+if TYPE_CHECKING:
+    from .movement_rules import MovementRuleEngine
+    from .space_cannon_coverage import SpaceCannonThreat
+
+_TENTHS = 10.0
+
+# owner, target columns, expected hits (tenths), hit points, capacity
+_Contribution = tuple[str, tuple[int, ...], int, int, int]
+
+
+@dataclass(frozen=True)
+class FleetStrength:
+    """The strength one player can bring to bear on one system."""
+
+    expected_hits: float = 0.0
+    hit_points: int = 0
+    capacity: int = 0
+    space_cannon_hits: float = 0.0
+
+    @property
+    def total_expected_hits(self) -> float:
+        """Expected hits of the ships plus space cannon fire."""
+        return self.expected_hits + self.space_cannon_hits
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.expected_hits
+            or self.hit_points
+            or self.capacity
+            or self.space_cannon_hits
+        )
+
+
+@dataclass(frozen=True)
+class ThreatHeatmap:
+    """A snapshot of the heatmap: one row per player, one column per system."""
+
+    players: tuple[str, ...]
+    systems: tuple[str, ...]
+    expected_hits: tuple[tuple[float, ...], ...]
+    hit_points: tuple[tuple[int, ...], ...]
+    capacity: tuple[tuple[int, ...], ...]
+    space_cannon_hits: tuple[tuple[float, ...], ...]
+
+    def get(self, player_id: str, system_id: str) -> FleetStrength:
+        """Get the strength of a player in a system."""
+        if player_id not in self.players or system_id not in self.systems:
+            return FleetStrength()
+        row = self.players.index(player_id)
+        column = self.systems.index(system_id)
+        return FleetStrength(
+            expected_hits=self.expected_hits[row][column],
+            hit_points=self.hit_points[row][column],
+            capacity=self.capacity[row][column],
+            space_cannon_hits=self.space_cannon_hits[row][column],
+        )
+
+    def get_threats(self, system_id: str) -> dict[str, FleetStrength]:
+        """Get every player able to project strength into a system."""
+        threats = {}
+        for player_id in self.players:
+            strength = self.get(player_id, system_id)
+            if strength:
+                threats[player_id] = strength
+        return threats
+
+
+class ThreatHeatmapEngine:
+    """Incrementally maintained reachable fleet strength per player."""
+
+    def __init__(
+        self,
+        systems: Mapping[str, Any],
+        galaxy: Any = None,
+        player_technologies: Mapping[str, Iterable[Any]] | None = None,
+        space_cannon: SpaceCannonCoverageIndex | None = None,
+        movement_engine: MovementRuleEngine | None = None,
+    ) -> None:
+        """Initialize the engine; systems are read on first use.
+
+        Args:
+            systems: System objects by ID
+            galaxy: Galaxy used for adjacency (None for no adjacency)
+            player_technologies: Technologies of each player (names or
+                Technology values), as in GameState.player_technologies
+            space_cannon: Space cannon coverage of the same systems
+            movement_engine: Rules giving each ship's movement range
+        """
+        if movement_engine is None:
+            from .movement_rules import MovementRuleEngine
+
+            movement_engine = MovementRuleEngine()
+        self.systems = systems
+        self.galaxy = galaxy
+        self.player_technologies = player_technologies or {}
+        self.space_cannon = space_cannon or SpaceCannonCoverageIndex(systems, galaxy)
+        self.movement_engine = movement_engine
+        self._reset()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> None:
+        # Derived data: a copied game state builds its own heatmap on demand
+        return None
+
+    def _reset(self) -> None:
+        self._known_count = len(self.systems)
+        self._columns = {system_id: i for i, system_id in enumerate(self.systems)}
+        self._dirty: set[str] = set(self.systems)
+        self._contributions: dict[str, list[_Contribution]] = {}
+        # player -> [expected hits (tenths), hit points, capacity] rows
+        self._rows: dict[str, tuple[list[int], list[int], list[int]]] = {}
+        self._adjacent: dict[str, frozenset[str]] = {}
+        self._reach: dict[tuple[str, int], tuple[int, ...]] = {}
+        self._wormholes: dict[str, tuple[str, ...]] = {}
+        self._system_of: dict[Any, str] = {}
+        self._technologies: dict[str, tuple[Any, ...]] = {}
+        self._technology_sets: dict[str, set[Technology]] = {}
+
+    def on_occupancy_changed(self, source: Any) -> None:
+        """Mark a changed system for re-reading."""
+        system_id = self._system_of.get(source)
+        if system_id is not None:
+            self._dirty.add(system_id)
+
+    def invalidate(self) -> None:
+        """Re-read everything, e.g. after the galaxy layout changed."""
+        self._reset()
+        self.space_cannon.invalidate()
+
+    def refresh_player(self, player_id: str) -> None:
+        """Re-read a player's ships, e.g. after a unit upgrade."""
+        self._technology_sets.pop(player_id, None)
+        for system_id, contributions in self._contributions.items():
+            if any(owner == player_id for owner, *_ in contributions):
+                self._dirty.add(system_id)
+        self.space_cannon.refresh_player(player_id)
+
+    def get_strength(self, player_id: str, system_id: str) -> FleetStrength:
+        """Get the strength a player can bring to bear on a system."""
+        self._refresh()
+        threat = self.space_cannon.get_threat(player_id, system_id)
+        cannon = _space_cannon_tenths(threat)
+        rows = self._rows.get(player_id)
+        column = self._columns.get(system_id)
+        if rows is None or column is None:
+            return FleetStrength(space_cannon_hits=cannon / _TENTHS)
+        hits, hit_points, capacity = rows
+        return FleetStrength(
+            expected_hits=hits[column] / _TENTHS,
+            hit_points=hit_points[column],
+            capacity=capacity[column],
+            space_cannon_hits=cannon / _TENTHS,
+        )
+
+    def get_heatmap(self) -> ThreatHeatmap:
+        """Get a snapshot of every player's strength in every system."""
+        self._refresh()
+        cannon: dict[str, list[int]] = {}
+        for player_id, coverage in self.space_cannon.get_threat_map().items():
+            row = cannon.setdefault(player_id, [0] * len(self._columns))
+            for system_id, threat in coverage.items():
+                column = self._columns.get(system_id)
+                if column is not None:
+                    row[column] = _space_cannon_tenths(threat)
+
+        players = sorted(
+            {player_id for player_id, rows in self._rows.items() if any(rows[1])}
+            | set(cannon)
+        )
+        empty = (0,) * len(self._columns)
+        rows = [
+            self._rows.get(player_id, (empty, empty, empty)) for player_id in players
+        ]
+        return ThreatHeatmap(
+            players=tuple(players),
+            systems=tuple(self._columns),
+            expected_hits=tuple(
+                tuple(value / _TENTHS for value in hits) for hits, _, _ in rows
+            ),
+            hit_points=tuple(tuple(hit_points) for _, hit_points, _ in rows),
+            capacity=tuple(tuple(capacity) for _, _, capacity in rows),
+            space_cannon_hits=tuple(
+                tuple(value / _TENTHS for value in cannon.get(player_id, empty))
+                for player_id in players
+            ),
+        )
+
+    def _refresh(self) -> None:
+        """Re-read the systems that changed since the last query."""
+        if len(self.systems) != self._known_count:
+            self._reset()
+        self._sync_technologies()
+        while self._dirty:
+            system_id = self._dirty.pop()
+            self._remove_contributions(system_id)
+            system = self.systems.get(system_id)
+            if system is None:
+                continue
+
+            wormholes = tuple(getattr(system, "wormholes", ()))
+            if self._wormholes.setdefault(system_id, wormholes) != wormholes:
+                # Adjacency changed: every reach may have changed
+                self._wormholes[system_id] = wormholes
+                for origin in list(self._contributions):
+                    self._remove_contributions(origin)
+                self._adjacent.clear()
+                self._reach.clear()
+                self._dirty.update(set(self.systems) - {system_id})
+
+            if hasattr(system, "add_occupancy_listener"):
+                system.add_occupancy_listener(self)
+                self._system_of[system] = system_id
+            contributions = self._read_system(system_id, system)
+            self._contributions[system_id] = contributions
+            for contribution in contributions:
+                self._apply(contribution, 1)
+
+    def _sync_technologies(self) -> None:
+        """Re-read the ships of players whose technologies changed."""
+        technologies = self.player_technologies
+        for player_id in set(self._technologies) | set(technologies):
+            current = tuple(technologies.get(player_id, ()))
+            if self._technologies.get(player_id, ()) != current:
+                self._technologies[player_id] = current
+                self.refresh_player(player_id)
+
+    def _read_system(self, system_id: str, system: Any) -> list[_Contribution]:
+        """Group the ships of a system by owner and movement range."""
+        # owner -> movement range -> [expected hits (tenths), hit points, capacity]
+        buckets: dict[str, dict[int, list[int]]] = {}
+        passengers: dict[str, list[tuple[int, int, int]]] = {}
+        seats: dict[str, int] = {}
+        fastest: dict[str, int] = {}
+        for unit in system.space_units:
+            owner = getattr(unit, "owner", None)
+            if owner is None or unit.unit_type not in GameConstants.SHIP_TYPES:
+                continue
+            values = _unit_values(unit)
+            movement_range = 0
+            if unit.get_movement() > 0:
+                movement_range = self.movement_engine.get_max_movement_range(
+                    unit, self._get_technology_set(owner)
+                )
+            if movement_range:
+                _accumulate(buckets, owner, movement_range, values)
+                seats[owner] = seats.get(owner, 0) + values[2]
+                fastest[owner] = max(fastest.get(owner, 0), movement_range)
+            else:
+                passengers.setdefault(owner, []).append(values)
+
+        for owner, units in passengers.items():
+            for values in units:
+                movement_range = 0
+                if seats.get(owner, 0) > 0:
+                    seats[owner] -= 1
+                    movement_range = fastest[owner]
+                _accumulate(buckets, owner, movement_range, values)
+
+        contributions: list[_Contribution] = [
+            (owner, self._within(system_id, movement_range), hits, hit_points, capacity)
+            for owner, ranges in buckets.items()
+            for movement_range, (hits, hit_points, capacity) in sorted(ranges.items())
+        ]
+        return contributions
+
+    def _apply(self, contribution: _Contribution, sign: int) -> None:
+        owner, columns, hits, hit_points, capacity = contribution
+        size = len(self._columns)
+        rows = self._rows.setdefault(owner, ([0] * size, [0] * size, [0] * size))
+        for column in columns:
+            rows[0][column] += sign * hits
+            rows[1][column] += sign * hit_points
+            rows[2][column] += sign * capacity
+
+    def _remove_contributions(self, system_id: str) -> None:
+        for contribution in self._contributions.pop(system_id, ()):
+            self._apply(contribution, -1)
+
+    def _within(self, system_id: str, movement_range: int) -> tuple[int, ...]:
+        """Columns of the systems at most movement_range moves away."""
+        key = (system_id, movement_range)
+        reach = self._reach.get(key)
+        if reach is None:
+            seen = {system_id}
+            frontier = [system_id]
+            for _ in range(movement_range):
+                next_frontier = []
+                for current in frontier:
+                    for neighbor in self._adjacent_systems(current):
+                        if neighbor not in seen:
+                            seen.add(neighbor)
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+            reach = tuple(sorted(self._columns[s] for s in seen if s in self._columns))
+            self._reach[key] = reach
+        return reach
+
+    def _adjacent_systems(self, system_id: str) -> frozenset[str]:
+        adjacent = self._adjacent.get(system_id)
+        if adjacent is None:
+            adjacent = frozenset()
+            if self.galaxy:
+                adjacent = frozenset(
+                    other_id
+                    for other_id in self.systems
+                    if other_id != system_id
+                    and self.galaxy.are_systems_adjacent(other_id, system_id)
+                )
+            self._adjacent[system_id] = adjacent
+        return adjacent
+
+    def _get_technology_set(self, player_id: str) -> set[Technology]:
+        technologies = self._technology_sets.get(player_id)
+        if technologies is None:
+            technologies = set()
+            for technology in self.player_technologies.get(player_id, ()):
+                try:
+                    technologies.add(Technology(technology))
+                except ValueError:
+                    continue
+            self._technology_sets[player_id] = technologies
+        return technologies
+
+
+def _unit_values(unit: Any) -> tuple[int, int, int]:
+    """Expected hits (tenths), hit points and capacity of one ship."""
+    stats = unit.get_stats()
+    hits = 0
+    if stats.combat_value is not None:
+        hits = stats.combat_dice * min(10, max(0, 11 - stats.combat_value))
+    hit_points = 1
+    if stats.sustain_damage and not unit.has_sustained_damage:
+        hit_points = 2
+    return hits, hit_points, stats.capacity
+
+
+def _accumulate(
+    buckets: dict[str, dict[int, list[int]]],
+    owner: str,
+    movement_range: int,
+    values: tuple[int, int, int],
+) -> None:
+    totals = buckets.setdefault(owner, {}).setdefault(movement_range, [0, 0, 0])
+    for i, value in enumerate(values):
+        totals[i] += value
+
+
+def _space_cannon_tenths(threat: SpaceCannonThreat) -> int:
+    return sum(
+        source.dice * min(10, max(0, 11 - source.hit_value))
+        for source in threat.sources
+        if source.hit_value is not None
+    )
+
+
+def get_threat_heatmap(game_state: Any) -> ThreatHeatmapEngine:
+    """Get the threat heatmap engine of a game state.
+
+    The engine is cached on the game state and reused by later states that
+    share the same systems and galaxy; it follows their player technologies.
+
+    Args:
+        game_state: The game state
+
+    Returns:
+        The heatmap engine (created on first use)
+    """
+    systems = game_state.systems
+    galaxy = getattr(game_state, "galaxy", None)
+    technologies = getattr(game_state, "player_technologies", None)
+    if not isinstance(technologies, Mapping):
+        technologies = {}
+    engine = getattr(game_state, "_threat_heatmap", None)
+    if (
+        isinstance(engine, ThreatHeatmapEngine)
+        and engine.systems is systems
+        and engine.galaxy is galaxy
+    ):
+        engine.player_technologies = technologies
+        return engine
+    engine = ThreatHeatmapEngine(
+        systems,
+        galaxy,
+        player_technologies=technologies,
+        space_cannon=get_space_cannon_coverage(game_state),
+    )
+    try:
+        object.__setattr__(game_state, "_threat_heatmap", engine)
+    except AttributeError:
+        pass
+    return engine
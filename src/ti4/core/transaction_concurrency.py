@@ -0,0 +1,370 @@
+"""Optimistic concurrency for Rule 28 component transactions.
+
+GameState.apply_concurrent_transaction_effects applies accepted deals one at
+a time, building a new game state for each. OptimisticTransactionExecutor
+instead treats each deal as an optimistic transaction over the components of
+the two players involved:
+
+- A deal reads a versioned snapshot of both players (trade goods,
+  commodities and promissory note hands) and computes their updated
+  components without touching the game state.
+- It commits atomically if neither player's version changed since the
+  snapshot (its read set is unchanged); otherwise it is retried against a
+  fresh snapshot. A deal that keeps conflicting is finally run under the
+  commit lock, so every deal completes.
+- A deal that fails (e.g. insufficient trade goods) only fails if its read
+  set is still current; a stale failure is retried like a conflict.
+
+Deals between different player pairs never conflict, so with
+``max_workers > 1`` they are validated and committed in parallel. Conflict
+metrics are accumulated per executor.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .deals import ComponentTransaction
+    from .game_state import GameState
+    from .player import Player
+    from .transactions import PromissoryNote
+
+DEFAULT_MAX_RETRIES = 3
+
+
+@dataclass(frozen=True)
+class ComponentSnapshot:
+    """One player's transferable components at a version."""
+
+    version: int
+    player: Player | None
+    promissory_notes: tuple[PromissoryNote, ...]
+
+
+@dataclass
+class TransactionConflictMetrics:
+    """Counters of optimistic transaction execution."""
+
+    transactions: int = 0
+    commits: int = 0
+    failures: int = 0
+    conflicts: int = 0
+    serialized: int = 0
+
+    @property
+    def conflict_rate(self) -> float:
+        """Conflicts per transaction."""
+        if not self.transactions:
+            return 0.0
+        return self.conflicts / self.transactions
+
+    def add(self, other: TransactionConflictMetrics) -> None:
+        """Add another set of counters to this one."""
+        self.transactions += other.transactions
+        self.commits += other.commits
+        self.failures += other.failures
+        self.conflicts += other.conflicts
+        self.serialized += other.serialized
+
+
+@dataclass
+class OptimisticExecutionResult:
+    """Result of executing a batch of transactions optimistically."""
+
+    game_state: GameState
+    # Committed transactions in commit order
+    committed: list[ComponentTransaction] = field(default_factory=list)
+    # Error message of each transaction that failed, by transaction ID
+    failed: dict[str, str] = field(default_factory=dict)
+    metrics: TransactionConflictMetrics = field(
+        default_factory=TransactionConflictMetrics
+    )
+
+    @property
+    def success(self) -> bool:
+        """Whether every transaction committed."""
+        return not self.failed
+
+
+class VersionedComponents:
+    """The players' transferable components with a version per player.
+
+    Reads and commits are atomic with respect to each other; a commit bumps
+    the version of every player it changes.
+    """
+
+    def __init__(self, game_state: GameState) -> None:
+        """Snapshot the components of every player of a game state."""
+        self._players: dict[str, Player] = {
+            player.id: player for player in game_state.players
+        }
+        self._hands: dict[str, tuple[PromissoryNote, ...]] = {
+            player_id: tuple(hand)
+            for player_id, hand in (
+                game_state.promissory_note_manager.get_player_hands().items()
+            )
+        }
+        self._versions: dict[str, int] = {}
+        self._changed: set[str] = set()
+        self._committed: list[ComponentTransaction] = []
+        # Reentrant so a serialized attempt can read and commit under it
+        self.lock = threading.RLock()
+
+    def read(self, player_ids: Iterable[str]) -> dict[str, ComponentSnapshot]:
+        """Read a consistent snapshot of some players' components."""
+        with self.lock:
+            return {
+                player_id: ComponentSnapshot(
+                    version=self._versions.get(player_id, 0),
+                    player=self._players.get(player_id),
+                    promissory_notes=self._hands.get(player_id, ()),
+                )
+                for player_id in player_ids
+            }
+
+    def is_current(self, snapshot: Mapping[str, ComponentSnapshot]) -> bool:
+        """Check that no player of a snapshot changed since it was read."""
+        with self.lock:
+            return all(
+                self._versions.get(player_id, 0) == components.version
+                for player_id, components in snapshot.items()
+            )
+
+    def commit(
+        self,
+        snapshot: Mapping[str, ComponentSnapshot],
+        players: Mapping[str, Player],
+        hands: Mapping[str, tuple[PromissoryNote, ...]],
+        transaction: ComponentTransaction,
+    ) -> bool:
+        """Install updated components if the snapshot is still current.
+
+        Returns:
+            True if committed, False if another commit changed a player of
+            the snapshot
+        """
+        with self.lock:
+            if not self.is_current(snapshot):
+                return False
+            self._players.update(players)
+            self._hands.update(hands)
+            for player_id in snapshot:
+                self._versions[player_id] = self._versions.get(player_id, 0) + 1
+            self._changed.update(snapshot)
+            self._committed.append(transaction)
+            return True
+
+    @property
+    def committed(self) -> list[ComponentTransaction]:
+        """Committed transactions in commit order."""
+        return list(self._committed)
+
+    def build_state(self, game_state: GameState) -> GameState:
+        """Build the game state with all committed changes applied."""
+        if not self._committed:
+            return game_state
+        players = [self._players[player.id] for player in game_state.players]
+        manager = game_state.promissory_note_manager.copy()
+        for player_id in self._changed:
+            if player_id in self._hands:
+                manager.set_player_hand(player_id, self._hands[player_id])
+        return game_state._create_new_state(
+            players=players, promissory_note_manager=manager
+        ).complete_transactions(self._committed)
+
+
+class OptimisticTransactionExecutor:
+    """Applies accepted transactions with optimistic concurrency control."""
+
+    def __init__(
+        self, max_workers: int = 1, max_retries: int = DEFAULT_MAX_RETRIES
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Threads validating and committing transactions; 1
+                runs them in the given order
+            max_retries: Optimistic attempts after a conflict before a
+                transaction is run under the commit lock
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.metrics = TransactionConflictMetrics()
+        self._metrics_lock = threading.Lock()
+
+    def execute(
+        self,
+        game_state: GameState,
+        transactions: Sequence[ComponentTransaction],
+        max_workers: int | None = None,
+    ) -> OptimisticExecutionResult:
+        """Apply the effects of accepted transactions.
+
+        Transactions that fail leave the game state unchanged; the others
+        are committed and moved to the transaction history in commit order.
+
+        Args:
+            game_state: The game state to apply the transactions to
+            transactions: Accepted ComponentTransactions
+            max_workers: Threads for this batch; defaults to the executor's
+                max_workers
+
+        Returns:
+            The new game state, the committed and failed transactions and
+            the metrics of this batch
+
+        Raises:
+            ValueError: If max_workers is less than 1, or if the committed
+                transactions result in an invalid game state; the game
+                state is left unchanged in that case
+        """
+        if max_workers is None:
+            max_workers = self.max_workers
+        elif max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        components = VersionedComponents(game_state)
+        result = OptimisticExecutionResult(game_state=game_state)
+        result.metrics.transactions = len(transactions)
+
+        if max_workers > 1 and len(transactions) > 1:
+            workers = min(max_workers, len(transactions))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="transactions"
+            ) as executor:
+                errors = list(
+                    executor.map(
+                        lambda transaction: self._run(
+                            transaction, game_state, components, result.metrics
+                        ),
+                        transactions,
+                    )
+                )
+        else:
+            errors = [
+                self._run(transaction, game_state, components, result.metrics)
+                for transaction in transactions
+            ]
+
+        for transaction, error in zip(transactions, errors, strict=True):
+            if error is not None:
+                result.failed[transaction.transaction_id] = error
+        result.committed = components.committed
+        result.metrics.commits = len(result.committed)
+        result.metrics.failures = len(result.failed)
+
+        new_state = components.build_state(game_state)
+        if not new_state.is_valid():
+            raise ValueError("Transaction effects resulted in invalid game state")
+        for transaction in result.committed:
+            new_state.notify_transaction_observers(transaction)
+        result.game_state = new_state
+
+        with self._metrics_lock:
+            self.metrics.add(result.metrics)
+        return result
+
+    def _run(
+        self,
+        transaction: ComponentTransaction,
+        game_state: GameState,
+        components: VersionedComponents,
+        metrics: TransactionConflictMetrics,
+    ) -> str | None:
+        """Run one transaction to completion.
+
+        Returns:
+            None if committed, otherwise the error message
+        """
+        player_ids = (transaction.proposing_player, transaction.target_player)
+        for _ in range(self.max_retries + 1):
+            snapshot = components.read(player_ids)
+            try:
+                players, hands = _apply_transaction(transaction, snapshot, game_state)
+            except ValueError as e:
+                if components.is_current(snapshot):
+                    return str(e)
+            else:
+                if components.commit(snapshot, players, hands, transaction):
+                    return None
+            with components.lock:
+                metrics.conflicts += 1
+
+        # Still conflicting: run while holding the commit lock
+        with components.lock:
+            metrics.serialized += 1
+            snapshot = components.read(player_ids)
+            try:
+                players, hands = _apply_transaction(transaction, snapshot, game_state)
+            except ValueError as e:
+                return str(e)
+            components.commit(snapshot, players, hands, transaction)
+            return None
+
+
+def _apply_transaction(
+    transaction: ComponentTransaction,
+    snapshot: Mapping[str, ComponentSnapshot],
+    game_state: GameState,
+) -> tuple[dict[str, Player], dict[str, tuple[PromissoryNote, ...]]]:
+    """Compute the components of both players after a transaction.
+
+    Mirrors GameState._apply_resource_effects and
+    GameState._apply_promissory_note_effects on a snapshot.
+
+    Raises:
+        ValueError: If a player cannot give what the transaction requires
+    """
+    proposing_id = transaction.proposing_player
+    target_id = transaction.target_player
+    players: dict[str, Player] = {}
+
+    for player_id in (proposing_id, target_id):
+        player = snapshot[player_id].player
+        if player is not None:
+            # Returns a copy, so the snapshot (and the original state) stay
+            # unchanged
+            players[player_id] = game_state.apply_transaction_to_player(
+                player, transaction
+            )
+
+    hands: dict[str, tuple[PromissoryNote, ...]] = {}
+    if transaction.offer.promissory_notes or transaction.request.promissory_notes:
+        proposing_hand = list(snapshot[proposing_id].promissory_notes)
+        target_hand = list(snapshot[target_id].promissory_notes)
+        _transfer_notes(
+            transaction.offer.promissory_notes,
+            proposing_hand,
+            target_hand,
+            proposing_id,
+        )
+        _transfer_notes(
+            transaction.request.promissory_notes,
+            target_hand,
+            proposing_hand,
+            target_id,
+        )
+        hands[proposing_id] = tuple(proposing_hand)
+        hands[target_id] = tuple(target_hand)
+    return players, hands
+
+
+def _transfer_notes(
+    notes: Iterable[Any],
+    giving_hand: list[Any],
+    receiving_hand: list[Any],
+    giving_player: str,
+) -> None:
+    for note in notes:
+        if note not in giving_hand:
+            raise ValueError(f"Player {giving_player} does not own promissory note")
+        giving_hand.remove(note)
+        receiving_hand.append(note)
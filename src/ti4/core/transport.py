@@ -7,8 +7,8 @@ Handles unit transport capacity, pickup restrictions, movement constraints, and
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from .constants import UnitType
@@ -93,6 +93,12 @@ class TransportMovementError(TransportError):
 # Rule 95.0: Only fighters and ground forces can be transported
 TRANSPORTABLE_UNIT_TYPES = {UnitType.FIGHTER, UnitType.INFANTRY, UnitType.MECH}
 
+# Loading order: transported units are destroyed with their ship (Rule 95.2),
+# so fighters go onto the sturdiest ships first, then mechs, then infantry
+CARGO_LOADING_PRIORITY = {UnitType.FIGHTER: 0, UnitType.MECH: 1, UnitType.INFANTRY: 2}
+
+DEFAULT_TRANSPORT_PLAN_CACHE_SIZE = 1024
+
 
 @dataclass
 class TransportState:
@@ -568,6 +574,272 @@ class TransportRules:
         )
 
 
+@dataclass(frozen=True)
+class TransportPickup:
+    """Units to pick up in a system the fleet moves through or into.
+
+    LRR Reference: Rule 95.3 - Pickup restrictions during movement
+    """
+
+    system_id: str
+    units: tuple[Unit, ...]
+    has_command_token: bool = False
+
+
+@dataclass
+class TransportLoadingPlan:
+    """How a fleet's ships carry their cargo."""
+
+    # Only the ships committed to transport, sturdiest first
+    transport_states: list[TransportState]
+    # Units that cannot be carried: not transportable, owned by another
+    # player, or in a system they cannot be picked up from (Rule 95.3)
+    rejected_units: list[Unit] = field(default_factory=list)
+
+    @property
+    def ships_committed(self) -> int:
+        """Number of ships carrying cargo."""
+        return len(self.transport_states)
+
+
+# (unit type, capacity, hit points, expected hits in tenths) of each ship
+_ShipKey = tuple[UnitType, int, int, int]
+# Number of cargo units of each type, in loading order
+_Counts = tuple[tuple[UnitType, int], ...]
+# Committed ships in loading order: (ship position, cargo counts loaded)
+_Packing = tuple[tuple[int, _Counts], ...]
+# Summed (hit points, expected hits) of a choice of ships, and their positions
+_Choice = tuple[tuple[int, int], tuple[int, ...]]
+
+
+class TransportPlanner:
+    """Assigns cargo to a fleet's ships as a bin packing problem.
+
+    The ships committed are the fewest whose capacity holds all cargo; among
+    those, the sturdiest set (most hit points, then most expected hits) is
+    chosen so cargo rides on the ships most likely to survive combat. Within
+    the committed ships, fighters are loaded onto the sturdiest ships first
+    (CARGO_LOADING_PRIORITY).
+
+    A packing depends only on the ships' stats and the number of cargo units
+    of each type, so it is cached by that signature and reused for any fleet
+    of the same composition.
+
+    LRR References:
+    - Rule 95.0: Transport capacity limits
+    - Rule 95.3: Pickup restrictions during movement
+    """
+
+    def __init__(
+        self,
+        transport_manager: TransportManager | None = None,
+        max_cache_size: int = DEFAULT_TRANSPORT_PLAN_CACHE_SIZE,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            transport_manager: Validates pickups (Rule 95.3)
+            max_cache_size: Packings kept before the oldest is dropped
+        """
+        self.transport_manager = transport_manager or TransportManager()
+        self.max_cache_size = max_cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: dict[tuple[tuple[_ShipKey, ...], _Counts], _Packing] = {}
+
+    def plan(
+        self,
+        fleet: Fleet,
+        units: list[Unit],
+        active_system_id: str | None = None,
+        pickups: Sequence[TransportPickup] = (),
+    ) -> TransportLoadingPlan:
+        """Plan how the fleet carries units from its system and pickups.
+
+        Args:
+            fleet: The moving fleet
+            units: Units to carry from the fleet's system
+            active_system_id: The active system (required with pickups)
+            pickups: Units to pick up in other systems during movement
+
+        Returns:
+            The committed ships' transport states and the rejected units
+
+        Raises:
+            ValueError: If fleet or units is None, or if pickups are given
+                without an active system
+            TransportCapacityError: If the fleet cannot carry the cargo
+        """
+        if fleet is None:
+            raise ValueError("Fleet cannot be None")
+        if units is None:
+            raise ValueError("Units list cannot be None")
+
+        cargo, rejected = self._collect_cargo(fleet, units, active_system_id, pickups)
+        ships = fleet.get_ships_with_capacity()
+        ship_keys = tuple(_ship_key(ship) for ship in ships)
+        total_capacity = sum(key[1] for key in ship_keys)
+        if len(cargo) > total_capacity:
+            raise TransportCapacityError(
+                f"Cannot distribute {len(cargo)} units across fleet capacity {total_capacity}",
+                ship_type=None,
+                ship_capacity=total_capacity,
+                units_requested=len(cargo),
+            )
+
+        by_type: dict[UnitType, list[Unit]] = {}
+        for unit in cargo:
+            by_type.setdefault(unit.unit_type, []).append(unit)
+        counts = tuple(
+            sorted(
+                ((unit_type, len(group)) for unit_type, group in by_type.items()),
+                key=lambda item: CARGO_LOADING_PRIORITY[item[0]],
+            )
+        )
+        packing = self._get_packing(ship_keys, counts)
+
+        remaining = {unit_type: iter(group) for unit_type, group in by_type.items()}
+        transport_states = [
+            TransportState(
+                transport_ship=ships[position],
+                transported_units=[
+                    next(remaining[unit_type])
+                    for unit_type, count in loads
+                    for _ in range(count)
+                ],
+                origin_system_id=fleet.system_id,
+                player_id=fleet.owner,
+            )
+            for position, loads in packing
+        ]
+        return TransportLoadingPlan(transport_states, rejected)
+
+    def clear_cache(self) -> None:
+        """Drop all cached packings."""
+        self._cache.clear()
+
+    def _collect_cargo(
+        self,
+        fleet: Fleet,
+        units: list[Unit],
+        active_system_id: str | None,
+        pickups: Sequence[TransportPickup],
+    ) -> tuple[list[Unit], list[Unit]]:
+        """Split units into cargo the fleet may carry and rejected units."""
+        if active_system_id is None:
+            if pickups:
+                raise ValueError("Active system is required to pick up units")
+            # Only pickups are validated against the active system
+            active_system_id = fleet.system_id
+        located = [(fleet.system_id, False, unit) for unit in units]
+        for pickup in pickups:
+            located.extend(
+                (pickup.system_id, pickup.has_command_token, unit)
+                for unit in pickup.units
+            )
+
+        cargo, rejected = [], []
+        for system_id, has_command_token, unit in located:
+            if (
+                unit.owner != fleet.owner
+                or unit.unit_type not in TRANSPORTABLE_UNIT_TYPES
+                or (
+                    system_id != fleet.system_id
+                    and not self.transport_manager.validate_pickup_during_movement(
+                        system_id,
+                        fleet.system_id,
+                        active_system_id,
+                        has_command_token,
+                    )
+                )
+            ):
+                rejected.append(unit)
+            else:
+                cargo.append(unit)
+        return cargo, rejected
+
+    def _get_packing(
+        self, ship_keys: tuple[_ShipKey, ...], counts: _Counts
+    ) -> _Packing:
+        signature = (ship_keys, counts)
+        packing = self._cache.get(signature)
+        if packing is not None:
+            self.cache_hits += 1
+            return packing
+        self.cache_misses += 1
+        packing = _pack(ship_keys, counts)
+        if len(self._cache) >= self.max_cache_size:
+            self._cache.pop(next(iter(self._cache)), None)
+        self._cache[signature] = packing
+        return packing
+
+
+def _ship_key(ship: Unit) -> _ShipKey:
+    stats = ship.get_stats()
+    hit_points = 1
+    if stats.sustain_damage and not ship.has_sustained_damage:
+        hit_points = 2
+    hits = 0
+    if stats.combat_value is not None:
+        hits = stats.combat_dice * min(10, max(0, 11 - stats.combat_value))
+    return ship.unit_type, stats.capacity, hit_points, hits
+
+
+def _pack(ship_keys: tuple[_ShipKey, ...], counts: _Counts) -> _Packing:
+    """Choose the ships to commit and load them.
+
+    A knapsack over the ships: best[k][c] is the sturdiest choice of k ships
+    with capacity c (capped at the cargo size).
+    """
+    needed = sum(count for _, count in counts)
+    if not needed:
+        return ()
+
+    best: list[dict[int, _Choice]] = [{0: ((0, 0), ())}]
+    for position, (_, capacity, hit_points, hits) in enumerate(ship_keys):
+        for chosen_count in range(len(best) - 1, -1, -1):
+            if chosen_count + 1 == len(best):
+                best.append({})
+            larger = best[chosen_count + 1]
+            for loaded, (score, chosen) in list(best[chosen_count].items()):
+                key = min(needed, loaded + capacity)
+                new_score = (score[0] + hit_points, score[1] + hits)
+                current = larger.get(key)
+                if current is None or new_score > current[0]:
+                    larger[key] = (new_score, (*chosen, position))
+    chosen = next(level[needed][1] for level in best if needed in level)
+
+    # Sturdiest ships first, fleet order between equals
+    order = sorted(
+        chosen,
+        key=lambda position: (-ship_keys[position][2], -ship_keys[position][3]),
+    )
+    pending = [count for _, count in counts]
+    packing = []
+    for position in order:
+        space = ship_keys[position][1]
+        loads = []
+        for index, (unit_type, _) in enumerate(counts):
+            taken = min(space, pending[index])
+            if taken:
+                loads.append((unit_type, taken))
+                pending[index] -= taken
+                space -= taken
+        packing.append((position, tuple(loads)))
+    return tuple(packing)
+
+
+_default_planner: TransportPlanner | None = None
+
+
+def get_transport_planner() -> TransportPlanner:
+    """Get the planner shared by fleet transport managers and optimizers."""
+    global _default_planner
+    if _default_planner is None:
+        _default_planner = TransportPlanner()
+    return _default_planner
+
+
 class FleetTransportManager:
     """Manages transport operations across multiple ships in a fleet.
 
@@ -575,6 +847,9 @@ class FleetTransportManager:
     across multiple ships according to Requirements 7.1-7.4.
     """
 
+    def __init__(self, planner: TransportPlanner | None = None) -> None:
+        self.planner = planner or get_transport_planner()
+
     def get_total_transport_capacity(self, fleet: Fleet) -> int:
         """Get total transport capacity across all ships in the fleet.
 
@@ -633,7 +908,7 @@ class FleetTransportManager:
             raise ValueError("Units list cannot be None")
 
         return self._create_distribution_with_strategy(
-            fleet, units, simple_distribution=True
+            fleet, units, simple_distribution=False
         )
 
     def _create_distribution_with_strategy(
@@ -644,13 +919,21 @@ class FleetTransportManager:
         Args:
             fleet: The fleet to distribute units across
             units: List of units to distribute
-            simple_distribution: If True, use simple first-fit strategy
+            simple_distribution: If True, use simple first-fit strategy;
+                otherwise pack units with the TransportPlanner
 
         Returns:
             List of TransportState objects for each ship
         """
-        transport_states = []
         ships_with_capacity = fleet.get_ships_with_capacity()
+        if not simple_distribution:
+            transport_states = _planned_states(self.planner, fleet, units)
+            self._add_empty_transport_states(
+                transport_states, ships_with_capacity, fleet
+            )
+            return transport_states
+
+        transport_states = []
 
         # Distribute units among ships
         units_remaining = units.copy()
@@ -712,6 +995,9 @@ class FleetTransportManager:
 class TransportOptimizer:
     """Optimizes unit distribution among transport ships."""
 
+    def __init__(self, planner: TransportPlanner | None = None) -> None:
+        self.planner = planner or get_transport_planner()
+
     def optimize_transport_distribution(
         self, fleet: Fleet, units: list[Unit]
     ) -> list[TransportState]:
@@ -737,51 +1023,28 @@ class TransportOptimizer:
     def _create_optimal_distribution(
         self, fleet: Fleet, units: list[Unit]
     ) -> list[TransportState]:
-        """Create optimal distribution using capacity-first strategy.
+        """Create optimal distribution by bin packing (see TransportPlanner).
 
         Args:
             fleet: The fleet to optimize distribution for
             units: List of units to distribute
 
         Returns:
-            List of TransportState objects with optimal distribution
+            TransportState objects of the ships committed to transport
         """
-        transport_states = []
-        ships_with_capacity = fleet.get_ships_with_capacity()
-
-        # Sort ships by capacity (highest first) for optimal distribution
-        ships_sorted = sorted(
-            ships_with_capacity, key=lambda s: s.get_capacity(), reverse=True
-        )
+        return _planned_states(self.planner, fleet, units)
 
-        units_remaining = units.copy()
-
-        for ship in ships_sorted:
-            ship_capacity = ship.get_capacity()
-            units_for_ship = units_remaining[:ship_capacity]
-            units_remaining = units_remaining[ship_capacity:]
 
-            transport_state = TransportState(
-                transport_ship=ship,
-                transported_units=units_for_ship,
-                origin_system_id=fleet.system_id,
-                player_id=fleet.owner,
-            )
-            transport_states.append(transport_state)
-
-            if not units_remaining:
-                break
-
-        if units_remaining:
-            total_capacity = fleet.get_total_capacity()
-            raise TransportCapacityError(
-                f"Cannot distribute {len(units)} units across fleet capacity {total_capacity}",
-                ship_type=None,
-                ship_capacity=total_capacity,
-                units_requested=len(units),
-            )
-
-        return transport_states
+def _planned_states(
+    planner: TransportPlanner, fleet: Fleet, units: list[Unit]
+) -> list[TransportState]:
+    """Plan a distribution, requiring every unit to be carried."""
+    plan = planner.plan(fleet, units)
+    if plan.rejected_units:
+        raise ValueError(
+            "Cannot transport units - capacity or type restrictions violated"
+        )
+    return plan.transport_states
 
 
 class FleetTransportValidator:
@@ -2,6 +2,7 @@
 
 from .cache import GameStateCache
 from .concurrent import ConcurrentGameManager, GameInstance, ThreadSafeGameStateCache
+from .histogram import LatencyHistogram, RingBuffer
 from .monitoring import ResourceMonitor
 
 __all__ = [
@@ -9,5 +10,7 @@ __all__ = [
     "GameInstance",
     "ThreadSafeGameStateCache",
     "ResourceMonitor",
+    "LatencyHistogram",
+    "RingBuffer",
     "GameStateCache",
 ]
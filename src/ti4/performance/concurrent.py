@@ -8,7 +8,9 @@ from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
+from ti4.core.agenda_cards import warm_up_agenda_cards
 from ti4.core.game_state import GameState
+from ti4.core.technology_cards import warm_up_technology_cards
 from ti4.performance.monitoring import ResourceMonitor
 
 
@@ -28,7 +30,13 @@ class ConcurrentGameManager:
     """Manages multiple concurrent game instances with thread safety."""
 
     def __init__(self, max_concurrent_games: int | None = None) -> None:
-        """Initialize the concurrent game manager."""
+        """Initialize the concurrent game manager.
+
+        The technology and agenda cards shared by all games are created here,
+        once, so that creating a game does not construct any cards.
+        """
+        warm_up_technology_cards()
+        warm_up_agenda_cards()
         if max_concurrent_games is None:
             from ..core.constants import PerformanceConstants
 
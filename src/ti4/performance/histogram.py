@@ -0,0 +1,232 @@
+"""Constant-cost latency histograms and ring buffers for TI4 monitoring.
+
+This module has no dependencies on ``ti4.core`` so that both the core
+observers and the performance package can use it without import cycles.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+# Sub-bucket precision bits: 2**8 sub-buckets per power of two keeps the
+# relative error of any reported percentile below 1/128 (< 1%).
+DEFAULT_PRECISION_BITS = 8
+
+# Durations are recorded as integer multiples of this unit (1 microsecond).
+DEFAULT_RESOLUTION_SECONDS = 1e-6
+
+
+class RingBuffer:
+    """Fixed-capacity buffer that keeps the most recent samples.
+
+    Appending is O(1) and never copies the buffer; once full, the oldest
+    sample is overwritten. A running sum is kept so the mean of the window
+    is also O(1).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._samples: deque[float] = deque(maxlen=capacity)
+        self._sum = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples retained."""
+        maxlen = self._samples.maxlen
+        assert maxlen is not None
+        return maxlen
+
+    def append(self, value: float) -> None:
+        """Add a sample, evicting the oldest one when the buffer is full."""
+        if len(self._samples) == self.capacity:
+            self._sum -= self._samples[0]
+        self._samples.append(value)
+        self._sum += value
+
+    def mean(self) -> float:
+        """Mean of the retained samples (0.0 when empty)."""
+        if not self._samples:
+            return 0.0
+        return self._sum / len(self._samples)
+
+    def trim(self, keep: int) -> None:
+        """Discard all but the ``keep`` most recent samples."""
+        while len(self._samples) > keep:
+            self._sum -= self._samples.popleft()
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._samples.clear()
+        self._sum = 0.0
+
+    def to_list(self) -> list[float]:
+        """Return the retained samples, oldest first."""
+        return list(self._samples)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._samples)
+
+
+class LatencyHistogram:
+    """Streaming HDR-style (log-linear) histogram of durations in seconds.
+
+    Each sample is mapped to a bucket in O(1); count, sum, min and max are
+    maintained alongside, so recording never touches previous samples.
+    Percentiles are answered from the bucket counts, whose number is bounded
+    by the precision and the largest value seen rather than by the number of
+    samples. Histograms with the same precision and resolution can be merged,
+    which allows per-game or per-thread histograms to be combined.
+    """
+
+    def __init__(
+        self,
+        precision_bits: int = DEFAULT_PRECISION_BITS,
+        resolution: float = DEFAULT_RESOLUTION_SECONDS,
+    ) -> None:
+        if precision_bits < 1:
+            raise ValueError("precision_bits must be at least 1")
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self._precision_bits = precision_bits
+        self._sub_bucket_count = 1 << precision_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self._resolution = resolution
+        self._counts: dict[int, int] = {}
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = 0.0
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: Iterable[float],
+        precision_bits: int = DEFAULT_PRECISION_BITS,
+        resolution: float = DEFAULT_RESOLUTION_SECONDS,
+    ) -> LatencyHistogram:
+        """Build a histogram from an iterable of durations."""
+        histogram = cls(precision_bits=precision_bits, resolution=resolution)
+        for sample in samples:
+            histogram.record(sample)
+        return histogram
+
+    @property
+    def count(self) -> int:
+        """Number of recorded samples."""
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """Sum of all recorded samples."""
+        return self._total
+
+    @property
+    def min(self) -> float:
+        """Smallest recorded sample (0.0 when empty)."""
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Largest recorded sample (0.0 when empty)."""
+        return self._max
+
+    def mean(self) -> float:
+        """Mean of all recorded samples (0.0 when empty)."""
+        return self._total / self._count if self._count else 0.0
+
+    def record(self, value: float) -> None:
+        """Record a single duration in O(1)."""
+        if value < 0:
+            raise ValueError("Cannot record a negative duration")
+        index = self._bucket_index(int(value / self._resolution))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self._count += 1
+        self._total += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, percent: float) -> float:
+        """Return the value at the given percentile (0-100).
+
+        The result is accurate to the bucket precision and is clamped to the
+        exact recorded minimum and maximum.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("percent must be between 0 and 100")
+        if not self._count:
+            return 0.0
+
+        target = max(1, math.ceil(self._count * percent / 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                value = self._highest_equivalent_value(index) * self._resolution
+                return min(max(value, self.min), self._max)
+        return self._max
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add all samples recorded in ``other`` to this histogram."""
+        if (
+            other._precision_bits != self._precision_bits
+            or other._resolution != self._resolution
+        ):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        for index, bucket_count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + bucket_count
+        self._count += other._count
+        self._total += other._total
+        if other._count:
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+
+    def copy(self) -> LatencyHistogram:
+        """Return an independent copy of this histogram."""
+        duplicate = LatencyHistogram(
+            precision_bits=self._precision_bits, resolution=self._resolution
+        )
+        duplicate.merge(self)
+        return duplicate
+
+    def clear(self) -> None:
+        """Reset the histogram to its empty state."""
+        self._counts.clear()
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Return count, mean, min, max and the p50/p95/p99 percentiles."""
+        return {
+            "count": self._count,
+            "average": self.mean(),
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+    def _bucket_index(self, units: int) -> int:
+        """Map an integer number of resolution units to its bucket index."""
+        if units < self._sub_bucket_count:
+            return units
+        shift = units.bit_length() - self._precision_bits
+        return shift * self._half_count + (units >> shift)
+
+    def _highest_equivalent_value(self, index: int) -> int:
+        """Return the largest integer value that maps to ``index``."""
+        if index < self._sub_bucket_count:
+            return index
+        shift = index // self._half_count - 1
+        sub_bucket = index - shift * self._half_count
+        return ((sub_bucket + 1) << shift) - 1
@@ -1,11 +1,13 @@
 """Resource monitoring and management for TI4."""
 
 import gc
+import threading
 import time
-from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
+from .histogram import LatencyHistogram, RingBuffer
+
 try:
     import psutil
 
@@ -42,7 +44,9 @@ class ResourceMonitor:
         """Initialize the resource monitor."""
         self._process = psutil.Process() if PSUTIL_AVAILABLE else None
         self._metrics_history: list[PerformanceMetrics] = []
-        self._operation_times: dict[str, list[float]] = defaultdict(list)
+        self._operation_times: dict[str, RingBuffer] = {}
+        self._operation_histograms: dict[str, LatencyHistogram] = {}
+        self._operation_lock = threading.Lock()
         self._peak_memory = 0.0
         self._start_time = time.time()
 
@@ -78,46 +82,85 @@ class ResourceMonitor:
         )
 
     def record_operation_time(self, operation_name: str, duration: float) -> None:
-        """Record the duration of an operation."""
-        self._operation_times[operation_name].append(duration)
-
-        # Keep only recent measurements
-        from ..core.constants import PerformanceConstants
+        """Record the duration of an operation.
 
-        if (
-            len(self._operation_times[operation_name])
-            > PerformanceConstants.MAX_OPERATION_HISTORY
-        ):
-            self._operation_times[operation_name] = self._operation_times[
-                operation_name
-            ][-PerformanceConstants.MAX_OPERATION_HISTORY :]
+        The sample is appended to a fixed-size ring buffer of recent durations
+        and folded into the operation's streaming histogram, both in O(1).
+        """
+        with self._operation_lock:
+            histogram = self._operation_histograms.get(operation_name)
+            if histogram is None:
+                from ..core.constants import PerformanceConstants
+
+                histogram = LatencyHistogram()
+                self._operation_histograms[operation_name] = histogram
+                self._operation_times[operation_name] = RingBuffer(
+                    PerformanceConstants.MAX_OPERATION_HISTORY
+                )
+            histogram.record(duration)
+            self._operation_times[operation_name].append(duration)
 
     def get_operation_stats(self, operation_name: str) -> dict[str, float]:
-        """Get statistics for a specific operation."""
-        times = self._operation_times.get(operation_name, [])
-        if not times:
-            return {"count": 0, "average": 0.0, "min": 0.0, "max": 0.0}
+        """Get statistics for a specific operation.
 
-        return {
-            "count": len(times),
-            "average": sum(times) / len(times),
-            "min": min(times),
-            "max": max(times),
+        Returns count, average, min and max plus the p50/p95/p99 latencies,
+        all read from the operation's histogram without scanning samples.
+        """
+        histogram = self._operation_histograms.get(operation_name)
+        if histogram is None:
+            return LatencyHistogram().summary()
+        with self._operation_lock:
+            return histogram.summary()
+
+    def get_operation_histogram(self, operation_name: str) -> LatencyHistogram:
+        """Get a copy of the latency histogram for an operation."""
+        with self._operation_lock:
+            histogram = self._operation_histograms.get(operation_name)
+            return histogram.copy() if histogram else LatencyHistogram()
+
+    def get_recent_operation_times(self, operation_name: str) -> list[float]:
+        """Get the most recent recorded durations for an operation."""
+        with self._operation_lock:
+            buffer = self._operation_times.get(operation_name)
+            return buffer.to_list() if buffer else []
+
+    def merge_operation_stats(self, other: "ResourceMonitor") -> None:
+        """Merge another monitor's operation histograms into this one.
+
+        Used to aggregate timings collected by separate games or threads.
+        Only the histograms are merged; recent-sample buffers stay local.
+        """
+        other_histograms = {
+            name: other.get_operation_histogram(name)
+            for name in list(other._operation_histograms)
         }
+        with self._operation_lock:
+            for name, histogram in other_histograms.items():
+                if name in self._operation_histograms:
+                    self._operation_histograms[name].merge(histogram)
+                else:
+                    from ..core.constants import PerformanceConstants
+
+                    self._operation_histograms[name] = histogram
+                    self._operation_times[name] = RingBuffer(
+                        PerformanceConstants.MAX_OPERATION_HISTORY
+                    )
 
     def collect_metrics(self) -> PerformanceMetrics:
         """Collect current performance metrics."""
         current_memory = self.get_current_memory_usage()
         current_cpu = self.get_current_cpu_usage()
 
-        # Calculate average operation time across all operations
-        all_times = []
-        total_operations = 0
-        for times in self._operation_times.values():
-            all_times.extend(times)
-            total_operations += len(times)
+        # Average across all operations from the per-operation running totals
+        with self._operation_lock:
+            total_operations = sum(
+                histogram.count for histogram in self._operation_histograms.values()
+            )
+            total_time = sum(
+                histogram.total for histogram in self._operation_histograms.values()
+            )
 
-        avg_time = sum(all_times) / len(all_times) if all_times else 0.0
+        avg_time = total_time / total_operations if total_operations else 0.0
 
         metrics = PerformanceMetrics(
             memory_usage_mb=current_memory,
@@ -145,11 +188,11 @@ class ResourceMonitor:
         if len(self._metrics_history) > 100:
             self._metrics_history = self._metrics_history[-100:]
 
-        # Clear old operation times
-        for operation_name in list(self._operation_times.keys()):
-            times = self._operation_times[operation_name]
-            if len(times) > 100:
-                self._operation_times[operation_name] = times[-100:]
+        # Clear old operation times; the histograms keep the full history,
+        # including anything merged in from other monitors
+        with self._operation_lock:
+            for buffer in self._operation_times.values():
+                buffer.trim(100)
 
         # Force garbage collection
         gc.collect()
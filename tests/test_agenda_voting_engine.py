@@ -0,0 +1,356 @@
+"""Tests for batch agenda voting from a per-phase influence snapshot.
+
+LRR References:
+- Rule 8: AGENDA PHASE
+- Rule 47.3: Trade goods cannot be spent as influence for votes
+- Rule 80.2: The speaker votes last
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from ti4.core.agenda_phase import (
+    AgendaCard,
+    AgendaPhase,
+    SpeakerSystem,
+    VotingSystem,
+    VotingValidationError,
+)
+from ti4.core.agenda_voting import AgendaVotingEngine, PlayerVote
+from ti4.core.constants import AgendaType, Faction
+from ti4.core.game_state import GameState
+from ti4.core.planet import Planet
+from ti4.core.player import Player
+
+
+def _game_state() -> GameState:
+    game_state = GameState()
+    planets = {
+        "player1": [
+            Planet("Mecatol Rex", resources=1, influence=6),
+            Planet("Jord", resources=4, influence=2),
+            Planet("Wren Terra", resources=2, influence=1),
+        ],
+        "player2": [Planet("Arretze", resources=2, influence=0)],
+        "player3": [
+            Planet("Moll Primus", resources=4, influence=1),
+            Planet("Hercant", resources=1, influence=1),
+            Planet("Kamdorn", resources=0, influence=1),
+        ],
+    }
+    for faction, (player_id, player_planets) in zip(
+        (Faction.SOL, Faction.HACAN, Faction.XXCHA), planets.items(), strict=True
+    ):
+        player = Player(id=player_id, faction=faction)
+        player.gain_trade_goods(5)
+        game_state = game_state.add_player(player)
+        for planet in player_planets:
+            planet.set_control(player_id)
+            game_state = game_state.add_player_planet(player_id, planet)
+    return game_state
+
+
+class _Deck:
+    def draw_top_card(self) -> AgendaCard:
+        return AgendaCard(
+            name="Research Team",
+            agenda_type=AgendaType.DIRECTIVE,
+            outcomes=["For", "Against"],
+        )
+
+
+def _planet(game_state: GameState, name: str) -> Planet:
+    for planets in game_state.player_planets.values():
+        for planet in planets:
+            if planet.name == name:
+                return planet
+    raise AssertionError(name)
+
+
+class TestAgendaVotingEngine:
+    """Test the voting engine on its own."""
+
+    def test_snapshot_excludes_trade_goods(self) -> None:
+        """Test that only ready planet influence can be voted (Rule 47.3)."""
+        engine = AgendaVotingEngine(_game_state(), ["player1", "player2", "player3"])
+
+        assert engine.get_votable_influence("player1") == 9
+        assert engine.get_votable_influence("player2") == 0
+        assert engine.get_votable_influence("nobody") == 0
+
+    def test_batch_tallies_in_voting_order(self) -> None:
+        """Test that a batch is cast in voting order with running tallies."""
+        game_state = _game_state()
+        engine = AgendaVotingEngine(game_state, ["player3", "player1", "player2"])
+
+        result = engine.cast_votes(
+            [
+                PlayerVote("player1", "For", 6),
+                PlayerVote("player2", None),
+                PlayerVote("player3", "Against", 2),
+            ],
+            valid_outcomes=["For", "Against"],
+        )
+
+        assert result.success
+        assert [vote.player_id for vote, _ in result.outcomes] == [
+            "player3",
+            "player1",
+            "player2",
+        ]
+        assert result.vote_tally == {"For": 6, "Against": 2}
+        assert _planet(game_state, "Mecatol Rex").is_exhausted()
+        assert not _planet(game_state, "Jord").is_exhausted()
+        assert engine.get_votable_influence("player1") == 3
+
+    def test_invalid_votes_fail_individually(self) -> None:
+        """Test that invalid votes do not stop the rest of the batch."""
+        engine = AgendaVotingEngine(_game_state(), ["player1", "player3"])
+
+        result = engine.cast_votes(
+            [
+                PlayerVote("player1", "Maybe", 2),
+                PlayerVote("player3", "For", 2),
+                PlayerVote("player3", "For", 1),
+            ],
+            valid_outcomes=["For", "Against"],
+        )
+
+        assert not result.success
+        assert result.vote_tally == {"For": 2}
+        assert result.get_outcome("player3").votes_cast == 2  # type: ignore[union-attr]
+        assert result.get_errors() == [
+            "Invalid outcome 'Maybe' for agenda",
+            "Player player3 has already voted for this agenda",
+        ]
+
+    def test_unaffordable_vote_is_rejected(self) -> None:
+        """Test that votes beyond the planet influence are rejected."""
+        engine = AgendaVotingEngine(_game_state(), ["player3"])
+
+        result = engine.cast_votes([PlayerVote("player3", "For", 4)])
+
+        assert "Insufficient influence" in (result.get_errors()[0])
+        assert engine.get_vote_tally() == {}
+
+    def test_spent_influence_carries_to_next_agenda(self) -> None:
+        """Test that planets spent on the first agenda stay spent."""
+        engine = AgendaVotingEngine(_game_state(), ["player1"])
+        engine.cast_votes([PlayerVote("player1", "For", 6)])
+
+        engine.start_agenda()
+
+        assert not engine.has_voted("player1")
+        assert engine.get_vote_tally() == {}
+        assert engine.get_votable_influence("player1") == 3
+
+    def test_planets_exhausted_elsewhere_are_replanned(self) -> None:
+        """Test that a stale snapshot does not exhaust a planet twice."""
+        game_state = _game_state()
+        engine = AgendaVotingEngine(game_state, ["player1"])
+        _planet(game_state, "Mecatol Rex").exhaust()
+
+        rejected = engine.cast_votes([PlayerVote("player1", "For", 6)])
+        engine.start_agenda()
+        accepted = engine.cast_votes([PlayerVote("player1", "For", 3)])
+
+        assert "Insufficient influence" in rejected.get_errors()[0]
+        assert accepted.vote_tally == {"For": 3}
+        assert engine.get_votable_influence("player1") == 0
+
+
+class TestAtomicBatches:
+    """Test batches that are cast in full or not at all."""
+
+    def test_invalid_vote_casts_nothing(self) -> None:
+        """Test that one invalid vote leaves every planet ready."""
+        game_state = _game_state()
+        engine = AgendaVotingEngine(game_state, ["player1", "player3"])
+
+        result = engine.cast_votes(
+            [PlayerVote("player1", "For", 6), PlayerVote("player3", "For", 4)],
+            atomic=True,
+        )
+
+        assert not result.success
+        assert "not cast" in result.get_errors()[0]
+        assert "Insufficient influence" in result.get_errors()[1]
+        assert engine.get_vote_tally() == {}
+        assert not engine.has_voted("player1")
+        assert not _planet(game_state, "Mecatol Rex").is_exhausted()
+
+    def test_failed_exhaust_rolls_back_the_batch(self) -> None:
+        """Test that votes already cast in the batch are undone."""
+        game_state = _game_state()
+        engine = AgendaVotingEngine(game_state, ["player1", "player3"])
+
+        with patch.object(
+            _planet(game_state, "Moll Primus"),
+            "exhaust",
+            side_effect=RuntimeError("Planet is locked"),
+        ):
+            result = engine.cast_votes(
+                [PlayerVote("player1", "For", 6), PlayerVote("player3", "For", 3)],
+                atomic=True,
+            )
+
+        assert result.get_errors()[1] == "Planet is locked"
+        assert engine.get_vote_tally() == {}
+        assert engine.get_votable_influence("player1") == 9
+        assert not _planet(game_state, "Mecatol Rex").is_exhausted()
+        assert engine.cast_votes([PlayerVote("player1", "For", 6)]).success
+
+
+class TestWhatIfTallies:
+    """Test hypothetical tallies for agents."""
+
+    def test_what_if_does_not_mutate(self) -> None:
+        """Test that hypothetical votes exhaust nothing."""
+        game_state = _game_state()
+        engine = AgendaVotingEngine(game_state, ["player1", "player3"])
+
+        tally = engine.what_if(
+            [PlayerVote("player1", "For", 5), PlayerVote("player3", "Against", 3)]
+        )
+
+        assert tally == {"For": 6, "Against": 3}
+        assert engine.get_vote_tally() == {}
+        assert not _planet(game_state, "Mecatol Rex").is_exhausted()
+        assert engine.get_votable_influence("player1") == 9
+
+    def test_what_if_matches_cast_votes(self) -> None:
+        """Test that hypothetical tallies equal the tallies of real votes."""
+        votes = [PlayerVote("player1", "For", 7), PlayerVote("player3", "For", 2)]
+        engine = AgendaVotingEngine(_game_state(), ["player1", "player3"])
+
+        predicted = engine.what_if(votes)
+
+        assert engine.cast_votes(votes).vote_tally == predicted
+
+    def test_splits_build_on_cast_votes(self) -> None:
+        """Test that splits are evaluated on top of the committed tally."""
+        engine = AgendaVotingEngine(_game_state(), ["player1", "player3"])
+        engine.cast_votes([PlayerVote("player1", "For", 2)])
+
+        tallies = engine.evaluate_vote_splits(
+            [
+                [PlayerVote("player3", "For", 3)],
+                [PlayerVote("player3", "Against", 3)],
+                [PlayerVote("player3", None)],
+            ]
+        )
+
+        assert tallies == [{"For": 5}, {"For": 2, "Against": 3}, {"For": 2}]
+
+    def test_invalid_hypothetical_vote_raises(self) -> None:
+        """Test that impossible hypothetical votes are reported."""
+        engine = AgendaVotingEngine(_game_state(), ["player1"])
+
+        with pytest.raises(ValueError, match="Insufficient influence"):
+            engine.what_if([PlayerVote("player1", "For", 10)])
+
+
+class TestVotingSystemBatchIntegration:
+    """Test batch voting through VotingSystem and AgendaPhase."""
+
+    def test_snapshot_replaces_resource_manager_queries(self) -> None:
+        """Test that influence is read from the snapshot during the phase."""
+        voting_system = VotingSystem()
+        voting_system.begin_agenda_phase(_game_state(), ["player1", "player3"])
+
+        with patch(
+            "ti4.core.resource_management.ResourceManager.calculate_available_influence"
+        ) as calculate:
+            influence = voting_system.calculate_available_influence_for_voting(
+                "player1",
+                resource_manager=None,  # type: ignore[arg-type]
+            )
+
+        assert influence == 9
+        calculate.assert_not_called()
+
+    def test_batch_requires_agenda_phase(self) -> None:
+        """Test that batch voting needs an influence snapshot."""
+        with pytest.raises(VotingValidationError):
+            VotingSystem().cast_votes_batch([PlayerVote("player1", "For", 1)])
+
+        result = AgendaPhase().resolve_first_agenda(
+            _Deck(),
+            SpeakerSystem(),
+            VotingSystem(),
+            ["player1"],
+            votes=[PlayerVote("player1", "For", 1)],
+        )
+
+        assert not result.success
+        assert "begin_agenda_phase()" in (result.error_message or "")
+
+    def test_complete_phase_takes_batch_votes(self) -> None:
+        """Test that the phase flow snapshots influence for batch votes."""
+        game_state = _game_state()
+        voting_system = VotingSystem()
+
+        class _PhaseState:
+            def get_player_planets(self, player_id: str) -> list[Planet]:
+                return game_state.get_player_planets(player_id)
+
+            def get_players(self) -> list[str]:
+                return ["player1", "player2", "player3"]
+
+            def get_voting_system(self) -> VotingSystem:
+                return voting_system
+
+            def get_agenda_deck(self) -> _Deck:
+                return _Deck()
+
+            def get_players_planets(self) -> dict[str, list[Planet]]:
+                return game_state.player_planets
+
+        result = AgendaPhase().execute_complete_phase(
+            _PhaseState(),
+            first_votes=[PlayerVote("player1", "For", 6)],
+            second_votes=[PlayerVote("player1", "For", 3)],
+        )
+
+        assert result.success
+        assert result.planets_readied
+        assert voting_system.get_vote_tally() == {"For": 3}
+        assert voting_system.voting_engine is None
+
+    def test_agenda_phase_resolves_batch_votes(self) -> None:
+        """Test that both agendas are decided by batch votes."""
+        game_state = _game_state()
+        speaker_system = SpeakerSystem()
+        speaker_system.set_speaker("player1")
+        voting_system = VotingSystem()
+        players = ["player1", "player2", "player3"]
+        engine = voting_system.begin_agenda_phase(game_state, players, speaker_system)
+
+        phase = AgendaPhase()
+        first = phase.resolve_first_agenda(
+            _Deck(),
+            speaker_system,
+            voting_system,
+            players,
+            votes=[
+                PlayerVote("player1", "Against", 6),
+                PlayerVote("player3", "For", 3),
+            ],
+        )
+        assert engine.voting_order == ("player2", "player3", "player1")
+        assert first.success
+        assert voting_system.get_vote_tally() == {"For": 3, "Against": 6}
+
+        second = phase.resolve_second_agenda(
+            _Deck(),
+            speaker_system,
+            voting_system,
+            players,
+            votes=[PlayerVote("player1", "For", 4)],
+        )
+
+        assert not second.success
+        assert "Insufficient influence" in (second.error_message or "")
+        voting_system.end_agenda_phase()
+        assert voting_system.voting_engine is None
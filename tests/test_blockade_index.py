@@ -0,0 +1,95 @@
+"""Tests for the blockade index (Rule 14: BLOCKADED)."""
+
+from unittest.mock import patch
+
+from ti4.core.blockade import BlockadeIndex, BlockadeManager, get_blockade_index
+from ti4.core.constants import UnitType
+from ti4.core.galaxy import Galaxy
+from ti4.core.planet import Planet
+from ti4.core.production import ProductionManager
+from ti4.core.system import System
+from ti4.core.unit import Unit
+
+
+def _galaxy(*system_ids: str) -> Galaxy:
+    """Systems each with one planet holding a player1 space dock."""
+    galaxy = Galaxy()
+    for system_id in system_ids:
+        system = System(system_id)
+        system.add_planet(Planet(f"planet_{system_id}", resources=1, influence=1))
+        system.place_unit_on_planet(
+            Unit(UnitType.SPACE_DOCK, "player1"), f"planet_{system_id}"
+        )
+        galaxy.register_system(system)
+    return galaxy
+
+
+def _space_dock(galaxy: Galaxy, system_id: str) -> Unit:
+    return galaxy.system_objects[system_id].planets[0].units[0]
+
+
+class TestBlockadeIndex:
+    """Test blockade status maintained per system."""
+
+    def test_status_follows_ship_movement(self) -> None:
+        """Test that blockades start and end as ships move (Rule 14.0)."""
+        galaxy = _galaxy("a", "b")
+        manager = BlockadeManager(galaxy)
+        dock = _space_dock(galaxy, "a")
+        destroyer = Unit(UnitType.DESTROYER, "player2")
+        assert not manager.is_unit_blockaded(dock)
+
+        galaxy.system_objects["a"].place_unit_in_space(destroyer)
+        assert manager.get_blockading_players(dock) == {"player2"}
+        assert manager.get_blockaded_systems("player1") == {"a": {"player2"}}
+
+        galaxy.system_objects["a"].place_unit_in_space(
+            Unit(UnitType.FIGHTER, "player1")
+        )
+        assert not manager.is_unit_blockaded(dock)
+        assert manager.get_blockaded_systems("player1") == {}
+
+    def test_only_changed_systems_are_reread(self) -> None:
+        """Test that checks between moves do not rescan the galaxy."""
+        galaxy = _galaxy("a", "b", "c")
+        manager = BlockadeManager(galaxy)
+        production = ProductionManager()
+        assert production.can_produce_ships_with_blockade_check(
+            _space_dock(galaxy, "a"), manager
+        )
+
+        galaxy.system_objects["b"].place_unit_in_space(
+            Unit(UnitType.CRUISER, "player2")
+        )
+        with patch.object(
+            BlockadeIndex, "_read_system", autospec=True, side_effect=lambda *a: None
+        ) as read:
+            for system_id in ("a", "b", "c"):
+                production.can_produce_ships_with_blockade_check(
+                    _space_dock(galaxy, system_id), manager
+                )
+
+        assert [call.args[1] for call in read.call_args_list] == ["b"]
+
+    def test_capture_prevention_uses_blockaders(self) -> None:
+        """Test that a blockaded player cannot capture blockaders (Rule 14.2a)."""
+        galaxy = _galaxy("a")
+        galaxy.system_objects["a"].place_unit_in_space(
+            Unit(UnitType.CARRIER, "player2")
+        )
+        manager = BlockadeManager(galaxy)
+
+        assert not manager.can_capture_unit(
+            Unit(UnitType.INFANTRY, "player2"), "player1"
+        )
+        assert manager.can_capture_unit(Unit(UnitType.INFANTRY, "player3"), "player1")
+
+    def test_index_is_shared_and_rebuilt_on_registration(self) -> None:
+        """Test that managers share the galaxy's index until systems change."""
+        galaxy = _galaxy("a")
+        index = get_blockade_index(galaxy)
+        assert get_blockade_index(galaxy) is index
+
+        galaxy.register_system(System("b"))
+
+        assert get_blockade_index(galaxy) is not index
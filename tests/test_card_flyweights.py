@@ -0,0 +1,122 @@
+"""Tests for technology and agenda cards shared across games."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ti4.core import agenda_deck
+from ti4.core.agenda_cards import AgendaCardRegistry, AgendaDeck, warm_up_agenda_cards
+from ti4.core.agenda_phase import AgendaPhase
+from ti4.core.constants import Technology
+from ti4.core.technology_cards import (
+    TechnologyCardFactory,
+    TechnologyFrameworkIntegration,
+    get_shared_technology_card,
+    warm_up_technology_cards,
+)
+from ti4.core.technology_cards.concrete.ai_development_algorithm import (
+    AIDevelopmentAlgorithm,
+)
+from ti4.core.technology_cards.factory import _get_implementations
+from ti4.performance.concurrent import ConcurrentGameManager
+
+
+class TestSharedTechnologyCards:
+    """Test process-wide technology card instances."""
+
+    def test_games_share_card_instances(self) -> None:
+        """Test that factories and integrations hand out the same cards."""
+        assert warm_up_technology_cards() == 2
+        card = get_shared_technology_card(Technology.GRAVITY_DRIVE)
+
+        assert TechnologyCardFactory().create_card(Technology.GRAVITY_DRIVE) is card
+        integration = TechnologyFrameworkIntegration()
+        assert integration.registry.get_card(Technology.GRAVITY_DRIVE) is card
+
+    def test_exhausted_state_is_per_game(self) -> None:
+        """Test that exhausting a technology in one game leaves others ready."""
+        ai_development = Technology.AI_DEVELOPMENT_ALGORITHM
+        implementations = {ai_development: AIDevelopmentAlgorithm}
+        with patch.dict(_get_implementations(), implementations):
+            assert warm_up_technology_cards() == 2
+            game1 = TechnologyFrameworkIntegration()
+            game2 = TechnologyFrameworkIntegration()
+            card1 = game1.registry.get_card(ai_development)
+            card2 = game2.registry.get_card(ai_development)
+
+            card1.exhaust()
+
+            assert card1.is_exhausted()
+            assert not card2.is_exhausted()
+            with pytest.raises(ValueError, match="already exhausted"):
+                card1.exhaust()
+            with pytest.raises(ValueError, match="created per game"):
+                get_shared_technology_card(ai_development)
+
+    def test_clear_cache_keeps_shared_cards(self) -> None:
+        """Test that clearing one factory leaves the shared cards intact."""
+        card = get_shared_technology_card(Technology.DARK_ENERGY_TAP)
+        factory = TechnologyCardFactory()
+        assert factory.create_card(Technology.DARK_ENERGY_TAP) is card
+
+        factory.clear_cache()
+
+        assert get_shared_technology_card(Technology.DARK_ENERGY_TAP) is card
+        assert TechnologyCardFactory().create_card(Technology.DARK_ENERGY_TAP) is card
+        assert factory.create_card(Technology.DARK_ENERGY_TAP) is not card
+
+
+class TestSharedAgendaCards:
+    """Test standard agenda registries and decks."""
+
+    def test_standard_registries_share_stateless_cards(self) -> None:
+        """Test that only cards with their own state are created per game."""
+        count = warm_up_agenda_cards()
+        registry1 = AgendaCardRegistry.create_standard()
+        registry2 = AgendaCardRegistry.create_standard()
+
+        assert len(registry1) == count + 1
+        assert registry1.get_card("Core Mining") is registry2.get_card("Core Mining")
+        assert registry1.get_card("Committee Formation") is not registry2.get_card(
+            "Committee Formation"
+        )
+
+    def test_deck_order_is_per_game(self) -> None:
+        """Test that drawing from one standard deck leaves another intact."""
+        deck1, deck2 = AgendaDeck.create_standard(), AgendaDeck.create_standard()
+
+        card = deck1.draw_top_card()
+
+        assert len(deck1) == len(deck2) - 1
+        assert card.get_name() in [c.get_name() for c in deck2.get_all_cards()]
+
+    def test_game_decks_use_the_shared_registry(self) -> None:
+        """Test that the Politics deck and default phase deck hold shared cards."""
+        registry = AgendaCardRegistry.create_standard()
+
+        politics_deck = agenda_deck.AgendaDeck()
+        with patch.object(AgendaPhase, "reveal_agenda") as reveal:
+            # Elections drawn from the shuffled deck need a target, so only
+            # the revealed cards are checked
+            AgendaPhase().execute_complete_phase(object())
+
+        assert sorted(politics_deck.cards) == sorted(registry.get_all_card_names())
+        revealed = [call.args[0] for call in reveal.call_args_list]
+        assert revealed
+        assert all(card.get_name() in registry for card in revealed)
+
+
+class TestWarmUp:
+    """Test that shared cards are created at startup."""
+
+    def test_game_manager_warms_up_shared_cards(self) -> None:
+        """Test that the game manager creates the shared cards once."""
+        with (
+            patch("ti4.performance.concurrent.warm_up_technology_cards") as tech,
+            patch("ti4.performance.concurrent.warm_up_agenda_cards") as agendas,
+        ):
+            manager = ConcurrentGameManager(max_concurrent_games=1)
+            manager.create_game("game1")
+
+        tech.assert_called_once_with()
+        agendas.assert_called_once_with()
@@ -0,0 +1,129 @@
+"""Tests for the load-once component data catalogs."""
+
+import pytest
+
+from ti4.core.component_catalog import (
+    OBJECTIVE_CARDS_FILE,
+    ComponentCatalog,
+    ObjectiveRecord,
+    get_ability_catalog,
+    get_objective_catalog,
+    get_planet_catalog,
+    get_system_catalog,
+    resolve_component_data_path,
+)
+from ti4.core.objective import ObjectiveCardFactory
+
+
+class TestComponentDataPath:
+    """Test component data file lookup."""
+
+    def test_resolves_source_tree_data(self) -> None:
+        """Test that data files are found in the source checkout."""
+        path = resolve_component_data_path(OBJECTIVE_CARDS_FILE)
+
+        assert path.is_file()
+        assert path.name == OBJECTIVE_CARDS_FILE
+
+    def test_missing_file_raises(self) -> None:
+        """Test that an unknown data file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            resolve_component_data_path("does_not_exist.csv")
+
+
+class TestComponentCatalog:
+    """Test catalog parsing and indexing."""
+
+    def test_catalog_is_lazy_and_parses_once(self, monkeypatch) -> None:
+        """Test that the file is read on first access only."""
+        reads = []
+        catalog = ComponentCatalog(
+            OBJECTIVE_CARDS_FILE,
+            ObjectiveRecord,
+            lambda row: ObjectiveRecord(
+                name=row["Name"],
+                condition=row["Condition"],
+                points=int(row["Points"]),
+                expansion=row["Expansion"],
+                phase=row["Phase"],
+                type=row["Type"],
+            ),
+            key=lambda record: record.name,
+            required_columns=frozenset({"Name"}),
+        )
+        original_read = catalog._read_records
+        monkeypatch.setattr(catalog, "_records_from_bundle", lambda: None)
+        monkeypatch.setattr(
+            catalog,
+            "_read_records",
+            lambda: reads.append(1) or original_read(),
+        )
+
+        assert not catalog.is_loaded
+        assert len(catalog) == 80
+        assert "Corner the Market" in catalog
+        assert catalog.get("Corner the Market").points == 1
+        assert len(reads) == 1
+
+    def test_records_are_frozen(self) -> None:
+        """Test that catalog records cannot be mutated."""
+        record = get_objective_catalog()["Corner the Market"]
+
+        with pytest.raises(AttributeError):
+            record.points = 5
+
+    def test_index_by_attribute(self) -> None:
+        """Test grouping records by an attribute."""
+        by_type = get_objective_catalog().index_by("type")
+
+        assert len(by_type["Stage I"]) == 20
+        assert len(by_type["Stage II"]) == 20
+        assert len(by_type["Secret"]) == 40
+        assert get_objective_catalog().index_by("type") is by_type
+
+    def test_system_catalog(self) -> None:
+        """Test parsing of the systems data file."""
+        catalog = get_system_catalog()
+
+        assert catalog["1"].is_home_system
+        assert catalog["1"].faction == "Federation of Sol"
+        assert any("Alpha" in system.wormholes for system in catalog)
+
+    def test_planet_catalog_skips_malformed_rows(self) -> None:
+        """Test that planets parse and malformed rows are skipped."""
+        catalog = get_planet_catalog()
+
+        mecatol = catalog["Mecatol Rex"]
+        assert (mecatol.resources, mecatol.influence) == (1, 6)
+        assert mecatol.system_id == "18"
+        assert all(isinstance(planet.resources, int) for planet in catalog)
+
+    def test_ability_catalog_restores_encoded_commas(self) -> None:
+        """Test that encoded commas in text fields are restored."""
+        bribery = get_ability_catalog()["Bribery"]
+
+        assert bribery.type == "Action Card"
+        assert "§" not in bribery.effect
+        assert "For each trade good spent," in bribery.effect
+
+
+class TestObjectiveFactoryUsesCatalog:
+    """Test that the objective factory shares cards built from the catalog."""
+
+    def test_objective_cards_are_shared_between_calls(self) -> None:
+        """Test that cards are built once and reused."""
+        first = ObjectiveCardFactory.create_all_objectives()
+        second = ObjectiveCardFactory.create_all_objectives()
+
+        assert first is not second
+        assert first["corner_the_market"] is second["corner_the_market"]
+
+    def test_returned_containers_are_independent(self) -> None:
+        """Test that mutating a returned container does not affect later calls."""
+        objectives = ObjectiveCardFactory.create_all_objectives()
+        objectives.clear()
+        stage_i = ObjectiveCardFactory.create_stage_i_objectives()
+        stage_i.clear()
+
+        assert len(ObjectiveCardFactory.create_all_objectives()) == 80
+        assert len(ObjectiveCardFactory.create_stage_i_objectives()) == 20
@@ -0,0 +1,215 @@
+"""Tests for the prebuilt static data bundle."""
+
+import os
+import struct
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from ti4.core import data_bundle
+from ti4.core.component_catalog import (
+    OBJECTIVE_CARDS_FILE,
+    PLANETS_FILE,
+    ComponentCatalog,
+    ObjectiveRecord,
+    get_objective_catalog,
+    get_planet_catalog,
+)
+from ti4.core.constants import Faction, Technology
+from ti4.core.data_bundle import (
+    BUNDLE_FORMAT_VERSION,
+    BUNDLE_MAGIC,
+    DataBundleError,
+    build_bundle,
+    compute_source_fingerprint,
+    get_installed_bundle,
+    install_bundle,
+    load_bundle,
+    reset_installed_bundle,
+)
+from ti4.core.leaders import LeaderRegistry, LeaderType
+from ti4.core.technology_cards.specifications import TechnologySpecificationRegistry
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    """Build a bundle into a temporary directory."""
+    return build_bundle(tmp_path / "static.bundle")
+
+
+@pytest.fixture(autouse=True)
+def _reset_bundle():
+    yield
+    reset_installed_bundle()
+
+
+class TestBundleRoundTrip:
+    """Test that bundle contents match the source data."""
+
+    def test_catalog_records_round_trip(self, bundle_path) -> None:
+        """Test that catalog records decode to the parsed CSV records."""
+        bundle = load_bundle(bundle_path)
+
+        objectives = get_objective_catalog()
+        assert (
+            bundle.get_catalog_records(OBJECTIVE_CARDS_FILE, ObjectiveRecord)
+            == objectives._read_records()
+        )
+        planets = get_planet_catalog()
+        assert (
+            bundle.get_catalog_records(PLANETS_FILE, planets.record_type)
+            == planets._read_records()
+        )
+
+    def test_unknown_catalog_returns_none(self, bundle_path) -> None:
+        """Test that a catalog missing from the bundle returns None."""
+        bundle = load_bundle(bundle_path)
+
+        assert bundle.get_catalog_records("missing.csv", ObjectiveRecord) is None
+
+    def test_technology_specifications_round_trip(self, bundle_path) -> None:
+        """Test that technology specifications decode to equal objects."""
+        bundle = load_bundle(bundle_path)
+        source = TechnologySpecificationRegistry(use_bundle=False)
+
+        decoded = bundle.get_technology_specifications()
+        assert decoded == {
+            spec.technology: spec for spec in source.get_all_specifications()
+        }
+        assert Technology.GRAVITY_DRIVE in decoded
+
+    def test_leader_definitions_round_trip(self, bundle_path) -> None:
+        """Test that leader definitions match the registry."""
+        bundle = load_bundle(bundle_path)
+        registry = LeaderRegistry()
+
+        for leader_type in LeaderType:
+            assert bundle.get_leader_definition(
+                Faction.SOL, leader_type
+            ) == registry.get_leader_definition(
+                Faction.SOL, leader_type, use_bundle=False
+            )
+
+    def test_leader_definition_is_a_copy(self, bundle_path) -> None:
+        """Test that callers cannot mutate the bundled definitions."""
+        bundle = load_bundle(bundle_path)
+
+        definition = bundle.get_leader_definition(Faction.SOL, LeaderType.AGENT)
+        definition["unlock_conditions"].append("mutated")
+
+        again = bundle.get_leader_definition(Faction.SOL, LeaderType.AGENT)
+        assert "mutated" not in again["unlock_conditions"]
+
+
+class TestBundleValidation:
+    """Test rejection of invalid bundles."""
+
+    def _rewrite_header(self, path, **fields) -> None:
+        header = struct.Struct("<4sHHBB32s")
+        data = bytearray(path.read_bytes())
+        names = ("magic", "version", "marshal_version", "major", "minor", "sha256")
+        values = dict(zip(names, header.unpack_from(data), strict=True))
+        values.update(fields)
+        header.pack_into(data, 0, *values.values())
+        path.write_bytes(bytes(data))
+
+    def test_bad_magic_rejected(self, bundle_path) -> None:
+        """Test that a file without the bundle magic is rejected."""
+        self._rewrite_header(bundle_path, magic=b"XXXX")
+
+        with pytest.raises(DataBundleError, match="not a TI4 data bundle"):
+            load_bundle(bundle_path)
+
+    def test_format_version_mismatch_rejected(self, bundle_path) -> None:
+        """Test that a bundle from another format version is rejected."""
+        self._rewrite_header(bundle_path, version=BUNDLE_FORMAT_VERSION + 1)
+
+        with pytest.raises(DataBundleError, match="format version"):
+            load_bundle(bundle_path)
+
+    def test_python_version_mismatch_rejected(self, bundle_path) -> None:
+        """Test that a bundle written by another interpreter is rejected."""
+        self._rewrite_header(bundle_path, minor=sys.version_info.minor + 1)
+
+        with pytest.raises(DataBundleError, match="rebuild it"):
+            load_bundle(bundle_path, verify=False)
+
+    def test_stale_fingerprint_rejected(self, bundle_path) -> None:
+        """Test that a bundle built from other source contents is rejected."""
+        self._rewrite_header(bundle_path, sha256=b"\0" * 32)
+
+        with pytest.raises(DataBundleError, match="out of date"):
+            load_bundle(bundle_path)
+        assert load_bundle(bundle_path, verify=False) is not None
+
+    def test_fingerprint_ignores_paths_and_mtimes(self, tmp_path) -> None:
+        """Test that an installed copy of the sources has the same fingerprint."""
+        sources = data_bundle._source_files()
+        fingerprint = compute_source_fingerprint()
+        copies = []
+        for name, path in sources:
+            if path is None:
+                copies.append((name, None))
+                continue
+            copy = tmp_path / name.replace("/", "_")
+            copy.write_bytes(path.read_bytes())
+            os.utime(copy, ns=(0, 0))
+            copies.append((name, copy))
+
+        with patch.object(data_bundle, "_source_files", return_value=copies):
+            assert compute_source_fingerprint() == fingerprint
+
+    def test_truncated_bundle_rejected(self, tmp_path) -> None:
+        """Test that a file shorter than the header is rejected."""
+        path = tmp_path / "short.bundle"
+        path.write_bytes(BUNDLE_MAGIC)
+
+        with pytest.raises(DataBundleError, match="truncated"):
+            load_bundle(path)
+
+    def test_invalid_bundle_is_ignored(self, tmp_path, monkeypatch) -> None:
+        """Test that an unusable installed bundle falls back to source."""
+        path = tmp_path / "bad.bundle"
+        path.write_bytes(b"garbage" * 20)
+        monkeypatch.setenv("TI4_DATA_BUNDLE", str(path))
+        reset_installed_bundle()
+
+        assert get_installed_bundle() is None
+
+
+class TestInstalledBundle:
+    """Test that loaders use the installed bundle."""
+
+    def test_catalog_loads_from_installed_bundle(
+        self, bundle_path, monkeypatch
+    ) -> None:
+        """Test that a catalog does not parse the CSV when a bundle exists."""
+        install_bundle(load_bundle(bundle_path))
+        catalog = ComponentCatalog(
+            OBJECTIVE_CARDS_FILE,
+            ObjectiveRecord,
+            lambda row: pytest.fail("CSV should not be parsed"),
+            key=lambda record: record.name,
+            required_columns=frozenset({"Name"}),
+        )
+        monkeypatch.setattr(
+            catalog, "_read_records", lambda: pytest.fail("CSV was read")
+        )
+
+        assert len(catalog) == 80
+        assert catalog["Corner the Market"].points == 1
+
+    def test_registries_use_installed_bundle(self, bundle_path) -> None:
+        """Test that the technology and leader registries read the bundle."""
+        bundle = load_bundle(bundle_path)
+        install_bundle(bundle)
+
+        registry = TechnologySpecificationRegistry()
+        assert (
+            registry.get_specification(Technology.GRAVITY_DRIVE)
+            is (bundle.get_technology_specifications()[Technology.GRAVITY_DRIVE])
+        )
+        assert LeaderRegistry().get_leader_definition(
+            Faction.SOL, LeaderType.HERO
+        ) == bundle.get_leader_definition(Faction.SOL, LeaderType.HERO)
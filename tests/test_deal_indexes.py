@@ -0,0 +1,211 @@
+"""Tests for the indexes behind Rule 28 deal validation.
+
+LRR References:
+- Rule 28: DEALS
+- Rule 60: NEIGHBORS
+"""
+
+import copy
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from ti4.core.constants import Faction
+from ti4.core.deals import (
+    ComponentTransaction,
+    EnhancedTransactionManager,
+    TransactionHistoryEntry,
+    TransactionStatus,
+    TransactionStore,
+)
+from ti4.core.galaxy import Galaxy
+from ti4.core.game_state import GameState
+from ti4.core.hex_coordinate import HexCoordinate
+from ti4.core.planet import Planet
+from ti4.core.player import Player
+from ti4.core.system import System
+from ti4.core.transactions import TransactionOffer
+from ti4.core.unit import Unit
+
+
+def _galaxy() -> tuple[Galaxy, System, System, System]:
+    """Three systems in a row; the outer two are not adjacent."""
+    galaxy = Galaxy()
+    systems = []
+    for index in range(3):
+        system = System(f"system{index}")
+        galaxy.place_system(HexCoordinate(index, 0), system.system_id)
+        galaxy.register_system(system)
+        systems.append(system)
+    return galaxy, systems[0], systems[1], systems[2]
+
+
+def _transaction(
+    transaction_id: str,
+    proposing_player: str,
+    target_player: str,
+    status: TransactionStatus = TransactionStatus.PENDING,
+) -> ComponentTransaction:
+    return ComponentTransaction(
+        transaction_id=transaction_id,
+        proposing_player=proposing_player,
+        target_player=target_player,
+        offer=TransactionOffer(trade_goods=1),
+        request=TransactionOffer(),
+        status=status,
+        timestamp=datetime.now(),
+    )
+
+
+class TestNeighborMatrix:
+    """Test that cached neighbor results follow unit movement and control."""
+
+    def test_results_are_cached(self) -> None:
+        """Test that repeated checks do not rescan the galaxy."""
+        galaxy, system0, system1, _ = _galaxy()
+        system0.place_unit_in_space(Unit("cruiser", "player1"))
+        system1.place_unit_in_space(Unit("cruiser", "player2"))
+        assert galaxy.are_players_neighbors("player1", "player2")
+
+        with patch.object(Galaxy, "_scan_player_systems", side_effect=AssertionError):
+            assert galaxy.are_players_neighbors("player2", "player1")
+
+    def test_unit_movement_invalidates(self) -> None:
+        """Test that moving a unit away ends the neighborship."""
+        galaxy, system0, system1, system2 = _galaxy()
+        cruiser = Unit("cruiser", "player2")
+        system0.place_unit_in_space(Unit("cruiser", "player1"))
+        system1.place_unit_in_space(cruiser)
+        assert galaxy.are_players_neighbors("player1", "player2")
+
+        system1.remove_unit_from_space(cruiser)
+        system2.place_unit_in_space(cruiser)
+
+        assert not galaxy.are_players_neighbors("player1", "player2")
+
+    def test_planet_control_and_units_invalidate(self) -> None:
+        """Test that planet control and ground forces are tracked."""
+        galaxy, system0, _, system2 = _galaxy()
+        planet = Planet("Jord", resources=4, influence=2)
+        system2.add_planet(planet)
+        system0.place_unit_in_space(Unit("cruiser", "player1"))
+        assert not galaxy.are_players_neighbors("player1", "player2")
+
+        planet.place_unit(Unit("infantry", "player1"))
+        planet.controlled_by = "player2"
+        assert galaxy.are_players_neighbors("player1", "player2")
+
+        planet.controlled_by = None
+        assert not galaxy.are_players_neighbors("player1", "player2")
+
+    def test_wormholes_invalidate(self) -> None:
+        """Test that new wormhole adjacency is picked up (Rule 101)."""
+        galaxy, system0, _, system2 = _galaxy()
+        system0.place_unit_in_space(Unit("cruiser", "player1"))
+        system2.place_unit_in_space(Unit("cruiser", "player2"))
+        assert not galaxy.are_players_neighbors("player1", "player2")
+
+        system0.add_wormhole("alpha")
+        system2.add_wormhole("alpha")
+
+        assert galaxy.are_players_neighbors("player1", "player2")
+
+    def test_copies_track_their_own_systems(self) -> None:
+        """Test that a deep-copied galaxy is not invalidated by the original."""
+        galaxy, system0, system1, _ = _galaxy()
+        cruiser = Unit("cruiser", "player2")
+        system0.place_unit_in_space(Unit("cruiser", "player1"))
+        system1.place_unit_in_space(cruiser)
+        assert galaxy.are_players_neighbors("player1", "player2")
+
+        copied = copy.deepcopy(galaxy)
+        copied_system1 = copied.get_system("system1")
+        assert copied_system1 is not None
+        copied_system1.remove_unit_from_space(copied_system1.space_units[0])
+
+        assert not copied.are_players_neighbors("player1", "player2")
+        assert galaxy.are_players_neighbors("player1", "player2")
+
+
+class TestTransactionStore:
+    """Test the player and status indexes of the transaction store."""
+
+    def test_status_updates_reindex(self) -> None:
+        """Test that replacing a transaction moves it between statuses."""
+        store = TransactionStore()
+        store["tx_1"] = _transaction("tx_1", "player1", "player2")
+        store["tx_2"] = _transaction("tx_2", "player3", "player1")
+        store["tx_3"] = _transaction("tx_3", "player2", "player3")
+
+        store["tx_2"] = _transaction(
+            "tx_2", "player3", "player1", TransactionStatus.REJECTED
+        )
+
+        pending = store.get_by_status(TransactionStatus.PENDING, "player1")
+        assert [t.transaction_id for t in pending] == ["tx_1"]
+        assert len(store.get_by_status(TransactionStatus.PENDING)) == 2
+        assert [t.transaction_id for t in store.get_for_player("player3")] == [
+            "tx_2",
+            "tx_3",
+        ]
+
+        del store["tx_1"]
+        assert store.get_by_status(TransactionStatus.PENDING, "player1") == []
+        assert list(store) == ["tx_2", "tx_3"]
+
+    def test_manager_queries_use_indexes(self) -> None:
+        """Test pending lookups and elimination through the manager."""
+        players = [
+            Player(id="player1", faction=Faction.SOL),
+            Player(id="player2", faction=Faction.HACAN),
+            Player(id="player3", faction=Faction.XXCHA),
+        ]
+        for player in players:
+            player.gain_trade_goods(10)
+        galaxy = Mock()
+        galaxy.are_players_neighbors.return_value = True
+        manager = EnhancedTransactionManager(galaxy, GameState(players=players))
+        for proposing, target in [
+            ("player1", "player2"),
+            ("player2", "player3"),
+            ("player3", "player1"),
+        ]:
+            manager.propose_transaction(
+                proposing, target, TransactionOffer(trade_goods=1), TransactionOffer()
+            )
+        manager.reject_transaction("tx_000001")
+
+        assert [
+            t.transaction_id for t in manager.get_pending_transactions("player1")
+        ] == ["tx_000003"]
+
+        manager.handle_player_elimination("player3")
+
+        assert manager.get_pending_transactions() == []
+        assert manager.get_transaction("tx_000002").status == (
+            TransactionStatus.CANCELLED
+        )
+
+
+class TestTransactionHistoryIndex:
+    """Test that history lookups follow the game state."""
+
+    def test_history_follows_new_states(self) -> None:
+        """Test that the index is rebuilt when the history changes."""
+        game_state = GameState()
+        manager = EnhancedTransactionManager(Mock(), game_state)
+        entry = TransactionHistoryEntry(
+            transaction_id="tx_1",
+            proposing_player="player1",
+            target_player="player2",
+            offer=TransactionOffer(trade_goods=1),
+            request=TransactionOffer(),
+            status=TransactionStatus.ACCEPTED,
+            timestamp=datetime.now(),
+        )
+        assert manager.get_transaction_history("player1") == []
+
+        manager._game_state = game_state.add_transaction_to_history(entry)
+
+        assert manager.get_transaction_history("player1") == [entry]
+        assert manager.get_transaction_history("player2") == [entry]
+        assert manager.get_transaction_history("player3") == []
@@ -0,0 +1,166 @@
+"""Tests for the incrementally maintained economy ledger."""
+
+import copy
+import gc
+from unittest.mock import patch
+
+from ti4.core.constants import Faction
+from ti4.core.deals import ResourceManager as DealResourceManager
+from ti4.core.economy_ledger import EconomyLedger, get_economy_ledger
+from ti4.core.game_state import GameState
+from ti4.core.planet import Planet
+from ti4.core.player import Player
+from ti4.core.resource_management import CachedResourceManager, ResourceManager
+
+
+def _game_state() -> tuple[GameState, Player, Planet, Planet]:
+    game_state = GameState()
+    player = Player(id="player1", faction=Faction.SOL)
+    jord = Planet("Jord", resources=4, influence=2)
+    mecatol = Planet("Mecatol Rex", resources=1, influence=6)
+    game_state = game_state.add_player(player)
+    game_state = game_state.add_player_planet(player.id, jord)
+    game_state = game_state.add_player_planet(player.id, mecatol)
+    player.gain_trade_goods(3)
+    return game_state, player, jord, mecatol
+
+
+class TestPlayerEconomy:
+    """Test running totals of a player's economy."""
+
+    def test_initial_totals(self) -> None:
+        """Test totals built from the controlled planets."""
+        game_state, player, _, _ = _game_state()
+
+        economy = get_economy_ledger(game_state).get_player_economy(player.id)
+
+        assert economy.ready_resources == 5
+        assert economy.ready_influence == 8
+        assert economy.trade_goods == 3
+
+    def test_exhaust_and_ready_update_totals(self) -> None:
+        """Test that planet exhaustion is applied without rebuilding."""
+        game_state, player, jord, _ = _game_state()
+        ledger = get_economy_ledger(game_state)
+        economy = ledger.get_player_economy(player.id)
+
+        jord.exhaust()
+        assert economy.ready_resources == 1
+        assert economy.ready_influence == 6
+        assert economy.get_ready_resource_planets() == {"Mecatol Rex": 1}
+
+        jord.ready()
+        assert economy.ready_resources == 5
+        assert economy.version == 2
+        assert ledger.get_player_economy(player.id) is economy
+
+    def test_trade_goods_are_live(self) -> None:
+        """Test that trade good changes are visible immediately."""
+        game_state, player, _, _ = _game_state()
+        economy = get_economy_ledger(game_state).get_player_economy(player.id)
+
+        player.spend_trade_goods(2)
+
+        assert economy.trade_goods == 1
+
+    def test_control_change_resynchronizes(self) -> None:
+        """Test that a replaced planet list is picked up."""
+        game_state, player, _, _ = _game_state()
+        ledger = get_economy_ledger(game_state)
+        old_economy = ledger.get_player_economy(player.id)
+
+        game_state.player_planets[player.id].append(
+            Planet("Arc Prime", resources=4, influence=0)
+        )
+        economy = ledger.get_player_economy(player.id)
+
+        assert economy is not old_economy
+        assert economy.ready_resources == 9
+        assert economy.version > old_economy.version
+
+    def test_unknown_player(self) -> None:
+        """Test that unknown players have no economy."""
+        game_state, _, _, _ = _game_state()
+
+        ledger = get_economy_ledger(game_state)
+
+        assert ledger.get_player_economy("nobody") is None
+        assert ledger.get_trade_goods("nobody") is None
+
+
+class TestEconomyLedgerLifecycle:
+    """Test how ledgers are shared, copied and released."""
+
+    def test_ledger_is_shared_per_game_state(self) -> None:
+        """Test that all readers of a state use one ledger."""
+        game_state, _, _, _ = _game_state()
+
+        assert get_economy_ledger(game_state) is get_economy_ledger(game_state)
+
+    def test_new_state_gets_new_ledger(self) -> None:
+        """Test that copy-on-write states do not share ledgers."""
+        game_state, player, _, _ = _game_state()
+        ledger = get_economy_ledger(game_state)
+
+        new_state = game_state.add_player_planet(
+            player.id, Planet("Arc Prime", resources=4, influence=0)
+        )
+
+        assert get_economy_ledger(new_state) is not ledger
+        assert (
+            ResourceManager(new_state).calculate_available_resources(player.id)
+            == ResourceManager(game_state).calculate_available_resources(player.id) + 4
+        )
+
+    def test_deepcopy_does_not_share_listeners(self) -> None:
+        """Test that exhausting a copied planet leaves the original ledger alone."""
+        game_state, player, _, _ = _game_state()
+        economy = get_economy_ledger(game_state).get_player_economy(player.id)
+
+        copied = copy.deepcopy(game_state)
+        for planet in copied.get_player_planets(player.id):
+            planet.exhaust()
+
+        assert economy.ready_resources == 5
+        copied_economy = get_economy_ledger(copied).get_player_economy(player.id)
+        assert copied_economy.ready_resources == 0
+
+    def test_planets_do_not_keep_ledgers_alive(self) -> None:
+        """Test that planet listeners are weak references."""
+        _, player, jord, _ = _game_state()
+        game_state = GameState().add_player(player).add_player_planet(player.id, jord)
+        EconomyLedger(game_state).get_player_economy(player.id)
+
+        gc.collect()
+
+        assert len(jord._exhaust_listeners) == 0
+
+
+class TestLedgerReaders:
+    """Test that resource readers use the ledger."""
+
+    def test_cached_manager_invalidates_from_ledger_revision(self) -> None:
+        """Test that cache validity is decided without hashing planets."""
+        game_state, player, jord, _ = _game_state()
+        manager = CachedResourceManager(game_state)
+        manager.calculate_available_resources(player.id)
+
+        with patch.object(Planet, "is_exhausted") as is_exhausted:
+            assert manager.calculate_available_resources(player.id) == 8
+            jord.exhaust()
+            assert manager.calculate_available_resources(player.id) == 4
+            is_exhausted.assert_not_called()
+
+        assert manager.get_cache_statistics().cache_hits == 1
+
+    def test_deal_trade_goods_follow_transfers(self) -> None:
+        """Test that deal trade goods reads see transfers."""
+        game_state, player, _, _ = _game_state()
+        other = Player(id="player2", faction=Faction.HACAN)
+        game_state = game_state.add_player(other)
+        deals = DealResourceManager(game_state)
+
+        deals.transfer_trade_goods(player.id, other.id, 2)
+
+        assert deals.get_trade_goods(player.id) == 1
+        assert deals.get_trade_goods(other.id) == 2
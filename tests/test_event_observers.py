@@ -144,6 +144,26 @@ class TestStatisticsCollector:
         assert stats["unit_movements"] == 3
         assert stats["player_actions"]["player_1"] == 3
 
+    def test_statistics_collector_tracks_event_latency(self) -> None:
+        """Test that StatisticsCollector records per-event-type delivery latency."""
+        collector = StatisticsCollector()
+
+        for i in range(3):
+            collector.handle_event(
+                create_unit_moved_event(
+                    game_id="game_123",
+                    unit_id=f"unit_{i}",
+                    from_system="system_1",
+                    to_system="system_2",
+                    player_id="player_1",
+                )
+            )
+
+        latency = collector.get_event_latency_stats("unit_moved")
+        assert latency["count"] == 3
+        assert 0.0 <= latency["p50"] <= latency["p99"] <= latency["max"]
+        assert collector.get_event_latency_stats("phase_changed")["count"] == 0
+
     def test_statistics_collector_can_be_registered_with_event_bus(self) -> None:
         """Test that StatisticsCollector can be registered with event bus."""
         event_bus = GameEventBus()
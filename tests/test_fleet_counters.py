@@ -0,0 +1,202 @@
+"""Tests for incremental fleet pool and capacity counters.
+
+LRR References:
+- Rule 16: CAPACITY
+- Rule 37: FLEET POOL
+"""
+
+from unittest.mock import patch
+
+from ti4.core import fleet_counters
+from ti4.core.constants import Faction, Technology, UnitType
+from ti4.core.fleet import Fleet
+from ti4.core.fleet_counters import FleetCounts, get_fleet_supply_index
+from ti4.core.fleet_pool import FleetPoolManager
+from ti4.core.game_state import GameState
+from ti4.core.game_technology_manager import GameTechnologyManager
+from ti4.core.player import Player
+from ti4.core.system import System
+from ti4.core.unit import Unit
+from ti4.core.unit_stats import UnitStats, UnitStatsProvider
+
+
+def _game_state(*system_ids: str) -> GameState:
+    player = Player(id="player1", faction=Faction.SOL)
+    player.command_sheet.fleet_pool = 2
+    systems = {system_id: System(system_id) for system_id in system_ids}
+    return GameState(players=[player], systems=systems)
+
+
+class TestSystemFleetCounts:
+    """Test per-player counts of a system's space area."""
+
+    def test_counts_follow_placement_and_removal(self) -> None:
+        """Test that counts are updated unit by unit."""
+        system = System("system1")
+        carrier = Unit(UnitType.CARRIER, "player1")
+        fighter = Unit(UnitType.FIGHTER, "player1")
+        system.place_unit_in_space(carrier)
+        system.place_unit_in_space(fighter)
+        system.place_unit_in_space(Unit(UnitType.INFANTRY, "player1"))
+        system.place_unit_in_space(Unit(UnitType.DESTROYER, "player2"))
+        system.place_unit_on_planet(Unit(UnitType.INFANTRY, "player1"), "missing")
+
+        assert system.get_fleet_counts("player1") == FleetCounts(1, 4, 2)
+        assert system.get_fleet_counts("player2") == FleetCounts(1, 0, 0)
+
+        system.remove_unit_from_space(carrier)
+        system.remove_unit_from_space(fighter)
+
+        assert system.get_fleet_counts("player1") == FleetCounts(0, 0, 1)
+        assert not system.get_fleet_counts("player1").is_within_capacity
+        assert system.get_fleet_counts("player3") == FleetCounts()
+
+    def test_direct_list_edits_are_recounted(self) -> None:
+        """Test that units added without place_unit_in_space are counted."""
+        system = System("system1")
+        system.space_units.extend(
+            [Unit(UnitType.CRUISER, "player1"), Unit(UnitType.CRUISER, "player1")]
+        )
+        assert system.get_fleet_counts("player1").non_fighter_ships == 2
+
+        system.space_units = [Unit(UnitType.WAR_SUN, "player1")]
+        assert system.get_fleet_counts("player1") == FleetCounts(1, 6, 0)
+
+    def test_fleet_pool_check_reads_counters(self) -> None:
+        """Test that fleet pool validation does not walk the space area."""
+        system = System("system1")
+        for _ in range(3):
+            system.place_unit_in_space(Unit(UnitType.CRUISER, "player1"))
+        manager = FleetPoolManager()
+
+        with patch.object(fleet_counters, "count_units", side_effect=AssertionError):
+            assert manager.is_fleet_pool_valid(system, "player1", fleet_tokens=3)
+            assert not manager.is_fleet_pool_valid(system, "player1", fleet_tokens=2)
+
+
+class TestFleetCounters:
+    """Test fleet capacity counters."""
+
+    def test_capacity_and_carried_units(self) -> None:
+        """Test that fleet counts follow added and removed units."""
+        fleet = Fleet("player1", "system1")
+        carrier = Unit(UnitType.CARRIER, "player1")
+        fleet.add_unit(carrier)
+        for _ in range(3):
+            fleet.add_unit(Unit(UnitType.FIGHTER, "player1"))
+        fleet.add_unit(Unit(UnitType.MECH, "player1"))
+
+        assert (fleet.get_total_capacity(), fleet.get_carried_units_count()) == (4, 4)
+
+        fleet.remove_unit(carrier)
+
+        assert (fleet.get_total_capacity(), fleet.get_carried_units_count()) == (0, 4)
+
+
+class TestUnitUpgrades:
+    """Test that researched unit upgrades refresh the counters."""
+
+    def test_upgrade_recounts_capacity(self) -> None:
+        """Test that an upgrade changing capacity is counted."""
+        provider = UnitStatsProvider()
+        provider.register_technology_modifier(
+            Technology.CRUISER_II, UnitType.CRUISER, UnitStats(capacity=1)
+        )
+        game_state = _game_state("a")
+        system = game_state.systems["a"]
+        fleet = Fleet("player1", "a")
+        system.add_fleet(fleet)
+        for units in (system.space_units, fleet.units):
+            units.append(Unit(UnitType.CRUISER, "player1", stats_provider=provider))
+        system.place_unit_in_space(Unit(UnitType.CRUISER, "player2"))
+        assert system.get_fleet_counts("player1").capacity == 0
+        assert fleet.get_total_capacity() == 0
+
+        game_state.upgrade_player_units("player1", Technology.CRUISER_II)
+
+        assert system.get_fleet_counts("player1").capacity == 1
+        assert fleet.get_total_capacity() == 1
+        assert Technology.CRUISER_II not in system.space_units[1].technologies
+
+    def test_research_upgrades_units(self) -> None:
+        """Test that researching a unit upgrade applies it to the board."""
+        game_state = _game_state("a")
+        manager = GameTechnologyManager(game_state)
+
+        with (
+            patch.object(
+                manager.technology_manager, "research_technology", return_value=True
+            ),
+            patch.object(GameState, "upgrade_player_units") as upgrade,
+        ):
+            manager.research_technology("player1", Technology.CRUISER_II)
+            manager.research_technology("player1", Technology.GRAVITY_DRIVE)
+
+        upgrade.assert_called_once_with("player1", Technology.CRUISER_II)
+
+
+class TestFleetSupplyIndex:
+    """Test fleet supply checks on the game state."""
+
+    def test_fleet_supply_follows_movement(self) -> None:
+        """Test that fleet pool tokens limit non-fighter ships per system."""
+        game_state = _game_state("a", "b", "c")
+        cruiser = Unit(UnitType.CRUISER, "player1")
+        game_state.systems["a"].place_unit_in_space(cruiser)
+        game_state.systems["b"].place_unit_in_space(Unit(UnitType.CARRIER, "player1"))
+        for system_id in ("b", "c"):
+            game_state.systems[system_id].place_unit_in_space(
+                Unit(UnitType.FIGHTER, "player1")
+            )
+        index = get_fleet_supply_index(game_state)
+
+        assert index.get_fleet_systems("player1") == {"a", "b"}
+        assert index.get_fleet_supply_used("player1") == 1
+        assert game_state.is_fleet_supply_consistent()
+
+        game_state.systems["a"].place_unit_in_space(Unit(UnitType.CRUISER, "player1"))
+        game_state.systems["a"].place_unit_in_space(Unit(UnitType.DESTROYER, "player1"))
+        assert index.get_fleet_supply_used("player1") == 3
+        assert not game_state.is_fleet_supply_consistent()
+
+        game_state.systems["a"].remove_unit_from_space(cruiser)
+        assert game_state.is_fleet_supply_consistent(audit=True)
+        assert get_fleet_supply_index(game_state) is index
+
+    def test_ships_spread_over_systems_are_within_supply(self) -> None:
+        """Test that ships in many systems only count per system."""
+        game_state = _game_state("a", "b", "c", "d")
+        for system in game_state.systems.values():
+            system.place_unit_in_space(Unit(UnitType.DESTROYER, "player1"))
+        index = get_fleet_supply_index(game_state)
+
+        assert index.is_within_fleet_supply("player1", 1)
+        assert FleetPoolManager().is_fleet_pool_valid(
+            game_state.systems["a"], "player1", 1
+        )
+
+        for _ in range(2):
+            game_state.systems["a"].place_unit_in_space(
+                Unit(UnitType.DESTROYER, "player1")
+            )
+        assert not index.is_within_fleet_supply("player1", 2)
+        assert not FleetPoolManager().is_fleet_pool_valid(
+            game_state.systems["a"], "player1", 2
+        )
+        # Fleet supply is checked where units move, not by is_valid
+        assert game_state.is_valid()
+
+    def test_audit_reports_stale_index(self) -> None:
+        """Test that the debug audit recounts the whole board."""
+        game_state = _game_state("a")
+        index = get_fleet_supply_index(game_state)
+        assert index.get_fleet_supply_used("player1") == 0
+
+        # Units appended directly do not notify the index
+        dreadnought = Unit(UnitType.DREADNOUGHT, "player1")
+        game_state.systems["a"].space_units.append(dreadnought)
+
+        assert fleet_counters.audit_fleet_counts(game_state) == [
+            "Player player1: fleet supply [] != recount ['a']"
+        ]
+        assert not game_state.is_fleet_supply_consistent(audit=True)
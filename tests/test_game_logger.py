@@ -1,6 +1,7 @@
 """Tests for GameLogger structured logging system."""
 
 import logging
+import threading
 from typing import Any
 from unittest.mock import patch
 
@@ -145,3 +146,182 @@ class TestGameLogger:
         handler = logger.logger.handlers[0]
         assert hasattr(handler, "formatter")
         assert handler.formatter is not None
+
+
+class CountingCommand(MockCommand):
+    """Mock command that counts serializations."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.serialize_calls = 0
+
+    def serialize(self) -> dict[str, Any]:
+        self.serialize_calls += 1
+        return super().serialize()
+
+
+class RecordingHandler(logging.Handler):
+    """Handler that keeps formatted records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(self.format(record))
+        self.threads.append(threading.current_thread().name)
+
+
+class TestLazyLogging:
+    """Test that disabled logging costs no serialization."""
+
+    def test_disabled_logger_does_not_serialize(self) -> None:
+        """Test that commands are not serialized when INFO is disabled."""
+        from ti4.core.logging import GameLogger
+
+        logger = GameLogger("lazy_disabled_game")
+        logger.logger.setLevel(logging.WARNING)
+        command = CountingCommand()
+
+        with patch("json.dumps") as dumps:
+            logger.log_command(command, "success")
+            dumps.assert_not_called()
+
+        assert command.serialize_calls == 0
+
+    def test_filtered_handlers_do_not_serialize(self) -> None:
+        """Test that a logger whose handlers filter INFO counts as disabled."""
+        from ti4.core.logging import GameLogger, is_logging_enabled
+
+        logger = GameLogger("lazy_filtered_game")
+        logger.logger.handlers[0].setLevel(logging.ERROR)
+        command = CountingCommand()
+
+        logger.log_command(command, "success")
+
+        assert command.serialize_calls == 0
+        assert not is_logging_enabled(logger.logger, logging.INFO)
+        assert is_logging_enabled(logger.logger, logging.ERROR)
+
+    def test_structured_payload_is_built_by_formatter(self) -> None:
+        """Test that structured data is resolved only when formatted."""
+        from ti4.core.logging import GameLogger, LazyPayload, StructuredFormatter
+
+        logger = GameLogger("lazy_formatted_game")
+        handler = RecordingHandler()
+        handler.setFormatter(StructuredFormatter("%(message)s", indent=None))
+        logger.logger.handlers = [handler]
+
+        with patch("logging.Logger.info") as mock_info:
+            logger.log_command(MockCommand(), "success")
+        payload = mock_info.call_args[1]["extra"]["structured_data"]
+        assert isinstance(payload, LazyPayload)
+
+        logger.log_command(MockCommand(), "success", {"turn": 2})
+        assert handler.messages == [
+            "Command executed: MockCommand\nStructured Data: "
+            '{"game_id": "lazy_formatted_game", "command_type": "mock", '
+            '"result": "success", "context": {"turn": 2}}'
+        ]
+
+    def test_structured_payload_reads_like_a_dict(self) -> None:
+        """Test that handlers other than StructuredFormatter can read the data."""
+        from ti4.core.logging import GameLogger
+
+        logger = GameLogger("lazy_mapping_game")
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.logger.handlers = [handler]
+
+        logger.log_command(MockCommand(), "success")
+
+        structured_data = records[0].structured_data
+        assert structured_data["result"] == "success"
+        assert dict(structured_data)["command_type"] == "mock"
+
+    def test_debug_level_includes_serialized_command(self) -> None:
+        """Test that the full command is only logged at DEBUG level."""
+        from ti4.core.logging import GameLogger, StructuredFormatter
+
+        logger = GameLogger("lazy_debug_game")
+        handler = RecordingHandler()
+        handler.setFormatter(StructuredFormatter("%(message)s", indent=None))
+        logger.logger.handlers = [handler]
+        logger.logger.setLevel(logging.DEBUG)
+
+        logger.log_command(MockCommand(), "success")
+
+        assert '"command": {"type": "mock", "data": "test"}' in handler.messages[0]
+
+
+class TestAsyncLogging:
+    """Test the queue-based asynchronous handler."""
+
+    def test_records_are_emitted_on_listener_thread(self) -> None:
+        """Test that formatting and output happen off the calling thread."""
+        from ti4.core.logging import AsyncLogHandler, GameLogger, StructuredFormatter
+
+        logger = GameLogger("async_game")
+        handler = RecordingHandler()
+        handler.setFormatter(StructuredFormatter("%(message)s"))
+        logger.logger.handlers = [handler]
+
+        async_handler = logger.enable_async()
+        try:
+            assert logger.logger.handlers == [async_handler]
+            assert isinstance(async_handler, AsyncLogHandler)
+            logger.log_command(MockCommand(), "success")
+            async_handler.flush()
+        finally:
+            from ti4.core.logging import disable_async_logging
+
+            disable_async_logging(logger.logger)
+
+        assert logger.logger.handlers == [handler]
+        assert handler.messages[0].startswith("Command executed: MockCommand")
+        assert handler.threads[0] != threading.current_thread().name
+
+    def test_full_queue_drops_records(self) -> None:
+        """Test that a full queue never blocks the caller."""
+        from ti4.core.logging import AsyncLogHandler
+
+        handler = AsyncLogHandler(RecordingHandler(), max_queue_size=1)
+        handler.listener.stop()
+        handler._running = False
+        record = logging.LogRecord("ti4", logging.INFO, "", 0, "msg", None, None)
+
+        handler.handle(record)
+        handler.handle(record)
+
+        assert handler.dropped_records == 1
+        handler.close()
+
+    def test_close_with_full_queue(self) -> None:
+        """Test that closing never fails or hangs on a full queue."""
+        from ti4.core.logging import AsyncLogHandler
+
+        started, release = threading.Event(), threading.Event()
+
+        class BlockingHandler(RecordingHandler):
+            def emit(self, record: logging.LogRecord) -> None:
+                started.set()
+                release.wait(5)
+                super().emit(record)
+
+        target = BlockingHandler()
+        handler = AsyncLogHandler(target, max_queue_size=1)
+        handler.listener.sentinel_timeout = 0.01
+        record = logging.LogRecord("ti4", logging.INFO, "", 0, "msg", None, None)
+        handler.handle(record)
+        assert started.wait(5)
+        handler.handle(record)  # Fills the queue
+
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        handler.close()
+        timer.join()
+
+        assert handler.dropped_records == 1
+        assert target.messages == ["msg"]
@@ -0,0 +1,79 @@
+"""Tests for the ring buffer and streaming latency histogram."""
+
+import pytest
+
+from ti4.performance.histogram import LatencyHistogram, RingBuffer
+
+
+class TestRingBuffer:
+    """Test cases for RingBuffer."""
+
+    def test_ring_buffer_overwrites_oldest_samples(self) -> None:
+        """Test that the buffer keeps only the most recent samples."""
+        buffer = RingBuffer(3)
+
+        for value in (1.0, 2.0, 3.0, 4.0):
+            buffer.append(value)
+
+        assert buffer.to_list() == [2.0, 3.0, 4.0]
+        assert buffer.mean() == pytest.approx(3.0)
+
+    def test_ring_buffer_trim(self) -> None:
+        """Test that trimming keeps the newest samples and updates the mean."""
+        buffer = RingBuffer(5)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            buffer.append(value)
+
+        buffer.trim(2)
+
+        assert buffer.to_list() == [3.0, 4.0]
+        assert buffer.mean() == pytest.approx(3.5)
+
+    def test_ring_buffer_requires_positive_capacity(self) -> None:
+        """Test that a zero capacity is rejected."""
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_empty_histogram_summary(self) -> None:
+        """Test that an empty histogram reports zeros."""
+        summary = LatencyHistogram().summary()
+
+        assert summary["count"] == 0
+        assert summary["p99"] == 0.0
+        assert summary["min"] == 0.0
+
+    def test_percentiles_within_precision(self) -> None:
+        """Test percentiles over a wide range of magnitudes."""
+        samples = [i * 1e-4 for i in range(1, 10001)]
+        histogram = LatencyHistogram.from_samples(samples)
+
+        assert histogram.count == 10000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=1e-2)
+        assert histogram.percentile(95) == pytest.approx(0.95, rel=1e-2)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=1e-2)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+        assert histogram.mean() == pytest.approx(0.50005)
+
+    def test_merge_matches_combined_recording(self) -> None:
+        """Test that merging equals recording all samples in one histogram."""
+        first = LatencyHistogram.from_samples([0.001, 0.002, 0.5])
+        second = LatencyHistogram.from_samples([0.01, 2.0])
+        combined = LatencyHistogram.from_samples([0.001, 0.002, 0.5, 0.01, 2.0])
+
+        first.merge(second)
+
+        assert first.summary() == combined.summary()
+
+    def test_merge_rejects_different_layouts(self) -> None:
+        """Test that histograms with different precision cannot be merged."""
+        with pytest.raises(ValueError):
+            LatencyHistogram(precision_bits=4).merge(LatencyHistogram())
+
+    def test_negative_duration_rejected(self) -> None:
+        """Test that negative durations are rejected."""
+        with pytest.raises(ValueError):
+            LatencyHistogram().record(-1.0)
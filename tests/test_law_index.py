@@ -0,0 +1,140 @@
+"""Tests for the indexed law lookup in LawManager."""
+
+from unittest.mock import patch
+
+from ti4.core.agenda_cards.base import LawCard
+from ti4.core.agenda_cards.law_manager import (
+    ActiveLaw,
+    GameContext,
+    LawManager,
+    classify_action_type,
+    classify_law_effect,
+)
+from ti4.core.game_state import GameState
+
+
+def _law(name: str, effect: str, elected_target: str | None = None) -> ActiveLaw:
+    return ActiveLaw(
+        agenda_card=LawCard(name),
+        enacted_round=1,
+        effect_description=effect,
+        elected_target=elected_target,
+    )
+
+
+class _AlwaysAppliesLaw(ActiveLaw):
+    """A law with its own applicability rule."""
+
+    def applies_to_context(self, context: GameContext) -> bool:
+        return True
+
+
+class TestLawClassification:
+    """Test the classification of effects and action types."""
+
+    def test_effect_categories(self) -> None:
+        """Test that effect text maps to categories."""
+        assert classify_law_effect("Research a technology") == {"technology"}
+        assert classify_law_effect("Ships are destroyed in combat") == {"combat"}
+        assert classify_law_effect("At most 4 tokens in fleet pools") == {
+            "fleet",
+            "fleet_pool",
+        }
+        assert classify_law_effect("Gain 1 victory point") == frozenset()
+
+    def test_action_categories(self) -> None:
+        """Test that action types map to the categories that apply to them."""
+        assert classify_action_type("research_technology") == {"technology"}
+        assert classify_action_type("fleet_pool_management") == {"fleet"}
+        assert classify_action_type("tactical_action") == frozenset()
+
+
+class TestLawIndex:
+    """Test that indexed lookups match per-law applicability."""
+
+    LAWS = (
+        _law("Anti-Intellectual Revolution", "After a player researches a technology"),
+        _law("Fleet Regulations", "No more than 4 tokens in fleet pools"),
+        _law("Enforced Travel Ban", "Alpha and beta wormholes have no effect"),
+        _law("Conventions of War", "No bombardment of cultural planets in combat"),
+        _law("Minister of Commerce", "Gain trade goods", elected_target="player1"),
+    )
+    ACTIONS = (
+        "research_technology",
+        "fleet_pool_check",
+        "movement",
+        "space_combat",
+        "combat_movement",
+        "production",
+    )
+
+    def _manager(self) -> LawManager:
+        manager = LawManager()
+        for law in self.LAWS:
+            manager.enact_law(law)
+        return manager
+
+    def test_lookup_matches_applies_to_context(self) -> None:
+        """Test the index against filtering every active law."""
+        manager = self._manager()
+
+        for action_type in self.ACTIONS:
+            context = GameContext(action_type=action_type, player_id="player1")
+            expected = [law for law in self.LAWS if law.applies_to_context(context)]
+            assert manager.get_laws_affecting_context(context) == expected
+
+    def test_cached_lookup_does_not_scan_text(self) -> None:
+        """Test that repeated lookups use the cache."""
+        manager = self._manager()
+        context = GameContext(action_type="movement", player_id="player1")
+        manager.get_laws_affecting_context(context)
+
+        with (
+            patch.object(ActiveLaw, "applies_to_context", side_effect=AssertionError),
+            patch(
+                "ti4.core.agenda_cards.law_manager.classify_law_effect",
+                side_effect=AssertionError,
+            ),
+        ):
+            laws = manager.get_laws_affecting_context(context)
+
+        assert [law.agenda_card.get_name() for law in laws] == ["Enforced Travel Ban"]
+
+    def test_index_follows_enact_and_remove(self) -> None:
+        """Test that enacting and removing laws invalidates cached results."""
+        manager = self._manager()
+        context = GameContext(action_type="research", player_id="player1")
+        assert len(manager.get_laws_affecting_context(context)) == 1
+
+        manager.remove_law("Anti-Intellectual Revolution")
+        assert manager.get_laws_affecting_context(context) == []
+
+        manager.restore_law(_law("Research Team", "Technology research is free"))
+        assert len(manager.get_laws_affecting_context(context)) == 1
+
+    def test_custom_applicability_is_respected(self) -> None:
+        """Test that laws overriding applies_to_context are still checked."""
+        manager = self._manager()
+        custom = _AlwaysAppliesLaw(
+            agenda_card=LawCard("Custom"), enacted_round=2, effect_description="x"
+        )
+        manager.enact_law(custom)
+
+        laws = manager.get_laws_affecting_context(
+            GameContext(action_type="production", player_id="player1")
+        )
+
+        assert laws == [custom]
+
+    def test_laws_by_player(self) -> None:
+        """Test the elected player index through GameState."""
+        game_state = GameState()
+        for law in self.LAWS:
+            assert game_state.law_manager is not None
+            game_state.law_manager.enact_law(law)
+
+        assert [
+            law.agenda_card.get_name()
+            for law in game_state.get_laws_affecting_player("player1")
+        ] == ["Minister of Commerce"]
+        assert game_state.get_laws_affecting_player("player2") == []
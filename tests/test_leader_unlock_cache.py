@@ -0,0 +1,93 @@
+"""Tests for memoized leader unlock condition checks.
+
+LRR References:
+- Rule 51: LEADERS
+"""
+
+from unittest.mock import patch
+
+from ti4.core.constants import Faction
+from ti4.core.game_state import GameState
+from ti4.core.leaders import (
+    Commander,
+    LeaderAbilityValidator,
+    LeaderLockStatus,
+    LeaderManager,
+    get_leader_unlock_cache,
+)
+from ti4.core.placeholder_leaders import UnlockableCommander
+from ti4.core.planet import Planet
+from ti4.core.player import Player
+
+
+def _game_state(planet_count: int, trade_goods: int) -> GameState:
+    player = Player(id="player1", faction=Faction.XXCHA)
+    player.gain_trade_goods(trade_goods)
+    planets = [Planet(f"planet_{i}", resources=1, influence=1) for i in range(3)]
+    return GameState(
+        players=[player], player_planets={"player1": planets[:planet_count]}
+    )
+
+
+class TestLeaderUnlockCache:
+    """Test that unlock conditions are re-checked only after changes."""
+
+    def test_unchanged_dependencies_reuse_the_result(self) -> None:
+        """Test that a repeated check does not re-run the conditions."""
+        game_state = _game_state(planet_count=3, trade_goods=4)
+        commander = UnlockableCommander(faction=Faction.XXCHA, player_id="player1")
+        cache = get_leader_unlock_cache(game_state)
+        assert not cache.check(commander, game_state)
+
+        with patch.object(
+            UnlockableCommander, "check_unlock_conditions", side_effect=AssertionError
+        ):
+            assert not cache.check(commander, game_state)
+        assert (cache.checks, cache.hits) == (2, 1)
+
+    def test_changed_dependency_is_rechecked(self) -> None:
+        """Test that gaining trade goods unlocks the commander."""
+        game_state = _game_state(planet_count=3, trade_goods=4)
+        commander = UnlockableCommander(faction=Faction.XXCHA, player_id="player1")
+        game_state.players[0].leader_sheet.commander = commander
+        manager = LeaderManager(game_state)
+        manager.check_unlock_conditions("player1")
+        assert commander.lock_status == LeaderLockStatus.LOCKED
+
+        game_state.players[0].gain_trade_goods(1)
+        manager.check_unlock_conditions("player1")
+
+        assert commander.lock_status == LeaderLockStatus.UNLOCKED
+
+    def test_undeclared_dependencies_are_always_checked(self) -> None:
+        """Test that leaders without declared dependencies are not cached."""
+        game_state = _game_state(planet_count=0, trade_goods=0)
+        commander = Commander(faction=Faction.XXCHA, player_id="player1")
+        cache = get_leader_unlock_cache(game_state)
+
+        with patch.object(
+            Commander, "check_unlock_conditions", return_value=False
+        ) as check:
+            cache.check(commander, game_state)
+            cache.check(commander, game_state)
+
+        assert check.call_count == 2
+        assert cache.hits == 0
+
+    def test_validator_reuses_the_cached_result(self) -> None:
+        """Test that unlock validation goes through the cache."""
+        game_state = _game_state(planet_count=3, trade_goods=5)
+        commander = UnlockableCommander(faction=Faction.XXCHA, player_id="player1")
+        cache = get_leader_unlock_cache(game_state)
+        assert cache.check(commander, game_state)
+
+        with patch.object(
+            UnlockableCommander, "check_unlock_conditions", side_effect=AssertionError
+        ):
+            error = LeaderAbilityValidator.validate_unlock_conditions(
+                commander, game_state
+            )
+
+        assert error is None
+        assert cache.hits == 1
+        assert get_leader_unlock_cache(game_state.set_speaker("player1")) is cache
@@ -0,0 +1,215 @@
+"""Tests for facet-driven objective eligibility tracking."""
+
+from unittest.mock import patch
+
+from ti4.core.constants import Expansion
+from ti4.core.events import GameEventBus, create_unit_moved_event
+from ti4.core.game_phase import GamePhase
+from ti4.core.game_state import GameState
+from ti4.core.objective import (
+    ObjectiveCard,
+    ObjectiveCardFactory,
+    ObjectiveCategory,
+    ObjectiveEligibilityTracker,
+    ObjectiveStateFacet,
+    ObjectiveType,
+    reads_state_facets,
+)
+from ti4.core.planet import Planet
+
+PLANETS = ObjectiveStateFacet.PLANETS
+TECHNOLOGIES = ObjectiveStateFacet.TECHNOLOGIES
+
+
+def _make_objective(obj_id, dependencies, validator, facets=None):
+    if facets is not None:
+        validator = reads_state_facets(*facets)(validator)
+    return ObjectiveCard(
+        id=obj_id,
+        name=obj_id.replace("_", " ").title(),
+        condition="Test condition",
+        points=1,
+        expansion=Expansion.BASE,
+        phase=GamePhase.STATUS,
+        type=ObjectiveType.PUBLIC_STAGE_I,
+        requirement_validator=validator,
+        category=ObjectiveCategory.SPECIAL,
+        dependencies=dependencies,
+    )
+
+
+class TestObjectiveStateFacets:
+    """Test the state facets declared by objective requirements."""
+
+    def test_validators_declare_facets(self) -> None:
+        """Test that an objective reports the facets its validator declares."""
+        objective = _make_objective(
+            "tech", ["technology"], lambda p, g: False, [TECHNOLOGIES]
+        )
+
+        assert objective.state_facets == frozenset({TECHNOLOGIES})
+
+    def test_undeclared_validators_have_no_facets(self) -> None:
+        """Test that facets are not guessed from the card dependencies."""
+        objective = _make_objective("special", ["technology"], lambda p, g: False)
+
+        assert objective.state_facets is None
+
+
+class TestObjectiveEligibilityTracker:
+    """Test objective eligibility caching and re-evaluation."""
+
+    def setup_method(self) -> None:
+        """Set up objectives that count their validator calls."""
+        self.calls = {"planets": 0, "tech": 0}
+        self.eligible = {"planets": False, "tech": False}
+
+        def validator_for(key):
+            def validator(player_id, game_state):
+                self.calls[key] += 1
+                return self.eligible[key]
+
+            return validator
+
+        self.objectives = {
+            "planets": _make_objective(
+                "planets", ["planets"], validator_for("planets"), [PLANETS]
+            ),
+            "tech": _make_objective(
+                "tech", ["technology"], validator_for("tech"), [TECHNOLOGIES]
+            ),
+        }
+        self.tracker = ObjectiveEligibilityTracker(self.objectives)
+        self.game_state = GameState()
+
+    def test_unchanged_state_is_served_from_cache(self) -> None:
+        """Test that repeated checks without notifications do not re-evaluate."""
+        self.tracker.check_all_objective_eligibility("player1", self.game_state)
+        self.tracker.check_all_objective_eligibility("player1", self.game_state)
+
+        assert self.calls == {"planets": 1, "tech": 1}
+        stats = self.tracker.get_cache_statistics()
+        assert stats["cache_hits"] == 2
+        assert stats["cache_misses"] == 2
+        assert stats["total_checks"] == 2
+
+    def test_only_affected_objectives_are_re_evaluated(self) -> None:
+        """Test that a facet change re-evaluates only objectives reading it."""
+        self.tracker.check_all_objective_eligibility("player1", self.game_state)
+        self.eligible["tech"] = True
+
+        self.tracker.notify_state_changed([TECHNOLOGIES], "player1")
+        result = self.tracker.check_all_objective_eligibility(
+            "player1", self.game_state
+        )
+
+        assert result == {"planets": False, "tech": True}
+        assert self.calls == {"planets": 1, "tech": 2}
+
+    def test_notifications_are_per_player(self) -> None:
+        """Test that changes for one player do not invalidate another's cache."""
+        for player_id in ("player1", "player2"):
+            self.tracker.check_all_objective_eligibility(player_id, self.game_state)
+
+        self.tracker.notify_state_changed([PLANETS], "player2")
+        self.tracker.check_all_objective_eligibility("player1", self.game_state)
+        self.tracker.check_all_objective_eligibility("player2", self.game_state)
+
+        assert self.calls == {"planets": 3, "tech": 2}
+
+    def test_new_game_state_re_evaluates_changed_facets(self) -> None:
+        """Test that a replaced game state re-evaluates only changed facets."""
+        planets = [Planet(f"planet_{i}", resources=1, influence=1) for i in range(2)]
+        self.tracker.check_all_objective_eligibility("player1", self.game_state)
+        self.eligible["planets"] = True
+
+        new_state = self.game_state._create_new_state(
+            player_planets={"player1": planets}
+        )
+        result = self.tracker.check_all_objective_eligibility("player1", new_state)
+
+        assert result == {"planets": True, "tech": False}
+        assert self.calls == {"planets": 2, "tech": 1}
+
+    def test_in_place_changes_are_detected(self) -> None:
+        """Test that mutating the same game state re-evaluates its facet."""
+        planet = Planet("planet", resources=1, influence=1)
+        game_state = GameState(player_planets={"player1": [planet]})
+        ready_objective = _make_objective(
+            "ready",
+            ["planets"],
+            lambda p, g: not g.player_planets[p][0].is_exhausted(),
+            [PLANETS],
+        )
+        tracker = ObjectiveEligibilityTracker({"ready": ready_objective})
+        assert tracker.check_all_objective_eligibility("player1", game_state) == {
+            "ready": True
+        }
+
+        planet.exhaust()
+
+        assert tracker.check_all_objective_eligibility("player1", game_state) == {
+            "ready": False
+        }
+
+    def test_undeclared_objectives_are_always_re_evaluated(self) -> None:
+        """Test that objectives without declared facets are never cached."""
+        calls = []
+        objective = _make_objective(
+            "special", ["game_state"], lambda p, g: calls.append(p) or False
+        )
+        tracker = ObjectiveEligibilityTracker({"special": objective})
+
+        tracker.check_all_objective_eligibility("player1", self.game_state)
+        tracker.check_all_objective_eligibility("player1", self.game_state)
+
+        assert calls == ["player1", "player1"]
+
+    def test_newly_eligible_objectives(self) -> None:
+        """Test detection of objectives that became eligible after a change."""
+        self.tracker.check_all_objective_eligibility("player1", self.game_state)
+        self.eligible["planets"] = True
+        self.tracker.notify_state_changed([PLANETS])
+
+        newly_eligible = self.tracker.get_newly_eligible_objectives(
+            "player1", self.game_state
+        )
+
+        assert newly_eligible == [self.objectives["planets"]]
+
+    def test_unit_moved_events_mark_units_changed(self) -> None:
+        """Test that the tracker reacts to unit movement events."""
+        units_objective = _make_objective(
+            "units", ["units"], lambda p, g: True, [ObjectiveStateFacet.UNITS]
+        )
+        tracker = ObjectiveEligibilityTracker({"units": units_objective})
+        event_bus = GameEventBus()
+        tracker.register_with_bus(event_bus)
+        tracker.check_all_objective_eligibility("player1", self.game_state)
+
+        event_bus.publish(
+            create_unit_moved_event(
+                game_id="game",
+                unit_id="unit",
+                from_system="a",
+                to_system="b",
+                player_id="player1",
+            )
+        )
+        tracker.check_all_objective_eligibility("player1", self.game_state)
+
+        assert tracker.get_cache_statistics()["cache_misses"] == 2
+
+    def test_objectives_loaded_once(self) -> None:
+        """Test that the objective cards are only created once per tracker."""
+        tracker = ObjectiveEligibilityTracker()
+
+        with patch.object(
+            ObjectiveCardFactory,
+            "create_all_objectives",
+            return_value=self.objectives,
+        ) as create_all:
+            tracker.check_all_objective_eligibility("player1", self.game_state)
+            tracker.check_all_objective_eligibility("player2", self.game_state)
+
+        create_all.assert_called_once()
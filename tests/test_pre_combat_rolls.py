@@ -0,0 +1,166 @@
+"""Tests for batched pre-combat ability rolls.
+
+LRR References:
+- Rule 10: ANTI-FIGHTER BARRAGE
+- Rule 15: BOMBARDMENT
+- Rule 77: SPACE CANNON
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from ti4.core.bombardment import BombardmentSystem
+from ti4.core.combat import CombatResolver
+from ti4.core.constants import Technology, UnitType
+from ti4.core.planet import Planet
+from ti4.core.pre_combat_rolls import PreCombatAbility, PreCombatRollBatch
+from ti4.core.system import System
+from ti4.core.unit import Unit
+
+
+class ScriptedDice:
+    """Rolls fixed die results."""
+
+    def __init__(self, results: list[int]) -> None:
+        self.results = results
+
+    def __call__(self, count: int) -> list[int]:
+        assert count == len(self.results)
+        return list(self.results)
+
+
+class TestPreCombatRollBatch:
+    """Test rolling and counting hits for a whole batch."""
+
+    def test_hits_per_roll_player_and_target(self) -> None:
+        """Test that each unit's dice are compared with its own value."""
+        war_sun = Unit(UnitType.WAR_SUN, "player1")
+        dreadnought = Unit(UnitType.DREADNOUGHT, "player1")
+        pds = Unit(UnitType.PDS, "player2")
+        batch = PreCombatRollBatch()
+        batch.add_bombardment(war_sun, "planet_a")
+        batch.add_bombardment(dreadnought, "planet_b")
+        batch.add_space_cannon(pds, "player1")
+        batch.add_bombardment(Unit(UnitType.CARRIER, "player1"), "planet_a")
+
+        result = batch.roll(ScriptedDice([3, 2, 10, 4, 6]))
+
+        assert len(batch) == 3
+        assert result.dice_results == ((3, 2, 10), (4,), (6,))
+        assert result.hits == (2, 0, 1)
+        assert result.hits_by_player() == {"player1": 2, "player2": 1}
+        assert result.hits_by_target(PreCombatAbility.BOMBARDMENT) == {
+            "planet_a": 2,
+            "planet_b": 0,
+        }
+        assert result.total_hits(PreCombatAbility.SPACE_CANNON) == 1
+
+    def test_matches_unit_by_unit_counting(self) -> None:
+        """Test that batched hits equal counting each unit's dice."""
+        batch = PreCombatRollBatch()
+        for hit_value in range(1, 11):
+            batch.add(
+                Unit(UnitType.DESTROYER, "player1"),
+                PreCombatAbility.ANTI_FIGHTER_BARRAGE,
+                3,
+                hit_value,
+            )
+
+        rng = random.Random(15)
+        result = batch.roll(lambda count: [rng.randint(1, 10) for _ in range(count)])
+
+        for roll, dice, hits in zip(
+            result.rolls, result.dice_results, result.hits, strict=True
+        ):
+            assert hits == sum(1 for die in dice if die >= roll.hit_value)
+
+    def test_plasma_scoring_and_validation(self) -> None:
+        """Test extra bombardment dice and invalid rolls."""
+        batch = PreCombatRollBatch()
+        batch.add_bombardment(
+            Unit(UnitType.DREADNOUGHT, "player1"),
+            "planet_a",
+            [Technology.PLASMA_SCORING],
+        )
+        assert batch.rolls[0].dice == 2
+
+        pds = Unit(UnitType.PDS, "player1")
+        with pytest.raises(ValueError, match="hit value"):
+            batch.add(pds, PreCombatAbility.SPACE_CANNON, 1, 0)
+        with pytest.raises(ValueError, match="negative"):
+            batch.add(pds, PreCombatAbility.SPACE_CANNON, -1, 6)
+
+
+class TestBatchedResolution:
+    """Test bombardment and AFB resolution through one batched roll."""
+
+    def test_bombardment_rolls_every_planet_at_once(self) -> None:
+        """Test per-planet hits from a single roll (Rule 15.1d)."""
+        system = System("system1")
+        for name in ("planet_a", "planet_b"):
+            planet = Planet(name, resources=1, influence=1)
+            planet.place_unit(Unit(UnitType.INFANTRY, "player2"))
+            system.add_planet(planet)
+        war_sun = Unit(UnitType.WAR_SUN, "player1")
+        dreadnought = Unit(UnitType.DREADNOUGHT, "player1")
+
+        with patch("ti4.core.dice.roll_dice", return_value=[1, 1, 3, 9]) as roll:
+            results = BombardmentSystem().execute_bombardment(
+                system,
+                "player1",
+                {"planet_a": [war_sun], "planet_b": [dreadnought]},
+            )
+
+        roll.assert_called_once_with(4)
+        assert results["planet_a"]["hits"] == 1
+        assert results["planet_b"]["hits"] == 1
+        assert results["planet_b"]["units_destroyed"] == 1
+
+    def test_bombardment_validates_before_rolling(self) -> None:
+        """Test that a shielded planet stops the whole bombardment."""
+        system = System("system1")
+        open_planet = Planet("open", resources=1, influence=1)
+        open_planet.place_unit(Unit(UnitType.INFANTRY, "player2"))
+        shielded = Planet("shielded", resources=1, influence=1)
+        shielded.place_unit(Unit(UnitType.PDS, "player2"))
+        system.add_planet(open_planet)
+        system.add_planet(shielded)
+
+        with pytest.raises(ValueError, match="planetary shield"):
+            BombardmentSystem().execute_bombardment(
+                system,
+                "player1",
+                {
+                    "open": [Unit(UnitType.WAR_SUN, "player1")],
+                    "shielded": [Unit(UnitType.WAR_SUN, "player1")],
+                },
+            )
+
+        assert len(open_planet.units) == 1
+
+    def test_batched_anti_fighter_barrage_phase(self) -> None:
+        """Test that batched AFB hits are assigned like per-unit hits."""
+        system = System("system1")
+        system.place_unit_in_space(Unit(UnitType.DESTROYER, "player1"))
+        fighters = [Unit(UnitType.FIGHTER, "player2") for _ in range(3)]
+        for fighter in fighters:
+            system.place_unit_in_space(fighter)
+        resolver = CombatResolver()
+
+        with (
+            patch("ti4.core.dice.roll_dice", return_value=[9, 3]),
+            patch.object(
+                resolver,
+                "perform_anti_fighter_barrage_enhanced",
+                side_effect=AssertionError,
+            ),
+        ):
+            result = resolver.resolve_anti_fighter_barrage_phase(
+                system, "player1", "player2", batched=True
+            )
+
+        assert (result.attacker_hits, result.defender_hits) == (1, 0)
+        assert result.destroyed_fighters == [fighters[0]]
+        assert len(result.remaining_fighters) == 2
@@ -0,0 +1,126 @@
+"""Tests for planning whole production orders (Rules 67 and 68)."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ti4.core.blockade import BlockadeManager
+from ti4.core.constants import UnitType
+from ti4.core.galaxy import Galaxy
+from ti4.core.planet import Planet
+from ti4.core.production import ProductionManager
+from ti4.core.resource_management import CostValidator
+from ti4.core.system import System
+from ti4.core.unit import Unit
+from ti4.core.unit_stats import UnitStatsProvider
+
+REINFORCEMENTS = {
+    UnitType.CARRIER: 4,
+    UnitType.CRUISER: 8,
+    UnitType.DESTROYER: 8,
+    UnitType.DREADNOUGHT: 5,
+    UnitType.FIGHTER: 10,
+    UnitType.INFANTRY: 12,
+}
+
+
+def _system(resources: int = 1) -> System:
+    """A system whose space dock has production resources + 2."""
+    system = System("system1")
+    planet = Planet("planet_a", resources=resources, influence=1)
+    planet.place_unit(Unit(UnitType.SPACE_DOCK, "player1"))
+    system.add_planet(planet)
+    return system
+
+
+def _manager(available_resources: int) -> ProductionManager:
+    resource_manager = Mock()
+    resource_manager.calculate_available_resources.return_value = available_resources
+    return ProductionManager(
+        resource_manager, CostValidator(resource_manager, UnitStatsProvider())
+    )
+
+
+class TestValidateOrder:
+    """Test validating a mixed order in one pass."""
+
+    def test_valid_mixed_order_with_partial_fighters(self) -> None:
+        """Test that one fighter costs a whole pair (Rule 68.1c)."""
+        planner = _manager(4).create_production_planner(
+            _system(), "player1", REINFORCEMENTS
+        )
+
+        result = planner.validate({UnitType.CARRIER: 1, UnitType.FIGHTER: 1})
+
+        assert result.is_valid
+        assert result.build.resource_cost == 4
+        assert result.build.production_used == 2
+
+    def test_every_violation_is_reported(self) -> None:
+        """Test reinforcements, capacity and cost together."""
+        planner = _manager(3).create_production_planner(
+            _system(), "player1", {UnitType.CRUISER: 1}
+        )
+
+        result = planner.validate({UnitType.CRUISER: 2, UnitType.DESTROYER: 2})
+
+        assert not result.is_valid
+        assert len(result.errors) == 4
+        assert "production capacity exceeded" in result.error_message.lower()
+
+    def test_blockade_stops_ships_but_not_ground_forces(self) -> None:
+        """Test that blockaded space docks produce only ground forces (Rule 14.1)."""
+        system = _system()
+        system.place_unit_in_space(Unit(UnitType.DESTROYER, "player2"))
+        galaxy = Galaxy()
+        galaxy.register_system(system)
+        planner = _manager(5).create_production_planner(
+            system, "player1", REINFORCEMENTS, blockade_manager=BlockadeManager(galaxy)
+        )
+
+        assert planner.blockaded
+        assert not planner.validate({UnitType.FIGHTER: 2}).is_valid
+        assert planner.validate({UnitType.INFANTRY: 3}).is_valid
+
+    def test_planner_requires_cost_validator(self) -> None:
+        """Test that planning needs a CostValidator."""
+        with pytest.raises(ValueError, match="CostValidator"):
+            ProductionManager().create_production_planner(
+                _system(), "player1", REINFORCEMENTS
+            )
+
+
+class TestEnumerateBuilds:
+    """Test enumeration of Pareto-optimal builds."""
+
+    def test_builds_cannot_be_extended(self) -> None:
+        """Test that every build is maximal and valid."""
+        planner = _manager(4).create_production_planner(
+            _system(), "player1", REINFORCEMENTS
+        )
+
+        builds = planner.enumerate_builds(
+            [UnitType.CRUISER, UnitType.FIGHTER, UnitType.INFANTRY]
+        )
+
+        as_dicts = [build.as_dict() for build in builds]
+        assert {UnitType.CRUISER: 2, UnitType.FIGHTER: 1} not in as_dicts
+        assert {UnitType.CRUISER: 1, UnitType.FIGHTER: 2} in as_dicts
+        assert {UnitType.FIGHTER: 1, UnitType.INFANTRY: 1} not in as_dicts
+        for build in builds:
+            assert planner.validate(build.as_dict()).is_valid
+            for extra in (UnitType.CRUISER, UnitType.FIGHTER, UnitType.INFANTRY):
+                extended = build.as_dict()
+                extended[extra] = extended.get(extra, 0) + 1
+                assert not planner.validate(extended).is_valid
+
+    def test_budget_limits_builds(self) -> None:
+        """Test that a smaller budget yields cheaper builds."""
+        planner = _manager(10).create_production_planner(
+            _system(resources=4), "player1", REINFORCEMENTS
+        )
+
+        builds = planner.enumerate_builds([UnitType.DREADNOUGHT], budget=8)
+
+        assert [build.as_dict() for build in builds] == [{UnitType.DREADNOUGHT: 2}]
+        assert builds[0].resource_cost == 8
@@ -113,9 +113,70 @@ class TestResourceMonitor:
         metrics_history = monitor.get_metrics_history()
         assert len(metrics_history) <= 100
 
-        # Test operation stats to verify cleanup
-        operation_stats = monitor.get_operation_stats("test_op")
-        assert operation_stats["count"] <= 100
+        # Recent samples are trimmed; the histogram keeps every sample
+        assert len(monitor.get_recent_operation_times("test_op")) <= 100
+        assert monitor.get_operation_stats("test_op")["count"] == 150
+
+    def test_operation_history_is_bounded_ring_buffer(self) -> None:
+        """Test that recent samples are capped while the histogram keeps counting."""
+        from ti4.core.constants import PerformanceConstants
+
+        monitor = ResourceMonitor()
+        limit = PerformanceConstants.MAX_OPERATION_HISTORY
+
+        for i in range(limit + 50):
+            monitor.record_operation_time("op", float(i))
+
+        recent = monitor.get_recent_operation_times("op")
+        assert len(recent) == limit
+        assert recent[0] == 50.0
+        assert recent[-1] == float(limit + 49)
+        assert monitor.get_operation_stats("op")["count"] == limit + 50
+
+    def test_operation_stats_include_percentiles(self) -> None:
+        """Test that operation stats expose p50/p95/p99 latencies."""
+        monitor = ResourceMonitor()
+
+        for i in range(1, 101):
+            monitor.record_operation_time("op", i / 1000)
+
+        stats = monitor.get_operation_stats("op")
+        assert stats["p50"] == pytest.approx(0.050, rel=1e-2)
+        assert stats["p95"] == pytest.approx(0.095, rel=1e-2)
+        assert stats["p99"] == pytest.approx(0.099, rel=1e-2)
+        assert stats["max"] == 0.1
+
+    def test_merge_operation_stats(self) -> None:
+        """Test that histograms from separate monitors can be merged."""
+        first = ResourceMonitor()
+        second = ResourceMonitor()
+        first.record_operation_time("op", 0.1)
+        second.record_operation_time("op", 0.3)
+        second.record_operation_time("other_op", 0.2)
+
+        first.merge_operation_stats(second)
+
+        stats = first.get_operation_stats("op")
+        assert stats["count"] == 2
+        assert stats["min"] == 0.1
+        assert stats["max"] == 0.3
+        assert first.get_operation_stats("other_op")["count"] == 1
+
+    def test_cleanup_keeps_merged_percentiles(self) -> None:
+        """Test that cleanup does not rebuild histograms from recent samples."""
+        first = ResourceMonitor()
+        second = ResourceMonitor()
+        for _i in range(200):
+            first.record_operation_time("op", 0.01)
+            second.record_operation_time("op", 1.0)
+        first.merge_operation_stats(second)
+        before = first.get_operation_stats("op")
+
+        first.cleanup_resources()
+
+        assert first.get_operation_stats("op") == before
+        assert before["count"] == 400
+        assert before["p99"] == pytest.approx(1.0, rel=1e-2)
 
 
 class TestGameStateResourceManager:
@@ -220,9 +220,13 @@ class TestBatchOperations:
         game_state = GameState()
         player = Player(id="player1", faction=Faction.SOL)
         jord = Planet("Jord", resources=10, influence=8)
+        # A planet pays either resources or influence, so the combined
+        # request needs a second planet
+        mecatol = Planet("Mecatol Rex", resources=1, influence=6)
 
         game_state = game_state.add_player(player)
         game_state = game_state.add_player_planet(player.id, jord)
+        game_state = game_state.add_player_planet(player.id, mecatol)
 
         batch_manager = BatchResourceManager(game_state)
 
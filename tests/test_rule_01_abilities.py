@@ -307,6 +307,90 @@ class TestRule01Abilities:
         assert result.success
 
 
+class TestAbilityTriggerIndex:
+    """Test the event-indexed ability registry in AbilityManager"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.ability_manager = AbilityManager(GameState())
+
+    def _make_ability(self, name, trigger, timing, precedence=None):
+        return Ability(
+            name=name,
+            timing=timing,
+            trigger=trigger,
+            effect=AbilityEffect(type="modify", value=name),
+            precedence=precedence or AbilityPrecedence.NORMAL,
+        )
+
+    def test_buckets_keep_precedence_order_on_insert(self):
+        """Abilities are kept sorted by precedence, ties in registration order"""
+        after_first = self._make_ability("after_1", "roll", TimingWindow.AFTER)
+        override = self._make_ability(
+            "override",
+            "roll",
+            TimingWindow.AFTER,
+            precedence=AbilityPrecedence.CARD_OVERRIDE,
+        )
+        when = self._make_ability("when", "roll", TimingWindow.WHEN)
+        after_second = self._make_ability("after_2", "roll", TimingWindow.AFTER)
+
+        for ability in (after_first, override, when, after_second):
+            self.ability_manager.add_ability(ability)
+
+        assert self.ability_manager.get_abilities_for_trigger("roll") == [
+            override,
+            when,
+            after_first,
+            after_second,
+        ]
+        assert self.ability_manager.get_resolution_order("roll") == [
+            override,
+            when,
+            after_first,
+            after_second,
+        ]
+
+    def test_lookup_by_timing_window(self):
+        """Abilities can be looked up by event and timing window"""
+        when = self._make_ability("when", "roll", TimingWindow.WHEN)
+        after = self._make_ability("after", "roll", TimingWindow.AFTER)
+        self.ability_manager.add_ability(when)
+        self.ability_manager.add_ability(after)
+
+        assert self.ability_manager.get_abilities_for_trigger(
+            "roll", TimingWindow.AFTER
+        ) == [after]
+        assert self.ability_manager.get_resolution_order(
+            "roll", timing=TimingWindow.WHEN
+        ) == [when]
+
+    def test_other_events_not_considered(self):
+        """Abilities for other events are never checked"""
+        unrelated = self._make_ability("unrelated", "move", TimingWindow.WHEN)
+        unrelated.can_trigger = Mock(return_value=True)
+        self.ability_manager.add_ability(unrelated)
+
+        result = self.ability_manager.trigger_event("roll")
+
+        assert result.resolved_abilities == []
+        unrelated.can_trigger.assert_not_called()
+
+    def test_remove_ability_updates_index(self):
+        """Removed abilities no longer trigger"""
+        ability = self._make_ability("when", "roll", TimingWindow.WHEN)
+        self.ability_manager.add_ability(ability)
+
+        self.ability_manager.remove_ability(ability)
+
+        assert self.ability_manager.get_abilities_for_trigger("roll") == []
+        assert (
+            self.ability_manager.get_abilities_for_trigger("roll", TimingWindow.WHEN)
+            == []
+        )
+        assert self.ability_manager.resolve_conflict("roll").winning_ability is None
+
+
 class TestTimingWindowSystem:
     """Test the core timing window system"""
 
@@ -0,0 +1,177 @@
+"""Tests for the per-player space cannon coverage index (Rule 77)."""
+
+from unittest.mock import Mock, patch
+
+from ti4.actions.movement_engine import SpaceCannonOffenseStep
+from ti4.core import space_cannon_coverage
+from ti4.core.constants import Technology, UnitType
+from ti4.core.galaxy import Galaxy
+from ti4.core.game_state import GameState
+from ti4.core.hex_coordinate import HexCoordinate
+from ti4.core.planet import Planet
+from ti4.core.space_cannon_coverage import (
+    SpaceCannonCoverageIndex,
+    get_space_cannon_coverage,
+)
+from ti4.core.system import System
+from ti4.core.unit import Unit
+
+
+def _layout() -> tuple[Galaxy, dict[str, System]]:
+    """Systems a, b, c in a row; a and c are not adjacent."""
+    galaxy = Galaxy()
+    systems = {}
+    for index, system_id in enumerate(("a", "b", "c")):
+        system = System(system_id)
+        system.add_planet(Planet(f"planet_{system_id}", resources=1, influence=1))
+        galaxy.place_system(HexCoordinate(index, 0), system_id)
+        galaxy.register_system(system)
+        systems[system_id] = system
+    return galaxy, systems
+
+
+def _pds(owner: str, pds_ii: bool = False) -> Unit:
+    pds = Unit(unit_type=UnitType.PDS, owner=owner)
+    if pds_ii:
+        pds._has_pds_ii_upgrade = True  # type: ignore[attr-defined]
+    return pds
+
+
+class TestSpaceCannonCoverageIndex:
+    """Test coverage lookups and incremental updates."""
+
+    def test_pds_covers_its_own_system(self) -> None:
+        """Test dice and hit value of a PDS in its system (Rule 77.3)."""
+        galaxy, systems = _layout()
+        systems["a"].place_unit_on_planet(_pds("player1"), "planet_a")
+        systems["a"].place_unit_on_planet(_pds("player1"), "planet_a")
+        index = SpaceCannonCoverageIndex(systems, galaxy)
+
+        threat = index.get_threat("player1", "a")
+
+        assert list(index.get_coverage("player1")) == ["a"]
+        assert (threat.dice, threat.hit_value) == (2, 6)
+        assert threat.expected_hits == 1.0
+        assert index.get_players_covering("a") == ["player1"]
+        assert index.get_threat("player1", "b").dice == 0
+
+    def test_pds_ii_covers_adjacent_systems(self) -> None:
+        """Test that PDS II units cover adjacent systems (Rule 77.3c)."""
+        galaxy, systems = _layout()
+        systems["b"].place_unit_on_planet(_pds("player1", pds_ii=True), "planet_b")
+        index = SpaceCannonCoverageIndex(systems, galaxy)
+
+        assert sorted(index.get_coverage("player1")) == ["a", "b", "c"]
+
+    def test_placement_and_destruction_update_coverage(self) -> None:
+        """Test that only changed systems are re-read."""
+        galaxy, systems = _layout()
+        index = SpaceCannonCoverageIndex(systems, galaxy)
+        assert index.get_threat_map() == {}
+        pds = _pds("player2")
+
+        systems["c"].place_unit_on_planet(pds, "planet_c")
+        with patch(
+            "ti4.core.space_cannon_coverage.find_space_cannon_sources",
+            wraps=space_cannon_coverage.find_space_cannon_sources,
+        ) as scan:
+            assert index.get_players_covering("c") == ["player2"]
+        assert scan.call_count == 1
+
+        systems["c"].remove_unit_from_planet(pds, "planet_c")
+        assert index.get_players_covering("c") == []
+
+    def test_wormholes_retarget_ranged_units(self) -> None:
+        """Test that new wormhole adjacency extends PDS II coverage."""
+        galaxy, systems = _layout()
+        systems["a"].place_unit_on_planet(_pds("player1", pds_ii=True), "planet_a")
+        index = SpaceCannonCoverageIndex(systems, galaxy)
+        assert "c" not in index.get_coverage("player1")
+
+        systems["a"].add_wormhole("alpha")
+        systems["c"].add_wormhole("alpha")
+
+        assert sorted(index.get_coverage("player1")) == ["a", "b", "c"]
+
+    def test_galaxy_layout_changes_retarget_ranged_units(self) -> None:
+        """Test that hyperlanes and moved systems update PDS II coverage."""
+        galaxy, systems = _layout()
+        systems["a"].place_unit_on_planet(_pds("player1", pds_ii=True), "planet_a")
+        index = SpaceCannonCoverageIndex(systems, galaxy)
+        assert sorted(index.get_coverage("player1")) == ["a", "b"]
+
+        galaxy.add_hyperlane_connection("a", "c")
+        assert sorted(index.get_coverage("player1")) == ["a", "b", "c"]
+
+        galaxy.place_system(HexCoordinate(5, 0), "b")
+        assert sorted(index.get_coverage("player1")) == ["a", "c"]
+
+    def test_upgrades_need_a_refresh(self) -> None:
+        """Test that refresh_player picks up a PDS II upgrade."""
+        galaxy, systems = _layout()
+        pds = _pds("player1")
+        systems["a"].place_unit_on_planet(pds, "planet_a")
+        index = SpaceCannonCoverageIndex(systems, galaxy)
+        assert list(index.get_coverage("player1")) == ["a"]
+
+        pds._has_pds_ii_upgrade = True  # type: ignore[attr-defined]
+        index.refresh_player("player1")
+
+        assert sorted(index.get_coverage("player1")) == ["a", "b"]
+
+    def test_researched_upgrade_refreshes_coverage(self) -> None:
+        """Test that upgrading a player's units re-reads their coverage."""
+        galaxy, systems = _layout()
+        pds = _pds("player1")
+        systems["a"].place_unit_on_planet(pds, "planet_a")
+        game_state = GameState(galaxy=galaxy, systems=systems)
+        index = get_space_cannon_coverage(game_state)
+        assert list(index.get_coverage("player1")) == ["a"]
+
+        pds._has_pds_ii_upgrade = True  # type: ignore[attr-defined]
+        game_state.upgrade_player_units("player1", Technology.CRUISER_II)
+
+        assert sorted(index.get_coverage("player1")) == ["a", "b"]
+        assert Technology.CRUISER_II in pds.technologies
+
+    def test_index_is_shared_by_states_with_the_same_systems(self) -> None:
+        """Test caching on the game state across copy-on-write states."""
+        galaxy, systems = _layout()
+        game_state = GameState(galaxy=galaxy, systems=systems)
+        index = get_space_cannon_coverage(game_state)
+
+        new_state = game_state._create_new_state(speaker_id="player1")
+
+        assert get_space_cannon_coverage(new_state) is index
+        other = game_state._create_new_state(systems=dict(systems))
+        assert get_space_cannon_coverage(other) is not index
+
+
+class TestSpaceCannonStepUsesIndex:
+    """Test the space cannon offense step through the index."""
+
+    def test_step_lookups_use_the_index(self) -> None:
+        """Test that repeated activations do not re-read unchanged systems."""
+        galaxy, systems = _layout()
+        systems["b"].place_unit_on_planet(_pds("player2"), "planet_b")
+        systems["a"].place_unit_on_planet(_pds("player1", pds_ii=True), "planet_a")
+        systems["b"].place_unit_in_space(Unit(UnitType.CRUISER, "player1"))
+        game_state = Mock()
+        game_state.systems = systems
+        game_state.galaxy = galaxy
+        context = {"active_system_id": "b", "player_id": "player1"}
+        step = SpaceCannonOffenseStep()
+        assert step.can_execute(game_state, context)
+
+        with patch(
+            "ti4.core.space_cannon_coverage.find_space_cannon_sources",
+            side_effect=AssertionError,
+        ):
+            assert step._get_space_cannon_players(systems["b"], game_state) == [
+                "player2"
+            ]
+            units = step._get_space_cannon_units_for_player(
+                "player1", game_state, context
+            )
+
+        assert [unit.owner for unit in units] == ["player1"]
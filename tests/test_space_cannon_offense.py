@@ -10,6 +10,7 @@ from ti4.actions.movement_engine import SpaceCannonOffenseStep, TacticalAction
 from ti4.core.constants import UnitType
 from ti4.core.galaxy import Galaxy, HexCoordinate
 from ti4.core.planet import Planet
+from ti4.core.pre_combat_rolls import PreCombatRollBatch
 from ti4.core.system import System
 from ti4.core.unit import Unit
 
@@ -165,17 +166,13 @@ class TestRule77SpaceCannonOffenseMechanics:
         cruiser = Unit(unit_type=UnitType.CRUISER, owner="player2")
         system.place_unit_in_space(cruiser)
 
-        game_state = Mock()
-        game_state.systems = {"active_system": system}
-
-        context = {"active_system_id": "active_system", "player_id": "player1"}
-
-        step = SpaceCannonOffenseStep()
+        batch = PreCombatRollBatch()
+        batch.add_space_cannon(pds, "player2")
 
         with patch("ti4.core.dice.roll_dice") as mock_roll:
-            mock_roll.return_value = [6, 4, 3]  # One hit (6 >= 6)
+            mock_roll.return_value = [6]  # One hit (6 >= 6)
 
-            hits = step._roll_space_cannon_dice(pds, game_state, context)
+            hits = batch.roll().total_hits()
 
             # PDS has space cannon 6 (x1), so should roll 1 die
             mock_roll.assert_called_once_with(1)
@@ -315,7 +312,7 @@ class TestRule77SpaceCannonOffenseMechanics:
     @patch("ti4.core.dice.roll_dice")
     def test_complete_space_cannon_offense_execution(self, mock_roll) -> None:
         """Test complete Space Cannon Offense step execution."""
-        mock_roll.return_value = [6]  # One hit
+        mock_roll.return_value = [6]  # One hit; every unit's dice in one roll
 
         Galaxy()
         system = System("active_system")
@@ -346,6 +343,6 @@ class TestRule77SpaceCannonOffenseMechanics:
             result_state = step.execute(game_state, context)
 
             # Should have rolled dice and assigned hits
-            mock_roll.assert_called()
-            mock_assign.assert_called()
+            mock_roll.assert_called_once()
+            mock_assign.assert_called_once_with(system, ["player2"], 1)
             assert result_state == game_state
@@ -0,0 +1,307 @@
+"""Tests for the optimal spending planner used by ResourceManager."""
+
+from itertools import combinations
+
+from ti4.core.constants import Faction
+from ti4.core.game_state import GameState
+from ti4.core.planet import Planet
+from ti4.core.player import Player
+from ti4.core.resource_management import (
+    BatchResourceManager,
+    JointSpendingPlanner,
+    ResourceManager,
+    SpendingPlanner,
+)
+
+
+def _brute_force(values: dict[str, int], amount: int) -> tuple[int, int]:
+    """Return the best (overspend, planet count) over all covering subsets."""
+    best = None
+    names = list(values)
+    for size in range(len(names) + 1):
+        for subset in combinations(names, size):
+            total = sum(values[name] for name in subset)
+            if total >= amount:
+                candidate = (total - amount, size)
+                if best is None or candidate < best:
+                    best = candidate
+    assert best is not None
+    return best
+
+
+class TestSpendingPlanner:
+    """Test planet selection by SpendingPlanner."""
+
+    def test_avoids_greedy_overspend(self) -> None:
+        """Test that the exact subset is chosen instead of smallest-first."""
+        planner = SpendingPlanner({"A": 1, "B": 2, "C": 3, "D": 4}, trade_goods=0)
+
+        selection = planner.plan(7)
+
+        assert selection.overspend == 0
+        assert selection.planets_to_exhaust == {"C": 3, "D": 4}
+
+    def test_matches_brute_force(self) -> None:
+        """Test optimality against exhaustive search."""
+        values = {"A": 1, "B": 2, "C": 2, "D": 3, "E": 5, "F": 6, "G": 4}
+        planner = SpendingPlanner(values, trade_goods=0)
+
+        for amount in range(1, sum(values.values()) + 1):
+            selection = planner.plan(amount)
+            expected = _brute_force(values, amount)
+            assert (
+                selection.overspend,
+                len(selection.planets_to_exhaust),
+            ) == expected
+            assert sum(selection.planets_to_exhaust.values()) == selection.total_value
+
+    def test_prefers_fewer_planets(self) -> None:
+        """Test that ties on overspend exhaust as few planets as possible."""
+        planner = SpendingPlanner({"A": 1, "B": 2, "C": 3}, trade_goods=0)
+
+        assert planner.plan(3).planets_to_exhaust == {"C": 3}
+
+    def test_preserves_dual_value_planets(self) -> None:
+        """Test that planets with more preserved value are kept ready."""
+        planner = SpendingPlanner(
+            {"Dual": 2, "Plain": 2},
+            trade_goods=0,
+            preserved_values={"Dual": 3, "Plain": 0},
+        )
+
+        assert planner.plan(2).planets_to_exhaust == {"Plain": 2}
+
+    def test_trade_goods_only_cover_shortfall(self) -> None:
+        """Test that trade goods are spent only when planets are not enough."""
+        planner = SpendingPlanner({"A": 4, "B": 2}, trade_goods=3)
+
+        covered = planner.plan(5)
+        assert covered.trade_goods_to_spend == 0
+        assert covered.planets_to_exhaust == {"A": 4, "B": 2}
+
+        shortfall = planner.plan(8)
+        assert shortfall.trade_goods_to_spend == 2
+        assert shortfall.total_value == 8
+        assert shortfall.overspend == 0
+
+    def test_unaffordable_amount_selects_everything(self) -> None:
+        """Test that an unaffordable amount reports all available value."""
+        planner = SpendingPlanner({"A": 1}, trade_goods=1)
+
+        selection = planner.plan(5)
+
+        assert not planner.can_afford(5)
+        assert selection.total_value == 2
+        assert selection.planets_to_exhaust == {"A": 1}
+
+    def test_zero_amount_is_empty(self) -> None:
+        """Test that nothing is spent for a zero amount."""
+        planner = SpendingPlanner({"A": 1}, trade_goods=1)
+
+        selection = planner.plan(0)
+
+        assert selection.planets_to_exhaust == {}
+        assert selection.trade_goods_to_spend == 0
+
+    def test_batch_shares_one_table(self) -> None:
+        """Test that batch queries reuse the table built for the first one."""
+        planner = SpendingPlanner({"A": 1, "B": 2, "C": 5}, trade_goods=0)
+
+        selections = planner.plan_batch([3, 5, 6])
+        table = planner._best
+
+        assert [s.total_value for s in selections] == [3, 5, 6]
+        planner.plan(8)
+        assert planner._best is table
+
+
+def _joint_brute_force(
+    planets: dict[str, tuple[int, int]],
+    trade_goods: int,
+    resource_amount: int,
+    influence_amount: int,
+) -> bool:
+    """Check joint affordability by trying every planet assignment."""
+    names = list(planets)
+    for assignment in range(3 ** len(names)):
+        resources = influence = 0
+        for name in names:
+            assignment, choice = divmod(assignment, 3)
+            if choice == 1:
+                resources += planets[name][0]
+            elif choice == 2:
+                influence += planets[name][1]
+        gap = max(0, resource_amount - resources) + max(0, influence_amount - influence)
+        if gap <= trade_goods:
+            return True
+    return False
+
+
+class TestJointSpendingPlanner:
+    """Test joint resource and influence allocation."""
+
+    PLANETS = {
+        "Jord": (4, 2),
+        "Mecatol Rex": (1, 6),
+        "Arc Prime": (4, 0),
+        "Wren Terra": (2, 1),
+        "Moll Primus": (4, 1),
+    }
+
+    def test_never_double_books_a_planet(self) -> None:
+        """Test that no planet pays both costs."""
+        planner = JointSpendingPlanner({"Jord": (4, 2)}, trade_goods=0)
+
+        resources, influence = planner.plan(4, 2)
+
+        assert not planner.can_afford(4, 2)
+        assert not (
+            resources.planets_to_exhaust.keys() & influence.planets_to_exhaust.keys()
+        )
+        assert resources.total_value + influence.total_value < 6
+
+    def test_splits_planets_between_costs(self) -> None:
+        """Test that each planet is used for the cost it is best at."""
+        planner = JointSpendingPlanner(self.PLANETS, trade_goods=0)
+
+        resources, influence = planner.plan(8, 6)
+
+        assert resources.planets_to_exhaust == {"Arc Prime": 4, "Moll Primus": 4}
+        assert influence.planets_to_exhaust == {"Mecatol Rex": 6}
+        assert resources.overspend == influence.overspend == 0
+
+    def test_trade_goods_cover_either_cost(self) -> None:
+        """Test that trade goods make up the shortfall of both costs."""
+        planner = JointSpendingPlanner({"Jord": (4, 2)}, trade_goods=2)
+
+        resources, influence = planner.plan(4, 2)
+
+        assert planner.can_afford(4, 2)
+        assert resources.planets_to_exhaust == {"Jord": 4}
+        assert influence.trade_goods_to_spend == 2
+
+    def test_voting_trade_goods_cannot_pay_influence(self) -> None:
+        """Test that Rule 47.3 is applied to the influence cost."""
+        planner = JointSpendingPlanner({"Jord": (4, 2)}, trade_goods=4, for_voting=True)
+
+        assert planner.can_afford(4, 2)
+        assert not planner.can_afford(0, 3)
+        resources, influence = planner.plan(4, 2)
+        assert influence.planets_to_exhaust == {"Jord": 2}
+        assert resources.trade_goods_to_spend == 4
+
+    def test_affordability_matches_brute_force(self) -> None:
+        """Test the affordability table against exhaustive assignment."""
+        for trade_goods in (0, 2):
+            planner = JointSpendingPlanner(self.PLANETS, trade_goods)
+            for resource_amount in range(18):
+                for influence_amount in range(14):
+                    assert planner.can_afford(
+                        resource_amount, influence_amount
+                    ) == _joint_brute_force(
+                        self.PLANETS, trade_goods, resource_amount, influence_amount
+                    )
+
+    def test_frontier_is_pareto_optimal(self) -> None:
+        """Test that no frontier point dominates another."""
+        frontier = JointSpendingPlanner(self.PLANETS, 0).get_frontier()
+
+        assert frontier[0] == (4, 10)
+        assert frontier[-1] == (15, 0)
+        for (r1, i1), (r2, i2) in zip(frontier, frontier[1:], strict=False):
+            assert r1 < r2 and i1 > i2
+
+    def test_sync_matches_fresh_planner(self) -> None:
+        """Test that incremental updates give the same answers as a rebuild."""
+        planner = JointSpendingPlanner({"Jord": (4, 2)}, trade_goods=0)
+        planner.sync(self.PLANETS, trade_goods=1)
+        planner.remove_planet("Arc Prime")
+
+        remaining = dict(self.PLANETS)
+        del remaining["Arc Prime"]
+        fresh = JointSpendingPlanner(remaining, trade_goods=1)
+        assert planner.get_frontier() == fresh.get_frontier()
+        assert planner.can_afford(8, 3) == fresh.can_afford(8, 3)
+
+
+class TestResourceManagerPlanning:
+    """Test ResourceManager integration with the planner."""
+
+    def _game_state(self) -> tuple[GameState, Player]:
+        game_state = GameState()
+        player = Player(id="player1", faction=Faction.SOL)
+        game_state = game_state.add_player(player)
+        for planet in (
+            Planet("Dual", resources=2, influence=3),
+            Planet("Industrial", resources=2, influence=0),
+            Planet("Big", resources=3, influence=1),
+        ):
+            game_state = game_state.add_player_planet(player.id, planet)
+        return game_state, player
+
+    def test_resource_plan_keeps_influence_planet(self) -> None:
+        """Test that resource spending avoids exhausting influence planets."""
+        game_state, player = self._game_state()
+
+        plan = ResourceManager(game_state).create_spending_plan(
+            player.id, resource_amount=2
+        )
+
+        assert plan.is_valid
+        assert plan.resource_spending.planets_to_exhaust == {"Industrial": 2}
+
+    def test_batch_plans_match_individual_plans(self) -> None:
+        """Test that batch planning gives the same plans as one-off planning."""
+        game_state, player = self._game_state()
+        requests = [(2, 0, False), (5, 0, False), (0, 3, True), (9, 0, False)]
+
+        batch = BatchResourceManager(game_state).create_batch_spending_plans(
+            player.id, requests
+        )
+        manager = ResourceManager(game_state)
+        individual = [
+            manager.create_spending_plan(
+                player.id,
+                resource_amount=resources,
+                influence_amount=influence,
+                for_voting=for_voting,
+            )
+            for resources, influence, for_voting in requests
+        ]
+
+        assert batch == individual
+        assert not batch[3].is_valid
+
+    def test_combined_plan_does_not_double_book(self) -> None:
+        """Test that a combined cost is allocated over disjoint planets."""
+        game_state, player = self._game_state()
+        manager = ResourceManager(game_state)
+
+        plan = manager.create_spending_plan(
+            player.id, resource_amount=5, influence_amount=3
+        )
+
+        assert plan.is_valid
+        assert plan.resource_spending.planets_to_exhaust == {
+            "Industrial": 2,
+            "Big": 3,
+        }
+        assert plan.influence_spending.planets_to_exhaust == {"Dual": 3}
+        assert not manager.can_afford_spending(
+            player.id, resource_amount=5, influence_amount=4
+        )
+
+    def test_joint_planner_tracks_exhausted_planets(self) -> None:
+        """Test that the cached joint planner follows planet exhaustion."""
+        game_state, player = self._game_state()
+        manager = ResourceManager(game_state)
+        assert manager.can_afford_spending(player.id, 2, 3)
+
+        for planet in game_state.get_player_planets(player.id):
+            if planet.name == "Dual":
+                planet.exhaust()
+
+        assert not manager.can_afford_spending(player.id, 2, 3)
+        assert manager.get_joint_planner(player.id) is manager.get_joint_planner(
+            player.id
+        )
@@ -0,0 +1,207 @@
+"""Tests for game state compaction used by the status phase optimizer."""
+
+import copy
+import sys
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from ti4.core.constants import Faction
+from ti4.core.deals import EnhancedTransactionManager
+from ti4.core.game_state import GameState
+from ti4.core.planet import Planet
+from ti4.core.player import Player
+from ti4.core.state_compaction import EnumBitSet, GameStateCompactor
+from ti4.core.status_phase_performance import StatusPhasePerformanceOptimizer
+from ti4.core.strategic_action import StrategyCardType
+
+
+def _game_state() -> GameState:
+    game_state = GameState()
+    for index, faction in enumerate((Faction.SOL, Faction.HACAN)):
+        game_state = game_state.add_player(
+            Player(id=f"player{index + 1}", faction=faction)
+        )
+    return game_state.add_player_planet(
+        "player1", Planet("Jord", resources=4, influence=2)
+    )
+
+
+def _history_entry(index: int) -> Mock:
+    entry = Mock()
+    entry.transaction_id = f"transaction_{index}"
+    entry.proposing_player = "player1"
+    entry.target_player = "player2"
+    return entry
+
+
+class TestEnumBitSet:
+    """Test the bitmask-backed enum set."""
+
+    def test_behaves_like_a_set(self) -> None:
+        """Test membership, iteration order, equality and copies."""
+        cards = EnumBitSet(
+            StrategyCardType, {StrategyCardType.TRADE, StrategyCardType.LEADERSHIP}
+        )
+
+        assert StrategyCardType.TRADE in cards
+        assert StrategyCardType.WARFARE not in cards
+        assert "trade" not in cards
+        assert list(cards) == [StrategyCardType.LEADERSHIP, StrategyCardType.TRADE]
+        assert cards == {StrategyCardType.TRADE, StrategyCardType.LEADERSHIP}
+        assert cards.bits == 0b10001
+
+        copied = cards.copy()
+        copied.discard(StrategyCardType.TRADE)
+        assert len(copied) == 1
+        assert len(cards) == 2
+
+    def test_operators_keep_members(self) -> None:
+        """Test that set operators return bit sets of the same enum."""
+        cards = EnumBitSet(StrategyCardType, [StrategyCardType.LEADERSHIP])
+        other = {StrategyCardType.DIPLOMACY, StrategyCardType.LEADERSHIP}
+
+        union = cards | {StrategyCardType.DIPLOMACY}
+        assert isinstance(union, EnumBitSet)
+        assert union == other
+        assert cards & other == {StrategyCardType.LEADERSHIP}
+        assert union - cards == {StrategyCardType.DIPLOMACY}
+        assert cards ^ other == {StrategyCardType.DIPLOMACY}
+        assert other - cards == {StrategyCardType.DIPLOMACY}
+
+    def test_rejects_other_values(self) -> None:
+        """Test that only members of the enum can be added."""
+        with pytest.raises(TypeError):
+            EnumBitSet(StrategyCardType).add("trade")  # type: ignore[arg-type]
+
+
+class TestGameStateCompactor:
+    """Test what a compaction pass changes."""
+
+    def test_drops_empty_per_player_entries(self) -> None:
+        """Test that empty entries are removed and accessors are unchanged."""
+        game_state = _game_state()
+
+        compacted, stats = GameStateCompactor().compact(game_state)
+
+        assert stats.empty_entries_removed > 0
+        assert "player2" not in compacted.player_planets
+        assert compacted.get_player_planets("player2") == []
+        player1_planets = game_state.player_planets["player1"]
+        assert compacted.player_planets["player1"] is player1_planets
+
+    def test_interns_strings(self) -> None:
+        """Test that equal strings end up as one object."""
+        card_name = "".join(["sabotage", "_1"])
+        game_state = _game_state()._create_new_state(
+            player_action_cards={"player1": [card_name]}
+        )
+
+        compacted, stats = GameStateCompactor().compact(game_state)
+
+        assert stats.strings_interned >= 1
+        assert compacted.player_action_cards["player1"][0] is sys.intern(card_name)
+
+    def test_archives_old_transactions(self) -> None:
+        """Test that history beyond the limit moves to the archive."""
+        game_state = _game_state()
+        for index in range(5):
+            game_state = game_state.add_transaction_to_history(_history_entry(index))
+
+        compacted, stats = GameStateCompactor(transaction_history_limit=2).compact(
+            game_state
+        )
+
+        assert stats.transactions_archived == 3
+        assert len(compacted.transaction_history) == 2
+        assert len(compacted.archived_transaction_history) == 3
+        assert compacted.get_full_transaction_history() == (
+            game_state.transaction_history
+        )
+        manager = EnhancedTransactionManager(compacted.galaxy, compacted)
+        history = manager.get_transaction_history("player2")
+        assert [entry.transaction_id for entry in history] == [
+            f"transaction_{index}" for index in range(5)
+        ]
+
+    def test_exhausted_strategy_cards_become_bitset(self) -> None:
+        """Test that exhausted card tracking keeps working as a bitset."""
+        game_state = _game_state()._create_new_state(
+            exhausted_strategy_cards={StrategyCardType.TRADE}
+        )
+
+        compacted, stats = GameStateCompactor().compact(game_state)
+        exhausted = compacted.exhaust_strategy_card(StrategyCardType.WARFARE)
+
+        assert stats.bitsets_created == 1
+        assert isinstance(compacted.exhausted_strategy_cards, EnumBitSet)
+        assert compacted.exhausted_strategy_cards == {StrategyCardType.TRADE}
+        assert exhausted.exhausted_strategy_cards == {
+            StrategyCardType.TRADE,
+            StrategyCardType.WARFARE,
+        }
+        assert copy.deepcopy(compacted).exhausted_strategy_cards == {
+            StrategyCardType.TRADE
+        }
+
+    def test_compacted_state_is_returned_unchanged(self) -> None:
+        """Test that compaction is idempotent."""
+        compacted, _ = GameStateCompactor().compact(_game_state())
+
+        again, stats = GameStateCompactor().compact(compacted)
+
+        assert again is compacted
+        assert not stats.changed
+
+
+class TestOptimizerCompaction:
+    """Test compaction and memory measurement in the optimizer."""
+
+    def test_optimizer_compacts_game_states(self) -> None:
+        """Test that large state optimization compacts and reports stats."""
+        optimizer = StatusPhasePerformanceOptimizer()
+
+        compacted = optimizer.optimize_for_large_game_states(_game_state())
+
+        assert "player2" not in compacted.player_planets
+        assert optimizer.get_cache_statistics()["last_compaction"].changed
+
+    def test_disabled_optimization_and_mocks_are_untouched(self) -> None:
+        """Test that non-GameState inputs and disabled optimizers pass through."""
+        game_state = _game_state()
+        mock_state = Mock()
+
+        assert (
+            StatusPhasePerformanceOptimizer().optimize_for_large_game_states(mock_state)
+            is mock_state
+        )
+        assert (
+            StatusPhasePerformanceOptimizer(
+                enable_memory_optimization=False
+            ).optimize_for_large_game_states(game_state)
+            is game_state
+        )
+
+    def test_memory_is_measured_in_traced_bytes(self) -> None:
+        """Test that monitoring reports tracemalloc bytes when tracing."""
+        optimizer = StatusPhasePerformanceOptimizer(trace_memory=True)
+        try:
+            with optimizer.monitor_performance("allocate") as metrics:
+                data = [bytearray(1024) for _ in range(100)]
+        finally:
+            optimizer.stop_memory_tracing()
+
+        assert len(data) == 100
+        assert metrics.memory_delta >= 100 * 1024
+        assert metrics.memory_peak >= metrics.memory_after
+        assert not tracemalloc.is_tracing()
+
+    def test_memory_is_zero_without_tracing(self) -> None:
+        """Test that no memory is reported when tracemalloc is off."""
+        optimizer = StatusPhasePerformanceOptimizer()
+
+        with optimizer.monitor_performance("noop") as metrics:
+            pass
+
+        assert metrics.memory_before == metrics.memory_after == 0
@@ -0,0 +1,202 @@
+"""Tests for staged (parallel) execution of status phase steps.
+
+LRR References:
+- Rule 81: Status Phase - Step order and dependencies
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ti4.core.constants import Faction, UnitType
+from ti4.core.game_phase import GamePhase
+from ti4.core.game_state import GameState
+from ti4.core.planet import Planet
+from ti4.core.planet_card import PlanetCard
+from ti4.core.player import Player
+from ti4.core.status_phase import (
+    StatusPhaseGameStateError,
+    StatusPhaseOrchestrator,
+    StatusPhaseStepGraph,
+    StepValidationError,
+)
+from ti4.core.status_phase_performance import (
+    OptimizedStatusPhaseOrchestrator,
+    StatusPhasePerformanceOptimizer,
+)
+from ti4.core.system import System
+from ti4.core.unit import Unit
+
+
+def _game_state() -> GameState:
+    game_state = GameState()
+    for index, faction in enumerate((Faction.SOL, Faction.HACAN, Faction.XXCHA)):
+        player = Player(id=f"player{index + 1}", faction=faction)
+        game_state = game_state.add_player(player)
+        planet = Planet(f"Planet {index + 1}", resources=2, influence=1)
+        planet.exhaust()
+        game_state = game_state.add_player_planet(player.id, planet)
+
+    system = System("18")
+    for player in game_state.players:
+        system.place_command_token(player.id)
+        cruiser = Unit(UnitType.CRUISER, owner=player.id)
+        system.place_unit_in_space(cruiser)
+    return game_state._create_new_state(systems={"18": system})
+
+
+def _summary(game_state: GameState) -> dict[str, object]:
+    system = game_state.systems["18"]
+    return {
+        "action_cards": game_state.player_action_cards,
+        "exhausted_planets": [
+            planet.name
+            for planets in game_state.player_planets.values()
+            for planet in planets
+            if planet.is_exhausted()
+        ],
+        "command_tokens": system.get_players_with_command_tokens(),
+        "tactic_tokens": [
+            player.command_sheet.tactic_pool for player in game_state.players
+        ],
+        "speaker": game_state.speaker_id,
+    }
+
+
+class TestStatusPhaseStepGraph:
+    """Test the dependency graph of the status phase steps."""
+
+    def test_independent_steps_share_a_stage(self) -> None:
+        """Test that the stages follow the declared dependencies."""
+        stages = StatusPhaseStepGraph().get_execution_stages()
+
+        assert stages == [(1,), (2, 3, 4, 6, 7), (5,), (8,)]
+
+    def test_conflicting_writes_are_separated(self) -> None:
+        """Test that steps writing the same state never share a stage."""
+        graph = StatusPhaseStepGraph(
+            dependencies={1: frozenset(), 2: frozenset(), 3: frozenset()},
+            writes={
+                1: frozenset({"systems.units"}),
+                2: frozenset({"systems.units"}),
+                3: frozenset(),
+            },
+        )
+
+        assert graph.get_execution_stages() == [(1, 3), (2,)]
+
+    def test_cyclic_dependencies_rejected(self) -> None:
+        """Test that a dependency cycle is reported."""
+        graph = StatusPhaseStepGraph(
+            dependencies={1: frozenset({2}), 2: frozenset({1})}, writes={}
+        )
+
+        with pytest.raises(StepValidationError, match="cyclic"):
+            graph.get_execution_stages()
+
+    def test_merge_combines_disjoint_changes(self) -> None:
+        """Test that results of steps from one base state are merged."""
+        base = _game_state()
+        graph = StatusPhaseStepGraph()
+
+        merged = graph.merge_step_states(
+            base,
+            {
+                2: base.set_speaker("player2"),
+                3: base.draw_action_cards("player1", 1),
+            },
+        )
+
+        assert merged.speaker_id == "player2"
+        assert merged.player_action_cards["player1"] == ["action_card_1"]
+        assert base.speaker_id is None
+
+    def test_merge_rejects_undeclared_changes(self) -> None:
+        """Test that a step replacing state it does not declare is detected."""
+        base = _game_state()
+
+        with pytest.raises(StatusPhaseGameStateError, match="undeclared"):
+            StatusPhaseStepGraph().merge_step_states(
+                base, {3: base.set_speaker("player2")}
+            )
+
+    def test_merge_carries_rebuilt_and_fixed_fields(self) -> None:
+        """Test merging fields that new states clone or do not take."""
+        base = _game_state()
+        graph = StatusPhaseStepGraph(
+            dependencies={1: frozenset(), 2: frozenset()},
+            writes={
+                1: frozenset({"player_planet_cards"}),
+                2: frozenset({"phase"}),
+            },
+        )
+        with_card = base._create_new_state(
+            player_planet_cards={"player1": [PlanetCard("Planet 1", 2, 1)]}
+        )
+        next_phase = base._create_new_state()
+        object.__setattr__(next_phase, "phase", GamePhase.STRATEGY)
+
+        merged = graph.merge_step_states(base, {1: with_card, 2: next_phase})
+
+        cards = merged.get_player_planet_cards("player1")
+        assert [card.name for card in cards] == ["Planet 1"]
+        assert merged.phase == GamePhase.STRATEGY
+        assert base.phase != GamePhase.STRATEGY
+
+    def test_merge_rejects_undeclared_rebuilt_fields(self) -> None:
+        """Test that changes to fields that are cloned are not dropped."""
+        base = _game_state()
+        with_card = base._create_new_state(
+            player_planet_cards={"player1": [PlanetCard("Planet 1", 2, 1)]}
+        )
+
+        with pytest.raises(StatusPhaseGameStateError, match="player_planet_cards"):
+            StatusPhaseStepGraph().merge_step_states(base, {3: with_card})
+
+
+class TestStagedExecution:
+    """Test that staged execution matches serial execution."""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_staged_matches_serial(self, max_workers: int) -> None:
+        """Test that merged results equal the one-step-at-a-time results."""
+        serial_result, serial_state = StatusPhaseOrchestrator(
+            parallel_steps=False
+        ).execute_complete_status_phase(_game_state())
+        staged_result, staged_state = StatusPhaseOrchestrator(
+            parallel_steps=True, max_workers=max_workers
+        ).execute_complete_status_phase(_game_state())
+
+        assert staged_result.success and serial_result.success
+        assert staged_result.steps_completed == serial_result.steps_completed
+        assert list(staged_result.step_results) == list(range(1, 9))
+        assert _summary(staged_state) == _summary(serial_state)
+        assert _summary(staged_state)["exhausted_planets"] == []
+        assert _summary(staged_state)["command_tokens"] == []
+
+    def test_single_worker_runs_serially_by_default(self) -> None:
+        """Test that stages are only formed when they can run concurrently."""
+        assert not StatusPhaseOrchestrator().parallel_steps
+        assert StatusPhaseOrchestrator(max_workers=4).parallel_steps
+        assert StatusPhaseOrchestrator(parallel_steps=True).parallel_steps
+
+    def test_mock_states_run_serially(self) -> None:
+        """Test that states that cannot be merged run one step per stage."""
+        stages = StatusPhaseOrchestrator().get_execution_stages(Mock())
+
+        assert stages == [(step,) for step in range(1, 9)]
+
+    def test_report_records_step_speedups(self) -> None:
+        """Test that the performance report records per-step speedup."""
+        orchestrator = OptimizedStatusPhaseOrchestrator(
+            StatusPhasePerformanceOptimizer(enable_memory_optimization=False),
+            parallel_steps=True,
+        )
+
+        orchestrator.execute_complete_status_phase(_game_state())
+        report = orchestrator.get_performance_report()
+
+        assert report is not None
+        assert set(report.step_speedups) == set(range(1, 9))
+        assert report.get_step_speedup(1) == 1.0
+        assert report.get_step_speedup(2) == report.get_step_speedup(7) > 0
@@ -0,0 +1,103 @@
+"""Tests for bitmask-encoded technology prerequisites.
+
+LRR References:
+- Rule 90: TECHNOLOGY
+"""
+
+from tests.test_technology_integration import MockGameState
+from ti4.actions.research_technology import (
+    ResearchTechnologyAction,
+    _copy_for_research,
+)
+from ti4.core.constants import Faction, Technology
+from ti4.core.game_state import GameState
+from ti4.core.technology import TECHNOLOGY_MASKS, TechnologyColor, TechnologyManager
+
+
+class TestTechnologyMasks:
+    """Test the technology bit encoding."""
+
+    def test_masks_round_trip(self) -> None:
+        """Test encoding and decoding technologies and their colors."""
+        technologies = {Technology.GRAVITY_DRIVE, Technology.AI_DEVELOPMENT_ALGORITHM}
+        mask = TECHNOLOGY_MASKS.to_mask(technologies)
+
+        assert TECHNOLOGY_MASKS.from_mask(mask) == technologies
+        gravity_drive = TECHNOLOGY_MASKS.bits[Technology.GRAVITY_DRIVE]
+        assert (
+            TECHNOLOGY_MASKS.mask_from_values(["gravity_drive", "unknown"])
+            == gravity_drive
+        )
+        color_counts = TECHNOLOGY_MASKS.color_counts(mask)
+        counts = dict(zip(TECHNOLOGY_MASKS.colors, color_counts, strict=True))
+        assert counts[TechnologyColor.BLUE] == counts[TechnologyColor.YELLOW] == 1
+
+
+class TestResearchableTechnologies:
+    """Test research legality for all technologies at once."""
+
+    def test_researchable_set_matches_single_checks(self) -> None:
+        """Test that the bulk query agrees with can_research_technology."""
+        manager = TechnologyManager()
+        for owned in ([], [Technology.ANTIMASS_DEFLECTORS], [Technology.CRUISER_II]):
+            for technology in owned:
+                manager.gain_technology("player1", technology)
+            researchable = manager.get_researchable_technologies("player1")
+            for technology in manager.get_technology_deck("player1"):
+                try:
+                    expected = manager.can_research_technology("player1", technology)
+                except ValueError:
+                    expected = False  # Unconfirmed prerequisites
+                assert (technology in researchable) == expected
+
+        assert Technology.GRAVITY_DRIVE in researchable
+        assert Technology.CRUISER_II not in researchable
+
+    def test_returned_set_is_a_copy(self) -> None:
+        """Test that edits of the returned set cannot desync the mask."""
+        manager = TechnologyManager()
+        manager.gain_technology("player1", Technology.DARK_ENERGY_TAP)
+
+        owned = manager.get_player_technologies("player1")
+        owned.discard(Technology.DARK_ENERGY_TAP)
+        owned.add(Technology.GRAVITY_DRIVE)
+
+        assert manager.get_player_technologies("player1") == {
+            Technology.DARK_ENERGY_TAP
+        }
+        assert manager.can_research_technology("player1", Technology.GRAVITY_DRIVE)
+
+
+class TestResearchTechnologyAction:
+    """Test the targeted state update of research."""
+
+    def test_research_leaves_original_state_untouched(self) -> None:
+        """Test that only the researching player's technologies are copied."""
+        state = MockGameState()
+        state.add_player("player1", Faction.SOL)
+        state.add_player("player2", Faction.HACAN)
+
+        new_state = ResearchTechnologyAction(Technology.ANTIMASS_DEFLECTORS).execute(
+            state, "player1"
+        )
+
+        assert new_state.player_technologies["player1"] == ["antimass_deflectors"]
+        assert new_state.get_player_state("player1").technologies == {
+            "antimass_deflectors"
+        }
+        assert state.player_technologies["player1"] == []
+        assert state.get_player_state("player1").technologies == set()
+        assert new_state.players["player2"] is state.players["player2"]
+        history = state.technology_research_history
+        assert new_state.technology_research_history is history
+
+    def test_research_on_game_state_creates_a_new_state(self) -> None:
+        """Test that a real game state is copied with _create_new_state."""
+        state = GameState(player_technologies={"player1": ["dark_energy_tap"]})
+
+        new_state = _copy_for_research(state, "player1")
+
+        assert isinstance(new_state, GameState)
+        assert new_state.player_technologies == state.player_technologies
+        assert new_state.player_technologies is not state.player_technologies
+        assert new_state.systems is state.systems
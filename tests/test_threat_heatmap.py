@@ -0,0 +1,129 @@
+"""Tests for the galaxy-wide threat heatmap."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ti4.core.constants import UnitType
+from ti4.core.galaxy import Galaxy
+from ti4.core.game_state import GameState
+from ti4.core.hex_coordinate import HexCoordinate
+from ti4.core.planet import Planet
+from ti4.core.system import System
+from ti4.core.threat_heatmap import ThreatHeatmapEngine, get_threat_heatmap
+from ti4.core.unit import Unit
+
+SYSTEM_IDS = ("a", "b", "c", "d")
+
+
+def _layout() -> tuple[Galaxy, dict[str, System]]:
+    """Systems a, b, c, d in a row."""
+    galaxy = Galaxy()
+    systems = {}
+    for index, system_id in enumerate(SYSTEM_IDS):
+        system = System(system_id)
+        system.add_planet(Planet(f"planet_{system_id}", resources=1, influence=1))
+        galaxy.place_system(HexCoordinate(index, 0), system_id)
+        galaxy.register_system(system)
+        systems[system_id] = system
+    return galaxy, systems
+
+
+class TestThreatHeatmapEngine:
+    """Test reachable strength and incremental updates."""
+
+    def test_ships_reach_systems_within_movement(self) -> None:
+        """Test that a cruiser (move 2) threatens systems up to 2 away."""
+        galaxy, systems = _layout()
+        systems["a"].place_unit_in_space(Unit(UnitType.CRUISER, "player1"))
+        engine = ThreatHeatmapEngine(systems, galaxy)
+
+        heatmap = engine.get_heatmap()
+
+        assert heatmap.players == ("player1",)
+        assert heatmap.systems == SYSTEM_IDS
+        assert heatmap.hit_points == ((1, 1, 1, 0),)
+        assert heatmap.expected_hits[0][2] == pytest.approx(0.4)
+        assert not engine.get_strength("player1", "d")
+
+    def test_fighters_ride_with_carriers(self) -> None:
+        """Test that fighters move with capacity and sustain damage adds HP."""
+        galaxy, systems = _layout()
+        systems["a"].place_unit_in_space(Unit(UnitType.CARRIER, "player1"))
+        systems["a"].place_unit_in_space(Unit(UnitType.FIGHTER, "player1"))
+        systems["a"].place_unit_in_space(Unit(UnitType.FIGHTER, "player1"))
+        systems["c"].place_unit_in_space(Unit(UnitType.DREADNOUGHT, "player2"))
+        engine = ThreatHeatmapEngine(systems, galaxy)
+
+        carrier_group = engine.get_strength("player1", "b")
+        dreadnought = engine.get_strength("player2", "b")
+
+        assert carrier_group.expected_hits == pytest.approx(0.6)
+        assert (carrier_group.hit_points, carrier_group.capacity) == (3, 4)
+        assert dreadnought.hit_points == 2
+        assert dreadnought.expected_hits == pytest.approx(0.6)
+        assert set(engine.get_heatmap().get_threats("b")) == {"player1", "player2"}
+
+    def test_movement_rereads_only_changed_systems(self) -> None:
+        """Test that moving a ship updates the heatmap incrementally."""
+        galaxy, systems = _layout()
+        cruiser = Unit(UnitType.CRUISER, "player1")
+        systems["a"].place_unit_in_space(cruiser)
+        systems["d"].place_unit_in_space(Unit(UnitType.CARRIER, "player2"))
+        engine = ThreatHeatmapEngine(systems, galaxy)
+        engine.get_heatmap()
+
+        systems["a"].remove_unit_from_space(cruiser)
+        systems["b"].place_unit_in_space(cruiser)
+        with patch.object(
+            ThreatHeatmapEngine, "_read_system", wraps=engine._read_system
+        ) as read:
+            heatmap = engine.get_heatmap()
+
+        assert sorted(call.args[0] for call in read.call_args_list) == ["a", "b"]
+        assert heatmap.hit_points[0] == (1, 1, 1, 1)
+        assert heatmap.get("player2", "c").capacity == 4
+
+    def test_wormholes_extend_reach(self) -> None:
+        """Test that new wormhole adjacency is picked up (Rule 101)."""
+        galaxy, systems = _layout()
+        systems["a"].place_unit_in_space(Unit(UnitType.CARRIER, "player1"))
+        engine = ThreatHeatmapEngine(systems, galaxy)
+        assert not engine.get_strength("player1", "d")
+
+        systems["a"].add_wormhole("alpha")
+        systems["d"].add_wormhole("alpha")
+
+        assert engine.get_strength("player1", "d").capacity == 4
+
+    def test_space_cannon_is_included(self) -> None:
+        """Test that PDS fire is reported with the fleet strength."""
+        galaxy, systems = _layout()
+        systems["b"].place_unit_on_planet(Unit(UnitType.PDS, "player3"), "planet_b")
+        engine = ThreatHeatmapEngine(systems, galaxy)
+
+        strength = engine.get_heatmap().get("player3", "b")
+
+        assert strength.space_cannon_hits == pytest.approx(0.5)
+        assert strength.total_expected_hits == pytest.approx(0.5)
+        assert strength.hit_points == 0
+
+
+class TestGameStateHeatmap:
+    """Test the heatmap cached on the game state."""
+
+    def test_technologies_follow_new_states(self) -> None:
+        """Test that Gravity Drive extends reach in a later state."""
+        galaxy, systems = _layout()
+        systems["a"].place_unit_in_space(Unit(UnitType.CARRIER, "player1"))
+        game_state = GameState(galaxy=galaxy, systems=systems)
+        engine = get_threat_heatmap(game_state)
+        assert not engine.get_strength("player1", "c")
+
+        new_state = game_state._create_new_state(
+            player_technologies={"player1": ["gravity_drive"]}
+        )
+
+        assert get_threat_heatmap(new_state) is engine
+        assert engine.get_strength("player1", "c").capacity == 4
+        assert get_threat_heatmap(game_state).get_strength("player1", "c").capacity == 0
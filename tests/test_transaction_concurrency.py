@@ -0,0 +1,280 @@
+"""Tests for optimistic concurrency of Rule 28 component transactions."""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ti4.core.constants import Faction
+from ti4.core.deals import (
+    ComponentTransaction,
+    EnhancedTransactionManager,
+    TransactionStatus,
+)
+from ti4.core.game_state import GameState
+from ti4.core.player import Player
+from ti4.core.transaction_concurrency import (
+    OptimisticTransactionExecutor,
+    VersionedComponents,
+)
+from ti4.core.transactions import (
+    PromissoryNote,
+    PromissoryNoteType,
+    TransactionOffer,
+)
+
+FACTIONS = (Faction.SOL, Faction.HACAN, Faction.XXCHA, Faction.ARBOREC)
+
+
+def _game_state(trade_goods: int = 10) -> GameState:
+    players = []
+    for index, faction in enumerate(FACTIONS):
+        player = Player(id=f"player{index + 1}", faction=faction)
+        player.gain_trade_goods(trade_goods)
+        players.append(player)
+    return GameState(players=players)
+
+
+def _deal(
+    transaction_id: str, proposing: str, target: str, give: int, receive: int = 0
+) -> ComponentTransaction:
+    return ComponentTransaction(
+        transaction_id=transaction_id,
+        proposing_player=proposing,
+        target_player=target,
+        offer=TransactionOffer(trade_goods=give),
+        request=TransactionOffer(trade_goods=receive),
+        status=TransactionStatus.ACCEPTED,
+        timestamp=datetime.now(),
+        completion_timestamp=datetime.now(),
+    )
+
+
+def _trade_goods(game_state: GameState) -> dict[str, int]:
+    return {player.id: player.get_trade_goods() for player in game_state.players}
+
+
+DEALS = [
+    _deal("tx_1", "player1", "player2", 3),
+    _deal("tx_2", "player3", "player4", 1, 2),
+    _deal("tx_3", "player2", "player3", 5),
+    _deal("tx_4", "player4", "player1", 2),
+]
+
+
+class TestOptimisticExecution:
+    """Test that optimistic execution matches serial application."""
+
+    def test_matches_serial_application(self) -> None:
+        """Test final balances and history against one-by-one application."""
+        game_state = _game_state()
+        serial = game_state.apply_concurrent_transaction_effects(DEALS)
+
+        result = OptimisticTransactionExecutor().execute(game_state, DEALS)
+
+        assert result.success
+        assert _trade_goods(result.game_state) == _trade_goods(serial)
+        history = result.game_state.transaction_history
+        assert [entry.transaction_id for entry in history] == [
+            "tx_1",
+            "tx_2",
+            "tx_3",
+            "tx_4",
+        ]
+        assert _trade_goods(game_state) == dict.fromkeys(_trade_goods(game_state), 10)
+        assert result.metrics.commits == 4
+        assert result.metrics.conflicts == 0
+
+    def test_parallel_workers_commit_every_deal(self) -> None:
+        """Test that overlapping deals across threads all commit."""
+        game_state = _game_state(trade_goods=100)
+        deals = [
+            _deal(
+                f"tx_{index}",
+                f"player{index % 4 + 1}",
+                f"player{(index + 1) % 4 + 1}",
+                1,
+            )
+            for index in range(200)
+        ]
+        executor = OptimisticTransactionExecutor(max_workers=4)
+
+        result = executor.execute(game_state, deals)
+
+        assert result.success
+        assert _trade_goods(result.game_state) == _trade_goods(
+            game_state.apply_concurrent_transaction_effects(deals)
+        )
+        assert len(result.game_state.transaction_history) == 200
+        assert executor.metrics.transactions == 200
+        assert executor.metrics.commits == 200
+
+    def test_failed_deals_leave_others_committed(self) -> None:
+        """Test that an unaffordable deal fails on its own."""
+        game_state = _game_state(trade_goods=2)
+
+        result = OptimisticTransactionExecutor().execute(
+            game_state,
+            [
+                _deal("tx_1", "player1", "player2", 5),
+                _deal("tx_2", "player3", "player4", 2),
+            ],
+        )
+
+        assert result.failed == {"tx_1": "Player player1 has insufficient trade goods"}
+        assert [t.transaction_id for t in result.committed] == ["tx_2"]
+        assert _trade_goods(result.game_state) == {
+            "player1": 2,
+            "player2": 2,
+            "player3": 0,
+            "player4": 4,
+        }
+
+    def test_deals_read_earlier_commits(self) -> None:
+        """Test that a deal can spend trade goods received in the same batch."""
+        game_state = _game_state(trade_goods=0)._create_new_state()
+        game_state.players[0].gain_trade_goods(3)
+
+        result = OptimisticTransactionExecutor().execute(
+            game_state,
+            [
+                _deal("tx_1", "player1", "player2", 3),
+                _deal("tx_2", "player2", "player3", 3),
+            ],
+        )
+
+        assert result.success
+        assert _trade_goods(result.game_state)["player3"] == 3
+
+    def test_promissory_notes_move_between_hands(self) -> None:
+        """Test that note transfers are applied to the new state's hands."""
+        game_state = _game_state()
+        note = PromissoryNote(
+            note_type=PromissoryNoteType.TRADE_AGREEMENT, issuing_player="player1"
+        )
+        game_state.promissory_note_manager.add_note_to_hand(note, "player1")
+        deal = ComponentTransaction(
+            transaction_id="tx_1",
+            proposing_player="player1",
+            target_player="player2",
+            offer=TransactionOffer(promissory_notes=[note]),
+            request=TransactionOffer(trade_goods=2),
+            status=TransactionStatus.ACCEPTED,
+            timestamp=datetime.now(),
+        )
+
+        new_state = game_state.apply_concurrent_transaction_effects(
+            [deal], optimistic=True
+        )
+
+        manager = new_state.promissory_note_manager
+        assert manager.get_player_hand("player1") == []
+        assert manager.get_player_hand("player2") == [note]
+        assert game_state.promissory_note_manager.get_player_hand("player1") == [note]
+
+    def test_game_state_optimistic_mode_is_all_or_nothing(self) -> None:
+        """Test that GameState raises if any deal fails, like serial mode."""
+        game_state = _game_state(trade_goods=1)
+
+        with pytest.raises(ValueError, match="tx_2"):
+            game_state.apply_concurrent_transaction_effects(
+                [
+                    _deal("tx_1", "player1", "player2", 1),
+                    _deal("tx_2", "player3", "player4", 5),
+                ],
+                optimistic=True,
+            )
+
+
+class TestVersionedComponents:
+    """Test read set validation."""
+
+    def test_stale_snapshot_does_not_commit(self) -> None:
+        """Test that a commit is rejected after a concurrent change."""
+        game_state = _game_state()
+        components = VersionedComponents(game_state)
+        first = components.read(["player1", "player2"])
+        second = components.read(["player2", "player3"])
+        untouched = components.read(["player4"])
+
+        assert components.commit(first, {}, {}, DEALS[0])
+        assert not components.commit(second, {}, {}, DEALS[2])
+        assert components.is_current(untouched)
+        assert components.committed == [DEALS[0]]
+
+    def test_conflicts_are_retried(self) -> None:
+        """Test that a deal whose players changed is retried and counted."""
+        game_state = _game_state()
+        components = VersionedComponents(game_state)
+        executor = OptimisticTransactionExecutor()
+        read = components.read
+
+        def read_then_interfere(player_ids: list[str]) -> dict:
+            snapshot = read(player_ids)
+            if not components.committed:
+                # Another deal commits between this deal's read and commit
+                components.commit(read(["player2"]), {}, {}, DEALS[2])
+            return snapshot
+
+        components.read = read_then_interfere  # type: ignore[method-assign]
+        metrics = executor.metrics
+
+        error = executor._run(DEALS[0], game_state, components, metrics)
+
+        assert error is None
+        assert metrics.conflicts == 1
+        assert components.committed == [DEALS[2], DEALS[0]]
+
+
+class TestManagerConcurrentAccept:
+    """Test accepting several deals at once through the manager."""
+
+    def test_accepts_and_reports_metrics(self) -> None:
+        """Test statuses, pending cleanup and metrics."""
+        galaxy = Mock()
+        galaxy.are_players_neighbors.return_value = True
+        manager = EnhancedTransactionManager(galaxy, _game_state(trade_goods=4))
+        ids = [
+            manager.propose_transaction(
+                proposing, target, TransactionOffer(trade_goods=4), TransactionOffer()
+            ).transaction_id
+            for proposing, target in [
+                ("player1", "player2"),
+                ("player3", "player4"),
+                ("player1", "player3"),
+            ]
+        ]
+
+        results = manager.accept_transactions_concurrently(ids, max_workers=2)
+
+        assert [result.success for result in results] == [True, True, False]
+        assert manager.get_transaction(ids[0]).status == TransactionStatus.ACCEPTED
+        assert manager.get_transaction(ids[2]).status == TransactionStatus.PENDING
+        game_state = manager._game_state
+        assert list(game_state.pending_transactions) == [ids[2]]
+        assert len(game_state.transaction_history) == 2
+        metrics = manager.get_concurrency_metrics()
+        assert (metrics.transactions, metrics.commits, metrics.failures) == (3, 2, 1)
+
+    def test_invalid_resulting_state_fails_the_batch(self) -> None:
+        """Test that an invalid result is reported instead of raised."""
+        galaxy = Mock()
+        galaxy.are_players_neighbors.return_value = True
+        manager = EnhancedTransactionManager(galaxy, _game_state(trade_goods=4))
+        ids = [
+            manager.propose_transaction(
+                proposing, target, TransactionOffer(trade_goods=1), TransactionOffer()
+            ).transaction_id
+            for proposing, target in [("player1", "player2"), ("player3", "player4")]
+        ]
+        game_state = manager._game_state
+
+        with patch.object(GameState, "is_valid", return_value=False):
+            results = manager.accept_transactions_concurrently(ids, max_workers=2)
+
+        assert [result.success for result in results] == [False, False]
+        assert "invalid game state" in (results[0].error_message or "")
+        assert manager._game_state is game_state
+        assert manager.get_transaction(ids[0]).status == TransactionStatus.PENDING
+        assert manager._optimistic_executor is not None
+        assert manager._optimistic_executor.max_workers == 1
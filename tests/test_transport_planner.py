@@ -0,0 +1,121 @@
+"""Tests for bin packing transport plans (Rule 95: TRANSPORT)."""
+
+import pytest
+
+from ti4.core.constants import UnitType
+from ti4.core.fleet import Fleet
+from ti4.core.transport import (
+    FleetTransportManager,
+    TransportCapacityError,
+    TransportOptimizer,
+    TransportPickup,
+    TransportPlanner,
+)
+from ti4.core.unit import Unit
+
+
+def _fleet(*unit_types: UnitType, system_id: str = "system1") -> Fleet:
+    fleet = Fleet("player1", system_id)
+    for unit_type in unit_types:
+        fleet.add_unit(Unit(unit_type, "player1"))
+    return fleet
+
+
+def _units(unit_type: UnitType, count: int, owner: str = "player1") -> list[Unit]:
+    return [Unit(unit_type, owner) for _ in range(count)]
+
+
+class TestTransportPlanner:
+    """Test ship selection, loading order and caching."""
+
+    def test_commits_the_fewest_ships(self) -> None:
+        """Test that one carrier is used rather than several small ships."""
+        fleet = _fleet(UnitType.DREADNOUGHT, UnitType.DREADNOUGHT, UnitType.CARRIER)
+
+        plan = TransportPlanner().plan(fleet, _units(UnitType.INFANTRY, 2))
+
+        assert plan.ships_committed == 1
+        assert plan.transport_states[0].transport_ship.unit_type == UnitType.CARRIER
+
+    def test_prefers_sturdy_ships_and_loads_fighters_there(self) -> None:
+        """Test that fighters ride on ships that can sustain damage."""
+        fleet = _fleet(UnitType.CARRIER, UnitType.CARRIER, UnitType.WAR_SUN)
+        cargo = _units(UnitType.INFANTRY, 6) + _units(UnitType.FIGHTER, 2)
+
+        plan = TransportPlanner().plan(fleet, cargo)
+
+        ships = [state.transport_ship.unit_type for state in plan.transport_states]
+        assert ships == [UnitType.WAR_SUN, UnitType.CARRIER]
+        war_sun_cargo = plan.transport_states[0].transported_units
+        assert [unit.unit_type for unit in war_sun_cargo[:2]] == [UnitType.FIGHTER] * 2
+        assert sum(len(s.transported_units) for s in plan.transport_states) == 8
+
+    def test_pickups_follow_rule_95_3(self) -> None:
+        """Test that units under a command token stay behind."""
+        fleet = _fleet(UnitType.CARRIER)
+        allowed = TransportPickup("active", tuple(_units(UnitType.MECH, 1)), True)
+        blocked = TransportPickup("middle", tuple(_units(UnitType.INFANTRY, 1)), True)
+
+        plan = TransportPlanner().plan(
+            fleet,
+            _units(UnitType.INFANTRY, 1) + _units(UnitType.INFANTRY, 1, "player2"),
+            active_system_id="active",
+            pickups=[allowed, blocked],
+        )
+
+        carried = plan.transport_states[0].transported_units
+        assert [unit.unit_type for unit in carried] == [
+            UnitType.MECH,
+            UnitType.INFANTRY,
+        ]
+        assert blocked.units[0] in plan.rejected_units
+        assert len(plan.rejected_units) == 2
+
+    def test_pickups_need_the_active_system(self) -> None:
+        """Test that pickups cannot be validated without an active system."""
+        pickup = TransportPickup("active", tuple(_units(UnitType.MECH, 1)), True)
+
+        with pytest.raises(ValueError, match="Active system"):
+            TransportPlanner().plan(_fleet(UnitType.CARRIER), [], pickups=[pickup])
+
+    def test_packings_are_cached_by_composition(self) -> None:
+        """Test that fleets of the same composition reuse a packing."""
+        planner = TransportPlanner()
+        first = planner.plan(_fleet(UnitType.CARRIER), _units(UnitType.FIGHTER, 3))
+        second = planner.plan(_fleet(UnitType.CARRIER), _units(UnitType.FIGHTER, 3))
+
+        assert (planner.cache_misses, planner.cache_hits) == (1, 1)
+        assert first.transport_states[0].transport_ship is not (
+            second.transport_states[0].transport_ship
+        )
+
+    def test_capacity_is_enforced(self) -> None:
+        """Test that cargo beyond the fleet's capacity is an error."""
+        with pytest.raises(TransportCapacityError):
+            TransportPlanner().plan(
+                _fleet(UnitType.CRUISER), _units(UnitType.INFANTRY, 1)
+            )
+
+
+class TestTransportManagersUsePlanner:
+    """Test the fleet transport manager and optimizer."""
+
+    def test_distribution_includes_idle_ships(self) -> None:
+        """Test that idle ships are listed with no cargo."""
+        fleet = _fleet(UnitType.DREADNOUGHT, UnitType.CARRIER)
+        manager = FleetTransportManager(TransportPlanner())
+
+        states = manager.create_transport_distribution(
+            fleet, _units(UnitType.INFANTRY, 3)
+        )
+
+        assert [len(state.transported_units) for state in states] == [3, 0]
+
+    def test_optimizer_rejects_untransportable_units(self) -> None:
+        """Test that ships cannot be transported (Rule 95.0)."""
+        optimizer = TransportOptimizer(TransportPlanner())
+
+        with pytest.raises(ValueError):
+            optimizer.optimize_transport_distribution(
+                _fleet(UnitType.CARRIER), _units(UnitType.DESTROYER, 1)
+            )